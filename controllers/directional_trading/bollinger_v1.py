@@ -1,12 +1,12 @@
-from typing import List
+from typing import Dict, List
 
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.indicators import BBands
 from hummingbot.smart_components.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -79,18 +79,31 @@ class BollingerV1Controller(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        # The indicators are computed incrementally by the candles feed
+        self.indicators = [BBands(length=config.bb_length, std=config.bb_std)]
         super().__init__(config, *args, **kwargs)
 
+    def get_last_candle(self) -> Dict[str, float]:
+        return self.market_data_provider.get_last_candle(connector_name=self.config.candles_connector,
+                                                         trading_pair=self.config.candles_trading_pair,
+                                                         interval=self.config.interval,
+                                                         max_records=self.max_records,
+                                                         indicators=self.indicators)
+
     def get_signal(self) -> int:
-        return self.get_processed_data()["signal"].iloc[-1]
+        bbp = self.get_last_candle()[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
+        if bbp < self.config.bb_long_threshold:
+            return 1
+        elif bbp > self.config.bb_short_threshold:
+            return -1
+        return 0
 
     def get_processed_data(self) -> pd.DataFrame:
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+                                                      max_records=self.max_records,
+                                                      indicators=self.indicators)
 
         # Generate signal
         long_condition = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"] < self.config.bb_long_threshold
@@ -1,12 +1,12 @@
 from typing import List
 
 import pandas as pd
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.indicators import MACD, BBands
 from hummingbot.smart_components.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -94,19 +94,33 @@ class MACDBBV1Controller(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        # The indicators are computed incrementally by the candles feed
+        self.indicators = [BBands(length=config.bb_length, std=config.bb_std),
+                           MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal)]
         super().__init__(config, *args, **kwargs)
 
     def get_signal(self) -> int:
-        return self.get_processed_data()["signal"].iloc[-1]
+        last_candle = self.market_data_provider.get_last_candle(connector_name=self.config.candles_connector,
+                                                                trading_pair=self.config.candles_trading_pair,
+                                                                interval=self.config.interval,
+                                                                max_records=self.max_records,
+                                                                indicators=self.indicators)
+        bbp = last_candle[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
+        macdh = last_candle[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macd = last_candle[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+
+        if bbp < self.config.bb_long_threshold and macdh > 0 and macd < 0:
+            return 1
+        elif bbp > self.config.bb_short_threshold and macdh < 0 and macd > 0:
+            return -1
+        return 0
 
     def get_processed_data(self) -> pd.DataFrame:
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
-        df.ta.macd(fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal, append=True)
+                                                      max_records=self.max_records,
+                                                      indicators=self.indicators)
 
         bbp = df[f"BBP_{self.config.bb_length}_{self.config.bb_std}"]
         macdh = df[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
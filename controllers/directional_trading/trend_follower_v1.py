@@ -6,6 +6,7 @@ from pydantic import Field, validator
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.indicators import SMA, BBands
 from hummingbot.smart_components.controllers.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
     DirectionalTradingControllerConfigBase,
@@ -83,20 +84,35 @@ class TrendFollowerV1(DirectionalTradingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        # The indicators are computed incrementally by the candles feed
+        self.indicators = [SMA(length=config.sma_fast), SMA(length=config.sma_slow),
+                           BBands(length=config.bb_length, std=config.bb_std)]
         super().__init__(config, *args, **kwargs)
 
     def get_signal(self) -> int:
-        return self.get_processed_data()["signal"].iloc[-1]
+        last_candle = self.market_data_provider.get_last_candle(connector_name=self.config.candles_connector,
+                                                                trading_pair=self.config.candles_trading_pair,
+                                                                interval=self.config.interval,
+                                                                max_records=self.max_records,
+                                                                indicators=self.indicators)
+        sma_fast = last_candle[f"SMA_{self.config.sma_fast}"]
+        sma_slow = last_candle[f"SMA_{self.config.sma_slow}"]
+        bb_upper = last_candle[f"BBU_{self.config.bb_length}_{self.config.bb_std}"]
+        bb_lower = last_candle[f"BBL_{self.config.bb_length}_{self.config.bb_std}"]
+        close = last_candle["close"]
+
+        if sma_fast > sma_slow and close < bb_lower + self.config.bb_threshold * (bb_upper - bb_lower):
+            return 1
+        elif sma_fast < sma_slow and close > bb_upper - self.config.bb_threshold * (bb_upper - bb_lower):
+            return -1
+        return 0
 
     def get_processed_data(self) -> pd.DataFrame:
         df = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                       trading_pair=self.config.candles_trading_pair,
                                                       interval=self.config.interval,
-                                                      max_records=self.max_records)
-        # Add indicators
-        df.ta.sma(close='close', length=self.config.sma_fast, append=True)
-        df.ta.sma(close='close', length=self.config.sma_slow, append=True)
-        df.ta.bbands(length=self.config.bb_length, std=self.config.bb_std, append=True)
+                                                      max_records=self.max_records,
+                                                      indicators=self.indicators)
 
         sma_fast = df[f"SMA_{self.config.sma_fast}"]
         sma_slow = df[f"SMA_{self.config.sma_slow}"]
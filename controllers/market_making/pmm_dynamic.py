@@ -2,12 +2,12 @@ import time
 from decimal import Decimal
 from typing import List
 
-import pandas_ta as ta  # noqa: F401
 from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import ClientFieldData
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
+from hummingbot.data_feed.candles_feed.indicators import MACD, NATR
 from hummingbot.smart_components.controllers.market_making_controller_base import (
     MarketMakingControllerBase,
     MarketMakingControllerConfigBase,
@@ -97,22 +97,25 @@ class PMMDynamicController(MarketMakingControllerBase):
                 interval=config.interval,
                 max_records=self.max_records
             )]
+        # The indicators are computed incrementally by the candles feed
+        self.indicators = [NATR(length=config.natr_length),
+                           MACD(fast=config.macd_fast, slow=config.macd_slow, signal=config.macd_signal)]
         super().__init__(config, *args, **kwargs)
 
     async def update_processed_data(self):
         candles = self.market_data_provider.get_candles_df(connector_name=self.config.candles_connector,
                                                            trading_pair=self.config.candles_trading_pair,
                                                            interval=self.config.interval,
-                                                           max_records=self.max_records)
-        natr = ta.natr(candles["high"], candles["low"], candles["close"], length=self.config.natr_length) / 100
-        macd_output = ta.macd(candles["close"], fast=self.config.macd_fast, slow=self.config.macd_slow, signal=self.config.macd_signal)
-        macd = macd_output[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macd_signal = - (macd - macd.mean()) / macd.std()
-        macdh = macd_output[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
-        macdh_signal = macdh.apply(lambda x: 1 if x > 0 else -1)
+                                                           max_records=self.max_records,
+                                                           indicators=self.indicators)
+        natr = candles[f"NATR_{self.config.natr_length}"].iloc[-1] / 100
+        macd = candles[f"MACD_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macd_signal = - (macd.iloc[-1] - macd.mean()) / macd.std()
+        macdh = candles[f"MACDh_{self.config.macd_fast}_{self.config.macd_slow}_{self.config.macd_signal}"]
+        macdh_signal = 1 if macdh.iloc[-1] > 0 else -1
         max_price_shift = natr / 2
-        price_multiplier = Decimal(((0.5 * macd_signal + 0.5 * macdh_signal) * max_price_shift).iloc[-1])
-        spread_multiplier = Decimal(natr.iloc[-1])
+        price_multiplier = Decimal((0.5 * macd_signal + 0.5 * macdh_signal) * max_price_shift)
+        spread_multiplier = Decimal(natr)
         mid_price = self.market_data_provider.get_price_by_type(self.config.connector_name, self.config.trading_pair,
                                                                 PriceType.MidPrice)
         reference_price = mid_price * (1 + price_multiplier)
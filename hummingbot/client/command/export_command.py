@@ -2,7 +2,7 @@ import os
 from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, joinedload
 
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
@@ -98,8 +98,10 @@ class ExportCommand:
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
             filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        # The orders are loaded with the trades, as the reports need the creation timestamp of each order
         query: Query = (session
                         .query(TradeFill)
+                        .options(joinedload(TradeFill.order))
                         .filter(*filters)
                         .order_by(TradeFill.timestamp.desc()))
         if number_of_rows is None:
@@ -3,12 +3,13 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, TradesAggregate
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -40,18 +41,40 @@ class HistoryCommand:
         if self.strategy_file_name is None:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
-        start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+        safe_ensure_future(self.history_report_from_db(days, verbose, precision))
+
+    async def history_report_from_db(self,  # type: HummingbotApplication
+                                     days: float = 0,
+                                     verbose: bool = False,
+                                     precision: Optional[int] = None):
+        # The trades waiting in the markets recorder queue are written before querying them
+        await self.flush_trade_records()
+        if days > 0:
+            start_time = get_timestamp(days)
+            with self.trade_fill_db.get_new_session() as session:
+                trades: List[TradeFill] = self._get_trades_from_session(
+                    int(start_time * 1e3),
+                    session=session,
+                    config_file_path=self.strategy_file_name)
+                aggregates = self.group_trades_by_market(trades)
+        else:
+            # The trades of the current session are added to the totals of the previous history reports
+            start_time = self.init_time
+            aggregates = self.get_session_trades_aggregates()
+        if not aggregates:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        await self.aggregates_report(start_time, aggregates, precision)
+
+    async def flush_trade_records(self,  # type: HummingbotApplication
+                                  ):
+        """
+        Writes the records queued by the markets recorder to the database
+        """
+        if self.markets_recorder is not None:
+            await self.markets_recorder.flush()
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
@@ -65,17 +88,39 @@ class HistoryCommand:
                 config_file_path=self.strategy_file_name)
             return list([TradeFill.to_bounty_api_json(t) for t in trades])
 
+    def get_session_trades_aggregates(self,  # type: HummingbotApplication
+                                      ) -> Dict[Tuple[str, str], TradesAggregate]:
+        """
+        Returns the totals of the trades of the current session by market and trading pair, adding the trades filled
+        since the last call.
+        """
+        tracker = PerformanceTracker.for_db(self.trade_fill_db)
+        return tracker.update(config_file_path=self.strategy_file_name, start_timestamp=int(self.init_time * 1e3))
+
+    @staticmethod
+    def group_trades_by_market(trades: List[TradeFill]) -> Dict[Tuple[str, str], TradesAggregate]:
+        trades_by_market: Dict[Tuple[str, str], List[TradeFill]] = {}
+        for trade in trades:
+            trades_by_market.setdefault((trade.market, trade.symbol), []).append(trade)
+        return {(market, symbol): PerformanceMetrics.add_trades(TradesAggregate(symbol), market_trades)
+                for (market, symbol), market_trades in trades_by_market.items()}
+
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        return await self.aggregates_report(start_time, self.group_trades_by_market(trades), precision, display_report)
+
+    async def aggregates_report(self,  # type: HummingbotApplication
+                                start_time: float,
+                                aggregates: Dict[Tuple[str, str], TradesAggregate],
+                                precision: Optional[int] = None,
+                                display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), aggregate in aggregates.items():
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +129,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await PerformanceMetrics.create_from_aggregate(aggregate, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -206,14 +251,10 @@ class HistoryCommand:
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
 
-        start_time = self.init_time
-
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        await self.flush_trade_records()
+        avg_return = await self.aggregates_report(self.init_time,
+                                                  self.get_session_trades_aggregates(),
+                                                  display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -446,6 +446,14 @@ class DBSqliteMode(DBMode):
             ),
         ),
     )
+    performance_profile: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the SQLite performance profile (WAL journal, tuned PRAGMAs and pooled connections)"
+            ),
+        ),
+    )
 
     class Config:
         title = "sqlite_db_engine"
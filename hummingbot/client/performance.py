@@ -1,8 +1,8 @@
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
@@ -15,6 +15,150 @@ s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+class PositionFill:
+    """
+    Price and amount of a fill of a derivative position, not paired yet with the fills of the opposite position action
+    """
+    __slots__ = ("position", "price", "amount")
+
+    def __init__(self, position: str, price: Decimal, amount: Decimal):
+        self.position = position
+        self.price = price
+        self.amount = amount
+
+
+class TradesSideAggregate:
+    """
+    Running totals of the buys or the sells of a trading pair
+    """
+
+    def __init__(self):
+        self.count: int = 0
+        self.vol_base: Decimal = s_decimal_0
+        self.vol_quote: Decimal = s_decimal_0
+        # The trades of a side are derivatives if the first one is a TradeFill and none is without position
+        self.are_derivatives: Optional[bool] = None
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "vol_base": str(self.vol_base),
+            "vol_quote": str(self.vol_quote),
+            "are_derivatives": self.are_derivatives,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "TradesSideAggregate":
+        side = cls()
+        side.count = data["count"]
+        side.vol_base = Decimal(data["vol_base"])
+        side.vol_quote = Decimal(data["vol_quote"])
+        side.are_derivatives = data["are_derivatives"]
+        return side
+
+
+class PositionsAggregate:
+    """
+    Realized PnL of the derivative positions of a trading pair. The open and close fills of the long (buy to open,
+    sell to close) and short (sell to open, buy to close) positions are paired as they are added, in chronological
+    order and by amount, so only the fills not paired yet are kept.
+    """
+
+    def __init__(self):
+        self.realized_pnl: Decimal = s_decimal_0
+        # The fills not paired of each direction all have the same position action
+        self.long_fills: Deque[PositionFill] = deque()
+        self.short_fills: Deque[PositionFill] = deque()
+
+    def add_fill(self, trade_type: str, position: str, price: Decimal, amount: Decimal):
+        is_buy = trade_type.upper() == TradeType.BUY.name
+        if position == PositionAction.OPEN.value:
+            is_long = is_buy
+        elif position == PositionAction.CLOSE.value:
+            is_long = not is_buy
+        else:
+            return
+        fills = self.long_fills if is_long else self.short_fills
+        while amount > s_decimal_0 and len(fills) > 0 and fills[0].position != position:
+            paired_fill = fills[0]
+            paired_amount = min(amount, paired_fill.amount)
+            open_price, close_price = ((price, paired_fill.price) if position == PositionAction.OPEN.value
+                                       else (paired_fill.price, price))
+            pnl = (close_price - open_price) * paired_amount
+            self.realized_pnl += pnl if is_long else -pnl
+            amount -= paired_amount
+            paired_fill.amount -= paired_amount
+            if paired_fill.amount <= s_decimal_0:
+                fills.popleft()
+        if amount > s_decimal_0:
+            fills.append(PositionFill(position=position, price=price, amount=amount))
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "realized_pnl": str(self.realized_pnl),
+            "long_fills": [[fill.position, str(fill.price), str(fill.amount)] for fill in self.long_fills],
+            "short_fills": [[fill.position, str(fill.price), str(fill.amount)] for fill in self.short_fills],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PositionsAggregate":
+        positions = cls()
+        positions.realized_pnl = Decimal(data["realized_pnl"])
+        positions.long_fills = deque(PositionFill(position, Decimal(price), Decimal(amount))
+                                     for position, price, amount in data["long_fills"])
+        positions.short_fills = deque(PositionFill(position, Decimal(price), Decimal(amount))
+                                      for position, price, amount in data["short_fills"])
+        return positions
+
+
+class TradesAggregate:
+    """
+    Running totals of the trades of a trading pair, from which the performance metrics are computed. Trades are added
+    in chronological order with `PerformanceMetrics.add_trades`, and the totals can be stored as JSON to continue
+    adding trades later.
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair = trading_pair
+        self.buys = TradesSideAggregate()
+        self.sells = TradesSideAggregate()
+        self.positions = PositionsAggregate()
+        self.first_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        # Fee amount paid in each token
+        self.fees: Dict[str, Decimal] = {}
+
+    @property
+    def are_derivatives(self) -> bool:
+        return bool(self.buys.are_derivatives or self.sells.are_derivatives)
+
+    @property
+    def num_trades(self) -> int:
+        return self.buys.count + self.sells.count
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "trading_pair": self.trading_pair,
+            "buys": self.buys.to_json(),
+            "sells": self.sells.to_json(),
+            "positions": self.positions.to_json(),
+            "first_price": None if self.first_price is None else str(self.first_price),
+            "last_price": None if self.last_price is None else str(self.last_price),
+            "fees": [[token, str(amount)] for token, amount in self.fees.items()],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "TradesAggregate":
+        aggregate = cls(data["trading_pair"])
+        aggregate.buys = TradesSideAggregate.from_json(data["buys"])
+        aggregate.sells = TradesSideAggregate.from_json(data["sells"])
+        aggregate.positions = PositionsAggregate.from_json(data["positions"])
+        aggregate.first_price = None if data["first_price"] is None else Decimal(data["first_price"])
+        aggregate.last_price = None if data["last_price"] is None else Decimal(data["last_price"])
+        aggregate.fees = {token: Decimal(amount) for token, amount in data["fees"]}
+        return aggregate
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
@@ -71,6 +215,28 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_aggregate(cls,
+                                    aggregate: TradesAggregate,
+                                    current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Creates the metrics of the trades added to the aggregate, equal to the metrics created from the trades
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_aggregate(aggregate, current_balances)
+        return performance
+
+    @classmethod
+    def add_trades(cls, aggregate: TradesAggregate, trades: List[Any]) -> TradesAggregate:
+        """
+        Adds the trades (TradeFill or Trade objects, in chronological order) to the running totals of the aggregate
+        """
+        performance = PerformanceMetrics()
+        _, quote = split_hb_trading_pair(aggregate.trading_pair)
+        for trade in trades:
+            performance._add_trade(aggregate, quote, trade)
+        return aggregate
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -174,27 +340,46 @@ class PerformanceMetrics:
     def _is_trade_fill(self, trade):
         return type(trade) == TradeFill
 
-    def _are_derivatives(self, trades: List[Any]) -> bool:
-        return (
-            trades
-            and self._is_trade_fill(trades[0])
-            and PositionAction.NIL.value not in [t.position for t in trades]
-        )
-
-    def _preprocess_trades_and_group_by_type(self, trades: List[Any]) -> Tuple[List[Any], List[Any]]:
-        buys = []
-        sells = []
-        for trade in trades:
-            if trade.trade_type.upper() == TradeType.BUY.name.upper():
-                buys.append(trade)
-                self.b_vol_base += Decimal(str(trade.amount))
-                self.b_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price)) * Decimal("-1")
-            elif trade.trade_type.upper() == TradeType.SELL.name.upper():
-                sells.append(trade)
-                self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
-                self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
-
-            self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
+    def _add_trade(self, aggregate: TradesAggregate, quote: str, trade: Any):
+        amount = Decimal(str(trade.amount))
+        price = Decimal(str(trade.price))
+        side = None
+        if trade.trade_type.upper() == TradeType.BUY.name.upper():
+            side = aggregate.buys
+            side.vol_base += amount
+            side.vol_quote += amount * price * Decimal("-1")
+        elif trade.trade_type.upper() == TradeType.SELL.name.upper():
+            side = aggregate.sells
+            side.vol_base += amount * Decimal("-1")
+            side.vol_quote += amount * price
+
+        aggregate.sells.vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
+
+        if side is not None:
+            side.count += 1
+            were_derivatives = side.are_derivatives
+            if side.are_derivatives is None:
+                side.are_derivatives = self._is_trade_fill(trade)
+            if side.are_derivatives and trade.position == PositionAction.NIL.value:
+                side.are_derivatives = False
+            if side.are_derivatives is False and were_derivatives is not False:
+                # Positions are not paired if the trades of any side are not derivatives
+                aggregate.positions = PositionsAggregate()
+            elif side.are_derivatives and (aggregate.buys.are_derivatives is not False
+                                           and aggregate.sells.are_derivatives is not False):
+                aggregate.positions.add_fill(trade.trade_type, trade.position, price, amount)
+        if aggregate.first_price is None:
+            aggregate.first_price = price
+        aggregate.last_price = price
+
+        for fee_token, fee_amount in self._trade_fees(quote, trade):
+            aggregate.fees[fee_token] = aggregate.fees.get(fee_token, s_decimal_0) + fee_amount
+
+    def _set_volumes(self, aggregate: TradesAggregate):
+        self.b_vol_base = aggregate.buys.vol_base
+        self.b_vol_quote = aggregate.buys.vol_quote
+        self.s_vol_base = aggregate.sells.vol_base
+        self.s_vol_quote = aggregate.sells.vol_quote
 
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
@@ -206,8 +391,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -224,30 +407,38 @@ class PerformanceMetrics:
             impact = Decimal(str(trade.amount)) * Decimal(str(trade.price)) * fee_percent * Decimal("-1")
         return impact
 
+    def _trade_fees(self, quote: str, trade: Any) -> List[Tuple[str, Decimal]]:
+        fees = []
+        fee_percent = None
+        trade_price = None
+        trade_amount = None
+        if self._is_trade_fill(trade):
+            if trade.trade_fee.get("percent") is not None:
+                trade_price = Decimal(str(trade.price))
+                trade_amount = Decimal(str(trade.amount))
+                fee_percent = Decimal(str(trade.trade_fee["percent"]))
+            flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
+                         for flat_fee in trade.trade_fee.get("flat_fees", [])]
+        else:  # assume this is Trade object
+            if trade.trade_fee.percent is not None:
+                trade_price = Decimal(trade.price)
+                trade_amount = Decimal(trade.amount)
+                fee_percent = Decimal(trade.trade_fee.percent)
+            flat_fees = trade.trade_fee.flat_fees
+
+        if fee_percent is not None:
+            fees.append((quote, trade_price * trade_amount * fee_percent))
+        for flat_fee in flat_fees:
+            fees.append((flat_fee.token, flat_fee.amount))
+        return fees
+
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
-            fee_percent = None
-            trade_price = None
-            trade_amount = None
-            if self._is_trade_fill(trade):
-                if trade.trade_fee.get("percent") is not None:
-                    trade_price = Decimal(str(trade.price))
-                    trade_amount = Decimal(str(trade.amount))
-                    fee_percent = Decimal(str(trade.trade_fee["percent"]))
-                flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
-                             for flat_fee in trade.trade_fee.get("flat_fees", [])]
-            else:  # assume this is Trade object
-                if trade.trade_fee.percent is not None:
-                    trade_price = Decimal(trade.price)
-                    trade_amount = Decimal(trade.amount)
-                    fee_percent = Decimal(trade.trade_fee.percent)
-                flat_fees = trade.trade_fee.flat_fees
-
-            if fee_percent is not None:
-                self.fees[quote] += trade_price * trade_amount * fee_percent
-            for flat_fee in flat_fees:
-                self.fees[flat_fee.token] += flat_fee.amount
+            for fee_token, fee_amount in self._trade_fees(quote, trade):
+                self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
 
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -262,27 +453,12 @@ class PerformanceMetrics:
                         f"using {RateOracle.get_instance()}. PNL value will be inconsistent."
                     )
 
-    def _calculate_trade_pnl(self, buys: list, sells: list):
+    def _calculate_trade_pnl(self, aggregate: TradesAggregate):
         self.trade_pnl = self.cur_value - self.hold_value
 
         # Handle trade_pnl differently for derivatives
-        if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
-
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
-
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
-
-            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
+        if aggregate.are_derivatives:
+            self.trade_pnl = aggregate.positions.realized_pnl
 
     async def _initialize_metrics(self,
                                   trading_pair: str,
@@ -295,11 +471,18 @@ class PerformanceMetrics:
         :param current_balances: current user account balance
         """
 
+        aggregate = self.add_trades(TradesAggregate(trading_pair), trades)
+        await self._initialize_metrics_from_aggregate(aggregate, current_balances)
+
+    async def _initialize_metrics_from_aggregate(self,
+                                                 aggregate: TradesAggregate,
+                                                 current_balances: Dict[str, Decimal]):
+        trading_pair = aggregate.trading_pair
         base, quote = split_hb_trading_pair(trading_pair)
-        buys, sells = self._preprocess_trades_and_group_by_type(trades)
+        self._set_volumes(aggregate)
 
-        self.num_buys = len(buys)
-        self.num_sells = len(sells)
+        self.num_buys = aggregate.buys.count
+        self.num_sells = aggregate.sells.count
         self.num_trades = self.num_buys + self.num_sells
 
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
@@ -307,10 +490,10 @@ class PerformanceMetrics:
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = aggregate.first_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = aggregate.last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +501,11 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
+        self._calculate_trade_pnl(aggregate)
 
-        await self._calculate_fees(quote, trades)
+        for fee_token, fee_amount in aggregate.fees.items():
+            self.fees[fee_token] = fee_amount
+        await self._calculate_fee_in_quote(quote)
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
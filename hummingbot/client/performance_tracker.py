@@ -0,0 +1,187 @@
+import logging
+import time
+import weakref
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from hummingbot.client.performance import PerformanceMetrics, TradesAggregate
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+# Market and trading pair of the trades of an aggregate
+MarketKey = Tuple[str, str]
+# Primary key of a TradeFill
+TradeKey = Tuple[str, str, str]
+
+# Minimum seconds between checkpoint saves, as the performance is updated every few seconds by the status monitor
+CHECKPOINT_INTERVAL = 60.0
+
+
+class _TrackedTrades:
+    __slots__ = ("last_trade_timestamp", "trades_count", "last_trade_keys", "aggregates", "checkpoint_time",
+                 "has_unsaved_trades")
+
+    def __init__(self):
+        self.last_trade_timestamp: Optional[int] = None
+        self.trades_count: int = 0
+        self.last_trade_keys: Set[TradeKey] = set()
+        self.aggregates: Dict[MarketKey, TradesAggregate] = {}
+        # Time of the last checkpoint saved, and whether trades were added after it
+        self.checkpoint_time: Optional[float] = None
+        self.has_unsaved_trades: bool = False
+
+
+class PerformanceTracker:
+    """
+    Keeps the running totals of the trades of a config since a start timestamp, for each market and trading pair, to
+    compute the performance metrics without loading all the trades every time.
+    - On every update only the trades filled after the last one added are loaded from the database and added to the
+      totals, which are checkpointed in the PerformanceCheckpoint table, so they are reused after a restart.
+    - The checkpoint is saved at most once every `checkpoint_interval` seconds. The trades added after the last one
+      saved are loaded again after a restart.
+    - Before adding new trades the checkpoint is checked against the number of stored trades up to its last trade. If
+      they don't match (e.g. a trade with an older timestamp was stored later), the totals are computed again from all
+      the trades.
+    The totals are equal to the ones computed by PerformanceMetrics from the list of trades. There is one tracker per
+    trades database.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _trackers: "weakref.WeakKeyDictionary[SQLConnectionManager, PerformanceTracker]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def for_db(cls, sql_manager: SQLConnectionManager) -> "PerformanceTracker":
+        """
+        Returns the tracker of the database, creating it if required
+        """
+        tracker = cls._trackers.get(sql_manager)
+        if tracker is None:
+            tracker = cls(sql_manager)
+            cls._trackers[sql_manager] = tracker
+        return tracker
+
+    def __init__(self, sql_manager: SQLConnectionManager, checkpoint_interval: float = CHECKPOINT_INTERVAL):
+        # The tracker is stored in a dictionary weakly keyed by the connection manager, so it must not keep it alive
+        self._sql_manager_ref = weakref.ref(sql_manager)
+        self._checkpoint_interval = checkpoint_interval
+        self._tracked_trades: Dict[Tuple[str, int], _TrackedTrades] = {}
+
+    def update(self, config_file_path: str, start_timestamp: int) -> Dict[MarketKey, TradesAggregate]:
+        """
+        Adds the trades filled since the last update and returns the totals of each market and trading pair
+        :param config_file_path: the config of the trades, matched as in `history`
+        :param start_timestamp: the timestamp in milliseconds of the first trade included
+        """
+        with self._sql_manager_ref().get_new_session() as session:
+            filters = [TradeFill.timestamp >= start_timestamp,
+                       TradeFill.config_file_path.like(f"%{config_file_path}%")]
+            tracked_trades = self._tracked_trades.get((config_file_path, start_timestamp))
+            if tracked_trades is None:
+                tracked_trades = self._load_checkpoint(session, config_file_path, start_timestamp)
+            if tracked_trades is not None and not self._is_consistent(session, filters, tracked_trades):
+                self.logger().info(f"The performance checkpoint of {config_file_path} doesn't match the stored "
+                                   f"trades, computing it again.")
+                tracked_trades = None
+            if tracked_trades is None:
+                tracked_trades = _TrackedTrades()
+            # Only the totals of the last config and start timestamp requested are kept in memory
+            self._tracked_trades = {(config_file_path, start_timestamp): tracked_trades}
+
+            if tracked_trades.last_trade_timestamp is not None:
+                filters.append(TradeFill.timestamp >= tracked_trades.last_trade_timestamp)
+            new_trades: List[TradeFill] = (session
+                                           .query(TradeFill)
+                                           .filter(*filters)
+                                           .order_by(TradeFill.timestamp)
+                                           .all())
+            if self._add_trades(tracked_trades, new_trades):
+                tracked_trades.has_unsaved_trades = True
+            now = self._time()
+            if tracked_trades.has_unsaved_trades and (tracked_trades.checkpoint_time is None
+                                                      or now - tracked_trades.checkpoint_time >= self._checkpoint_interval):
+                self._save_checkpoint(session, config_file_path, start_timestamp, tracked_trades)
+                tracked_trades.checkpoint_time = now
+                tracked_trades.has_unsaved_trades = False
+        return dict(tracked_trades.aggregates)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+    @staticmethod
+    def _is_consistent(session: Session, filters: List, tracked_trades: _TrackedTrades) -> bool:
+        if tracked_trades.last_trade_timestamp is None:
+            return True
+        stored_trades_count = (session
+                               .query(func.count())
+                               .select_from(TradeFill)
+                               .filter(*filters, TradeFill.timestamp <= tracked_trades.last_trade_timestamp)
+                               .scalar())
+        return stored_trades_count == tracked_trades.trades_count
+
+    @staticmethod
+    def _add_trades(tracked_trades: _TrackedTrades, trades: List[TradeFill]) -> bool:
+        trades_by_market: Dict[MarketKey, List[TradeFill]] = {}
+        for trade in trades:
+            trade_key = (trade.market, trade.order_id, trade.exchange_trade_id)
+            if trade.timestamp == tracked_trades.last_trade_timestamp:
+                if trade_key in tracked_trades.last_trade_keys:
+                    continue
+                tracked_trades.last_trade_keys.add(trade_key)
+            else:
+                tracked_trades.last_trade_timestamp = trade.timestamp
+                tracked_trades.last_trade_keys = {trade_key}
+            trades_by_market.setdefault((trade.market, trade.symbol), []).append(trade)
+            tracked_trades.trades_count += 1
+
+        for (market, symbol), market_trades in trades_by_market.items():
+            aggregate = tracked_trades.aggregates.get((market, symbol))
+            if aggregate is None:
+                aggregate = TradesAggregate(symbol)
+                tracked_trades.aggregates[(market, symbol)] = aggregate
+            PerformanceMetrics.add_trades(aggregate, market_trades)
+        return len(trades_by_market) > 0
+
+    @staticmethod
+    def _load_checkpoint(session: Session, config_file_path: str, start_timestamp: int) -> Optional[_TrackedTrades]:
+        checkpoint: Optional[PerformanceCheckpoint] = (session
+                                                       .query(PerformanceCheckpoint)
+                                                       .filter(PerformanceCheckpoint.config_file_path == config_file_path,
+                                                               PerformanceCheckpoint.start_timestamp == start_timestamp)
+                                                       .one_or_none())
+        if checkpoint is None:
+            return None
+        tracked_trades = _TrackedTrades()
+        tracked_trades.last_trade_timestamp = checkpoint.last_trade_timestamp
+        tracked_trades.trades_count = checkpoint.trades_count
+        tracked_trades.last_trade_keys = set(tuple(trade_key) for trade_key in checkpoint.last_trade_keys)
+        try:
+            tracked_trades.aggregates = {(market, aggregate["trading_pair"]): TradesAggregate.from_json(aggregate)
+                                         for market, aggregate in checkpoint.aggregates}
+        except KeyError:
+            # Checkpoints stored in a previous format are not used
+            return None
+        return tracked_trades
+
+    @staticmethod
+    def _save_checkpoint(session: Session, config_file_path: str, start_timestamp: int, tracked_trades: _TrackedTrades):
+        # Checkpoints of previous runs of the config are not used anymore
+        session.query(PerformanceCheckpoint).filter(PerformanceCheckpoint.config_file_path == config_file_path).delete()
+        session.add(PerformanceCheckpoint(
+            config_file_path=config_file_path,
+            start_timestamp=start_timestamp,
+            last_trade_timestamp=tracked_trades.last_trade_timestamp,
+            trades_count=tracked_trades.trades_count,
+            last_trade_keys=[list(trade_key) for trade_key in tracked_trades.last_trade_keys],
+            aggregates=[[market, aggregate.to_json()] for (market, _), aggregate in tracked_trades.aggregates.items()],
+        ))
+        session.commit()
@@ -1,14 +1,13 @@
 import asyncio
 from decimal import Decimal
-from typing import List, Optional, Set, Tuple
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 import psutil
 import tabulate
 
 from hummingbot.client.config.config_data_types import ClientConfigEnum
-from hummingbot.client.performance import PerformanceMetrics
-from hummingbot.model.trade_fill import TradeFill
+from hummingbot.client.performance import PerformanceMetrics, TradesAggregate
 
 s_decimal_0 = Decimal("0")
 
@@ -66,29 +65,25 @@ async def start_trade_monitor(trade_monitor):
         try:
             if hb.strategy_task is not None and not hb.strategy_task.done():
                 if all(market.ready for market in hb.markets.values()):
-                    with hb.trade_fill_db.get_new_session() as session:
-                        trades: List[TradeFill] = hb._get_trades_from_session(
-                            int(hb.init_time * 1e3),
-                            session=session,
-                            config_file_path=hb.strategy_file_name)
-                        if len(trades) > 0:
-                            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                            for market, symbol in market_info:
-                                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-                                cur_balances = await hb.get_current_balances(market)
-                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
-                                return_pcts.append(perf.return_pct)
-                                pnls.append(perf.total_pnl)
-                            avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
-                            quote_assets = set(t.symbol.split("-")[1] for t in trades)
-                            if len(quote_assets) == 1:
-                                total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
-                            else:
-                                total_pnls = "N/A"
-                            trade_monitor.log(f"Trades: {len(trades)}, Total P&L: {total_pnls}, "
-                                              f"Return %: {avg_return:.2%}")
-                            return_pcts.clear()
-                            pnls.clear()
+                    # Only the trades filled since the previous update are loaded
+                    aggregates: Dict[Tuple[str, str], TradesAggregate] = hb.get_session_trades_aggregates()
+                    if len(aggregates) > 0:
+                        for (market, symbol), aggregate in aggregates.items():
+                            cur_balances = await hb.get_current_balances(market)
+                            perf = await PerformanceMetrics.create_from_aggregate(aggregate, cur_balances)
+                            return_pcts.append(perf.return_pct)
+                            pnls.append(perf.total_pnl)
+                        avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+                        quote_assets = set(symbol.split("-")[1] for _, symbol in aggregates)
+                        if len(quote_assets) == 1:
+                            total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
+                        else:
+                            total_pnls = "N/A"
+                        trades_count = sum(aggregate.num_trades for aggregate in aggregates.values())
+                        trade_monitor.log(f"Trades: {trades_count}, Total P&L: {total_pnls}, "
+                                          f"Return %: {avg_return:.2%}")
+                        return_pcts.clear()
+                        pnls.clear()
             await _sleep(2)  # sleeping for longer to manage resources
         except asyncio.CancelledError:
             raise
@@ -2,8 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Collection, Dict, Iterator, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -29,12 +28,44 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersByExchangeOrderId(Mapping):
+    """
+    Read-only view of a group of the orders of a ClientOrderTracker (active, cached and/or lost orders) by exchange
+    order ID. Lookups use the index of the tracker, so the orders are not copied.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", groups: Collection[str]):
+        self._tracker = tracker
+        self._groups = groups
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker.fetch_order_by_exchange_order_id(exchange_order_id, groups=self._groups)
+        if order is None:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([exchange_order_id for exchange_order_id in self._tracker.indexed_exchange_order_ids()
+                     if exchange_order_id in self])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, exchange_order_id: object) -> bool:
+        return self._tracker.fetch_order_by_exchange_order_id(exchange_order_id, groups=self._groups) is not None
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
     CACHED_ORDER_TTL = 30.0  # seconds
     TRADE_FILLS_WAIT_TIMEOUT = 5  # seconds
 
+    # Groups of tracked orders
+    ACTIVE = "active"
+    CACHED = "cached"
+    LOST = "lost"
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global cot_logger
@@ -62,6 +93,13 @@ class ClientOrderTracker:
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+        # Index of the tracked orders by exchange order ID. Orders get their exchange order ID after they are tracked,
+        # and cached orders expire, so the index is checked against the tracked orders on every lookup.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        # Tracked orders that had no exchange order ID when indexed, by client order ID
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._index_cleanup_size = self.MAX_CACHE_SIZE
+
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
         """
@@ -91,15 +129,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders, **self.lost_orders}
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(tracker=self, groups=(self.ACTIVE, self.CACHED, self.LOST))
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
@@ -109,14 +143,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.lost_orders}
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(tracker=self, groups=(self.ACTIVE, self.LOST))
 
     @property
     def current_timestamp(self) -> int:
@@ -142,6 +173,7 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -162,6 +194,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,38 +205,64 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._cached_orders.get(client_order_id) or self._in_flight_orders.get(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            found_order = self.fetch_order_by_exchange_order_id(exchange_order_id, groups=(self.ACTIVE, self.CACHED))
 
         return found_order
 
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._lost_orders.get(client_order_id)
 
-        if client_order_id in self._lost_orders:
-            found_order = self._lost_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self.fetch_order_by_exchange_order_id(exchange_order_id, groups=(self.LOST,))
 
         return found_order
 
+    def fetch_order_by_exchange_order_id(
+        self, exchange_order_id: str, groups: Collection[str] = (ACTIVE, CACHED, LOST)
+    ) -> Optional[InFlightOrder]:
+        """
+        Returns the tracked order with the exchange order ID, if it belongs to one of the groups of orders
+
+        :param exchange_order_id: the exchange order ID of the order
+        :param groups: the groups of orders to search (ACTIVE, CACHED and/or LOST)
+        """
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None and len(self._orders_without_exchange_order_id) > 0:
+            self._index_orders_without_exchange_order_id()
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None:
+            return None
+
+        group = self._order_group(order)
+        if group is None or order.exchange_order_id != exchange_order_id:
+            # The order is no longer tracked, or its exchange order ID changed
+            del self._orders_by_exchange_order_id[exchange_order_id]
+            if group is not None:
+                self._index_order(order)
+            return None
+        return order if group in groups else None
+
+    def indexed_exchange_order_ids(self) -> Iterator[str]:
+        """
+        Returns the exchange order IDs in the index, including the ones of orders that are no longer tracked
+        """
+        self._index_orders_without_exchange_order_id()
+        return iter(list(self._orders_by_exchange_order_id))
+
     def process_order_update(self, order_update: OrderUpdate):
         return safe_ensure_future(self._process_order_update(order_update))
 
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = (self._lost_orders.get(client_order_id)
+                                                  or self._cached_orders.get(client_order_id)
+                                                  or self._in_flight_orders.get(client_order_id))
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -219,6 +278,7 @@ class ClientOrderTracker:
                     trade_id=trade_update.trade_id,
                     exchange_order_id=trade_update.exchange_order_id,
                 )
+            self._index_order(tracked_order)
 
     async def process_order_not_found(self, client_order_id: str):
         """
@@ -290,6 +350,7 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            self._index_order(tracked_order)
             if updated:
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -301,6 +362,7 @@ class ClientOrderTracker:
                 if order_update.new_state in [OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED]:
                     # If the order officially reaches a final state after being lost it should be removed from the lost list
                     del self._lost_orders[lost_order.client_order_id]
+                    self._unindex_order(lost_order)
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
@@ -439,6 +501,50 @@ class ClientOrderTracker:
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
+    def _order_group(self, order: InFlightOrder) -> Optional[str]:
+        client_order_id = order.client_order_id
+        if self._in_flight_orders.get(client_order_id) is order:
+            return self.ACTIVE
+        if self._cached_orders.get(client_order_id) is order:
+            return self.CACHED
+        if self._lost_orders.get(client_order_id) is order:
+            return self.LOST
+        return None
+
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+            return
+        self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+        self._orders_by_exchange_order_id[order.exchange_order_id] = order
+        if len(self._orders_by_exchange_order_id) > self._index_cleanup_size:
+            self._remove_untracked_orders_from_index()
+
+    def _index_orders_without_exchange_order_id(self):
+        # The exchange order ID could have been assigned since the orders were indexed
+        for order in list(self._orders_without_exchange_order_id.values()):
+            if self._order_group(order) is None:
+                del self._orders_without_exchange_order_id[order.client_order_id]
+            elif order.exchange_order_id is not None:
+                self._index_order(order)
+
+    def _unindex_order(self, order: InFlightOrder):
+        self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+        if self._orders_by_exchange_order_id.get(order.exchange_order_id) is order:
+            del self._orders_by_exchange_order_id[order.exchange_order_id]
+
+    def _remove_untracked_orders_from_index(self):
+        # Cached orders leave the index when they expire, removed in bulk to keep the cost of indexing constant
+        self._orders_by_exchange_order_id = {
+            exchange_order_id: order for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+            if self._order_group(order) is not None and order.exchange_order_id == exchange_order_id
+        }
+        self._orders_without_exchange_order_id = {
+            client_order_id: order for client_order_id, order in self._orders_without_exchange_order_id.items()
+            if self._order_group(order) is not None
+        }
+        self._index_cleanup_size = max(self.MAX_CACHE_SIZE, 2 * len(self._orders_by_exchange_order_id))
+
     @staticmethod
     def _restore_order_from_json(serialized_order: Dict):
         order = InFlightOrder.from_json(serialized_order)
@@ -17,6 +17,8 @@ cdef class ConnectorBase(NetworkIterator):
         public object _trade_fee_schema
         public object _trade_volume_metric_collector
         public object _client_config
+        public object _order_fill_ledger
+        object _order_fill_forwarder
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
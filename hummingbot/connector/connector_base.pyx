@@ -5,6 +5,7 @@ from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.order_fill_ledger import OrderFillLedger
 from hummingbot.connector.utils import split_hb_trading_pair, TradeFillOrderDetails
 from hummingbot.connector.constants import s_decimal_NaN, s_decimal_0
 from hummingbot.core.clock cimport Clock
@@ -12,6 +13,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -43,15 +45,23 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionUpdateFailure,
         MarketEvent.RangePositionFeeCollected,
     ]
+    # Number of most recent order fill events kept in the event logs
+    ORDER_FILLED_EVENTS_WINDOW = 1000
+    # Number of most recent fill timestamps for which the filled balances are kept
+    ORDER_FILL_CHECKPOINTS_WINDOW = 10000
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name,
+                                         order_filled_events_window=self.ORDER_FILLED_EVENTS_WINDOW)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        self._order_fill_ledger = OrderFillLedger(max_checkpoints=self.ORDER_FILL_CHECKPOINTS_WINDOW)
+        self._order_fill_forwarder = EventForwarder(self._order_fill_ledger.add_fill)
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._order_fill_forwarder)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -139,27 +149,12 @@ cdef class ConnectorBase(NetworkIterator):
         Calculates total asset balance changes from filled orders since the timestamp
         For BUY filled order, the quote balance goes down while the base balance goes up, and for SELL order, it's the
         opposite. This does not account for fee.
+        The changes are kept by the order fill ledger as fills happen, so they don't depend on the fill events still
+        kept in the event logs.
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
-        balances = {}
-        for event in order_filled_events:
-            base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
-        return balances
+        return self._order_fill_ledger.balances_since(starting_timestamp)
 
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
@@ -524,7 +519,7 @@ cdef class ConnectorBase(NetworkIterator):
         """
         # Assume (market, exchange_trade_id, trading_pair) are unique. Also order has to be recorded in Order table
         return (not TradeFillOrderDetails(self.display_name, exchange_trade_id, trading_pair) in self._current_trade_fills) and \
-               (exchange_order_id in set(self._exchange_order_ids.keys()))
+               (exchange_order_id in self._exchange_order_ids)
 
     def trade_fee_schema(self):
         if self._trade_fee_schema is None:
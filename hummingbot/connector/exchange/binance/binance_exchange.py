@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 from bidict import bidict
 
@@ -16,6 +16,8 @@ from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
+from hummingbot.core.api_throttler.async_sliding_window_throttler import SlidingWindowAsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -32,6 +34,9 @@ if TYPE_CHECKING:
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    # Snapshots consume 100 of the 6000 request weight per minute, the throttler spreads them when many pairs are used
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS = 5
+    COALESCE_ORDER_BOOK_DIFF_MESSAGES = True
 
     web_utils = web_utils
 
@@ -77,6 +82,10 @@ class BinanceExchange(ExchangePyBase):
     def rate_limits_rules(self):
         return CONSTANTS.RATE_LIMITS
 
+    @property
+    def throttler_class(self) -> Type[AsyncThrottlerBase]:
+        return SlidingWindowAsyncThrottler
+
     @property
     def domain(self):
         return self._domain
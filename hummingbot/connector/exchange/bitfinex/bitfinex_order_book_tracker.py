@@ -32,6 +32,7 @@ class BitfinexOrderBookTracker(OrderBookTracker):
     _logger: Optional[HummingbotLogger] = None
 
     EXCEPTION_TIME_SLEEP = 5.0
+    ROUTE_DIFF_MESSAGES_DIRECTLY = False
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
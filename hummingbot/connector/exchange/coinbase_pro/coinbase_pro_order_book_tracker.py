@@ -22,6 +22,7 @@ from hummingbot.logger import HummingbotLogger
 
 class CoinbaseProOrderBookTracker(OrderBookTracker):
     _cbpobt_logger: Optional[HummingbotLogger] = None
+    ROUTE_DIFF_MESSAGES_DIRECTLY = False
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -2,9 +2,12 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Type
 
 from async_timeout import timeout
 
@@ -15,6 +18,7 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -31,6 +35,7 @@ from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.data_feed.market_data_recorder import MarketDataRecorder
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -45,6 +50,11 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    MAX_CONCURRENT_ORDER_UPDATE_REQUESTS = 10
+    # Number of order book snapshots requested concurrently during startup (None to initialize them one by one)
+    MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS: Optional[int] = None
+    # Merge pending diff messages when processing lags behind (only for diffs with list rows of absolute amounts)
+    COALESCE_ORDER_BOOK_DIFF_MESSAGES: bool = False
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,9 +70,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._last_order_reconciliation_latency: float = 0
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = self.throttler_class(
             rate_limits=self.rate_limits_rules,
             limits_share_percentage=client_config_map.rate_limits_share_pct)
         self._poll_notifier = asyncio.Event()
@@ -76,13 +87,17 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            max_concurrent_initializations=self.MAX_CONCURRENT_ORDER_BOOK_INITIALIZATIONS,
+            coalesce_diff_messages=self.COALESCE_ORDER_BOOK_DIFF_MESSAGES))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        self._market_data_recorder: Optional[MarketDataRecorder] = None
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -104,6 +119,14 @@ class ExchangePyBase(ExchangeBase, ABC):
     def rate_limits_rules(self) -> List[RateLimit]:
         raise NotImplementedError
 
+    @property
+    def throttler_class(self) -> Type[AsyncThrottlerBase]:
+        """
+        The throttler engine used by the connector. Connectors handling a high number of requests can override it to
+        return SlidingWindowAsyncThrottler.
+        """
+        return AsyncThrottler
+
     @property
     @abstractmethod
     def domain(self) -> str:
@@ -183,6 +206,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    @property
+    def last_order_reconciliation_latency(self) -> float:
+        """
+        Returns the duration in seconds of the last order fills and status update cycle, either for the active orders
+        or for the lost orders
+        """
+        return self._last_order_reconciliation_latency
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -694,6 +725,33 @@ class ExchangePyBase(ExchangeBase, ABC):
             return NetworkStatus.NOT_CONNECTED
         return NetworkStatus.CONNECTED
 
+    @property
+    def market_data_recorder(self) -> Optional[MarketDataRecorder]:
+        return self._market_data_recorder
+
+    def start_market_data_recorder(self, data_dir: Optional[str] = None, **kwargs) -> MarketDataRecorder:
+        """
+        Starts recording the order book diffs, snapshots and trades of the connector trading pairs, as they are
+        processed by the order book tracker. The recording is not interrupted when the network is restarted.
+        :param data_dir: directory of the recordings, data/market_data if not provided
+        :param kwargs: other arguments of the MarketDataRecorder
+        :return: the recorder, that can be used to read the recorded data
+        """
+        if self._market_data_recorder is None:
+            self._market_data_recorder = MarketDataRecorder(connector_name=self.name, data_dir=data_dir, **kwargs)
+            self._market_data_recorder.start()
+            self.order_book_tracker.start_recording(self._market_data_recorder)
+        return self._market_data_recorder
+
+    def stop_market_data_recorder(self):
+        """
+        Stops the recording, writing the pending data to disk.
+        """
+        if self._market_data_recorder is not None:
+            self.order_book_tracker.stop_recording()
+            self._market_data_recorder.stop()
+            self._market_data_recorder = None
+
     def _stop_network(self):
         # Resets timestamps and events for status_polling_loop
         self._last_poll_timestamp = 0
@@ -951,18 +1009,53 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        orders_to_request = await self._process_bulk_trade_updates(orders=orders)
+        await self._execute_order_update_requests(
+            requests=[partial(self._update_order_fills, order=order) for order in orders_to_request]
+        )
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+    async def _process_bulk_trade_updates(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Requests the trade updates for all the orders of each trading pair with a single request, for the connectors
+        implementing `_all_trade_updates_for_trading_pair`.
+        :return: the orders that could not be resolved with bulk requests and have to be requested one by one
+        """
+        results = await self._execute_order_update_requests(
+            requests=[partial(self._bulk_trade_updates_for_trading_pair, trading_pair=trading_pair, orders=pair_orders)
+                      for trading_pair, pair_orders in self._group_orders_by_trading_pair(orders=orders).items()]
+        )
+        return [order for unresolved_orders in results for order in unresolved_orders]
+
+    async def _bulk_trade_updates_for_trading_pair(
+            self, trading_pair: str, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        try:
+            trade_updates = await self._all_trade_updates_for_trading_pair(trading_pair=trading_pair, orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for {trading_pair}. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+        if trade_updates is None:
+            return orders
+        for trade_update in trade_updates:
+            self._order_tracker.process_trade_update(trade_update)
+        return []
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -991,14 +1084,76 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
+        orders_to_request = await self._process_bulk_order_updates(orders=orders)
+        await self._execute_order_update_requests(
+            requests=[partial(self._update_order_with_error_handler, order=order, error_handler=error_handler)
+                      for order in orders_to_request]
+        )
+
+    async def _update_order_with_error_handler(self, order: InFlightOrder, error_handler: Callable):
+        try:
+            order_update = await self._request_order_status(tracked_order=order)
+            self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            await error_handler(order, request_error)
+
+    async def _process_bulk_order_updates(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Requests the status of the orders of each trading pair with a single request, for the connectors implementing
+        `_request_order_updates_for_trading_pair`.
+        :return: the orders not included in the bulk responses, that have to be requested one by one
+        """
+        results = await self._execute_order_update_requests(
+            requests=[partial(self._bulk_order_updates_for_trading_pair, trading_pair=trading_pair, orders=pair_orders)
+                      for trading_pair, pair_orders in self._group_orders_by_trading_pair(orders=orders).items()]
+        )
+        return [order for unresolved_orders in results for order in unresolved_orders]
+
+    async def _bulk_order_updates_for_trading_pair(
+            self, trading_pair: str, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        try:
+            order_updates = await self._request_order_updates_for_trading_pair(trading_pair=trading_pair, orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch order updates for {trading_pair}. Error: {request_error}",
+                exc_info=request_error,
+            )
+            return orders
+        if order_updates is None:
+            return orders
+        updated_order_ids = set()
+        for order_update in order_updates:
+            self._order_tracker.process_order_update(order_update)
+            updated_order_ids.add(order_update.client_order_id)
+        return [order for order in orders if order.client_order_id not in updated_order_ids]
+
+    async def _execute_order_update_requests(self, requests: List[Callable[[], Awaitable[Any]]]) -> List[Any]:
+        """
+        Executes the order update requests concurrently. The number of requests in progress is bounded by
+        MAX_CONCURRENT_ORDER_UPDATE_REQUESTS, and each request is still subject to the connector throttler limits.
+        :param requests: callables returning the coroutine of each request
+        :return: the results of the requests, in the same order
+        """
+        if len(requests) == 0:
+            return []
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_ORDER_UPDATE_REQUESTS)
+
+        async def _bounded_request(request: Callable[[], Awaitable[Any]]):
+            async with semaphore:
+                return await request()
+
+        return await safe_gather(*[_bounded_request(request) for request in requests])
+
+    @staticmethod
+    def _group_orders_by_trading_pair(orders: List[InFlightOrder]) -> Dict[str, List[InFlightOrder]]:
+        orders_by_trading_pair = defaultdict(list)
         for order in orders:
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
-                self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                await error_handler(order, request_error)
+            orders_by_trading_pair[order.trading_pair].append(order)
+        return orders_by_trading_pair
 
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
@@ -1013,12 +1168,33 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
+        start = time.perf_counter()
         await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
+        fills_update_end = time.perf_counter()
         await self._update_orders()
+        self._register_order_reconciliation_latency(
+            fills_latency=fills_update_end - start,
+            status_latency=time.perf_counter() - fills_update_end,
+            orders_count=len(self.in_flight_orders),
+        )
 
     async def _update_lost_orders_status(self):
+        start = time.perf_counter()
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
+        fills_update_end = time.perf_counter()
         await self._update_lost_orders()
+        self._register_order_reconciliation_latency(
+            fills_latency=fills_update_end - start,
+            status_latency=time.perf_counter() - fills_update_end,
+            orders_count=len(self._order_tracker.lost_orders),
+        )
+
+    def _register_order_reconciliation_latency(self, fills_latency: float, status_latency: float, orders_count: int):
+        self._last_order_reconciliation_latency = fills_latency + status_latency
+        self.logger().debug(
+            f"Order status update cycle for {orders_count} orders took {self._last_order_reconciliation_latency:.3f}s "
+            f"(fills: {fills_latency:.3f}s, status: {status_latency:.3f}s)"
+        )
 
     async def _cancel_lost_orders(self):
         for _, lost_order in self._order_tracker.lost_orders.items():
@@ -1050,6 +1226,30 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_order_updates_for_trading_pair(
+            self, trading_pair: str, orders: List[InFlightOrder]) -> Optional[List[OrderUpdate]]:
+        """
+        Bulk alternative to `_request_order_status`. Connectors supporting a request to get the status of many orders
+        at once (i.e. the open orders for a trading pair) can override it.
+        The orders without an update in the returned list are requested individually with `_request_order_status`.
+        :param trading_pair: the trading pair of the orders
+        :param orders: the tracked orders to update
+        :return: the order updates, or None if bulk status requests are not supported
+        """
+        return None
+
+    async def _all_trade_updates_for_trading_pair(
+            self, trading_pair: str, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        """
+        Bulk alternative to `_all_trade_updates_for_order`. Connectors supporting a request to get all the account
+        trades for a trading pair since a timestamp can override it, using the creation timestamp of the oldest order.
+        The returned list must include the trade updates for all the orders (it is not retried per order).
+        :param trading_pair: the trading pair of the orders
+        :param orders: the tracked orders to get the trades for
+        :return: the trade updates, or None if bulk trade requests are not supported
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
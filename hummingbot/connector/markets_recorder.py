@@ -5,6 +5,7 @@ import os.path
 import threading
 import time
 from decimal import Decimal
+from functools import partial
 from shutil import move
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -45,10 +46,17 @@ from hummingbot.model.range_position_collected_fees import RangePositionCollecte
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.write_behind_queue import WriteBehindQueue, WriteBehindQueueStats
 from hummingbot.smart_components.models.executors_info import ExecutorInfo
 
 
 class MarketsRecorder:
+    """
+    Records the orders, trades and market states of the markets in the database.
+    The records are written by a `WriteBehindQueue` while the recorder is started: the event handlers only create the
+    records and queue their writes, which are committed in batches in a separate thread. The market states are saved
+    once per batch and market, however many events the market had.
+    """
     _logger = None
     _shared_instance: "MarketsRecorder" = None
     market_event_tag_map: Dict[int, MarketEvent] = {
@@ -84,12 +92,12 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._write_queue: WriteBehindQueue = WriteBehindQueue(sql_manager=sql)
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
+        trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
+        trade_fill_details = {TradeFillOrderDetails(tf.market, tf.exchange_trade_id, tf.symbol) for tf in trade_fills}
         for market in self._markets:
-            trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
-            market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
-                                                                               tf.exchange_trade_id,
-                                                                               tf.symbol) for tf in trade_fills})
+            market.add_trade_fills_from_market_recorder(set(trade_fill_details))
 
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
@@ -131,28 +139,28 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    market_data_records: List[MarketData] = []
+                    for market in self._markets:
+                        exchange = market.display_name
+                        for trading_pair in market.trading_pairs:
+                            mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                            best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                            best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                            order_book = market.get_order_book(trading_pair)
+                            depth = self._market_data_collection_config.market_data_collection_depth + 1
+                            market_data = MarketData(
+                                timestamp=self.db_timestamp,
+                                exchange=exchange,
+                                trading_pair=trading_pair,
+                                mid_price=mid_price,
+                                best_bid=best_bid,
+                                best_ask=best_ask,
+                                order_book={
+                                    "bid": list(order_book.bid_entries())[:depth],
+                                    "ask": list(order_book.ask_entries())[:depth]}
+                            )
+                            market_data_records.append(market_data)
+                    self._write_queue.put(lambda session: session.add_all(market_data_records))
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -176,7 +184,15 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue_stats(self) -> WriteBehindQueueStats:
+        """
+        Queue depth and commit latency of the records waiting to be written to the database
+        """
+        return self._write_queue.stats
+
     def start(self):
+        self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -189,6 +205,14 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        # Writes the queued records before returning
+        self._write_queue.stop()
+
+    async def flush(self):
+        """
+        Writes the queued records to the database
+        """
+        await self._write_queue.flush()
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -244,17 +268,35 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
+        self._save_market_states_snapshot(config_file_path, market, market.tracking_states, self.db_timestamp, session)
+
+    def _queue_market_states_save(self, market: ConnectorBase):
+        # Only the last state of the market is saved with each batch of writes
+        def prepare_write():
+            saved_state = market.tracking_states
+            timestamp = self.db_timestamp
+
+            def write(session: Session):
+                self._save_market_states_snapshot(self._config_file_path, market, saved_state, timestamp, session)
+            return write
+
+        self._write_queue.put_coalesced(key=(self._config_file_path, market.display_name), prepare_write=prepare_write)
+
+    def _save_market_states_snapshot(self,
+                                     config_file_path: str,
+                                     market: ConnectorBase,
+                                     saved_state: Dict[str, any],
+                                     timestamp: int,
+                                     session: Session):
         market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
-
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
                                         market=market.display_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -287,31 +329,33 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+
+        def write(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._write_queue.put(write)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._queue_market_states_save(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -326,57 +370,59 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            # The CSV row is built in the transaction to read the order, and appended once the fill is committed
+            csv_path, field_names, field_data = self._trade_csv_row(trade_fill_record)
+            return partial(self._append_row_to_csv, csv_path, field_names, field_data)
+
+        self._write_queue.put(write)
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._queue_market_states_save(market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -388,19 +434,20 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market.display_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._write_queue.put(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -408,6 +455,10 @@ class MarketsRecorder:
         return tuple(df.iloc[0].values) == header
 
     def append_to_csv(self, trade: TradeFill):
+        self._append_row_to_csv(*self._trade_csv_row(trade))
+
+    @staticmethod
+    def _trade_csv_row(trade: TradeFill) -> Tuple[str, tuple, tuple]:
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -420,7 +471,9 @@ class MarketsRecorder:
             '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return csv_path, field_names, field_data
 
+    def _append_row_to_csv(self, csv_path: str, field_names: tuple, field_data: tuple):
         if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
             move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
 
@@ -446,18 +499,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write_queue.put(write)
+        self._queue_market_states_save(market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -493,15 +547,13 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._write_queue.put(lambda session: session.add(rp_update))
+        self._queue_market_states_save(connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -511,17 +563,15 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._write_queue.put(lambda session: session.add(rp_fees))
+        self._queue_market_states_save(connector)
 
     @staticmethod
     async def _sleep(delay):
@@ -0,0 +1,100 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.events import OrderFilledEvent
+
+s_decimal_0 = Decimal("0")
+
+
+class OrderFillLedger:
+    """
+    Keeps the balance changes of the filled orders of a connector by token, so the changes since a timestamp are
+    computed without going through the fill events.
+    For BUY fills the quote balance goes down while the base balance goes up, and for SELL fills it's the opposite.
+    Fees are not accounted for.
+    - The totals of all the fills are updated with each fill.
+    - A checkpoint with the totals of the fills up to each fill timestamp is kept for the most recent
+      `max_checkpoints` timestamps. Fills with a timestamp older than the last one are added to the checkpoints after
+      them.
+    - The changes since a timestamp older than the retained checkpoints only include the fills after the newest
+      discarded checkpoint, unless the timestamp is older than all the fills.
+    """
+
+    def __init__(self, max_checkpoints: int = 10000):
+        self._max_checkpoints = max_checkpoints
+        self._fills_count = 0
+        self._first_timestamp: Optional[float] = None
+        self._totals: Dict[str, Decimal] = {}
+        # Checkpoint timestamps in ascending order, and the totals of the fills up to each of them (both included)
+        self._checkpoint_timestamps: List[float] = []
+        self._checkpoint_balances: List[Dict[str, Decimal]] = []
+        # Totals of the fills up to the newest discarded checkpoint
+        self._discarded_timestamp: Optional[float] = None
+        self._discarded_balances: Dict[str, Decimal] = {}
+        self._trading_pair_assets: Dict[str, Tuple[str, str]] = {}
+
+    @property
+    def fills_count(self) -> int:
+        return self._fills_count
+
+    @property
+    def checkpoints_count(self) -> int:
+        return len(self._checkpoint_timestamps)
+
+    def add_fill(self, event: OrderFilledEvent):
+        assets = self._trading_pair_assets.get(event.trading_pair)
+        if assets is None:
+            assets = split_hb_trading_pair(event.trading_pair)
+            self._trading_pair_assets[event.trading_pair] = assets
+        base, quote = assets
+        if event.trade_type is TradeType.BUY:
+            changes = ((base, event.amount), (quote, Decimal("-1") * event.price * event.amount))
+        else:
+            changes = ((base, Decimal("-1") * event.amount), (quote, event.price * event.amount))
+
+        timestamp = event.timestamp
+        self._fills_count += 1
+        if self._first_timestamp is None or timestamp < self._first_timestamp:
+            self._first_timestamp = timestamp
+        self._add_changes(self._totals, changes)
+
+        index = bisect_right(self._checkpoint_timestamps, timestamp)
+        for balances in self._checkpoint_balances[index:]:
+            self._add_changes(balances, changes)
+        if self._discarded_timestamp is not None and timestamp <= self._discarded_timestamp:
+            self._add_changes(self._discarded_balances, changes)
+        elif index > 0 and self._checkpoint_timestamps[index - 1] == timestamp:
+            self._add_changes(self._checkpoint_balances[index - 1], changes)
+        else:
+            previous_balances = self._checkpoint_balances[index - 1] if index > 0 else self._discarded_balances
+            balances = dict(previous_balances)
+            self._add_changes(balances, changes)
+            self._checkpoint_timestamps.insert(index, timestamp)
+            self._checkpoint_balances.insert(index, balances)
+            self._discard_old_checkpoints()
+
+    def balances_since(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        Returns the balance changes of the fills with a timestamp after `starting_timestamp`
+        """
+        if self._first_timestamp is None or starting_timestamp < self._first_timestamp:
+            return dict(self._totals)
+        index = bisect_right(self._checkpoint_timestamps, starting_timestamp)
+        previous_balances = self._checkpoint_balances[index - 1] if index > 0 else self._discarded_balances
+        return {token: total - previous_balances.get(token, s_decimal_0) for token, total in self._totals.items()}
+
+    def _discard_old_checkpoints(self):
+        discarded_count = len(self._checkpoint_timestamps) - self._max_checkpoints
+        if discarded_count > 0:
+            self._discarded_timestamp = self._checkpoint_timestamps[discarded_count - 1]
+            self._discarded_balances = self._checkpoint_balances[discarded_count - 1]
+            del self._checkpoint_timestamps[:discarded_count]
+            del self._checkpoint_balances[:discarded_count]
+
+    @staticmethod
+    def _add_changes(balances: Dict[str, Decimal], changes: Tuple[Tuple[str, Decimal], ...]):
+        for token, change in changes:
+            balances[token] = balances.get(token, s_decimal_0) + change
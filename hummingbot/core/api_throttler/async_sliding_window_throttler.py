@@ -0,0 +1,244 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+
+class LimitWindow:
+    """
+    Sliding window of the weights consumed for a single limit_id.
+    Entries are stored in arrival order together with their expiration timestamp, so the running total of the used
+    weight can be kept up to date by only evicting entries from the head of the window.
+    """
+
+    __slots__ = ("_entries", "_used_weight")
+
+    def __init__(self):
+        self._entries: Deque[Tuple[float, int]] = deque()
+        self._used_weight: int = 0
+
+    @property
+    def used_weight(self) -> int:
+        return self._used_weight
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def evict(self, now: float):
+        """
+        Removes the entries that expired at or before `now`
+        """
+        entries = self._entries
+        while entries and entries[0][0] <= now:
+            _, weight = entries.popleft()
+            self._used_weight -= weight
+
+    def record(self, expiration_timestamp: float, weight: int):
+        self._entries.append((expiration_timestamp, weight))
+        self._used_weight += weight
+
+    def has_capacity(self, limit: int, weight: int) -> bool:
+        return self._used_weight + weight <= limit
+
+    def next_capacity_timestamp(self, limit: int, weight: int) -> Optional[float]:
+        """
+        Calculates the timestamp at which enough weight will have expired to accept a new task with `weight`
+        :return: the timestamp, or None if the weight can never fit in the limit
+        """
+        excess = self._used_weight + weight - limit
+        if excess <= 0:
+            return 0.0
+        if weight > limit:
+            return None
+        freed = 0
+        for expiration_timestamp, entry_weight in self._entries:
+            freed += entry_weight
+            if freed >= excess:
+                return expiration_timestamp
+        return None
+
+
+class PendingRequest:
+    __slots__ = ("requirements", "future")
+
+    def __init__(self, requirements: List[Tuple[RateLimit, int]], future: asyncio.Future):
+        self.requirements = requirements
+        self.future = future
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits in the throttler queue until all the rate limits
+    associated with the request have capacity for it.
+    """
+
+    def __init__(self,
+                 throttler: "SlidingWindowAsyncThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]]):
+        self._throttler = throttler
+        self._rate_limit = rate_limit
+        self._related_limits = related_limits
+
+    async def acquire(self):
+        if self._rate_limit is not None:
+            requirements = [(self._rate_limit, self._rate_limit.weight)] + self._related_limits
+            await self._throttler.acquire_capacity(requirements=requirements)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class SlidingWindowAsyncThrottler(AsyncThrottlerBase):
+    """
+    Throttler engine with the same RateLimit and LinkedLimitWeightPair semantics as AsyncThrottler, intended for
+    connectors that process a high number of requests.
+    Instead of a shared list of TaskLog, it keeps one sliding window per limit_id with a running total of the used
+    weight, so checking the capacity of a request only requires evicting the expired entries of the limits involved.
+    Requests that can not be executed immediately are queued in FIFO order and woken up by a timer scheduled at the
+    exact time when the capacity they need is freed, instead of polling every `retry_interval`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._windows: Dict[str, LimitWindow] = {}
+        self._pending_requests: Deque[PendingRequest] = deque()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    def execute_task(self, limit_id: str) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return SlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+        )
+
+    def used_capacity(self, limit_id: str) -> int:
+        """
+        Returns the weight consumed for the limit in its current time window
+        """
+        window = self._windows.get(limit_id)
+        if window is None:
+            return 0
+        window.evict(self._time())
+        return window.used_weight
+
+    async def acquire_capacity(self, requirements: List[Tuple[RateLimit, int]]):
+        """
+        Waits until all the limits in `requirements` have capacity for the associated weights and registers the
+        consumption. The check and the registration happen without yielding to the event loop, so no lock is needed.
+        :param requirements: list of rate limits and the weight consumed from each of them
+        """
+        if len(self._pending_requests) == 0 and self._try_register(requirements=requirements, now=self._time()):
+            return
+
+        request = PendingRequest(requirements=requirements, future=asyncio.get_event_loop().create_future())
+        self._pending_requests.append(request)
+        self._process_pending_requests()
+        try:
+            await request.future
+        except asyncio.CancelledError:
+            self._remove_pending_request(request)
+            raise
+
+    def _window(self, limit_id: str) -> LimitWindow:
+        window = self._windows.get(limit_id)
+        if window is None:
+            window = LimitWindow()
+            self._windows[limit_id] = window
+        return window
+
+    def _try_register(self, requirements: List[Tuple[RateLimit, int]], now: float) -> bool:
+        for rate_limit, weight in requirements:
+            window = self._window(rate_limit.limit_id)
+            window.evict(now)
+            if not window.has_capacity(limit=rate_limit.limit, weight=weight):
+                self._log_max_capacity_reached(rate_limit=rate_limit, capacity_used=window.used_weight, now=now)
+                return False
+        for rate_limit, weight in requirements:
+            expiration = now + rate_limit.time_interval * (1 + self._safety_margin_pct)
+            self._windows[rate_limit.limit_id].record(expiration_timestamp=expiration, weight=weight)
+        return True
+
+    def _next_capacity_timestamp(self, requirements: List[Tuple[RateLimit, int]]) -> Optional[float]:
+        next_timestamp = 0.0
+        for rate_limit, weight in requirements:
+            timestamp = self._window(rate_limit.limit_id).next_capacity_timestamp(limit=rate_limit.limit, weight=weight)
+            if timestamp is None:
+                return None
+            next_timestamp = max(next_timestamp, timestamp)
+        return next_timestamp
+
+    def _process_pending_requests(self):
+        """
+        Grants capacity to the queued requests in FIFO order. A request that can not be granted blocks the limits it
+        uses, so that later requests for the same limits do not overtake it, while requests for unrelated limits can
+        still proceed. A single timer is then scheduled for the earliest time a blocked request can be granted.
+        """
+        self._cancel_wakeup()
+        now = self._time()
+        blocked_limit_ids: Set[str] = set()
+        next_wakeup_timestamp: Optional[float] = None
+        still_pending: Deque[PendingRequest] = deque()
+
+        for request in self._pending_requests:
+            if request.future.done():
+                continue
+            limit_ids = [rate_limit.limit_id for rate_limit, _ in request.requirements]
+            if blocked_limit_ids.isdisjoint(limit_ids):
+                if self._try_register(requirements=request.requirements, now=now):
+                    request.future.set_result(None)
+                    continue
+                timestamp = self._next_capacity_timestamp(requirements=request.requirements)
+                if timestamp is not None:
+                    next_wakeup_timestamp = (timestamp
+                                             if next_wakeup_timestamp is None
+                                             else min(next_wakeup_timestamp, timestamp))
+            blocked_limit_ids.update(limit_ids)
+            still_pending.append(request)
+
+        self._pending_requests = still_pending
+        if next_wakeup_timestamp is not None:
+            delay = max(0.0, next_wakeup_timestamp - now)
+            self._wakeup_handle = asyncio.get_event_loop().call_later(delay, self._process_pending_requests)
+
+    def _remove_pending_request(self, request: PendingRequest):
+        try:
+            self._pending_requests.remove(request)
+        except ValueError:
+            pass
+        # The removed request might have been blocking other requests
+        self._process_pending_requests()
+
+    def _cancel_wakeup(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+
+    def _log_max_capacity_reached(self, rate_limit: RateLimit, capacity_used: int, now: float):
+        if AsyncRequestContextBase._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {capacity_used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+    def _time(self) -> float:
+        return time.time()
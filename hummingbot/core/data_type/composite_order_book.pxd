@@ -1,8 +1,9 @@
 # distutils: language=c++
-from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book cimport OrderBook, OrderBookSideCursor
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookSideCursor c_side_cursor(self, bint is_bid)
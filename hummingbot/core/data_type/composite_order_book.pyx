@@ -5,6 +5,7 @@ from typing import Iterator
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBookSideCursor
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
@@ -15,7 +16,9 @@ cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+    Override the order book bid_entries, ask_entries methods to return the composite order book entries.
+    The depth queries of OrderBook traverse the book through c_side_cursor, which is overridden to go through the
+    composite entries.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
@@ -192,3 +195,24 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef OrderBookSideCursor c_side_cursor(self, bint is_bid):
+        cdef RowsSideCursor cursor = RowsSideCursor()
+        cursor._rows = iter(self.bid_entries() if is_bid else self.ask_entries())
+        return cursor
+
+
+cdef class RowsSideCursor(OrderBookSideCursor):
+    """
+    Cursor over an iterator of OrderBookRow, used to run the OrderBook depth queries on the composite entries
+    """
+    cdef object _rows
+
+    cdef bint c_next(self) except -1:
+        row = next(self._rows, None)
+        if row is None:
+            return False
+        self.price = row.price
+        self.amount = row.amount
+        self.update_id = row.update_id
+        return True
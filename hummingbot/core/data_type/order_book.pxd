@@ -9,6 +9,14 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef class OrderBookSideCursor:
+    cdef double price
+    cdef double amount
+    cdef double update_id
+
+    cdef bint c_next(self) except -1
+
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -26,14 +34,26 @@ cdef class OrderBook(PubSub):
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookSideCursor c_side_cursor(self, bint is_bid)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef int64_t c_fill_side_arrays(self,
+                                    bint is_bid,
+                                    double[:] prices,
+                                    double[:] amounts,
+                                    double[:] cumulative_amounts,
+                                    double[:] update_ids)
+    cdef np.ndarray c_get_price_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes)
+    cdef np.ndarray c_get_vwap_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes)
+    cdef np.ndarray c_get_volume_for_prices(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] prices)
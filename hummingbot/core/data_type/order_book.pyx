@@ -20,7 +20,7 @@ from cython.operator cimport(
     postincrement as inc,
 )
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
@@ -36,6 +36,61 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef int64_t numpy_rows_to_entries(const double[:, :] rows, vector[OrderBookEntry] &entries):
+    """
+    Appends the [price, amount, update_id] rows to the entries vector
+    :return: the largest update ID of the rows, 0 if there are no rows
+    """
+    cdef:
+        Py_ssize_t i
+        int64_t update_id
+        int64_t last_update_id = 0
+    entries.reserve(entries.size() + rows.shape[0])
+    for i in range(rows.shape[0]):
+        update_id = <int64_t>rows[i, 2]
+        entries.push_back(OrderBookEntry(rows[i, 0], rows[i, 1], update_id))
+        if update_id > last_update_id:
+            last_update_id = update_id
+    return last_update_id
+
+
+cdef class OrderBookSideCursor:
+    """
+    Iterates the levels of one side of an order book, best price first. After each call to c_next returning True the
+    level is available in the price, amount and update_id attributes.
+    """
+    cdef bint c_next(self) except -1:
+        return False
+
+
+cdef class BookSideCursor(OrderBookSideCursor):
+    """
+    Cursor over the C++ set of one side of an OrderBook
+    """
+    cdef:
+        OrderBook _order_book
+        bint _is_bid
+        set[OrderBookEntry].reverse_iterator _bid_it
+        set[OrderBookEntry].iterator _ask_it
+
+    cdef bint c_next(self) except -1:
+        cdef OrderBookEntry entry
+        if self._is_bid:
+            if self._bid_it == self._order_book._bid_book.rend():
+                return False
+            entry = deref(self._bid_it)
+            inc(self._bid_it)
+        else:
+            if self._ask_it == self._order_book._ask_book.end():
+                return False
+            entry = deref(self._ask_it)
+            inc(self._ask_it)
+        self.price = entry.getPrice()
+        self.amount = entry.getAmount()
+        self.update_id = entry.getUpdateId()
+        return True
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -171,11 +226,64 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
-        return bids_df, asks_df
+        return self._side_snapshot_df(is_bid=True), self._side_snapshot_df(is_bid=False)
+
+    def _side_snapshot_df(self, is_bid: bool) -> pd.DataFrame:
+        cdef:
+            Py_ssize_t size = self._bid_book.size() if is_bid else self._ask_book.size()
+            np.ndarray[np.float64_t, ndim=2] data = np.empty((4, size), dtype=np.float64)
+            int64_t levels = self.c_fill_side_arrays(is_bid, data[0], data[1], data[3], data[2])
+        return pd.DataFrame(data={field: data[i, :levels] for i, field in enumerate(OrderBookRow._fields)},
+                            dtype="float64")
+
+    def fill_bid_arrays(self,
+                        prices: np.ndarray,
+                        amounts: np.ndarray,
+                        cumulative_amounts: np.ndarray,
+                        update_ids: Optional[np.ndarray] = None) -> int:
+        """
+        Writes the bid levels, best price first, into preallocated float64 arrays without creating OrderBookRow
+        objects. Only as many levels as fit in the arrays are written.
+        :return: the number of levels written
+        """
+        return self.c_fill_side_arrays(True, prices, amounts, cumulative_amounts, update_ids)
+
+    def fill_ask_arrays(self,
+                        prices: np.ndarray,
+                        amounts: np.ndarray,
+                        cumulative_amounts: np.ndarray,
+                        update_ids: Optional[np.ndarray] = None) -> int:
+        """
+        Writes the ask levels, best price first, into preallocated float64 arrays without creating OrderBookRow
+        objects. Only as many levels as fit in the arrays are written.
+        :return: the number of levels written
+        """
+        return self.c_fill_side_arrays(False, prices, amounts, cumulative_amounts, update_ids)
+
+    def bid_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :param depth: maximum number of levels to export, all the levels if None
+        :return: the price, amount and cumulative amount arrays of the bid levels, best price first
+        """
+        return self._side_arrays(is_bid=True, depth=depth)
+
+    def ask_arrays(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :param depth: maximum number of levels to export, all the levels if None
+        :return: the price, amount and cumulative amount arrays of the ask levels, best price first
+        """
+        return self._side_arrays(is_bid=False, depth=depth)
+
+    def _side_arrays(self, is_bid: bool, depth: Optional[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        cdef:
+            Py_ssize_t size = self._bid_book.size() if is_bid else self._ask_book.size()
+            np.ndarray[np.float64_t, ndim=2] data
+            int64_t levels
+        if depth is not None:
+            size = min(size, depth)
+        data = np.empty((3, size), dtype=np.float64)
+        levels = self.c_fill_side_arrays(is_bid, data[0], data[1], data[2], None)
+        return data[0, :levels], data[1, :levels], data[2, :levels]
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
@@ -208,16 +316,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If update_id is None, the largest update ID in the arrays is used as the diff update ID.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -225,26 +335,23 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = max(numpy_rows_to_entries(bids_array, cpp_bids),
+                                         numpy_rows_to_entries(asks_array, cpp_asks))
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If update_id is None, the largest update ID in the arrays is used as the snapshot update ID.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -252,15 +359,28 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = max(numpy_rows_to_entries(bids_array, cpp_bids),
+                                         numpy_rows_to_entries(asks_array, cpp_asks))
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message. The NumPy arrays of CompactOrderBookMessage instances are applied directly.
+        """
+        if isinstance(message, CompactOrderBookMessage):
+            self.c_apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message. The NumPy arrays of CompactOrderBookMessage instances are applied directly.
+        """
+        if isinstance(message, CompactOrderBookMessage):
+            self.c_apply_numpy_snapshot(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -318,145 +438,207 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef OrderBookSideCursor c_side_cursor(self, bint is_bid):
+        """
+        Returns a cursor over the levels of one side of the book, best price first. All the depth queries traverse
+        the book through this method, so subclasses presenting different entries only need to override it.
+        """
+        cdef BookSideCursor cursor = BookSideCursor()
+        cursor._order_book = self
+        cursor._is_bid = is_bid
+        cursor._bid_it = self._bid_book.rbegin()
+        cursor._ask_it = self._ask_book.begin()
+        return cursor
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        while cursor.c_next():
+            cumulative_volume += cursor.amount
+            if cumulative_volume >= volume:
+                result_price = cursor.price
+                break
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        while cursor.c_next():
+            if total_volume + cursor.amount >= volume:
+                total_cost += (volume - total_volume) * cursor.price
+                total_volume = volume
+                result_vwap = total_cost / total_volume
+                break
+            total_cost += cursor.amount * cursor.price
+            total_volume += cursor.amount
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        while cursor.c_next():
+            cumulative_volume += cursor.amount * cursor.price
+            if cumulative_volume >= quote_volume:
+                result_price = cursor.price
+                break
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+        while cursor.c_next():
+            row_amount = cursor.amount
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * cursor.price
+            if cumulative_base_amount >= base_amount:
+                break
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        while cursor.c_next():
+            if (cursor.price > price) if is_buy else (cursor.price < price):
+                break
+            cumulative_volume += cursor.amount
+            result_price = cursor.price
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        while cursor.c_next():
+            if (cursor.price > price) if is_buy else (cursor.price < price):
+                break
+            cumulative_volume += cursor.amount * cursor.price
+            result_price = cursor.price
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef int64_t c_fill_side_arrays(self,
+                                    bint is_bid,
+                                    double[:] prices,
+                                    double[:] amounts,
+                                    double[:] cumulative_amounts,
+                                    double[:] update_ids):
+        """
+        Writes the levels of one side of the book, best price first, into the preallocated arrays. Levels beyond the
+        length of the arrays are ignored.
+        update_ids can be None when the update ids are not required.
+        :return: the number of levels written
+        """
+        cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(is_bid)
+            Py_ssize_t max_levels = min(prices.shape[0], amounts.shape[0], cumulative_amounts.shape[0])
+            Py_ssize_t index = 0
+            double cumulative_amount = 0
+
+        if update_ids is not None:
+            max_levels = min(max_levels, update_ids.shape[0])
+
+        while index < max_levels and cursor.c_next():
+            cumulative_amount += cursor.amount
+            prices[index] = cursor.price
+            amounts[index] = cursor.amount
+            cumulative_amounts[index] = cumulative_amount
+            if update_ids is not None:
+                update_ids[index] = cursor.update_id
+            index += 1
+
+        return index
+
+    cdef np.ndarray c_get_price_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
+            np.ndarray[np.int64_t, ndim=1] order = np.argsort(volumes, kind="stable")
+            np.ndarray[np.float64_t, ndim=1] results = np.full(volumes.shape[0], NaN, dtype=np.float64)
+            Py_ssize_t queries_count = volumes.shape[0]
+            Py_ssize_t query_index = 0
+            double cumulative_volume = 0
+
+        while query_index < queries_count and cursor.c_next():
+            cumulative_volume += cursor.amount
+            while query_index < queries_count and cumulative_volume >= volumes[order[query_index]]:
+                results[order[query_index]] = cursor.price
+                query_index += 1
+
+        return results
+
+    cdef np.ndarray c_get_vwap_for_volumes(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] volumes):
+        cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
+            np.ndarray[np.int64_t, ndim=1] order = np.argsort(volumes, kind="stable")
+            np.ndarray[np.float64_t, ndim=1] results = np.full(volumes.shape[0], NaN, dtype=np.float64)
+            Py_ssize_t queries_count = volumes.shape[0]
+            Py_ssize_t query_index = 0
+            double total_cost = 0
+            double total_volume = 0
+            double volume
+
+        while query_index < queries_count and cursor.c_next():
+            while query_index < queries_count and total_volume + cursor.amount >= volumes[order[query_index]]:
+                volume = volumes[order[query_index]]
+                # Same calculation as c_get_vwap_for_volume, a zero volume raises ZeroDivisionError in both
+                results[order[query_index]] = (total_cost + (volume - total_volume) * cursor.price) / volume
+                query_index += 1
+            total_cost += cursor.amount * cursor.price
+            total_volume += cursor.amount
+
+        return results
+
+    cdef np.ndarray c_get_volume_for_prices(self, bint is_buy, np.ndarray[np.float64_t, ndim=1] prices):
+        cdef:
+            OrderBookSideCursor cursor = self.c_side_cursor(not is_buy)
+            # Buy queries are answered walking the asks up, sell queries walking the bids down
+            np.ndarray[np.int64_t, ndim=1] order = (np.argsort(prices, kind="stable")
+                                                    if is_buy
+                                                    else np.argsort(-prices, kind="stable"))
+            np.ndarray[np.float64_t, ndim=1] results = np.zeros(prices.shape[0], dtype=np.float64)
+            Py_ssize_t queries_count = prices.shape[0]
+            Py_ssize_t query_index = 0
+            double cumulative_volume = 0
+
+        while query_index < queries_count and cursor.c_next():
+            while query_index < queries_count and ((cursor.price > prices[order[query_index]])
+                                                   if is_buy
+                                                   else (cursor.price < prices[order[query_index]])):
+                results[order[query_index]] = cumulative_volume
+                query_index += 1
+            cumulative_volume += cursor.amount
+
+        while query_index < queries_count:
+            results[order[query_index]] = cumulative_volume
+            query_index += 1
+
+        return results
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -475,9 +657,30 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_price_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of get_price_for_volume, answering all the volumes in a single pass through the book.
+        :return: the result price for each volume (NaN if the book has not enough volume)
+        """
+        return self.c_get_price_for_volumes(is_buy, np.ascontiguousarray(volumes, dtype=np.float64))
+
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of get_vwap_for_volume, answering all the volumes in a single pass through the book.
+        :return: the VWAP for each volume (NaN if the book has not enough volume)
+        """
+        return self.c_get_vwap_for_volumes(is_buy, np.ascontiguousarray(volumes, dtype=np.float64))
+
+    def get_volume_for_prices(self, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+        """
+        Vectorized version of get_volume_for_price, answering all the prices in a single pass through the book.
+        :return: the cumulative volume available up to each price
+        """
+        return self.c_get_volume_for_prices(is_buy, np.ascontiguousarray(prices, dtype=np.float64))
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
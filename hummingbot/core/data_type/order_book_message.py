@@ -3,6 +3,8 @@ from enum import Enum
 from functools import total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
@@ -95,3 +97,137 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+@total_ordering
+class CompactOrderBookMessage:
+    """
+    Order book message with the same interface as OrderBookMessage, that parses its content only once.
+    The scalar fields are read from the content when the message is created, and the bids and asks of diffs and
+    snapshots are converted into float64 arrays with the [price, amount, update_id] columns expected by
+    `OrderBook.apply_numpy_diffs`, so the order book can apply them without creating OrderBookRow objects.
+    Connectors can adopt it by creating instances of this class instead of OrderBookMessage, with the same arguments.
+    """
+
+    __slots__ = (
+        "type", "content", "timestamp", "trading_pair", "update_id", "first_update_id", "trade_id",
+        "bids_array", "asks_array", "_bids", "_asks",
+    )
+
+    def __init__(self, message_type: OrderBookMessageType, content: Dict[str, any], timestamp: Optional[float] = None):
+        self.type: OrderBookMessageType = message_type
+        self.content: Dict[str, any] = content
+        self.timestamp: Optional[float] = timestamp
+        self.trading_pair: str = content["trading_pair"]
+
+        if message_type is OrderBookMessageType.TRADE:
+            self.update_id: int = -1
+            self.first_update_id: int = -1
+            self.trade_id: int = content["trade_id"]
+            self.bids_array: np.ndarray = np.empty((0, 3), dtype=np.float64)
+            self.asks_array: np.ndarray = self.bids_array
+        else:
+            self.update_id: int = content["update_id"]
+            self.first_update_id: int = (content.get("first_update_id", self.update_id)
+                                         if message_type is OrderBookMessageType.DIFF
+                                         else -1)
+            self.trade_id: int = -1
+            self.bids_array: np.ndarray = self._rows_to_array(content["bids"], self.update_id)
+            self.asks_array: np.ndarray = self._rows_to_array(content["asks"], self.update_id)
+        self._bids: Optional[List[OrderBookRow]] = None
+        self._asks: Optional[List[OrderBookRow]] = None
+
+    @classmethod
+    def merge_diffs(cls, older: "CompactOrderBookMessage", newer: "CompactOrderBookMessage") -> "CompactOrderBookMessage":
+        """
+        Merges two consecutive diff messages working on their arrays, without parsing rows again. For price levels
+        present in both messages the amount of the newer one is kept.
+        The content of the merged message holds the merged arrays as bids and asks.
+        """
+        message = cls.__new__(cls)
+        message.type = OrderBookMessageType.DIFF
+        message.timestamp = newer.timestamp
+        message.trading_pair = newer.trading_pair
+        message.update_id = newer.update_id
+        message.first_update_id = older.first_update_id
+        message.trade_id = -1
+        message.bids_array = cls._merge_arrays(older.bids_array, newer.bids_array, newer.update_id)
+        message.asks_array = cls._merge_arrays(older.asks_array, newer.asks_array, newer.update_id)
+        message.content = {
+            "trading_pair": message.trading_pair,
+            "update_id": message.update_id,
+            "first_update_id": message.first_update_id,
+            "bids": message.bids_array,
+            "asks": message.asks_array,
+        }
+        message._bids = None
+        message._asks = None
+        return message
+
+    @staticmethod
+    def _merge_arrays(older: np.ndarray, newer: np.ndarray, update_id: int) -> np.ndarray:
+        # Reversed, so the first occurrence of each price found by np.unique is the most recent one
+        rows = np.concatenate((older, newer))[::-1]
+        _, latest_indexes = np.unique(rows[:, 0], return_index=True)
+        merged = rows[latest_indexes]
+        merged[:, 2] = update_id
+        return merged
+
+    @staticmethod
+    def _rows_to_array(rows: List[any], update_id: int) -> np.ndarray:
+        array = np.empty((len(rows), 3), dtype=np.float64)
+        if len(rows) > 0:
+            array[:, :2] = [row[:2] for row in rows]
+        array[:, 2] = update_id
+        return array
+
+    @staticmethod
+    def _array_to_rows(array: np.ndarray, update_id: int) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, update_id) for price, amount in array[:, :2].tolist()]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        if self._asks is None:
+            self._asks = self._array_to_rows(self.asks_array, self.update_id)
+        return self._asks
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        if self._bids is None:
+            self._bids = self._array_to_rows(self.bids_array, self.update_id)
+        return self._bids
+
+    @property
+    def has_update_id(self) -> bool:
+        return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
+
+    @property
+    def has_trade_id(self) -> bool:
+        return self.type == OrderBookMessageType.TRADE
+
+    def __eq__(self, other: "OrderBookMessage") -> bool:
+        eq = (
+            (self.type == other.type)
+            and (
+                (self.has_update_id and (self.update_id == other.update_id))
+                or (self.trade_id == other.trade_id)
+            )
+        )
+        return eq
+
+    def __hash__(self):
+        return hash((self.type, self.update_id, self.trade_id))
+
+    def __lt__(self, other: "OrderBookMessage") -> bool:
+        eq = (
+            (self.has_update_id and other.has_update_id and self.update_id < other.update_id)
+            or (self.has_trade_id and other.has_trade_id and self.trade_id < other.trade_id)
+            or (
+                ((self.timestamp != other.timestamp) and self.timestamp < other.timestamp)
+                or self.has_update_id  # if same timestamp, order book messages < trade messages.
+            )
+        )
+        return eq
+
+    def __repr__(self) -> str:
+        return f"CompactOrderBookMessage(type={self.type}, content={self.content}, timestamp={self.timestamp})"
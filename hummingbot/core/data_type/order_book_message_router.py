@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, List, Optional
+
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookMessageQueue(asyncio.Queue):
+    """
+    Queue with the order book messages of a single trading pair.
+    If `coalescing_threshold` is set, once the number of queued messages reaches it a new diff message is merged into
+    the last queued diff instead of being appended, so a backlog of diffs is applied to the order book as a single
+    update. Only diffs of the same message class are merged, snapshots and connector specific message classes are
+    always appended. Merging assumes the rows of the diffs are lists starting with the price and holding the absolute
+    amount of the level, which is why connectors have to enable it explicitly.
+    If `max_size` is set, the queue never holds more messages: when it is full and the new message can't be merged, the
+    queued messages are discarded. A new snapshot replaces them, and a new diff is queued alone and `snapshot_required`
+    is set, so the consumer restores the order book from a fresh snapshot before applying it.
+    The queue also registers when each message was queued, to report how long the last message waited to be processed.
+    """
+
+    def __init__(self, coalescing_threshold: Optional[int] = None, max_size: Optional[int] = None):
+        super().__init__()
+        self._coalescing_threshold = coalescing_threshold
+        self._max_size = max_size
+        self._enqueue_timestamps: Deque[float] = deque()
+        self._coalesced_messages: int = 0
+        self._dropped_messages: int = 0
+        self._snapshot_required: bool = False
+        self._last_message_lag: float = 0.0
+
+    @property
+    def coalesced_messages(self) -> int:
+        """
+        Returns the number of diff messages that have been merged into a previously queued diff
+        """
+        return self._coalesced_messages
+
+    @property
+    def dropped_messages(self) -> int:
+        """
+        Returns the number of messages discarded because the queue was full
+        """
+        return self._dropped_messages
+
+    @property
+    def snapshot_required(self) -> bool:
+        """
+        Returns True if diff messages were discarded since the last call to `snapshot_restored`, so the order book has
+        to be restored from a new snapshot
+        """
+        return self._snapshot_required
+
+    def snapshot_restored(self):
+        self._snapshot_required = False
+
+    @property
+    def last_message_lag(self) -> float:
+        """
+        Returns the time in seconds the last consumed message spent in the queue
+        """
+        return self._last_message_lag
+
+    @staticmethod
+    def merge_diff_messages(older: OrderBookMessage, newer: OrderBookMessage) -> OrderBookMessage:
+        """
+        Merges two consecutive diff messages of the same trading pair. For price levels present in both messages the
+        amount of the newer one is kept.
+        """
+        if isinstance(newer, CompactOrderBookMessage):
+            return CompactOrderBookMessage.merge_diffs(older=older, newer=newer)
+        content = {
+            "trading_pair": newer.trading_pair,
+            "update_id": newer.update_id,
+            "first_update_id": older.first_update_id,
+            "bids": OrderBookMessageQueue._merge_rows(older.content["bids"], newer.content["bids"]),
+            "asks": OrderBookMessageQueue._merge_rows(older.content["asks"], newer.content["asks"]),
+        }
+        return type(newer)(OrderBookMessageType.DIFF, content, newer.timestamp)
+
+    @staticmethod
+    def _merge_rows(older_rows: List[Any], newer_rows: List[Any]) -> List[Any]:
+        levels = {float(row[0]): row for row in older_rows}
+        for row in newer_rows:
+            levels[float(row[0])] = row
+        return list(levels.values())
+
+    @staticmethod
+    def _is_mergeable(message: OrderBookMessage) -> bool:
+        return (type(message) in (OrderBookMessage, CompactOrderBookMessage)
+                and message.type is OrderBookMessageType.DIFF)
+
+    def _put(self, item: OrderBookMessage):
+        queue = self._queue
+        if (self._coalescing_threshold is not None
+                and len(queue) >= self._coalescing_threshold
+                and self._is_mergeable(item)
+                and type(queue[-1]) is type(item)
+                and self._is_mergeable(queue[-1])
+                and queue[-1].trading_pair == item.trading_pair):
+            queue[-1] = self.merge_diff_messages(older=queue[-1], newer=item)
+            self._coalesced_messages += 1
+        elif self._max_size is not None and len(queue) >= self._max_size:
+            self._dropped_messages += len(queue)
+            queue.clear()
+            self._enqueue_timestamps.clear()
+            if item.type is not OrderBookMessageType.SNAPSHOT:
+                self._snapshot_required = True
+            queue.append(item)
+            self._enqueue_timestamps.append(time.perf_counter())
+        else:
+            queue.append(item)
+            self._enqueue_timestamps.append(time.perf_counter())
+
+    def _get(self) -> OrderBookMessage:
+        item = self._queue.popleft()
+        self._last_message_lag = time.perf_counter() - self._enqueue_timestamps.popleft()
+        return item
+
+
+class OrderBookDiffRouter:
+    """
+    Dispatches the order book diff messages to the queue of their trading pair.
+    It implements the `put` and `put_nowait` methods of asyncio.Queue, so it can be given to the data source as the
+    output of `listen_for_order_book_diffs` and messages are routed as soon as they are parsed, without going through
+    a shared queue consumed by a single routing task. Routing never waits: messages for pairs that are not tracked yet
+    are saved, and outdated messages are discarded.
+    The router reads the queues and order books from the tracker on every message, so trackers replacing those
+    dictionaries after the base initialization are supported.
+    """
+    _odr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._odr_logger is None:
+            cls._odr_logger = logging.getLogger(__name__)
+        return cls._odr_logger
+
+    def __init__(self, tracker: "OrderBookTracker"):
+        self._tracker = tracker
+        self._last_message_timestamp: float = time.time()
+        self._messages_queued: int = 0
+        self._messages_accepted: int = 0
+        self._messages_rejected: int = 0
+
+    async def put(self, message: OrderBookMessage):
+        self.route(message)
+
+    def put_nowait(self, message: OrderBookMessage):
+        self.route(message)
+
+    def route(self, message: OrderBookMessage):
+        trading_pair: str = message.trading_pair
+        tracker = self._tracker
+        message_queue: Optional[asyncio.Queue] = tracker._tracking_message_queues.get(trading_pair)
+
+        if message_queue is None:
+            self._messages_queued += 1
+            # Save diff messages received before snapshots are ready
+            tracker._saved_message_queues[trading_pair].append(message)
+        # Check the order book's initial update ID. If it's larger, don't bother.
+        elif tracker._order_books[trading_pair].snapshot_uid > message.update_id:
+            self._messages_rejected += 1
+        else:
+            message_queue.put_nowait(message)
+            self._messages_accepted += 1
+
+        # Log some statistics.
+        now: float = time.time()
+        if int(now / 60.0) > int(self._last_message_timestamp / 60.0):
+            self.logger().debug(f"Diff messages processed: {self._messages_accepted}, "
+                                f"rejected: {self._messages_rejected}, queued: {self._messages_queued}")
+            self._messages_accepted = 0
+            self._messages_rejected = 0
+            self._messages_queued = 0
+        self._last_message_timestamp = now
@@ -3,18 +3,22 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_router import OrderBookDiffRouter, OrderBookMessageQueue
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
+if TYPE_CHECKING:
+    from hummingbot.data_feed.market_data_recorder import MarketDataRecorder
+
 
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
@@ -23,6 +27,12 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    DIFF_COALESCING_THRESHOLD: int = 100
+    # Max number of messages queued per trading pair. When it is exceeded the queued messages are discarded and the
+    # order book is restored from a new snapshot
+    MAX_QUEUED_DIFF_MESSAGES: int = 5000
+    # Trackers overriding `_order_book_diff_router` should disable the direct routing of diff messages
+    ROUTE_DIFF_MESSAGES_DIRECTLY: bool = True
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,7 +41,22 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 max_concurrent_initializations: Optional[int] = None,
+                 coalesce_diff_messages: bool = False):
+        """
+        :param data_source: the data source providing the order book snapshots and messages
+        :param trading_pairs: the trading pairs to track
+        :param domain: the exchange domain
+        :param max_concurrent_initializations: if set, the initial snapshots are requested concurrently with at most
+            this number of requests in progress, relying on the data source throttler to respect the rate limits.
+            If None the order books are initialized one by one, waiting one second between them.
+        :param coalesce_diff_messages: if True, diff messages are merged once DIFF_COALESCING_THRESHOLD messages are
+            pending for a trading pair. Only valid for data sources producing diffs with list rows of absolute amounts
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
@@ -45,6 +70,11 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._max_concurrent_initializations: Optional[int] = max_concurrent_initializations
+        self._order_book_init_durations: Dict[str, float] = {}
+        self._coalesce_diff_messages: bool = coalesce_diff_messages
+        self._diff_message_router: OrderBookDiffRouter = OrderBookDiffRouter(tracker=self)
+        self._market_data_recorder: Optional["MarketDataRecorder"] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +98,54 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        Returns the trading pairs with an initialized order book, even if the initialization of the rest of the order
+        books is still in progress
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if trading_pair in self._tracking_tasks]
+
+    @property
+    def order_book_init_durations(self) -> Dict[str, float]:
+        """
+        Returns the time in seconds it took for each order book to be ready since the initialization started
+        """
+        return self._order_book_init_durations
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._tracking_tasks
+
+    @property
+    def message_queue_depths(self) -> Dict[str, int]:
+        """
+        Returns the number of order book messages pending to be processed for each trading pair
+        """
+        return {trading_pair: queue.qsize() for trading_pair, queue in self._tracking_message_queues.items()}
+
+    @property
+    def message_queue_lags(self) -> Dict[str, float]:
+        """
+        Returns the time in seconds the last processed order book message of each trading pair spent waiting since it
+        was routed
+        """
+        return {
+            trading_pair: queue.last_message_lag
+            for trading_pair, queue in self._tracking_message_queues.items()
+            if isinstance(queue, OrderBookMessageQueue)
+        }
+
+    @property
+    def message_queue_drops(self) -> Dict[str, int]:
+        """
+        Returns the number of order book messages of each trading pair discarded because its queue was full
+        """
+        return {
+            trading_pair: queue.dropped_messages
+            for trading_pair, queue in self._tracking_message_queues.items()
+            if isinstance(queue, OrderBookMessageQueue)
+        }
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,6 +153,23 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def market_data_recorder(self) -> Optional["MarketDataRecorder"]:
+        return self._market_data_recorder
+
+    def start_recording(self, recorder: "MarketDataRecorder"):
+        """
+        Records the current state of the order books, and the diffs, snapshots and trades processed from then on.
+        The recording continues if the tracker is restarted, until stop_recording is called.
+        :param recorder: the recorder receiving the messages
+        """
+        self._market_data_recorder = recorder
+        for trading_pair in self.ready_trading_pairs:
+            recorder.record_order_book(trading_pair, self._order_books[trading_pair], timestamp=time.time())
+
+    def stop_recording(self):
+        self._market_data_recorder = None
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -83,8 +178,11 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        diff_messages_output = (self._diff_message_router
+                                if self.ROUTE_DIFF_MESSAGES_DIRECTLY
+                                else self._order_book_diff_stream)
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_messages_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
@@ -95,9 +193,10 @@ class OrderBookTracker:
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
+        if not self.ROUTE_DIFF_MESSAGES_DIRECTLY:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
@@ -176,54 +275,59 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        start_time = time.perf_counter()
+        if self._max_concurrent_initializations is None:
+            for trading_pair in self._trading_pairs:
+                await self._init_order_book(trading_pair=trading_pair, start_time=start_time)
+                await self._sleep(delay=1)
+        else:
+            semaphore = asyncio.Semaphore(self._max_concurrent_initializations)
+            await safe_gather(*[
+                self._init_order_book_with_retries(trading_pair=trading_pair, semaphore=semaphore, start_time=start_time)
+                for trading_pair in self._trading_pairs
+            ])
+            self.logger().info(f"Initialized {len(self._trading_pairs)} order books in "
+                               f"{time.perf_counter() - start_time:.2f} seconds.")
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, start_time: float):
+        self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.record_order_book(trading_pair, self._order_books[trading_pair],
+                                                         timestamp=time.time())
+        self._tracking_message_queues[trading_pair] = OrderBookMessageQueue(
+            coalescing_threshold=self.DIFF_COALESCING_THRESHOLD if self._coalesce_diff_messages else None,
+            max_size=self.MAX_QUEUED_DIFF_MESSAGES)
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_init_durations[trading_pair] = time.perf_counter() - start_time
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._tracking_tasks)}/{len(self._trading_pairs)} completed.")
+
+    async def _init_order_book_with_retries(self, trading_pair: str, semaphore: asyncio.Semaphore, start_time: float):
+        while True:
+            try:
+                async with semaphore:
+                    await self._init_order_book(trading_pair=trading_pair, start_time=start_time)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error initializing order book. Retrying after 5 seconds."
+                )
+                await self._sleep(delay=5.0)
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
+        Only used when the diff messages are not routed directly by the data source (see ROUTE_DIFF_MESSAGES_DIRECTLY)
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
-                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
+                self._diff_message_router.route(ob_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -271,9 +375,18 @@ class OrderBookTracker:
                 else:
                     message = await message_queue.get()
 
+                if isinstance(message_queue, OrderBookMessageQueue) and message_queue.snapshot_required:
+                    await self._restore_order_book_from_new_snapshot(trading_pair, order_book)
+                    message_queue.snapshot_restored()
+
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if message.update_id < order_book.snapshot_uid:
+                        # Outdated by a snapshot restored after the diff was queued
+                        continue
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
+                    if self._market_data_recorder is not None:
+                        self._market_data_recorder.record_message(message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -285,6 +398,10 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self._market_data_recorder is not None:
+                        # The restored book includes the newer past diffs, so it is recorded instead of the snapshot
+                        self._market_data_recorder.record_order_book(trading_pair, order_book,
+                                                                     timestamp=message.timestamp)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +412,22 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    async def _restore_order_book_from_new_snapshot(self, trading_pair: str, order_book: OrderBook):
+        """
+        Replaces the content of the order book with a new snapshot, after the diffs queued for it were discarded.
+        The order book instance is kept because it is referenced by the connector.
+        """
+        self.logger().warning(f"The order book messages queue of {trading_pair} is full. Discarded "
+                              f"{self._tracking_message_queues[trading_pair].dropped_messages} messages so far. "
+                              f"Restoring the order book from a new snapshot.")
+        new_order_book: OrderBook = await self._initial_order_book_for_trading_pair(trading_pair)
+        order_book.apply_snapshot(list(new_order_book.bid_entries()),
+                                  list(new_order_book.ask_entries()),
+                                  new_order_book.snapshot_uid)
+        self._past_diffs_windows[trading_pair].clear()
+        if self._market_data_recorder is not None:
+            self._market_data_recorder.record_order_book(trading_pair, order_book, timestamp=time.time())
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -319,6 +452,8 @@ class OrderBookTracker:
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                if self._market_data_recorder is not None:
+                    self._market_data_recorder.record_message(trade_message)
 
                 messages_accepted += 1
 
@@ -11,13 +11,17 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self, event_source: Optional[str] = None, order_filled_events_window: Optional[int] = None):
+        """
+        :param event_source: the name of the source of the events
+        :param order_filled_events_window: the number of most recent order fill events kept, all of them if None
+        """
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # Order fill events are kept separately, with their own limit
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
+        self._order_filled_logged_events = deque(maxlen=order_filled_events_window)
         self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
         self._waiting = {}
         self._wait_returns = {}
@@ -14,7 +14,7 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -32,7 +32,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are kept in a RateGraph,
+    that caches the rates found and only recomputes the ones affected by each price update.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -52,7 +53,7 @@ class RateOracle(NetworkBase):
     def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        self._prices: RateGraph = RateGraph()
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -93,14 +94,14 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
-            self._prices = {}
+            self._prices = RateGraph()
 
     @property
     def prices(self) -> Dict[str, Decimal]:
         """
         Actual prices retrieved from URL
         """
-        return self._prices.copy()
+        return dict(self._prices)
 
     async def start_network(self):
         await self.stop_network()
@@ -111,7 +112,7 @@ class RateOracle(NetworkBase):
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
         # Reset stored prices so that they are not used if they are not being updated
-        self._prices = {}
+        self._prices = RateGraph()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -1,10 +1,144 @@
+from collections import UserDict, deque
 from decimal import Decimal
-from typing import Dict
+from itertools import chain
+from typing import Deque, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
-from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
+from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
 
+class RateGraph(UserDict):
+    """
+    Dictionary of trading pair prices that indexes the pairs as a graph of tokens, to find conversion rates between
+    any two tokens connected through one or more pairs.
+    Conversion rates are cached. Updating the price of a pair only invalidates the cached rates computed through that
+    pair, while adding or removing pairs (which can change the paths between tokens) invalidates all of them.
+    Rates are computed through the path with the least number of pairs. Among paths with the same length pairs quoted
+    in the starting token are preferred, in the order they were added (the order used by `find_rate` before the graph).
+    """
+
+    def __init__(self, prices: Optional[Mapping[str, Decimal]] = None):
+        # For each token, the tokens it is priced in ({quote: pair}) and the tokens priced in it ({base: pair})
+        self._quotes: Dict[str, Dict[str, str]] = {}
+        self._bases: Dict[str, Dict[str, str]] = {}
+        self._rates: Dict[Tuple[str, str], Optional[Decimal]] = {}
+        self._rates_by_pair: Dict[str, Set[Tuple[str, str]]] = {}
+        super().__init__(prices)
+
+    def __setitem__(self, pair: str, price: Decimal):
+        is_new_pair = pair not in self.data
+        previous_price = self.data.get(pair)
+        self.data[pair] = price
+        if is_new_pair:
+            self._add_pair(pair)
+            self._rates.clear()
+        elif previous_price != price:
+            if previous_price == 0 or price == 0:
+                # Pairs with a price of zero can't be used to convert from their quote token
+                self._rates.clear()
+            else:
+                self._invalidate_rates(pair)
+
+    def __delitem__(self, pair: str):
+        del self.data[pair]
+        self._remove_pair(pair)
+        self._rates.clear()
+
+    def clear(self):
+        self.data.clear()
+        self._quotes.clear()
+        self._bases.clear()
+        self._rates.clear()
+        self._rates_by_pair.clear()
+
+    def find_rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Returns the conversion rate for the trading pair, or None if its tokens are not connected
+        :param pair: The trading pair
+        """
+        price = self.data.get(pair)
+        if price is not None:
+            return price
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        key = (base, quote)
+        if key not in self._rates:
+            path = self._find_path(base=base, quote=quote)
+            self._rates[key] = None if path is None else self._path_rate(path)
+            for path_pair, _ in path or []:
+                self._rates_by_pair.setdefault(path_pair, set()).add(key)
+        return self._rates[key]
+
+    def _add_pair(self, pair: str):
+        try:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+        except ValueError:
+            return
+        self._quotes.setdefault(base, {})[quote] = pair
+        self._bases.setdefault(quote, {})[base] = pair
+
+    def _remove_pair(self, pair: str):
+        try:
+            base, quote = split_hb_trading_pair(trading_pair=pair)
+        except ValueError:
+            return
+        self._quotes.get(base, {}).pop(quote, None)
+        self._bases.get(quote, {}).pop(base, None)
+        self._rates_by_pair.pop(pair, None)
+
+    def _invalidate_rates(self, pair: str):
+        for key in self._rates_by_pair.pop(pair, ()):
+            self._rates.pop(key, None)
+
+    def _neighbours(self, token: str) -> Iterator[Tuple[str, str, bool]]:
+        """
+        Iterates the tokens connected to the token, with the pair connecting them and whether the token is its base
+        """
+        return chain(
+            ((quote, pair, True) for quote, pair in self._quotes.get(token, {}).items()),
+            ((base, pair, False) for base, pair in self._bases.get(token, {}).items() if self.data[pair] != 0),
+        )
+
+    def _find_path(self, base: str, quote: str) -> Optional[List[Tuple[str, bool]]]:
+        """
+        Breadth first search of the shortest path between two tokens, as a list of (pair, is_base_to_quote) steps
+        """
+        previous_steps: Dict[str, Optional[Tuple[str, str, bool]]] = {base: None}
+        pending_tokens: Deque[str] = deque([base])
+        while pending_tokens:
+            token = pending_tokens.popleft()
+            for neighbour, pair, is_base_to_quote in self._neighbours(token):
+                if neighbour in previous_steps:
+                    continue
+                previous_steps[neighbour] = (token, pair, is_base_to_quote)
+                if neighbour == quote:
+                    return self._build_path(previous_steps, quote)
+                pending_tokens.append(neighbour)
+        return None
+
+    @staticmethod
+    def _build_path(previous_steps: Dict[str, Optional[Tuple[str, str, bool]]],
+                    token: str) -> List[Tuple[str, bool]]:
+        path = []
+        step = previous_steps[token]
+        while step is not None:
+            token, pair, is_base_to_quote = step
+            path.append((pair, is_base_to_quote))
+            step = previous_steps[token]
+        path.reverse()
+        return path
+
+    def _path_rate(self, path: List[Tuple[str, bool]]) -> Decimal:
+        first_pair, first_is_base_to_quote = path[0]
+        rate = self.data[first_pair] if first_is_base_to_quote else Decimal("1") / self.data[first_pair]
+        for pair, is_base_to_quote in path[1:]:
+            rate = rate * self.data[pair] if is_base_to_quote else rate / self.data[pair]
+        return rate
+
+
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     '''
     Finds exchange rate for a given trading pair from a dictionary of prices
@@ -13,25 +147,12 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    Tokens connected through more than one intermediate token are also converted. If prices is a RateGraph the rates
+    are cached, otherwise the graph is built for the lookup.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
     if pair in prices:
         return prices[pair]
-    base, quote = split_hb_trading_pair(trading_pair=pair)
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    rate_graph = prices if isinstance(prices, RateGraph) else RateGraph(prices)
+    return rate_graph.find_rate(pair)
@@ -1,28 +1,9 @@
-import cachetools
 import errno
-import functools
 import numpy as np
 import socket
 import pandas as pd
 
-
-def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
-    cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
-
-    def decorator(fn):
-        @functools.wraps(fn)
-        async def memoize(*args, **kwargs):
-            key = str((args, kwargs))
-            try:
-                return cache[key]
-            except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
-
-        memoize.cache_clear = lambda: cache.clear()
-        return memoize
-
-    return decorator
+from hummingbot.core.utils.async_cache import async_ttl_cache  # noqa: F401
 
 
 def map_df_to_str(df: pd.DataFrame) -> pd.DataFrame:
@@ -0,0 +1,213 @@
+import asyncio
+import functools
+import inspect
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+
+class AsyncCacheStats(NamedTuple):
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    deduplicated: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    def __add__(self, other: "AsyncCacheStats") -> "AsyncCacheStats":
+        return AsyncCacheStats(*(a + b for a, b in zip(self, other)))
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    expiration_timestamp: float
+
+
+def make_cache_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Builds a hashable key from the arguments of a call. Lists, sets and dictionaries are converted to tuples and
+    frozensets, other hashable values are used as they are, so numerically equal Decimals share the same key.
+    Values that can't be hashed are represented by their `repr`, as the keys of the previous cache implementation.
+    """
+    return tuple(_normalize(arg) for arg in args), tuple(sorted((k, _normalize(v)) for k, v in kwargs.items()))
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((k, _normalize(v)) for k, v in value.items())
+    if isinstance(value, set):
+        return frozenset(_normalize(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class AsyncTTLCache:
+    """
+    Cache for the results of a coroutine function, with a time to live for each entry and a maximum number of entries
+    (the least recently used entry is evicted first).
+    - Concurrent calls with the same key share a single execution of the coroutine (singleflight).
+    - If `stale_ttl` is greater than zero, an expired entry is still returned during `stale_ttl` seconds while it is
+      refreshed in the background (stale-while-revalidate).
+    Exceptions raised by the coroutine are propagated to all the waiting callers and are not cached.
+    """
+    _atc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._atc_logger is None:
+            cls._atc_logger = logging.getLogger(__name__)
+        return cls._atc_logger
+
+    def __init__(self, ttl: float, maxsize: int, stale_ttl: float = 0):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._stale_ttl = stale_ttl
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._deduplicated = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> AsyncCacheStats:
+        return AsyncCacheStats(
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            deduplicated=self._deduplicated,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
+
+    def clear(self):
+        # Loads already running belong to the previous generation, their results are not stored
+        self._generation += 1
+        self._entries.clear()
+        self._in_flight.clear()
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the cached value for the key, calling `loader` to get it if there is no valid entry.
+        """
+        now = self._time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.expiration_timestamp:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.expiration_timestamp + self._stale_ttl:
+                self._stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._in_flight:
+                    self._start_load(key, loader).add_done_callback(self._log_refresh_error)
+                return entry.value
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self._misses += 1
+            task = self._start_load(key, loader)
+        else:
+            self._deduplicated += 1
+        # A cancelled caller must not cancel the execution shared with the other callers
+        return await asyncio.shield(task)
+
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.ensure_future(self._load(key, loader, self._generation))
+        self._in_flight[key] = task
+        return task
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]], generation: int) -> Any:
+        try:
+            value = await loader()
+            if generation != self._generation:
+                return value
+            self._entries[key] = _CacheEntry(value=value, expiration_timestamp=self._time() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return value
+        finally:
+            if generation == self._generation:
+                del self._in_flight[key]
+
+    def _log_refresh_error(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            self.logger().warning("Error refreshing a cached value, the stale value is kept until it expires.",
+                                  exc_info=task.exception())
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
+
+
+def async_ttl_cache(ttl: float = 3600, maxsize: int = 1, stale_ttl: float = 0):
+    """
+    Decorator caching the results of a coroutine function in an `AsyncTTLCache`.
+    Calls are keyed on their normalized arguments (positional and keyword arguments of the same call share the key,
+    and default values are applied). For methods (first parameter named `self`) each instance has its own cache, so
+    `maxsize` applies per instance and the instance is not part of the key.
+    The decorated function exposes `cache_clear()` and `cache_info(instance=None)`, which returns the `AsyncCacheStats`
+    of an instance, or the sum over all the caches if no instance is specified.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        parameters = list(signature.parameters)
+        is_method = len(parameters) > 0 and parameters[0] == "self"
+        shared_cache = AsyncTTLCache(ttl=ttl, maxsize=maxsize, stale_ttl=stale_ttl)
+        instance_caches: "weakref.WeakKeyDictionary[Any, AsyncTTLCache]" = weakref.WeakKeyDictionary()
+
+        def get_cache(instance: Any) -> Tuple[AsyncTTLCache, bool]:
+            try:
+                cache = instance_caches.get(instance)
+                if cache is None:
+                    cache = AsyncTTLCache(ttl=ttl, maxsize=maxsize, stale_ttl=stale_ttl)
+                    instance_caches[instance] = cache
+                return cache, True
+            except TypeError:
+                # Instances that can't be weak referenced or hashed use the shared cache
+                return shared_cache, False
+
+        @functools.wraps(fn)
+        async def memoize(*args, **kwargs):
+            bound_arguments = signature.bind(*args, **kwargs)
+            bound_arguments.apply_defaults()
+            call_args = bound_arguments.args
+            cache = shared_cache
+            if is_method:
+                cache, is_instance_scoped = get_cache(call_args[0])
+                if is_instance_scoped:
+                    call_args = call_args[1:]
+            key = make_cache_key(call_args, bound_arguments.kwargs)
+            return await cache.get(key, lambda: fn(*args, **kwargs))
+
+        def cache_clear():
+            shared_cache.clear()
+            for cache in list(instance_caches.values()):
+                cache.clear()
+
+        def cache_info(instance: Any = None) -> AsyncCacheStats:
+            if instance is not None:
+                cache = instance_caches.get(instance)
+                return cache.stats if cache is not None else AsyncCacheStats()
+            return sum((cache.stats for cache in list(instance_caches.values())), shared_cache.stats)
+
+        memoize.cache_clear = cache_clear
+        memoize.cache_info = cache_info
+        return memoize
+
+    return decorator
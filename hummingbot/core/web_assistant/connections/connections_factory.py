@@ -2,6 +2,7 @@ from typing import Optional
 
 import aiohttp
 
+from hummingbot.core.web_assistant.connections.json_decoders import JSONDecoderBase
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
@@ -29,9 +30,9 @@ class ConnectionsFactory:
         connection = RESTConnection(aiohttp_client_session=shared_client)
         return connection
 
-    async def get_ws_connection(self) -> WSConnection:
+    async def get_ws_connection(self, json_decoder: Optional[JSONDecoderBase] = None) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, json_decoder=json_decoder)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
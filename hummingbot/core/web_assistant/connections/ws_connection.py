@@ -1,16 +1,20 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoders import JSONDecoderBase, default_json_decoder
+from hummingbot.core.web_assistant.connections.ws_frame_filters import WSFrameFilterBase
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_decoder: Optional[JSONDecoderBase] = None):
         self._client_session = aiohttp_client_session
+        self._json_decoder = json_decoder or default_json_decoder()
+        self._frame_filter: Optional[WSFrameFilterBase] = None
+        self._filtered_frames = 0
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -24,12 +28,20 @@ class WSConnection:
     def connected(self) -> bool:
         return self._connected
 
+    @property
+    def filtered_frames(self) -> int:
+        """
+        Returns the number of text frames discarded by the frame filter
+        """
+        return self._filtered_frames
+
     async def connect(
         self,
         ws_url: str,
         ping_timeout: float = 10,
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
+        frame_filter: Optional[WSFrameFilterBase] = None,
     ):
         self._ensure_not_connected()
         self._connection = await self._client_session.ws_connect(
@@ -39,6 +51,7 @@ class WSConnection:
             heartbeat=ping_timeout,
         )
         self._message_timeout = message_timeout
+        self._frame_filter = frame_filter
         self._connected = True
 
     async def disconnect(self):
@@ -60,6 +73,9 @@ class WSConnection:
         while self._connected:
             msg = await self._read_message()
             msg = await self._process_message(msg)
+            if msg is not None and self._is_filtered(msg):
+                self._filtered_frames += 1
+                continue
             if msg is not None:
                 response = self._build_resp(msg)
                 break
@@ -113,6 +129,11 @@ class WSConnection:
             msg = None
         return msg
 
+    def _is_filtered(self, msg: aiohttp.WSMessage) -> bool:
+        return (self._frame_filter is not None
+                and msg.type == aiohttp.WSMsgType.TEXT
+                and not self._frame_filter.accept(msg.data))
+
     def _update_last_recv_time(self, _: aiohttp.WSMessage):
         self._last_recv_time = time.time()
 
@@ -122,14 +143,13 @@ class WSConnection:
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = self._json_decoder.decode(msg.data)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
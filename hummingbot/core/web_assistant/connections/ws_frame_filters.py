@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Union
+
+
+class WSFrameFilterBase(ABC):
+    """
+    Decides, using only the raw payload of a text frame, whether the frame should be decoded and returned by
+    `WSConnection.receive`. Frames that are not accepted are discarded before being decoded, so a connector can save
+    the decoding cost of the channels it does not process.
+    """
+
+    @abstractmethod
+    def accept(self, data: Union[str, bytes]) -> bool:
+        ...
+
+
+class ChannelFrameFilter(WSFrameFilterBase):
+    """
+    Accepts only the frames containing at least one of the configured markers, usually the channel or event names
+    as they appear in the raw payload (for example '"depthUpdate"').
+    The markers of every message the connector needs, including subscription confirmations or errors it waits for,
+    have to be configured.
+    """
+
+    def __init__(self, markers: Iterable[str]):
+        self._str_markers = tuple(markers)
+        self._bytes_markers = tuple(marker.encode() for marker in self._str_markers)
+
+    def accept(self, data: Union[str, bytes]) -> bool:
+        markers = self._str_markers if isinstance(data, str) else self._bytes_markers
+        for marker in markers:
+            if marker in data:
+                return True
+        return False
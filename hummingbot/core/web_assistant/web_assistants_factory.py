@@ -3,6 +3,7 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_decoders import JSONDecoderBase
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -19,6 +20,9 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    The JSON decoder used by the WebSocket connections can be replaced by passing a `ws_json_decoder`. If not
+    specified the standard library decoder is used (see `default_json_decoder` and `fastest_json_decoder`).
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,6 +33,7 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        ws_json_decoder: Optional[JSONDecoderBase] = None,
     ):
         self._connections_factory = ConnectionsFactory()
         self._rest_pre_processors = rest_pre_processors or []
@@ -37,6 +42,7 @@ class WebAssistantsFactory:
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._ws_json_decoder = ws_json_decoder
 
     @property
     def throttler(self) -> AsyncThrottlerBase:
@@ -58,7 +64,7 @@ class WebAssistantsFactory:
         return assistant
 
     async def get_ws_assistant(self) -> WSAssistant:
-        connection = await self._connections_factory.get_ws_connection()
+        connection = await self._connections_factory.get_ws_connection(json_decoder=self._ws_json_decoder)
         assistant = WSAssistant(
             connection, self._ws_pre_processors, self._ws_post_processors, self._auth
         )
@@ -4,6 +4,7 @@ from typing import AsyncGenerator, Dict, List, Optional
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.connections.ws_frame_filters import WSFrameFilterBase
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
 
@@ -39,8 +40,18 @@ class WSAssistant:
         ping_timeout: float = 10,
         message_timeout: Optional[float] = None,
         ws_headers: Optional[Dict] = {},
+        frame_filter: Optional[WSFrameFilterBase] = None,
     ):
-        await self._connection.connect(ws_url=ws_url, ws_headers=ws_headers, ping_timeout=ping_timeout, message_timeout=message_timeout)
+        """
+        :param frame_filter: if specified, the text frames not accepted by the filter are discarded without being
+            decoded
+        """
+        await self._connection.connect(
+            ws_url=ws_url,
+            ws_headers=ws_headers,
+            ping_timeout=ping_timeout,
+            message_timeout=message_timeout,
+            frame_filter=frame_filter)
 
     async def disconnect(self):
         await self._connection.disconnect()
@@ -50,7 +61,9 @@ class WSAssistant:
         await self.send(request)
 
     async def send(self, request: WSRequest):
-        request = deepcopy(request)
+        # Pre-processors and authenticators can modify the request, so it is copied only if any of them is applied
+        if len(self._ws_pre_processors) > 0 or (self._auth is not None and request.is_auth_required):
+            request = deepcopy(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         await self._connection.send(request)
@@ -1,10 +1,10 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, List, Optional, Tuple
 
 import numpy as np
 
-from hummingbot.core.network_iterator import NetworkStatus, safe_ensure_future
+from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
@@ -104,20 +104,39 @@ class BinancePerpetualCandles(CandlesBase):
                 )
                 await self._sleep(1.0)
 
+    @property
+    def candles_hub_supported(self) -> bool:
+        return True
+
+    def _kline_stream_name(self, interval: str) -> str:
+        return f"{self._ex_trading_pair.lower()}@kline_{interval}"
+
+    def _kline_subscription_request(self, stream_names: List[str], subscribe: bool = True) -> WSJSONRequest:
+        payload = {
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": stream_names,
+            "id": 1
+        }
+        return WSJSONRequest(payload=payload)
+
+    def _parse_kline_message(self, data: Any) -> Optional[Tuple[str, np.ndarray]]:
+        if data is None or data.get("e") != "kline":  # data will be None when the websocket is disconnected
+            return None
+        kline = data["k"]
+        candle = np.array([kline["t"], kline["o"], kline["h"], kline["l"], kline["c"], kline["v"], kline["q"],
+                           kline["n"], kline["V"], kline["Q"]], dtype=float)
+        return f"{data['s'].lower()}@kline_{kline['i']}", candle
+
+    def _timestamp_interval(self, interval: str) -> float:
+        return self.get_seconds_from_interval(interval) * 1000
+
     async def _subscribe_channels(self, ws: WSAssistant):
         """
         Subscribes to the candles events through the provided websocket connection.
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
-            candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": candle_params,
-                "id": 1
-            }
-            subscribe_candles_request: WSJSONRequest = WSJSONRequest(payload=payload)
+            subscribe_candles_request = self._kline_subscription_request([self._kline_stream_name(self.interval)])
 
             await ws.send(subscribe_candles_request)
             self.logger().info("Subscribed to public klines...")
@@ -132,30 +151,6 @@ class BinancePerpetualCandles(CandlesBase):
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                low = data["k"]["l"]
-                high = data["k"]["h"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    safe_ensure_future(self.fill_historical_candles())
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+            kline = self._parse_kline_message(ws_response.data)
+            if kline is not None:
+                self._update_candle(kline[1])
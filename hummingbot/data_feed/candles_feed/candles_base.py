@@ -1,8 +1,8 @@
 import asyncio
 import os
-from collections import deque
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from bidict import bidict
 
@@ -10,14 +10,25 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.indicators import CandlesIndicator, CandlesIndicators
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a CandlesStore to store candles. The
+    candles DataFrame is cached until the stored candles change, and the indicators requested are computed
+    incrementally as the candles are added.
+    If the cache is enabled, the candles are loaded from the CandlesCache on start and persisted periodically, so only
+    the candles missing since the last persisted one are fetched after a restart or a reconnection.
+    The feeds that support it can share the websocket connection and the throttler of their exchange with the rest of
+    feeds through the CandlesHub, instead of opening their own connection.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -41,14 +52,24 @@ class CandlesBase(NetworkBase):
     })
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    cache_persist_interval = 300.0
 
     def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesStore(columns_count=len(self.columns), maxlen=max_records)
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version: Optional[int] = None
+        self._indicators = CandlesIndicators(candles=self._candles, columns=self.columns)
         self._listen_candles_task: Optional[asyncio.Task] = None
+        self._fill_historical_candles_task: Optional[asyncio.Task] = None
+        self._cache: Optional[CandlesCache] = None
+        self._cache_version: Optional[int] = None
+        self._persist_candles_task: Optional[asyncio.Task] = None
+        self._candles_hub_enabled = False
+        self._candles_hub: Optional[CandlesHub] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         if interval in self.intervals.keys():
@@ -60,23 +81,44 @@ class CandlesBase(NetworkBase):
 
     async def start_network(self):
         """
-        This method starts the network and starts a task for listen_for_subscriptions.
+        This method starts the network and starts a task for listen_for_subscriptions, or adds the feed to the
+        CandlesHub of the exchange if it is enabled. If the cache is enabled, the cached candles are loaded first and a
+        task persists the new candles periodically.
         """
         await self.stop_network()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._cache is not None:
+            self.load_cached_candles()
+            self._persist_candles_task = safe_ensure_future(self._persist_candles_loop())
+        if self._candles_hub_enabled:
+            self._candles_hub = CandlesHub.for_feed(self)
+            self._api_factory = self._candles_hub.api_factory
+            self._candles_hub.add_feed(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
-        This method stops the network by canceling the _listen_candles_task task.
+        This method stops the network by canceling the _listen_candles_task task or removing the feed from the
+        CandlesHub, and persists the candles.
         """
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._candles_hub is not None:
+            self._candles_hub.remove_feed(self)
+            self._candles_hub = None
+        if self._persist_candles_task is not None:
+            self._persist_candles_task.cancel()
+            self._persist_candles_task = None
+        if self._fill_historical_candles_task is not None:
+            self._fill_historical_candles_task.cancel()
+            self._fill_historical_candles_task = None
+        self.persist_candles()
 
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles store has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -108,15 +150,58 @@ class CandlesBase(NetworkBase):
     def intervals(self):
         raise NotImplementedError
 
+    @property
+    def candles_hub_supported(self) -> bool:
+        """
+        This property returns whether the feed implements the methods used by the CandlesHub to share the websocket
+        connection: _kline_stream_name, _kline_subscription_request, _parse_kline_message and _timestamp_interval.
+        """
+        return False
+
     async def check_network(self) -> NetworkStatus:
         raise NotImplementedError
 
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles store as a Pandas DataFrame.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        return self.get_candles_df()
+
+    def get_candles_df(self, max_records: Optional[int] = None,
+                       indicators: Optional[List[CandlesIndicator]] = None) -> pd.DataFrame:
+        """
+        This method returns a copy of the last candles as a Pandas DataFrame, so the caller can add columns to it. The
+        DataFrame is only built again when the stored candles change.
+        :param max_records: max number of candles returned, all of them if not provided
+        :param indicators: indicators added as columns after the candle columns
+        """
+        if self._candles_df_version != self._candles.version:
+            self._candles_df_cache = self._candles_to_df()
+            self._candles_df_version = self._candles.version
+        candles_df = self._candles_df_cache if max_records is None else self._candles_df_cache.iloc[-max_records:]
+        if not indicators:
+            return candles_df.copy()
+        columns = list(candles_df.columns)
+        values = [candles_df.values]
+        for indicator in indicators:
+            indicator_values = self._indicators.get_values(indicator)
+            columns.extend(indicator.columns)
+            values.append(indicator_values if max_records is None else indicator_values[-max_records:])
+        return pd.DataFrame(np.hstack(values), columns=columns, index=candles_df.index)
+
+    def get_last_candle(self, indicators: Optional[List[CandlesIndicator]] = None) -> Dict[str, float]:
+        """
+        This method returns the values of the last candle by column, without building a DataFrame.
+        :param indicators: indicators whose values of the last candle are included
+        """
+        last_candle = dict(zip(self.columns, self._candles[-1].tolist()))
+        for indicator in indicators or []:
+            last_candle.update(zip(indicator.columns, self._indicators.get_values(indicator)[-1].tolist()))
+        return last_candle
+
+    def _candles_to_df(self) -> pd.DataFrame:
+        return pd.DataFrame(self._candles.values, columns=self.columns, dtype=float, copy=True)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -134,6 +219,48 @@ class CandlesBase(NetworkBase):
         df.sort_values(by="timestamp", ascending=False, inplace=True)
         self._candles.extendleft(df.values.tolist())
 
+    def enable_candles_hub(self):
+        """
+        This method makes the feed share the websocket connection of its exchange through the CandlesHub from the next
+        start, if the feed supports it.
+        """
+        self._candles_hub_enabled = self.candles_hub_supported
+
+    def enable_cache(self, cache_dir: Optional[str] = None):
+        """
+        This method enables the CandlesCache of the feed, used from the next start.
+        :param cache_dir: directory of the cache files, data/candles if not provided
+        """
+        self._cache = CandlesCache(name=self.name, interval=self.interval, cache_dir=cache_dir)
+
+    def load_cached_candles(self):
+        """
+        This method fills the _candles store with the newest cached candles when it is empty.
+        """
+        if self._cache is not None and len(self._candles) == 0:
+            candles = self._cache.load_last_candles(max_records=self._candles.maxlen)
+            if len(candles) > 0 and candles.shape[1] == len(self.columns):
+                self._candles.extendleft(candles[::-1])
+            self._cache_version = self._candles.version
+
+    def persist_candles(self):
+        """
+        This method stores the candles in the cache, except the last one since it is not closed yet. The candles are
+        only written when they changed since the last time.
+        """
+        if self._cache is not None and len(self._candles) > 1 and self._cache_version != self._candles.version:
+            try:
+                self._cache.save(self._candles.values[:-1])
+                self._cache_version = self._candles.version
+            except Exception:
+                self.logger().exception(f"Unexpected error occurred when persisting the candles in "
+                                        f"{self._cache.file_path}.")
+
+    async def _persist_candles_loop(self):
+        while True:
+            await self._sleep(self.cache_persist_interval)
+            self.persist_candles()
+
     async def fetch_candles(self,
                             start_time: Optional[int] = None,
                             end_time: Optional[int] = None,
@@ -149,7 +276,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles store with historical candles.
         """
         raise NotImplementedError
 
@@ -163,6 +290,7 @@ class CandlesBase(NetworkBase):
             try:
                 ws: WSAssistant = await self._connected_websocket_assistant()
                 await self._subscribe_channels(ws)
+                await self._fill_missing_candles()
                 await self._process_websocket_messages(websocket_assistant=ws)
             except asyncio.CancelledError:
                 raise
@@ -192,15 +320,171 @@ class CandlesBase(NetworkBase):
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
         raise NotImplementedError
 
+    def _kline_stream_name(self, interval: str) -> str:
+        """
+        Returns the name of the websocket stream of the klines of the trading pair with the interval.
+        :param interval: interval of the klines
+        """
+        raise NotImplementedError
+
+    def _kline_subscription_request(self, stream_names: List[str], subscribe: bool = True) -> WSJSONRequest:
+        """
+        Returns the request that subscribes to (or unsubscribes from) the websocket streams.
+        :param stream_names: names of the streams
+        :param subscribe: False to unsubscribe
+        """
+        raise NotImplementedError
+
+    def _parse_kline_message(self, data: Any) -> Optional[Tuple[str, np.ndarray]]:
+        """
+        Returns the name of the stream and the candle of a kline websocket message, or None for other messages.
+        :param data: data of the websocket message
+        """
+        raise NotImplementedError
+
+    def _timestamp_interval(self, interval: str) -> float:
+        """
+        Returns the duration of the interval in the units of the timestamps of the candles.
+        :param interval: interval of the candles
+        """
+        raise NotImplementedError
+
+    def _update_candle(self, candle: np.ndarray):
+        """
+        Adds a new candle, or updates the last one if it has the same timestamp. The first candle triggers the fill of
+        the historical candles.
+        :param candle: values of the candle
+        """
+        if len(self._candles) == 0:
+            self._candles.append(candle)
+            self._start_filling_historical_candles()
+        elif candle[0] > self._candles[-1][0]:
+            # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+            self._candles.append(candle)
+        elif candle[0] == self._candles[-1][0]:
+            self._candles[-1] = candle
+
     async def _sleep(self, delay):
         """
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
         """
         await asyncio.sleep(delay)
 
+    async def _fill_missing_candles(self):
+        """
+        Fills the candles missed since the last stored candle, when the websocket was disconnected or the candles were
+        loaded from the cache. The last candles are fetched first, and if they don't reach the last stored candle the
+        candles in between are fetched page by page from it. If the gap can't be filled (it is longer than the store,
+        or the exchange API doesn't support fetching candles from a start time) the fetched candles replace the stored
+        ones, and the older candles are loaded from the cache or filled by fill_historical_candles.
+        """
+        if len(self._candles) == 0:
+            return
+        try:
+            last_candles = await self._fetch_sorted_candles()
+            if len(last_candles) > 0 and last_candles[0, 0] > self._candles[-1][0]:
+                if not await self._fill_candles_gap(until_timestamp=last_candles[0, 0],
+                                                    page_size=len(last_candles)):
+                    self._candles.clear()
+            if len(self._candles) > 0:
+                self._merge_newer_candles(last_candles)
+            else:
+                self._candles.extendleft(last_candles[-self._candles.maxlen:][::-1])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().exception("Unexpected error occurred when fetching the missing candles.")
+            # The websocket fills the candles again from scratch
+            self._candles.clear()
+            return
+        self._fill_candles_from_cache()
+        if len(self._candles) > 0 and not self.ready:
+            self._start_filling_historical_candles()
+
+    async def _fill_candles_gap(self, until_timestamp: float, page_size: int) -> bool:
+        """
+        Appends the candles after the last stored one and before until_timestamp, fetching them page by page.
+        Returns False if the gap can't be filled.
+        :param until_timestamp: timestamp of the first candle already fetched after the gap
+        :param page_size: number of candles returned by each request
+        """
+        step = self._candles_timestamp_step()
+        if step is not None and (until_timestamp - self._candles[-1][0]) / step > self._candles.maxlen:
+            # The stored candles would be discarded by the missing ones
+            return False
+        for _ in range(self._candles.maxlen // max(page_size, 1) + 1):
+            if self._gap_is_filled(until_timestamp):
+                return True
+            last_timestamp = self._candles[-1][0]
+            candles = await self._fetch_sorted_candles(start_time=int(last_timestamp) + 1)
+            candles = candles[(candles[:, 0] > last_timestamp) & (candles[:, 0] < until_timestamp)]
+            if len(candles) == 0:
+                # The exchange API doesn't return the candles from the start time
+                return False
+            for candle in candles:
+                self._candles.append(candle)
+        return self._gap_is_filled(until_timestamp)
+
+    def _gap_is_filled(self, until_timestamp: float) -> bool:
+        step = self._candles_timestamp_step()
+        return step is not None and until_timestamp - self._candles[-1][0] <= 1.5 * step
+
+    async def _fetch_sorted_candles(self, start_time: Optional[int] = None) -> np.ndarray:
+        candles = await self.fetch_candles() if start_time is None else await self.fetch_candles(start_time=start_time)
+        candles = np.asarray(candles, dtype=float).reshape(-1, len(self.columns))
+        return candles[np.argsort(candles[:, 0], kind="stable")]
+
+    def _merge_newer_candles(self, candles: np.ndarray):
+        last_timestamp = self._candles[-1][0]
+        for candle in candles[candles[:, 0] >= last_timestamp]:
+            if candle[0] == last_timestamp:
+                self._candles[-1] = candle
+            else:
+                self._candles.append(candle)
+
+    def _fill_candles_from_cache(self):
+        """
+        Adds the cached candles right before the first stored candle, so they don't have to be fetched again.
+        """
+        if self._cache is None or len(self._candles) == 0 or self.ready:
+            return
+        first_timestamp = self._candles[0][0]
+        cached_candles = self._cache.load_last_candles(max_records=self._candles.maxlen - len(self._candles),
+                                                       end_time=first_timestamp)
+        if len(cached_candles) == 0 or cached_candles.shape[1] != len(self.columns):
+            return
+        step = self._candles_timestamp_step()
+        if step is None and len(cached_candles) > 1:
+            step = float(np.median(np.diff(cached_candles[:, 0])))
+        if step is not None and first_timestamp - cached_candles[-1, 0] <= 1.5 * step:
+            self._candles.extendleft(cached_candles[::-1])
+
+    def _candles_timestamp_step(self) -> Optional[float]:
+        """
+        Returns the difference between the timestamps of consecutive candles, or None if it is unknown.
+        """
+        try:
+            return self._timestamp_interval(self.interval)
+        except NotImplementedError:
+            pass
+        if len(self._candles) > 1:
+            return float(np.median(np.diff(self._candles.values[-100:, 0])))
+        return None
+
+    def _start_filling_historical_candles(self):
+        """
+        Starts filling the historical candles, unless they are already being filled.
+        """
+        if self._fill_historical_candles_task is None or self._fill_historical_candles_task.done():
+            self._fill_historical_candles_task = safe_ensure_future(self.fill_historical_candles())
+
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
+        """
+        Disconnects the websocket keeping the stored candles, the ones missed until the websocket is connected again
+        are filled by _fill_missing_candles.
+        """
         websocket_assistant and await websocket_assistant.disconnect()
-        self._candles.clear()
+        self.persist_candles()
 
     def get_seconds_from_interval(self, interval: str) -> int:
         """
@@ -0,0 +1,105 @@
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+
+
+class CandlesCache:
+    """
+    This class persists the candles of a connector, trading pair and interval on disk, so they can be shared by the
+    candles feeds, the scripts that download candles and the backtesting engine without fetching them again.
+    The candles are stored sorted by timestamp as a float array in a NumPy file (one row per candle, with the columns
+    of the candles feed), that is memory mapped when read so loading a time range only reads the rows in it.
+    """
+
+    def __init__(self, name: str, interval: str, cache_dir: Optional[str] = None):
+        """
+        :param name: name of the candles, the connector name and the trading pair (e.g. binance_BTC-USDT)
+        :param interval: interval of the candles
+        :param cache_dir: directory of the cache files, data/candles if not provided
+        """
+        self._cache_dir = cache_dir or os.path.join(data_path(), "candles")
+        self._file_path = os.path.join(self._cache_dir, f"{name}_{interval}.npy")
+
+    @classmethod
+    def for_trading_pair(cls, connector_name: str, trading_pair: str, interval: str,
+                         cache_dir: Optional[str] = None) -> "CandlesCache":
+        return cls(name=f"{connector_name}_{trading_pair}", interval=interval, cache_dir=cache_dir)
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def load(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> np.ndarray:
+        """
+        This method returns the cached candles with a timestamp between start_time and end_time (both included).
+        :param start_time: timestamp of the first candle, from the oldest one if not provided
+        :param end_time: timestamp of the last candle, up to the newest one if not provided
+        """
+        candles = self._read()
+        if len(candles) == 0:
+            return np.array(candles)
+        start = 0 if start_time is None else np.searchsorted(candles[:, 0], start_time, side="left")
+        end = len(candles) if end_time is None else np.searchsorted(candles[:, 0], end_time, side="right")
+        return np.array(candles[start:end])
+
+    def load_last_candles(self, max_records: int, end_time: Optional[float] = None) -> np.ndarray:
+        """
+        This method returns up to max_records of the newest cached candles that have no gaps between them, so they can
+        be used as the latest candles of a feed. A gap is a difference between two consecutive timestamps larger than
+        the usual one (with some margin for the intervals of variable length, like months).
+        :param max_records: max number of candles returned
+        :param end_time: if provided, only the candles older than end_time are returned
+        """
+        candles = self._read()
+        if end_time is not None and len(candles) > 0:
+            candles = candles[:np.searchsorted(candles[:, 0], end_time, side="left")]
+        candles = candles[-max_records:] if max_records > 0 else candles[:0]
+        if len(candles) < 3:
+            return np.array(candles)
+        timestamp_steps = np.diff(candles[:, 0])
+        gaps = np.flatnonzero(timestamp_steps > 1.5 * np.median(timestamp_steps))
+        start = gaps[-1] + 1 if len(gaps) > 0 else 0
+        return np.array(candles[start:])
+
+    def save(self, candles: np.ndarray):
+        """
+        This method adds the candles to the cache. The candles already cached with the same timestamps are replaced.
+        The file is written to a temporary file first and then renamed, so it is never read half written.
+        :param candles: candles to store, one row per candle with the timestamp in the first column
+        """
+        candles = np.asarray(candles, dtype=float)
+        if len(candles) == 0:
+            return
+        cached_candles = self._read()
+        if len(cached_candles) > 0 and cached_candles.shape[1] == candles.shape[1]:
+            candles = np.concatenate([cached_candles, candles])
+        # The memory mapped file is closed before it is replaced
+        del cached_candles
+        # The reversed order keeps the last candle added of each timestamp, and the unique timestamps are sorted
+        _, positions = np.unique(candles[::-1, 0], return_index=True)
+        candles = candles[::-1][positions]
+        os.makedirs(self._cache_dir, exist_ok=True)
+        temporary_file_path = f"{self._file_path}.tmp"
+        with open(temporary_file_path, "wb") as temporary_file:
+            np.save(temporary_file, candles)
+        os.replace(temporary_file_path, self._file_path)
+
+    def get_candles_df(self, columns: list, start_time: Optional[float] = None,
+                       end_time: Optional[float] = None) -> pd.DataFrame:
+        """
+        This method returns the cached candles between start_time and end_time as a Pandas DataFrame.
+        :param columns: names of the columns of the candles
+        :param start_time: timestamp of the first candle, from the oldest one if not provided
+        :param end_time: timestamp of the last candle, up to the newest one if not provided
+        """
+        candles = self.load(start_time=start_time, end_time=end_time)
+        return pd.DataFrame(candles.reshape(-1, len(columns)), columns=columns)
+
+    def _read(self) -> np.ndarray:
+        if not os.path.exists(self._file_path):
+            return np.empty((0, 0))
+        return np.load(self._file_path, mmap_mode="r")
@@ -30,11 +30,15 @@ class CandlesConfig(BaseModel):
     - trading_pair: str
     - interval: str
     - max_records: int
+    - cache_candles: bool, whether the candles are loaded from and persisted in the CandlesCache
+    - use_candles_hub: bool, whether the websocket connection of the exchange is shared through the CandlesHub
     """
     connector: str
     trading_pair: str
     interval: str = "1m"
     max_records: int = 500
+    cache_candles: bool = True
+    use_candles_hub: bool = True
 
 
 class CandlesFactory:
@@ -64,10 +68,15 @@ class CandlesFactory:
         """
         connector_class = cls._candles_map.get(candles_config.connector)
         if connector_class:
-            return connector_class(
+            candles = connector_class(
                 candles_config.trading_pair,
                 candles_config.interval,
                 candles_config.max_records
             )
+            if candles_config.cache_candles:
+                candles.enable_cache()
+            if candles_config.use_candles_hub:
+                candles.enable_candles_hub()
+            return candles
         else:
             raise UnsupportedConnectorException(candles_config.connector)
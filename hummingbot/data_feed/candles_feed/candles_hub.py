@@ -0,0 +1,300 @@
+import asyncio
+import logging
+import weakref
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesResampler:
+    """
+    Aggregates the candles of a smaller interval (the stream candles) into the candles of the interval of a feed. The
+    stream candles of the current feed candle are kept by timestamp, since they are updated until they are closed.
+    When the resampler starts in the middle of a feed candle, the stream candles before it are unknown, so the feed
+    candle stored until then (e.g. fetched through the REST API) is used for them: the stream candle seen at that moment
+    only adds the changes of its volumes from then on.
+    """
+    _sum_columns = slice(5, None)
+
+    def __init__(self, candle_size: float):
+        """
+        :param candle_size: duration of the feed candles, in the units of the candles timestamps
+        """
+        self._candle_size = candle_size
+        self._timestamp: Optional[float] = None
+        self._complete = False
+        self._candle_requested = False
+        self._candle: Optional[np.ndarray] = None
+        self._first_candle: Optional[np.ndarray] = None
+        self._first_stream_candle: Optional[np.ndarray] = None
+        self._stream_candles: Dict[float, np.ndarray] = {}
+
+    def update(self, stream_candle: np.ndarray, last_candle: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Adds a stream candle, or an update of it, and returns the feed candle that includes it.
+        :param stream_candle: values of the stream candle
+        :param last_candle: last candle stored by the feed, used for the stream candles not seen
+        """
+        timestamp = stream_candle[0] - stream_candle[0] % self._candle_size
+        if timestamp != self._timestamp:
+            # Only the candles started after the first one are complete
+            self._complete = self._timestamp is not None or stream_candle[0] == timestamp
+            self._timestamp = timestamp
+            self._candle_requested = False
+            self._candle = None
+            self._first_candle = None
+            self._first_stream_candle = None
+            self._stream_candles.clear()
+        if (not self._complete and last_candle is not None and last_candle[0] == timestamp
+                and (self._candle is None or not np.array_equal(last_candle, self._candle))):
+            # The feed candle was not built here, it replaces the stream candles seen until now
+            self._first_candle = np.array(last_candle, dtype=float)
+            self._first_stream_candle = np.array(stream_candle, dtype=float)
+            self._stream_candles.clear()
+        self._stream_candles[stream_candle[0]] = np.array(stream_candle, dtype=float)
+
+        stream_candles = np.array([self._stream_candles[key] for key in sorted(self._stream_candles)])
+        candle = np.empty_like(stream_candles[0])
+        candle[0] = timestamp
+        candle[1] = stream_candles[0, 1]
+        candle[2] = stream_candles[:, 2].max()
+        candle[3] = stream_candles[:, 3].min()
+        candle[4] = stream_candles[-1, 4]
+        candle[self._sum_columns] = stream_candles[:, self._sum_columns].sum(axis=0)
+        if self._first_candle is not None:
+            candle[1] = self._first_candle[1]
+            candle[2] = max(candle[2], self._first_candle[2])
+            candle[3] = min(candle[3], self._first_candle[3])
+            candle[self._sum_columns] += (self._first_candle[self._sum_columns]
+                                          - self._first_stream_candle[self._sum_columns])
+        self._candle = candle
+        return candle
+
+    def request_candle(self) -> bool:
+        """
+        Returns True, once per feed candle, if the feed candle has to be fetched because the stream candles before the
+        first one seen are unknown.
+        """
+        if self._complete or self._first_candle is not None or self._candle_requested:
+            return False
+        self._candle_requested = True
+        return True
+
+
+class CandlesHub:
+    """
+    Shares one websocket connection and one throttler between all the candles feeds of an exchange, subscribing the
+    klines of all of them over the same connection and dispatching each kline to the feeds that use it.
+    - The feeds of the same trading pair whose interval is a multiple of the interval of another feed (up to one day)
+      are resampled locally from its klines, so a trading pair only needs one stream for all those intervals.
+    - The streams are assigned again every time a feed is added or removed, subscribing and unsubscribing the streams
+      that changed on the open connection, so the feeds are grouped regardless of the order they are started.
+    - When the connection is interrupted the feeds keep their candles, and the ones missed are filled once connected
+      again.
+    The feeds provide the exchange specific parts: the stream names, the subscription requests and the parsing of the
+    kline messages. There is one hub per event loop and websocket URL.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _hubs: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, CandlesHub]]" = weakref.WeakKeyDictionary()
+    max_resampled_interval = 86400
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def for_feed(cls, feed: "CandlesBase") -> "CandlesHub":
+        loop = asyncio.get_event_loop()
+        hubs = cls._hubs.get(loop)
+        if hubs is None:
+            hubs = {}
+            cls._hubs[loop] = hubs
+        hub = hubs.get(feed.wss_url)
+        if hub is None:
+            hub = cls(wss_url=feed.wss_url, rate_limits=feed.rate_limits)
+            hubs[feed.wss_url] = hub
+        return hub
+
+    def __init__(self, wss_url: str, rate_limits: List):
+        self._wss_url = wss_url
+        self._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=rate_limits))
+        self._feeds: List["CandlesBase"] = []
+        self._feed_streams: Dict["CandlesBase", str] = {}
+        self._stream_feeds: Dict[str, Set["CandlesBase"]] = {}
+        self._resamplers: Dict["CandlesBase", CandlesResampler] = {}
+        self._ws: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def api_factory(self) -> WebAssistantsFactory:
+        return self._api_factory
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._stream_feeds)
+
+    def get_feed_stream(self, feed: "CandlesBase") -> Optional[str]:
+        return self._feed_streams.get(feed)
+
+    def add_feed(self, feed: "CandlesBase"):
+        """
+        Starts dispatching the klines to the feed, connecting the websocket if it is the first one.
+        """
+        if feed in self._feeds:
+            return
+        self._feeds.append(feed)
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self._listen_for_klines())
+        elif self._ws is not None:
+            self._update_subscriptions()
+            safe_ensure_future(feed._fill_missing_candles())
+
+    def remove_feed(self, feed: "CandlesBase"):
+        """
+        Stops dispatching the klines to the feed, closing the connection if it was the last feed.
+        """
+        if feed not in self._feeds:
+            return
+        self._feeds.remove(feed)
+        if len(self._feeds) == 0:
+            self._stop_listening()
+            self._update_streams()
+        elif self._ws is not None:
+            self._update_subscriptions()
+        else:
+            self._update_streams()
+
+    async def _listen_for_klines(self):
+        while True:
+            try:
+                self._ws = await self._connected_websocket_assistant()
+                # The klines missed while disconnected can't be resampled
+                self._resamplers.clear()
+                self._update_streams()
+                await self._send_subscription(self._feeds[0], self.streams, subscribe=True)
+                await asyncio.gather(*[feed._fill_missing_candles() for feed in self._feeds])
+                await self._process_websocket_messages()
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                await self._on_stream_interruption()
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        await ws.connect(ws_url=self._wss_url, ping_timeout=30)
+        return ws
+
+    async def _send_subscription(self, feed: "CandlesBase", streams: List[str], subscribe: bool):
+        try:
+            await self._ws.send(feed._kline_subscription_request(streams, subscribe=subscribe))
+            self.logger().info(f"{'Subscribed to' if subscribe else 'Unsubscribed from'} public klines "
+                               f"{', '.join(streams)}...")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error occurred updating the subscription to public klines...",
+                                exc_info=True)
+            raise
+
+    async def _process_websocket_messages(self):
+        async for ws_response in self._ws.iter_messages():
+            if len(self._feeds) == 0:
+                continue
+            kline = self._feeds[0]._parse_kline_message(ws_response.data)
+            if kline is None:
+                continue
+            stream, stream_candle = kline
+            for feed in self._stream_feeds.get(stream, ()):
+                resampler = self._resamplers.get(feed)
+                if resampler is None:
+                    feed._update_candle(stream_candle)
+                else:
+                    last_candle = feed._candles[-1] if len(feed._candles) > 0 else None
+                    feed._update_candle(resampler.update(stream_candle, last_candle))
+                    if resampler.request_candle():
+                        safe_ensure_future(feed._fill_missing_candles())
+
+    async def _on_stream_interruption(self):
+        websocket_assistant, self._ws = self._ws, None
+        websocket_assistant and await websocket_assistant.disconnect()
+        for feed in self._feeds:
+            await feed._on_order_stream_interruption()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+    def _stop_listening(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        if self._ws is not None:
+            safe_ensure_future(self._ws.disconnect())
+            self._ws = None
+
+    def _update_subscriptions(self):
+        added_streams, removed_streams = self._update_streams()
+        if len(added_streams) > 0:
+            safe_ensure_future(self._send_subscription(self._feeds[0], added_streams, subscribe=True))
+        if len(removed_streams) > 0:
+            safe_ensure_future(self._send_subscription(self._feeds[0], removed_streams, subscribe=False))
+
+    def _update_streams(self) -> Tuple[List[str], List[str]]:
+        """
+        Assigns the streams of all the feeds, from the smallest interval to the largest, so the feeds are resampled
+        from the smallest interval possible. The feeds that keep their stream keep their resampler.
+        :return: the streams added and the streams removed
+        """
+        previous_streams = self.streams
+        previous_feed_streams = dict(self._feed_streams)
+        previous_resamplers = dict(self._resamplers)
+        self._feed_streams.clear()
+        self._stream_feeds.clear()
+        self._resamplers.clear()
+        for feed in sorted(self._feeds, key=lambda feed: feed.get_seconds_from_interval(feed.interval)):
+            stream_interval = self._stream_interval(feed)
+            stream = feed._kline_stream_name(stream_interval)
+            if stream_interval != feed.interval:
+                resampler = previous_resamplers.get(feed)
+                if resampler is None or previous_feed_streams.get(feed) != stream:
+                    resampler = CandlesResampler(candle_size=feed._timestamp_interval(feed.interval))
+                self._resamplers[feed] = resampler
+            self._feed_streams[feed] = stream
+            self._stream_feeds.setdefault(stream, set()).add(feed)
+        added_streams = [stream for stream in self._stream_feeds if stream not in previous_streams]
+        removed_streams = [stream for stream in previous_streams if stream not in self._stream_feeds]
+        return added_streams, removed_streams
+
+    def _stream_interval(self, feed: "CandlesBase") -> str:
+        """
+        Returns the smallest interval of the streams already assigned to feeds of the same trading pair that the
+        interval of the feed can be resampled from, or the interval of the feed.
+        """
+        interval_seconds = feed.get_seconds_from_interval(feed.interval)
+        stream_interval = feed.interval
+        if interval_seconds <= self.max_resampled_interval:
+            for other_feed in self._feed_streams:
+                other_interval_seconds = other_feed.get_seconds_from_interval(other_feed.interval)
+                if (other_feed._trading_pair == feed._trading_pair
+                        and other_feed not in self._resamplers
+                        and interval_seconds % other_interval_seconds == 0
+                        and other_interval_seconds < feed.get_seconds_from_interval(stream_interval)):
+                    stream_interval = other_feed.interval
+        return stream_interval
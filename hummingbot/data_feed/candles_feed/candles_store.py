@@ -0,0 +1,139 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+class CandlesStore:
+    """
+    This class stores the most recent candles in a preallocated float array, one row per candle, with the same
+    interface as the bounded deque used before (append, pop, extendleft, clear, indexing and maxlen).
+    The buffer has room for twice the max number of candles, so the stored candles are always a contiguous block that
+    is read without copying, and the block is only moved back to the start of the buffer once every max_records
+    appends.
+    The version is increased every time the candles change, so the views built from them can be cached until then.
+    The appended candles and the rest of changes (except updating the last candle) are counted separately, so the
+    values computed incrementally from the candles can tell whether they can be updated with just the new candles.
+    """
+
+    def __init__(self, columns_count: int, maxlen: int):
+        self._maxlen = maxlen
+        self._buffer = np.zeros((2 * maxlen, columns_count), dtype=float)
+        self._start = 0
+        self._end = 0
+        self._version = 0
+        self._appends_count = 0
+        self._resets_count = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def version(self) -> int:
+        """
+        This property returns a number that changes every time the stored candles change.
+        """
+        return self._version
+
+    @property
+    def appends_count(self) -> int:
+        """
+        This property returns the number of candles appended since the store was created.
+        """
+        return self._appends_count
+
+    @property
+    def resets_count(self) -> int:
+        """
+        This property returns the number of changes that were not appending a candle or updating the last one.
+        """
+        return self._resets_count
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        This property returns a read-only view of the stored candles, from the oldest to the newest. The view is only
+        valid until the candles change.
+        """
+        values = self._buffer[self._start:self._end]
+        values.flags.writeable = False
+        return values
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for position in range(self._start, self._end):
+            yield self._buffer[position].copy()
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self._buffer[self._position(index)].copy()
+
+    def __setitem__(self, index: int, candle: Iterable):
+        """
+        Replaces a stored candle in place. Used to update the live candle, which doesn't change the version if the
+        values are the same.
+        """
+        position = self._position(index)
+        candle = np.asarray(candle, dtype=float)
+        if not np.array_equal(self._buffer[position], candle):
+            self._buffer[position] = candle
+            self._version += 1
+            if position != self._end - 1:
+                self._resets_count += 1
+
+    def append(self, candle: Iterable):
+        if self._maxlen == 0:
+            return
+        if self._end == len(self._buffer):
+            self._move_to_start()
+        self._buffer[self._end] = np.asarray(candle, dtype=float)
+        self._end += 1
+        if self._end - self._start > self._maxlen:
+            self._start += 1
+        self._version += 1
+        self._appends_count += 1
+
+    def pop(self) -> np.ndarray:
+        if self._end == self._start:
+            raise IndexError("pop from an empty CandlesStore")
+        self._end -= 1
+        self._version += 1
+        self._resets_count += 1
+        return self._buffer[self._end].copy()
+
+    def extendleft(self, candles: Iterable[Iterable]):
+        """
+        Adds the candles to the start of the store one by one, so they end up in reverse order. As with a deque, if
+        the store is full the newest candles are discarded.
+        """
+        new_candles = np.asarray(candles if isinstance(candles, np.ndarray) else list(candles), dtype=float)
+        if len(new_candles) == 0:
+            return
+        new_candles = new_candles.reshape(-1, self._buffer.shape[1])[::-1]
+        stored_candles = np.concatenate([new_candles, self._buffer[self._start:self._end]])[:self._maxlen]
+        self._buffer[:len(stored_candles)] = stored_candles
+        self._start = 0
+        self._end = len(stored_candles)
+        self._version += 1
+        self._resets_count += 1
+
+    def clear(self):
+        self._start = 0
+        self._end = 0
+        self._version += 1
+        self._resets_count += 1
+
+    def _position(self, index: int) -> int:
+        length = self._end - self._start
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("CandlesStore index out of range")
+        return self._start + index
+
+    def _move_to_start(self):
+        length = self._end - self._start
+        self._buffer[:length] = self._buffer[self._start:self._end]
+        self._start = 0
+        self._end = length
@@ -171,7 +171,6 @@ class GateioSpotCandles(CandlesBase):
                                                    quote_asset_volume, n_trades, taker_buy_base_volume,
                                                    taker_buy_quote_volume]))
                 elif timestamp_ms == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp_ms, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+                    self._candles[-1] = np.array([timestamp_ms, open, high, low, close, volume,
+                                                  quote_asset_volume, n_trades, taker_buy_base_volume,
+                                                  taker_buy_quote_volume])
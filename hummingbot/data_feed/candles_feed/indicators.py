@@ -0,0 +1,422 @@
+import math
+import sys
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+NaN = float("nan")
+
+
+class _Rolling:
+    """
+    Mean and population variance of the last `length` values, as pandas `rolling(length).mean()` and
+    `rolling(length).var(ddof=0)`.
+    The sums are kept relative to a reference value to avoid losing precision with large prices, and are computed again
+    from the window every `length` values so the rounding errors don't build up.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._window = deque()
+        self._reference = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._added_count = 0
+        self._live: Optional[float] = None
+
+    def compute(self, value: float) -> Tuple[float, float]:
+        self._live = value
+        if len(self._window) + 1 < self._length:
+            return NaN, NaN
+        deviation = value - self._reference
+        values_sum = self._sum + deviation
+        mean = values_sum / self._length
+        variance = max((self._sum_sq + deviation * deviation) / self._length - mean * mean, 0.0)
+        return self._reference + mean, variance
+
+    def commit(self):
+        if self._live is None:
+            return
+        value, self._live = self._live, None
+        self._window.append(value)
+        if len(self._window) >= self._length:
+            removed_deviation = self._window.popleft() - self._reference
+            self._sum -= removed_deviation
+            self._sum_sq -= removed_deviation * removed_deviation
+        self._added_count += 1
+        if self._added_count % self._length == 0:
+            self._reference = value
+            self._sum = sum(window_value - value for window_value in self._window)
+            self._sum_sq = sum((window_value - value) ** 2 for window_value in self._window)
+        else:
+            deviation = value - self._reference
+            self._sum += deviation
+            self._sum_sq += deviation * deviation
+
+
+class _EWM:
+    """
+    Exponentially weighted mean, computed as pandas `ewm(alpha=alpha, adjust=adjust, min_periods=min_periods).mean()`.
+    """
+
+    def __init__(self, alpha: float, adjust: bool, min_periods: int = 0):
+        self._old_weight_factor = 1.0 - alpha
+        self._new_weight = 1.0 if adjust else alpha
+        self._adjust = adjust
+        self._min_periods = max(min_periods, 1)
+        # Weighted mean, weight of the previous values and number of observations
+        self._state: Tuple[float, float, int] = (NaN, 1.0, 0)
+        self._live: Optional[Tuple[float, float, int]] = None
+
+    def compute(self, value: float) -> float:
+        weighted, old_weight, observations_count = self._state
+        is_observation = value == value
+        observations_count += is_observation
+        if weighted == weighted:
+            old_weight *= self._old_weight_factor
+            if is_observation:
+                if weighted != value:
+                    weighted = (old_weight * weighted + self._new_weight * value) / (old_weight + self._new_weight)
+                old_weight = old_weight + self._new_weight if self._adjust else 1.0
+        elif is_observation:
+            weighted = value
+        self._live = (weighted, old_weight, observations_count)
+        return weighted if observations_count >= self._min_periods else NaN
+
+    def commit(self):
+        if self._live is not None:
+            self._state, self._live = self._live, None
+
+
+class _EMA:
+    """
+    Exponential moving average as computed by pandas_ta: the first value is the mean of the first `length` values and
+    the rest are computed with `ewm(span=length, adjust=False)`.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._ewm = _EWM(alpha=2.0 / (length + 1), adjust=False)
+        # Number of values, and sum and count of the non NaN values of the first `length` values
+        self._state: Tuple[int, float, int] = (0, 0.0, 0)
+        self._live: Optional[Tuple[int, float, int]] = None
+
+    def compute(self, value: float) -> float:
+        values_count, seed_sum, seed_count = self._state
+        values_count += 1
+        if values_count <= self._length and value == value:
+            seed_sum += value
+            seed_count += 1
+        self._live = (values_count, seed_sum, seed_count)
+        if values_count < self._length:
+            return NaN
+        if values_count == self._length:
+            value = seed_sum / seed_count if seed_count > 0 else NaN
+        return self._ewm.compute(value)
+
+    def commit(self):
+        if self._live is not None:
+            self._state, self._live = self._live, None
+            self._ewm.commit()
+
+
+class _Previous:
+    """
+    Returns the previous value, as pandas `shift(1)`.
+    """
+
+    def __init__(self):
+        self._previous = NaN
+        self._live: Optional[float] = None
+
+    def compute(self, value: float) -> float:
+        self._live = value
+        return self._previous
+
+    def commit(self):
+        if self._live is not None:
+            self._previous, self._live = self._live, None
+
+
+def _non_zero(value: float) -> float:
+    # As pandas_ta `non_zero_range`, to avoid dividing by zero
+    return value + sys.float_info.epsilon if value == 0 else value
+
+
+class CandlesIndicator:
+    """
+    Base class of the indicators computed incrementally from the candles, so each new or updated candle is processed
+    in constant time instead of computing the indicator again over all the candles.
+    The values of the live candle can change until the next candle is added, so each indicator keeps the state up to
+    the previous candle, and the state including the live candle is only committed when a new candle is added.
+    The indicators have the same names, columns and values as the ones of pandas_ta with the same parameters, when
+    computed over all the candles processed since the indicator was reset.
+    """
+    inputs: Tuple[str, ...] = ("close",)
+
+    def __init__(self, name: str, columns: List[str]):
+        self._name = name
+        self._columns = columns
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    def reset(self):
+        raise NotImplementedError
+
+    def compute(self, *values: float) -> Sequence[float]:
+        """
+        Computes the indicator values of the live candle.
+        :param values: values of the columns in `inputs` of the candle
+        """
+        raise NotImplementedError
+
+    def commit(self):
+        """
+        Commits the state of the live candle, before adding a new candle.
+        """
+        raise NotImplementedError
+
+
+class SMA(CandlesIndicator):
+
+    def __init__(self, length: int = 10):
+        super().__init__(name=f"SMA_{length}", columns=[f"SMA_{length}"])
+        self._length = length
+        self.reset()
+
+    def reset(self):
+        self._rolling = _Rolling(self._length)
+
+    def compute(self, close: float) -> Sequence[float]:
+        return self._rolling.compute(close)[:1]
+
+    def commit(self):
+        self._rolling.commit()
+
+
+class EMA(CandlesIndicator):
+
+    def __init__(self, length: int = 10):
+        super().__init__(name=f"EMA_{length}", columns=[f"EMA_{length}"])
+        self._length = length
+        self.reset()
+
+    def reset(self):
+        self._ema = _EMA(self._length)
+
+    def compute(self, close: float) -> Sequence[float]:
+        return (self._ema.compute(close),)
+
+    def commit(self):
+        self._ema.commit()
+
+
+class BBands(CandlesIndicator):
+    """
+    Bollinger Bands of `length` candles with `std` standard deviations, as pandas_ta `bbands` (simple moving average and
+    population standard deviation).
+    """
+
+    def __init__(self, length: int = 5, std: float = 2.0):
+        suffix = f"_{length}_{std}"
+        super().__init__(name=f"BBANDS{suffix}",
+                         columns=[f"BBL{suffix}", f"BBM{suffix}", f"BBU{suffix}", f"BBB{suffix}", f"BBP{suffix}"])
+        self._length = length
+        self._std = std
+        self.reset()
+
+    def reset(self):
+        self._rolling = _Rolling(self._length)
+
+    def compute(self, close: float) -> Sequence[float]:
+        mid, variance = self._rolling.compute(close)
+        deviations = self._std * math.sqrt(variance)
+        lower = mid - deviations
+        upper = mid + deviations
+        bands_range = _non_zero(upper - lower)
+        bandwidth = 100 * bands_range / mid if mid != 0 else NaN
+        percent = _non_zero(close - lower) / bands_range
+        return lower, mid, upper, bandwidth, percent
+
+    def commit(self):
+        self._rolling.commit()
+
+
+class MACD(CandlesIndicator):
+    """
+    Moving Average Convergence Divergence, as pandas_ta `macd`. The columns are the MACD, the histogram and the signal.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        suffix = f"_{fast}_{slow}_{signal}"
+        super().__init__(name=f"MACD{suffix}", columns=[f"MACD{suffix}", f"MACDh{suffix}", f"MACDs{suffix}"])
+        self._fast = fast
+        self._slow = slow
+        self._signal = signal
+        self.reset()
+
+    def reset(self):
+        self._fast_ema = _EMA(self._fast)
+        self._slow_ema = _EMA(self._slow)
+        # The signal is only computed from the valid MACD values
+        self._signal_ema = _EMA(self._signal)
+
+    def compute(self, close: float) -> Sequence[float]:
+        macd = self._fast_ema.compute(close) - self._slow_ema.compute(close)
+        if macd != macd:
+            return NaN, NaN, NaN
+        signal = self._signal_ema.compute(macd)
+        return macd, macd - signal, signal
+
+    def commit(self):
+        self._fast_ema.commit()
+        self._slow_ema.commit()
+        self._signal_ema.commit()
+
+
+class RSI(CandlesIndicator):
+    """
+    Relative Strength Index, as pandas_ta `rsi` (the gains and losses are averaged with `ewm(alpha=1 / length)`).
+    """
+
+    def __init__(self, length: int = 14):
+        super().__init__(name=f"RSI_{length}", columns=[f"RSI_{length}"])
+        self._length = length
+        self.reset()
+
+    def reset(self):
+        self._previous_close = _Previous()
+        self._gains = _EWM(alpha=1.0 / self._length, adjust=True, min_periods=self._length)
+        self._losses = _EWM(alpha=1.0 / self._length, adjust=True, min_periods=self._length)
+
+    def compute(self, close: float) -> Sequence[float]:
+        change = close - self._previous_close.compute(close)
+        gain = self._gains.compute(max(change, 0.0) if change == change else NaN)
+        loss = abs(self._losses.compute(min(change, 0.0) if change == change else NaN))
+        return (100 * gain / (gain + loss) if gain + loss != 0 else NaN,)
+
+    def commit(self):
+        self._previous_close.commit()
+        self._gains.commit()
+        self._losses.commit()
+
+
+class NATR(CandlesIndicator):
+    """
+    Normalized Average True Range, as pandas_ta `natr` (the true range is averaged with an EMA).
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = 14):
+        super().__init__(name=f"NATR_{length}", columns=[f"NATR_{length}"])
+        self._length = length
+        self.reset()
+
+    def reset(self):
+        self._previous_close = _Previous()
+        self._atr = _EMA(self._length)
+
+    def compute(self, high: float, low: float, close: float) -> Sequence[float]:
+        previous_close = self._previous_close.compute(close)
+        if previous_close != previous_close:
+            true_range = NaN
+        else:
+            true_range = max(abs(_non_zero(high - low)), abs(high - previous_close), abs(previous_close - low))
+        return (100 / close * self._atr.compute(true_range),)
+
+    def commit(self):
+        self._previous_close.commit()
+        self._atr.commit()
+
+
+class CandlesIndicators:
+    """
+    Keeps the values of the indicators added to a candles feed in sync with its candles, one row per candle.
+    The indicators are updated the next time their values are read:
+    - If candles were only appended, or the last one updated, only those candles are processed.
+    - Any other change to the candles (e.g. adding the historical candles before the first one) computes the indicators
+      again from all the stored candles.
+    Indicators with the same name are only computed once, so they are shared by all the users of the candles.
+    """
+
+    def __init__(self, candles: CandlesStore, columns: List[str]):
+        self._candles = candles
+        self._column_indexes = {column: index for index, column in enumerate(columns)}
+        self._indicators: Dict[str, CandlesIndicator] = {}
+        self._inputs: Dict[str, List[int]] = {}
+        self._values: Dict[str, CandlesStore] = {}
+        self._synced_version: Optional[int] = None
+        self._synced_appends_count = 0
+        self._synced_resets_count = 0
+        self._synced_length = 0
+
+    def add(self, indicator: CandlesIndicator) -> CandlesIndicator:
+        """
+        Adds the indicator if there isn't one with the same name already, and returns the one computed.
+        """
+        existing_indicator = self._indicators.get(indicator.name)
+        if existing_indicator is not None:
+            return existing_indicator
+        self._sync()
+        self._indicators[indicator.name] = indicator
+        self._inputs[indicator.name] = [self._column_indexes[column] for column in indicator.inputs]
+        self._values[indicator.name] = CandlesStore(columns_count=len(indicator.columns), maxlen=self._candles.maxlen)
+        self._compute_all(indicator)
+        return indicator
+
+    def get_values(self, indicator: CandlesIndicator) -> np.ndarray:
+        """
+        Returns a read-only view of the values of the indicator, one row per stored candle.
+        """
+        indicator = self.add(indicator)
+        self._sync()
+        return self._values[indicator.name].values
+
+    def _sync(self):
+        candles = self._candles
+        if candles.version == self._synced_version:
+            return
+        new_candles_count = candles.appends_count - self._synced_appends_count
+        if (candles.resets_count != self._synced_resets_count
+                or self._synced_length == 0
+                or new_candles_count >= len(candles)):
+            for indicator in self._indicators.values():
+                self._compute_all(indicator)
+        else:
+            # The last candle processed could have been updated before the new ones were added
+            first_new_index = len(candles) - new_candles_count
+            for index in range(first_new_index - 1, len(candles)):
+                candle = candles[index].tolist()
+                is_new_candle = index >= first_new_index
+                for name, indicator in self._indicators.items():
+                    if is_new_candle:
+                        indicator.commit()
+                    values = indicator.compute(*[candle[input_index] for input_index in self._inputs[name]])
+                    if is_new_candle:
+                        self._values[name].append(values)
+                    else:
+                        self._values[name][-1] = values
+        self._synced_version = candles.version
+        self._synced_appends_count = candles.appends_count
+        self._synced_resets_count = candles.resets_count
+        self._synced_length = len(candles)
+
+    def _compute_all(self, indicator: CandlesIndicator):
+        indicator.reset()
+        values = self._values[indicator.name]
+        values.clear()
+        input_indexes = self._inputs[indicator.name]
+        for candle in self._candles.values[:, input_indexes].tolist():
+            indicator.commit()
+            values.append(indicator.compute(*candle))
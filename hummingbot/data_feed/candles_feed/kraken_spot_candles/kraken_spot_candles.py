@@ -56,9 +56,8 @@ class KrakenSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+    def _candles_to_df(self) -> pd.DataFrame:
+        df = super()._candles_to_df()
         df["timestamp"] = df["timestamp"] * 1000
         return df.sort_values(by="timestamp", ascending=True)
 
@@ -210,7 +209,6 @@ class KrakenSpotCandles(CandlesBase):
                                                        quote_asset_volume, n_trades, taker_buy_base_volume,
                                                        taker_buy_quote_volume]))
                     elif timestamp == int(self._candles[-1][0]):
-                        self._candles.pop()
-                        self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                       quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                       taker_buy_quote_volume]))
+                        self._candles[-1] = np.array([timestamp, open, high, low, close, volume,
+                                                      quote_asset_volume, n_trades, taker_buy_base_volume,
+                                                      taker_buy_quote_volume])
@@ -61,9 +61,8 @@ class KucoinSpotCandles(CandlesBase):
     def intervals(self):
         return CONSTANTS.INTERVALS
 
-    @property
-    def candles_df(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+    def _candles_to_df(self) -> pd.DataFrame:
+        df = super()._candles_to_df()
         df["timestamp"] = df["timestamp"] * 1000
         return df.sort_values(by="timestamp", ascending=True)
 
@@ -186,8 +185,7 @@ class KucoinSpotCandles(CandlesBase):
                     # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
                     self._candles.append(candles_array)
                 elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(candles_array)
+                    self._candles[-1] = candles_array
 
     async def _connected_websocket_assistant(self) -> WSAssistant:
         rest_assistant = await self._api_factory.get_rest_assistant()
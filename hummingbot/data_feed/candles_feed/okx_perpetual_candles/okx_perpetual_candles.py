@@ -156,5 +156,4 @@ class OKXPerpetualCandles(CandlesBase):
                 elif int(timestamp) > int(self._candles[-1][0]):
                     self._candles.append(candles_row)
                 elif int(timestamp) == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(candles_row)
+                    self._candles[-1] = candles_row
@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -6,6 +6,7 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
+from hummingbot.data_feed.candles_feed.indicators import CandlesIndicator
 
 
 class MarketDataProvider:
@@ -55,6 +56,9 @@ class MarketDataProvider:
             return existing_feed
         else:
             # Create a new feed or restart the existing one with updated max_records
+            if existing_feed:
+                # The replaced feed stops sharing the websocket connection of the exchange
+                existing_feed.stop()
             candle_feed = CandlesFactory.get_candle(config)
             self.candles_feeds[key] = candle_feed
             if hasattr(candle_feed, 'start'):
@@ -113,13 +117,15 @@ class MarketDataProvider:
         connector = self.get_connector(connector_name)
         return connector.get_price_by_type(trading_pair, price_type)
 
-    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500,
+                       indicators: Optional[List[CandlesIndicator]] = None):
         """
         Retrieves the candles for a trading pair from the specified connector.
         :param connector_name: str
         :param trading_pair: str
         :param interval: str
         :param max_records: int
+        :param indicators: List[CandlesIndicator] added as columns, computed incrementally by the candles feed
         :return: Candles dataframe.
         """
         candles = self.get_candles_feed(CandlesConfig(
@@ -128,7 +134,26 @@ class MarketDataProvider:
             interval=interval,
             max_records=max_records,
         ))
-        return candles.candles_df.iloc[-max_records:]
+        return candles.get_candles_df(max_records=max_records, indicators=indicators)
+
+    def get_last_candle(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500,
+                        indicators: Optional[List[CandlesIndicator]] = None) -> Dict[str, float]:
+        """
+        Retrieves the values of the last candle for a trading pair from the specified connector.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param max_records: int
+        :param indicators: List[CandlesIndicator] whose values are included, computed incrementally by the candles feed
+        :return: Values of the last candle by column.
+        """
+        candles = self.get_candles_feed(CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        ))
+        return candles.get_last_candle(indicators=indicators)
 
     def get_trading_pairs(self, connector_name: str):
         """
@@ -0,0 +1,479 @@
+import logging
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataSegment:
+    """
+    A segment file stores the order book and trade messages of a trading pair received during a period of time.
+    It is an append-only sequence of blocks, and each block stores a group of rows in columns (one row per order book
+    level or trade) that are compressed separately:
+    - timestamp: timestamp of the message
+    - update_id: update id of the order book message, or trade id of the trade (-1 if it is not numeric)
+    - type: OrderBookMessageType value of the message
+    - side: 1 for the bids and the buy trades, 2 for the asks and the sell trades (the TradeType values)
+    - price: price of the level or the trade
+    - amount: amount of the level (0 when it is removed) or the trade
+    The bytes of each column are shuffled before they are compressed, so the bytes of the values that change less
+    (like the exponent of the prices) are stored together and compress better.
+    The blocks of a segment are listed in an index file next to it, so a time range can be read without reading the
+    whole segment. The blocks written after the last index update (if the recorder was interrupted) are found by
+    reading their headers.
+    """
+
+    FILE_EXTENSION = ".hbmd"
+    INDEX_FILE_EXTENSION = ".idx"
+    BLOCK_MAGIC = b"HBMD"
+    # magic, rows, first timestamp, last timestamp and the compressed size of each column
+    BLOCK_HEADER = struct.Struct("<4sIdd6I")
+    COLUMNS: Tuple[Tuple[str, np.dtype], ...] = (
+        ("timestamp", np.dtype("<f8")),
+        ("update_id", np.dtype("<i8")),
+        ("type", np.dtype("u1")),
+        ("side", np.dtype("u1")),
+        ("price", np.dtype("<f8")),
+        ("amount", np.dtype("<f8")),
+    )
+    INDEX_DTYPE = np.dtype([("offset", "<i8"), ("size", "<i8"), ("rows", "<i8"),
+                            ("start_timestamp", "<f8"), ("end_timestamp", "<f8")])
+
+    def __init__(self, file_path: str, compression_level: int = 3):
+        """
+        Opens the segment to append blocks, discarding any block left incomplete at the end of the file.
+        :param file_path: path of the segment file, created if it does not exist
+        :param compression_level: zlib compression level of the columns
+        """
+        self._file_path = file_path
+        self._compression_level = compression_level
+        self._blocks: List[Tuple[int, int, int, float, float]] = self.read_blocks(file_path).tolist()
+        end = self._blocks[-1][0] + self._blocks[-1][1] if len(self._blocks) > 0 else 0
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "ab") as segment_file:
+            segment_file.truncate(end)
+        self._file = open(file_path, "ab")
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @classmethod
+    def index_file_path(cls, file_path: str) -> str:
+        return f"{file_path}{cls.INDEX_FILE_EXTENSION}"
+
+    def append(self, columns: Dict[str, np.ndarray]):
+        """
+        Writes a block with the rows and updates the index of the segment.
+        :param columns: arrays of the same length with the values of each column
+        """
+        timestamps = columns["timestamp"]
+        compressed_columns = [self._encode(name, np.ascontiguousarray(columns[name], dtype=dtype))
+                              for name, dtype in self.COLUMNS]
+        header = self.BLOCK_HEADER.pack(self.BLOCK_MAGIC, len(timestamps), timestamps.min(), timestamps.max(),
+                                        *[len(column) for column in compressed_columns])
+        offset = self._file.tell()
+        self._file.write(header)
+        for column in compressed_columns:
+            self._file.write(column)
+        self._file.flush()
+        self._blocks.append((offset, self._file.tell() - offset, len(timestamps), timestamps.min(), timestamps.max()))
+        self._write_index()
+
+    def close(self):
+        self._file.close()
+
+    @classmethod
+    def read(cls, file_path: str, start_time: Optional[float] = None,
+             end_time: Optional[float] = None) -> pd.DataFrame:
+        """
+        Returns the rows of the segment with a timestamp between start_time and end_time (both included), in the
+        order they were recorded. Only the blocks with rows in the time range are read.
+        :param file_path: path of the segment file
+        :param start_time: min timestamp of the rows, from the oldest one if not provided
+        :param end_time: max timestamp of the rows, up to the newest one if not provided
+        """
+        blocks = cls.read_blocks(file_path)
+        if start_time is not None:
+            blocks = blocks[blocks["end_timestamp"] >= start_time]
+        if end_time is not None:
+            blocks = blocks[blocks["start_timestamp"] <= end_time]
+        columns: Dict[str, List[np.ndarray]] = {name: [] for name, _ in cls.COLUMNS}
+        if len(blocks) > 0:
+            with open(file_path, "rb") as segment_file:
+                for offset, size, _, _, _ in blocks.tolist():
+                    segment_file.seek(offset)
+                    for name, values in cls._decode_block(segment_file.read(size)).items():
+                        columns[name].append(values)
+        data = pd.DataFrame({name: np.concatenate(columns[name]) if len(columns[name]) > 0 else np.empty(0, dtype)
+                             for name, dtype in cls.COLUMNS})
+        if start_time is not None or end_time is not None:
+            timestamps = data["timestamp"].values
+            in_range = np.ones(len(data), dtype=bool)
+            if start_time is not None:
+                in_range &= timestamps >= start_time
+            if end_time is not None:
+                in_range &= timestamps <= end_time
+            data = data[in_range].reset_index(drop=True)
+        return data
+
+    @classmethod
+    def read_blocks(cls, file_path: str) -> np.ndarray:
+        """
+        Returns the index of the complete blocks of the segment (offset, size, rows, start and end timestamps).
+        """
+        if not os.path.exists(file_path):
+            return np.empty(0, dtype=cls.INDEX_DTYPE)
+        index_file_path = cls.index_file_path(file_path)
+        blocks = np.load(index_file_path) if os.path.exists(index_file_path) else np.empty(0, dtype=cls.INDEX_DTYPE)
+        offset = int(blocks["offset"][-1] + blocks["size"][-1]) if len(blocks) > 0 else 0
+        file_size = os.path.getsize(file_path)
+        unindexed_blocks = []
+        with open(file_path, "rb") as segment_file:
+            segment_file.seek(offset)
+            while offset + cls.BLOCK_HEADER.size <= file_size:
+                magic, rows, start_timestamp, end_timestamp, *sizes = cls.BLOCK_HEADER.unpack(
+                    segment_file.read(cls.BLOCK_HEADER.size))
+                size = cls.BLOCK_HEADER.size + sum(sizes)
+                if magic != cls.BLOCK_MAGIC or rows == 0 or offset + size > file_size:
+                    break
+                unindexed_blocks.append((offset, size, rows, start_timestamp, end_timestamp))
+                offset += size
+                segment_file.seek(offset)
+        if len(unindexed_blocks) > 0:
+            blocks = np.concatenate([blocks, np.array(unindexed_blocks, dtype=cls.INDEX_DTYPE)])
+        return blocks
+
+    def _write_index(self):
+        # The index is written to a temporary file first and then renamed, so it is never read half written
+        index_file_path = self.index_file_path(self._file_path)
+        temporary_file_path = f"{index_file_path}.tmp"
+        with open(temporary_file_path, "wb") as index_file:
+            np.save(index_file, np.array(self._blocks, dtype=self.INDEX_DTYPE))
+        os.replace(temporary_file_path, index_file_path)
+
+    def _encode(self, name: str, values: np.ndarray) -> bytes:
+        if name == "update_id":
+            # The update ids grow steadily, so their differences take less space than their values
+            values = np.diff(values, prepend=0)
+        shuffled = values.view(np.uint8).reshape(-1, values.itemsize).T
+        return zlib.compress(shuffled.tobytes(), self._compression_level)
+
+    @classmethod
+    def _decode_block(cls, block: bytes) -> Dict[str, np.ndarray]:
+        _, rows, _, _, *sizes = cls.BLOCK_HEADER.unpack_from(block)
+        columns = {}
+        position = cls.BLOCK_HEADER.size
+        for (name, dtype), size in zip(cls.COLUMNS, sizes):
+            shuffled = np.frombuffer(zlib.decompress(block[position:position + size]), dtype=np.uint8)
+            values = shuffled.reshape(dtype.itemsize, rows).T.copy().view(dtype).ravel()
+            columns[name] = np.cumsum(values) if name == "update_id" else values
+            position += size
+        return columns
+
+
+class _PairBuffer:
+    """
+    Rows of the messages of a trading pair pending to be written, grouped by message so the values shared by all the
+    rows of a message are repeated only when the block is written.
+    """
+
+    def __init__(self, segment_start: float, created: float):
+        self.segment_start = segment_start
+        self.created = created
+        self.rows = 0
+        self.timestamps: List[float] = []
+        self.update_ids: List[int] = []
+        self.types: List[int] = []
+        self.row_counts: List[int] = []
+        self.sides: List[np.ndarray] = []
+        self.prices_and_amounts: List[np.ndarray] = []
+
+    def add(self, timestamp: float, update_id: int, message_type: int, sides: np.ndarray,
+            prices_and_amounts: np.ndarray):
+        self.timestamps.append(timestamp)
+        self.update_ids.append(update_id)
+        self.types.append(message_type)
+        self.row_counts.append(len(sides))
+        self.sides.append(sides)
+        self.prices_and_amounts.append(prices_and_amounts)
+        self.rows += len(sides)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        prices_and_amounts = np.concatenate(self.prices_and_amounts)
+        return {
+            "timestamp": np.repeat(np.array(self.timestamps, dtype=np.float64), self.row_counts),
+            "update_id": np.repeat(np.array(self.update_ids, dtype=np.int64), self.row_counts),
+            "type": np.repeat(np.array(self.types, dtype=np.uint8), self.row_counts),
+            "side": np.concatenate(self.sides),
+            "price": prices_and_amounts[:, 0],
+            "amount": prices_and_amounts[:, 1],
+        }
+
+
+class MarketDataRecorder:
+    """
+    This class records the order book diffs, snapshots and trades of the trading pairs of a connector, as they are
+    processed by its order book tracker, in compressed columnar segments (see MarketDataSegment) that can be read
+    later for research or to replay the order books.
+    The event loop only puts the messages in a queue; they are converted to rows, compressed and written to disk by a
+    writer thread. The rows of each trading pair are written in blocks, every flush_interval seconds or when
+    max_block_rows rows are pending, and a new segment is started every segment_duration seconds.
+    The segments are stored in data/market_data/<connector name>/<trading pair>/<segment start time>.hbmd
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+    _STOP = object()
+    BID_SIDE = TradeType.BUY.value
+    ASK_SIDE = TradeType.SELL.value
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 connector_name: str,
+                 data_dir: Optional[str] = None,
+                 segment_duration: float = 3600.0,
+                 flush_interval: float = 10.0,
+                 max_block_rows: int = 100000,
+                 compression_level: int = 3):
+        """
+        :param connector_name: name of the connector of the recorded trading pairs
+        :param data_dir: directory of the recordings, data/market_data if not provided
+        :param segment_duration: seconds of messages stored in each segment
+        :param flush_interval: max seconds the messages received are kept in memory before they are written
+        :param max_block_rows: max number of rows of each block
+        :param compression_level: zlib compression level of the columns
+        """
+        self._connector_name = connector_name
+        self._data_dir = os.path.join(data_dir or os.path.join(data_path(), "market_data"), connector_name)
+        self._segment_duration = segment_duration
+        self._flush_interval = flush_interval
+        self._max_block_rows = max_block_rows
+        self._compression_level = compression_level
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+        # Only used by the writer thread
+        self._buffers: Dict[str, _PairBuffer] = {}
+        self._segments: Dict[str, MarketDataSegment] = {}
+
+    @property
+    def connector_name(self) -> str:
+        return self._connector_name
+
+    @property
+    def data_dir(self) -> str:
+        return self._data_dir
+
+    @property
+    def is_recording(self) -> bool:
+        return self._writer_thread is not None
+
+    @property
+    def pending_messages(self) -> int:
+        """
+        Returns the number of messages waiting to be processed by the writer thread
+        """
+        return self._queue.qsize()
+
+    def start(self):
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_loop, name=f"{self._connector_name}_recorder",
+                                                   daemon=True)
+            self._writer_thread.start()
+
+    def stop(self):
+        """
+        Writes the pending messages and waits for the writer thread to finish.
+        """
+        if self._writer_thread is not None:
+            self._queue.put(self._STOP)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def record_message(self, message: OrderBookMessage):
+        """
+        Records an order book diff or snapshot, or a trade message. The message must not be modified afterwards.
+        """
+        if self._writer_thread is not None:
+            self._queue.put(message)
+
+    def record_order_book(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        """
+        Records the current levels of an order book as a snapshot.
+        :param trading_pair: trading pair of the order book
+        :param order_book: the order book
+        :param timestamp: timestamp of the snapshot
+        """
+        if self._writer_thread is not None:
+            bid_prices, bid_amounts, _ = order_book.bid_arrays()
+            ask_prices, ask_amounts, _ = order_book.ask_arrays()
+            self._queue.put(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": trading_pair,
+                "update_id": order_book.snapshot_uid,
+                "bids": np.column_stack([bid_prices, bid_amounts]),
+                "asks": np.column_stack([ask_prices, ask_amounts]),
+            }, timestamp))
+
+    def segment_paths(self, trading_pair: str) -> List[str]:
+        """
+        Returns the paths of the segments recorded for a trading pair, oldest first.
+        """
+        trading_pair_dir = os.path.join(self._data_dir, trading_pair)
+        if not os.path.isdir(trading_pair_dir):
+            return []
+        return [os.path.join(trading_pair_dir, file_name)
+                for file_name in sorted(os.listdir(trading_pair_dir))
+                if file_name.endswith(MarketDataSegment.FILE_EXTENSION)]
+
+    def read(self, trading_pair: str, start_time: Optional[float] = None,
+             end_time: Optional[float] = None) -> pd.DataFrame:
+        """
+        Returns the recorded rows of a trading pair with a timestamp between start_time and end_time.
+        See MarketDataSegment.read
+        """
+        segments = [MarketDataSegment.read(file_path, start_time=start_time, end_time=end_time)
+                    for file_path in self.segment_paths(trading_pair)]
+        if len(segments) == 0:
+            return pd.DataFrame({name: np.empty(0, dtype) for name, dtype in MarketDataSegment.COLUMNS})
+        return pd.concat(segments, ignore_index=True)
+
+    @classmethod
+    def iter_messages(cls, trading_pair: str, data: pd.DataFrame) -> Iterator[OrderBookMessage]:
+        """
+        Converts recorded rows back to the order book and trade messages, in the order they were recorded, so they
+        can be replayed in an order book (the consecutive levels of the same type, timestamp and update id are
+        returned as one message).
+        :param trading_pair: trading pair of the rows
+        :param data: rows returned by read
+        """
+        if len(data) == 0:
+            return
+        timestamps, update_ids = data["timestamp"].values, data["update_id"].values
+        types, sides = data["type"].values, data["side"].values
+        prices_and_amounts = data[["price", "amount"]].values
+        is_trade = types == OrderBookMessageType.TRADE.value
+        message_starts = np.ones(len(data), dtype=bool)
+        message_starts[1:] = ((types[1:] != types[:-1]) | (timestamps[1:] != timestamps[:-1])
+                              | (update_ids[1:] != update_ids[:-1]) | is_trade[1:])
+        boundaries = np.append(np.flatnonzero(message_starts), len(data))
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            message_type = OrderBookMessageType(types[start])
+            if message_type is OrderBookMessageType.TRADE:
+                content: Dict[str, Any] = {
+                    "trading_pair": trading_pair,
+                    "trade_type": float(sides[start]),
+                    "trade_id": int(update_ids[start]),
+                    "price": prices_and_amounts[start, 0],
+                    "amount": prices_and_amounts[start, 1],
+                }
+            else:
+                message_sides = sides[start:end]
+                content = {
+                    "trading_pair": trading_pair,
+                    "update_id": int(update_ids[start]),
+                    "bids": prices_and_amounts[start:end][message_sides == cls.BID_SIDE],
+                    "asks": prices_and_amounts[start:end][message_sides == cls.ASK_SIDE],
+                }
+            yield OrderBookMessage(message_type, content, float(timestamps[start]))
+
+    def _write_loop(self):
+        stop = False
+        next_flush_check = time.time() + 1
+        while not stop:
+            try:
+                message = self._queue.get(timeout=1)
+                if message is self._STOP:
+                    stop = True
+                else:
+                    self._add_message(message, time.time())
+            except queue.Empty:
+                pass
+            except Exception:
+                self.logger().error("Unexpected error recording a market data message.", exc_info=True)
+            now = time.time()
+            if stop or now >= next_flush_check:
+                self._flush_buffers(now, flush_all=stop)
+                next_flush_check = now + 1
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    def _add_message(self, message: OrderBookMessage, now: float):
+        trading_pair = message.trading_pair
+        segment_start = now - now % self._segment_duration
+        buffer = self._buffers.get(trading_pair)
+        if buffer is not None and buffer.segment_start != segment_start:
+            self._flush_buffer(trading_pair)
+            buffer = None
+        if buffer is None:
+            buffer = self._buffers[trading_pair] = _PairBuffer(segment_start=segment_start, created=now)
+
+        if message.type is OrderBookMessageType.TRADE:
+            update_id = message.trade_id
+            sides = np.array([int(float(message.content["trade_type"]))], dtype=np.uint8)
+            prices_and_amounts = np.array([[float(message.content["price"]), float(message.content["amount"])]])
+            if not isinstance(update_id, int):
+                update_id = int(update_id) if str(update_id).isdigit() else -1
+        else:
+            update_id = int(message.update_id)
+            bids = self._levels_array(getattr(message, "bids_array", None), message.content["bids"])
+            asks = self._levels_array(getattr(message, "asks_array", None), message.content["asks"])
+            sides = np.repeat(np.array([self.BID_SIDE, self.ASK_SIDE], dtype=np.uint8), [len(bids), len(asks)])
+            prices_and_amounts = np.concatenate([bids, asks])
+        buffer.add(timestamp=float(message.timestamp), update_id=update_id, message_type=message.type.value,
+                   sides=sides, prices_and_amounts=prices_and_amounts)
+        if buffer.rows >= self._max_block_rows:
+            self._flush_buffer(trading_pair)
+
+    @staticmethod
+    def _levels_array(levels_array: Optional[np.ndarray], rows: Any) -> np.ndarray:
+        if levels_array is not None:
+            return levels_array[:, :2]
+        if len(rows) == 0:
+            return np.empty((0, 2))
+        if isinstance(rows, np.ndarray):
+            return rows[:, :2].astype(np.float64)
+        return np.array([row[:2] for row in rows], dtype=np.float64)
+
+    def _flush_buffers(self, now: float, flush_all: bool = False):
+        for trading_pair, buffer in list(self._buffers.items()):
+            if flush_all or now - buffer.created >= self._flush_interval:
+                self._flush_buffer(trading_pair)
+
+    def _flush_buffer(self, trading_pair: str):
+        buffer = self._buffers.pop(trading_pair)
+        if buffer.rows == 0:
+            return
+        try:
+            segment = self._segment(trading_pair, buffer.segment_start)
+            segment.append(buffer.columns())
+        except Exception:
+            self.logger().error(f"Unexpected error writing the market data of {trading_pair}.", exc_info=True)
+
+    def _segment(self, trading_pair: str, segment_start: float) -> MarketDataSegment:
+        file_name = datetime.fromtimestamp(segment_start, tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
+        file_path = os.path.join(self._data_dir, trading_pair, f"{file_name}{MarketDataSegment.FILE_EXTENSION}")
+        segment = self._segments.get(trading_pair)
+        if segment is None or segment.file_path != file_path:
+            if segment is not None:
+                segment.close()
+            segment = self._segments[trading_pair] = MarketDataSegment(file_path,
+                                                                       compression_level=self._compression_level)
+        return segment
@@ -26,6 +26,7 @@ class Migrator:
     def migrate_db_to_version(self, client_config_map: ClientConfigAdapter, db_handle, from_version, to_version):
         original_db_path = db_handle.db_path
         original_db_name = Path(original_db_path).stem
+        db_handle.checkpoint()
         backup_db_path = original_db_path + '.backup_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S")
         new_db_path = original_db_path + '.new'
         copyfile(original_db_path, new_db_path)
@@ -57,7 +58,9 @@ class Migrator:
                 new_db_handle.engine.dispose()
                 if migration_successful:
                     move(new_db_path, original_db_path)
-                db_handle.__init__(SQLConnectionType.TRADE_FILLS, original_db_path, original_db_name, True)
+                db_handle.__init__(
+                    client_config_map, SQLConnectionType.TRADE_FILLS, original_db_path, original_db_name, True
+                )
             except Exception as e:
                 logging.getLogger().error(f"Fatal error migrating DB {original_db_path}")
                 raise e
@@ -2,7 +2,10 @@ from sqlalchemy import Column, Integer, Text
 
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.executors import Executors
+from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
 
 
 class AddExchangeOrderIdColumnToOrders(DatabaseTransformation):
@@ -149,3 +152,33 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddQueryIndexes(DatabaseTransformation):
+    """
+    Adds the indexes used to load the orders of a config and market at startup, the trades of the `history` command
+    and the executors of a controller
+    """
+    index_names = {
+        Order.__table__: ("o_config_market_timestamp_index",),
+        TradeFill.__table__: ("tf_timestamp_config_index",),
+        Executors.__table__: ("ex_controller_id",),
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        for table, index_names in self.index_names.items():
+            for index in table.indexes:
+                if index.name in index_names:
+                    index.create(bind=db_handle.engine, checkfirst=True)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddQueryIndexes"
+
+    @property
+    def to_version(self):
+        return 20240501
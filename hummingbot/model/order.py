@@ -26,7 +26,9 @@ class Order(HummingbotBase):
                       Index("o_market_base_asset_timestamp_index",
                             "market", "base_asset", "creation_timestamp"),
                       Index("o_market_quote_asset_timestamp_index",
-                            "market", "quote_asset", "creation_timestamp"))
+                            "market", "quote_asset", "creation_timestamp"),
+                      Index("o_config_market_timestamp_index",
+                            "config_file_path", "market", "creation_timestamp", "exchange_order_id"))
 
     id = Column(Text, primary_key=True, nullable=False)
     config_file_path = Column(Text, nullable=False)
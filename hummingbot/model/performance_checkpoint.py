@@ -0,0 +1,25 @@
+from sqlalchemy import JSON, BigInteger, Column, Integer, Text
+
+from . import HummingbotBase
+
+
+class PerformanceCheckpoint(HummingbotBase):
+    """
+    Running totals of the trades of a config since `start_timestamp`, up to the trade with `last_trade_timestamp`,
+    stored to compute the performance adding only the trades filled afterwards.
+    """
+    __tablename__ = "PerformanceCheckpoint"
+
+    config_file_path = Column(Text, primary_key=True, nullable=False)
+    start_timestamp = Column(BigInteger, primary_key=True, nullable=False)
+    last_trade_timestamp = Column(BigInteger, nullable=False)
+    trades_count = Column(Integer, nullable=False)
+    # Keys of the trades with the last trade timestamp, to skip them when adding the following trades
+    last_trade_keys = Column(JSON, nullable=False)
+    # Totals of each market and trading pair, as stored by TradesAggregate.to_json
+    aggregates = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"PerformanceCheckpoint(config_file_path='{self.config_file_path}', " \
+               f"start_timestamp={self.start_timestamp}, last_trade_timestamp={self.last_trade_timestamp}, " \
+               f"trades_count={self.trades_count})"
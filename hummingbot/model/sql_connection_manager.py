@@ -3,9 +3,10 @@ from enum import Enum
 from os.path import join
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
 from hummingbot import data_path
@@ -27,7 +28,19 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20230516"
+    LOCAL_DB_VERSION_VALUE = "20240501"
+
+    # Applied to every connection when the SQLite performance profile is enabled. The WAL journal lets the trades be
+    # read while they are written, and with `synchronous=NORMAL` commits don't wait for a sync of the database file
+    # (a power loss can lose the last commits, but can't corrupt the database).
+    SQLITE_PERFORMANCE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA busy_timeout=5000",
+    )
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -70,9 +83,11 @@ class SQLConnectionManager(TransactionBase):
                  called_from_migrator = False):
         db_path = self.create_db_path(db_path, db_name)
         self.db_path = db_path
+        # Only the SQLite mode has a performance profile
+        self._performance_profile: bool = getattr(client_config_map.db_mode, "performance_profile", False)
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
-            self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            self._engine: Engine = self._create_engine(client_config_map.db_mode.get_url(self.db_path))
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -100,6 +115,35 @@ class SQLConnectionManager(TransactionBase):
     def engine(self) -> Engine:
         return self._engine
 
+    @property
+    def performance_profile(self) -> bool:
+        return self._performance_profile
+
+    def _create_engine(self, url: str) -> Engine:
+        if not self._performance_profile:
+            return create_engine(url)
+        # Connections are kept open and reused (opening a SQLite connection reads the whole schema). They can be used
+        # by other threads, like the writer thread of the markets recorder, as long as one thread uses them at a time.
+        engine = create_engine(url, poolclass=QueuePool, connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", self._apply_performance_pragmas)
+        return engine
+
+    def _apply_performance_pragmas(self, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in self.SQLITE_PERFORMANCE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    def checkpoint(self):
+        """
+        Moves the changes stored in the WAL journal to the database file, so it can be copied
+        """
+        if self._performance_profile:
+            with self._engine.connect() as connection:
+                connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def get_new_session(self) -> Session:
         return self._session_cls()
 
@@ -119,14 +163,15 @@ class SQLConnectionManager(TransactionBase):
                                                                 value=self.LOCAL_DB_VERSION_VALUE)
                     session.add(version_info)
                     session.commit()
-                else:
-                    # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                    # if needed.
-                    if local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
-                        was_migration_successful = Migrator().migrate_db_to_version(
-                            client_config_map, self, int(local_db_version.value), int(self.LOCAL_DB_VERSION_VALUE)
-                        )
-                        if was_migration_successful:
-                            # Cannot use variable local_db_version because reference is not valid
-                            # since Migrator changed it
-                            self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+                    return
+                current_db_version = local_db_version.value
+
+        if current_db_version < self.LOCAL_DB_VERSION_VALUE:
+            # The migration replaces the database file, so no session can be open while it runs
+            was_migration_successful = Migrator().migrate_db_to_version(
+                client_config_map, self, int(current_db_version), int(self.LOCAL_DB_VERSION_VALUE)
+            )
+            if was_migration_successful:
+                with self.get_new_session() as session:
+                    with session.begin():
+                        self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+# A write receives the session of the transaction it belongs to. It can return a function to call once the
+# transaction is committed, for side effects that must not be repeated if the write is retried
+SessionWrite = Callable[[Session], Optional[Callable[[], None]]]
+
+
+class WriteBehindQueueStats(NamedTuple):
+    queue_depth: int = 0
+    committed_batches: int = 0
+    committed_writes: int = 0
+    failed_writes: int = 0
+    last_commit_latency: float = 0.0
+    max_commit_latency: float = 0.0
+
+
+class WriteBehindQueue:
+    """
+    Queues database writes and commits them in batches, one transaction per batch, in a dedicated thread, so the event
+    loop doesn't wait for the database.
+    - Writes are committed in the order they were queued, every `flush_interval` seconds or as soon as `max_batch_size`
+      writes are pending.
+    - Coalesced writes replace the pending write with the same key. They are prepared on the event loop when the batch
+      is created (so the data they save is read from the event loop thread) and committed after the other writes of
+      the batch.
+    - If a batch fails, its writes are committed again one by one, and the failing writes are logged and discarded.
+    - The functions returned by the writes are called after their transaction is committed, so they are called once
+      even if the writes are retried.
+    While the queue is not started, writes are committed immediately in the calling thread. `stop` commits the pending
+    writes before returning.
+    """
+    _wbq_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wbq_logger is None:
+            cls._wbq_logger = logging.getLogger(__name__)
+        return cls._wbq_logger
+
+    def __init__(self, sql_manager: SQLConnectionManager, flush_interval: float = 0.5, max_batch_size: int = 500):
+        self._sql_manager = sql_manager
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._pending_writes: List[SessionWrite] = []
+        self._pending_coalesced_writes: Dict[Hashable, Callable[[], SessionWrite]] = {}
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._committed_batches = 0
+        self._committed_writes = 0
+        self._failed_writes = 0
+        self._last_commit_latency = 0.0
+        self._max_commit_latency = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._flush_task is not None
+
+    @property
+    def stats(self) -> WriteBehindQueueStats:
+        return WriteBehindQueueStats(
+            queue_depth=len(self._pending_writes) + len(self._pending_coalesced_writes),
+            committed_batches=self._committed_batches,
+            committed_writes=self._committed_writes,
+            failed_writes=self._failed_writes,
+            last_commit_latency=self._last_commit_latency,
+            max_commit_latency=self._max_commit_latency,
+        )
+
+    def start(self):
+        if self._flush_task is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write_behind_queue")
+            self._flush_requested = asyncio.Event()
+            self._flush_task = asyncio.ensure_future(self._flush_loop())
+
+    def stop(self):
+        """
+        Stops the queue, waiting for the batch being committed and committing the pending writes in the calling thread
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._commit_batch(self._next_batch())
+
+    def put(self, write: SessionWrite):
+        if not self.started:
+            self._commit_batch([write])
+            return
+        self._pending_writes.append(write)
+        if len(self._pending_writes) >= self._max_batch_size:
+            self._flush_requested.set()
+
+    def put_coalesced(self, key: Hashable, prepare_write: Callable[[], SessionWrite]):
+        """
+        Queues a write replacing the pending write with the same key. `prepare_write` is called on the event loop when
+        the batch is created, and returns the write to commit.
+        """
+        if not self.started:
+            self._commit_batch([prepare_write()])
+            return
+        self._pending_coalesced_writes.pop(key, None)
+        self._pending_coalesced_writes[key] = prepare_write
+
+    async def flush(self):
+        """
+        Commits the pending writes, waiting until they are stored
+        """
+        if self.started:
+            batch = self._next_batch()
+            if len(batch) > 0:
+                await asyncio.get_event_loop().run_in_executor(self._executor, self._commit_batch, batch)
+        else:
+            self._commit_batch(self._next_batch())
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._flush_requested.wait(), timeout=self._flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_requested.clear()
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error committing the queued database writes.", exc_info=True)
+
+    def _next_batch(self) -> List[SessionWrite]:
+        batch = self._pending_writes
+        self._pending_writes = []
+        coalesced_writes = self._pending_coalesced_writes
+        self._pending_coalesced_writes = {}
+        for prepare_write in coalesced_writes.values():
+            try:
+                batch.append(prepare_write())
+            except Exception:
+                self._failed_writes += 1
+                self.logger().error("Unexpected error preparing a database write.", exc_info=True)
+        return batch
+
+    def _commit_batch(self, batch: List[SessionWrite]):
+        if len(batch) == 0:
+            return
+        start_timestamp = time.perf_counter()
+        failed_writes = 0
+        try:
+            self._commit(batch)
+        except Exception:
+            self.logger().warning(f"Error committing a batch of {len(batch)} database writes, retrying one by one.",
+                                  exc_info=True)
+            for write in batch:
+                try:
+                    self._commit([write])
+                except Exception:
+                    failed_writes += 1
+                    self.logger().error("Unexpected error committing a database write.", exc_info=True)
+        self._last_commit_latency = time.perf_counter() - start_timestamp
+        self._max_commit_latency = max(self._max_commit_latency, self._last_commit_latency)
+        self._committed_batches += 1
+        self._committed_writes += len(batch) - failed_writes
+        self._failed_writes += failed_writes
+
+    def _commit(self, writes: List[SessionWrite]):
+        post_commit_callbacks = []
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for write in writes:
+                    post_commit_callback = write(session)
+                    if post_commit_callback is not None:
+                        post_commit_callbacks.append(post_commit_callback)
+        for post_commit_callback in post_commit_callbacks:
+            try:
+                post_commit_callback()
+            except Exception:
+                self.logger().error("Unexpected error after committing a database write.", exc_info=True)
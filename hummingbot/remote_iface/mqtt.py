@@ -295,6 +295,11 @@ class MQTTCommands:
                     self._hb_app.status
                 )
             else:
+                call_sync(
+                    self._hb_app.flush_trade_records(),
+                    loop=self._ev_loop,
+                    timeout=timeout
+                )
                 res = call_sync(
                     self._hb_app.strategy_status(),
                     loop=self._ev_loop,
@@ -311,13 +316,23 @@ class MQTTCommands:
 
     def _on_cmd_history(self, msg: HistoryCommandMessage.Request):
         response = HistoryCommandMessage.Response()
+        timeout = 30  # seconds
         try:
             if msg.async_backend:
                 self._hb_app.history(msg.days, msg.verbose, msg.precision)
             else:
+                # The trades waiting in the markets recorder queue are written before querying them
+                call_sync(
+                    self._hb_app.flush_trade_records(),
+                    loop=self._ev_loop,
+                    timeout=timeout
+                )
                 trades = self._hb_app.get_history_trades_json(msg.days)
                 if trades:
                     response.trades = trades
+        except asyncio.exceptions.TimeoutError:
+            response.msg = f'Hummingbot history command timed out after {timeout} seconds'
+            response.status = MQTT_STATUS_CODE.ERROR
         except Exception as e:
             response.status = MQTT_STATUS_CODE.ERROR
             response.msg = str(e)
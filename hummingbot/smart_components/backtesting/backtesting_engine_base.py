@@ -4,6 +4,8 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 from hummingbot.smart_components.controllers.controller_base import ControllerBase
 
 
@@ -33,6 +35,23 @@ class BacktestingEngineBase:
             end_condition = pd.Series([True] * len(df))
         return df[start_condition & end_condition]
 
+    @staticmethod
+    def load_candles_df(connector_name: str, trading_pair: str, interval: str, start: Optional[str] = None,
+                        end: Optional[str] = None, cache_dir: Optional[str] = None) -> pd.DataFrame:
+        """
+        Loads the candles stored in the CandlesCache by the candles feeds or the download candles script.
+
+        :param connector_name: The connector of the candles.
+        :param trading_pair: The trading pair of the candles.
+        :param interval: The interval of the candles.
+        :param start: Start date of the candles (%Y-%m-%d).
+        :param end: End date of the candles (%Y-%m-%d).
+        :param cache_dir: Directory of the cache files, data/candles if not provided.
+        """
+        cache = CandlesCache.for_trading_pair(connector_name, trading_pair, interval, cache_dir=cache_dir)
+        candles_df = cache.get_candles_df(columns=CandlesBase.columns)
+        return BacktestingEngineBase.filter_df_by_time(candles_df, start=start, end=end)
+
     def apply_triple_barrier_method(self, df, tp=1.0, sl=1.0, tl=5, trade_cost=0.0006):
         df.index = pd.to_datetime(df.timestamp, unit="ms")
         if "target" not in df.columns:
@@ -66,26 +85,85 @@ class BacktestingEngineBase:
 
     @staticmethod
     def apply_tp_sl_on_tl(df: pd.DataFrame, tp: float, sl: float):
-        events = df[df["signal"] != 0].copy()
+        events_mask = (df["signal"] != 0).values
+        event_positions = np.flatnonzero(events_mask)
+        events = df.iloc[event_positions]
         if tp > 0:
-            take_profit = tp * events["target"]
+            take_profit = (tp * events["target"]).values.astype(float)
         else:
-            take_profit = pd.Series(index=df.index)  # NaNs
+            take_profit = np.full(len(events), np.nan)
         if sl > 0:
-            stop_loss = - sl * events["target"]
+            stop_loss = (- sl * events["target"]).values.astype(float)
         else:
-            stop_loss = pd.Series(index=df.index)  # NaNs
+            stop_loss = np.full(len(events), np.nan)
 
-        for loc, tl in events["tl"].fillna(df.index[-1]).items():
-            df0 = df.close[loc:tl]  # path prices
-            df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]  # path returns
-            df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()  # earliest stop loss.
-            df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()  # earliest profit taking.
+        # The path of each event goes from its candle to the last candle before or at its time limit (both included)
+        time_limits = events["tl"].fillna(df.index[-1])
+        end_positions = df.index.searchsorted(time_limits.values, side="right")
+        stop_loss_positions, take_profit_positions = BacktestingEngineBase.get_barrier_hit_positions(
+            close=df["close"].values.astype(float),
+            signal=events["signal"].values.astype(float),
+            take_profit=take_profit,
+            stop_loss=stop_loss,
+            start_positions=event_positions,
+            end_positions=end_positions,
+        )
+        positions_to_times = BacktestingEngineBase._positions_to_times
+        df.loc[events.index, "stop_loss_time"] = positions_to_times(df.index, stop_loss_positions)
+        df.loc[events.index, "take_profit_time"] = positions_to_times(df.index, take_profit_positions)
         df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
         df["close_type"] = df[["take_profit_time", "stop_loss_time", "tl"]].dropna(how="all").idxmin(axis=1)
         df["close_type"].replace({"take_profit_time": "tp", "stop_loss_time": "sl"}, inplace=True)
         return df
 
+    @staticmethod
+    def get_barrier_hit_positions(close: np.ndarray, signal: np.ndarray, take_profit: np.ndarray,
+                                  stop_loss: np.ndarray, start_positions: np.ndarray, end_positions: np.ndarray,
+                                  max_chunk_size: int = 2 ** 22):
+        """
+        Finds for every event the first candle of its path where the return crosses the stop loss and the take profit.
+        The paths of a chunk of events are read as rows of a strided window view of the close prices and evaluated
+        at once, the chunks are sized to keep at most max_chunk_size prices in memory.
+
+        :param close: close prices of all the candles.
+        :param signal: signal of each event (1 for long, -1 for short).
+        :param take_profit: take profit return of each event, NaN if it does not apply.
+        :param stop_loss: stop loss return of each event (negative), NaN if it does not apply.
+        :param start_positions: position of the candle of each event.
+        :param end_positions: position after the last candle of the path of each event.
+        :return: the positions of the stop loss and take profit candles of each event, -1 if the barrier is not hit.
+        """
+        events_count = len(start_positions)
+        stop_loss_positions = np.full(events_count, -1, dtype=np.int64)
+        take_profit_positions = np.full(events_count, -1, dtype=np.int64)
+        path_lengths = np.maximum(end_positions - start_positions, 0)
+        if events_count == 0 or path_lengths.max() == 0:
+            return stop_loss_positions, take_profit_positions
+
+        window = int(path_lengths.max())
+        padded_close = np.concatenate((close, np.full(window - 1, np.nan)))
+        paths = np.lib.stride_tricks.sliding_window_view(padded_close, window)
+        offsets = np.arange(window)
+        chunk_size = max(1, max_chunk_size // window)
+        for chunk_start in range(0, events_count, chunk_size):
+            chunk = slice(chunk_start, chunk_start + chunk_size)
+            starts = start_positions[chunk]
+            returns = (paths[starts] / close[starts, None] - 1) * signal[chunk, None]
+            in_path = offsets < path_lengths[chunk, None]
+            for barrier_hits, hit_positions in (
+                    (returns < stop_loss[chunk, None], stop_loss_positions),
+                    (returns > take_profit[chunk, None], take_profit_positions)):
+                barrier_hits &= in_path
+                first_hits = barrier_hits.argmax(axis=1)
+                hit_positions[chunk] = np.where(barrier_hits.any(axis=1), starts + first_hits, -1)
+        return stop_loss_positions, take_profit_positions
+
+    @staticmethod
+    def _positions_to_times(index: pd.Index, positions: np.ndarray):
+        times = index[np.maximum(positions, 0)].values.copy()
+        times[positions < 0] = np.datetime64("NaT")
+        return times
+
     def run_backtesting(self, initial_portfolio_usd=1000, trade_cost=0.0006,
                         start: Optional[str] = None, end: Optional[str] = None):
         # Load historical candles
@@ -9,7 +9,6 @@ from pydantic import Field, validator
 
 from hummingbot.client.config.config_data_types import BaseClientModel, ClientFieldData
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.smart_components.models.base import SmartComponentStatus
@@ -142,7 +141,7 @@ class ControllerBase(SmartComponentBase):
         if self._status != SmartComponentStatus.RUNNING:
             self.terminated.clear()
             self._status = SmartComponentStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            self.start_control_loop()
         self.initialize_candles()
 
     def initialize_candles(self):
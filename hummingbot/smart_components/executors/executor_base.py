@@ -17,6 +17,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.smart_components.executors.data_types import ExecutorConfigBase
+from hummingbot.smart_components.executors.order_event_dispatcher import OrderEventDispatcher
 from hummingbot.smart_components.models.base import SmartComponentStatus
 from hummingbot.smart_components.models.executors import CloseType
 from hummingbot.smart_components.models.executors_info import ExecutorInfo
@@ -27,7 +28,11 @@ from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 class ExecutorBase(SmartComponentBase):
     """
     Base class for all executors. Executors are responsible for executing orders based on the strategy.
+    The order events are received through the OrderEventDispatcher of each connector, that only delivers the events
+    of the orders placed with `place_order`. Executors tracking other orders can set ROUTE_EVENTS_BY_ORDER_ID to False
+    to listen to all the order events of their connectors.
     """
+    ROUTE_EVENTS_BY_ORDER_ID: bool = True
 
     def __init__(self, strategy: ScriptStrategyBase, connectors: List[str], config: ExecutorConfigBase, update_interval: float = 0.5):
         """
@@ -234,16 +239,22 @@ class ExecutorBase(SmartComponentBase):
         Registers the events with the connectors.
         """
         for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.add_listener(event_pair[0], event_pair[1])
+            if self.ROUTE_EVENTS_BY_ORDER_ID:
+                OrderEventDispatcher.for_connector(connector).register_executor(self)
+            else:
+                for event_pair in self._event_pairs:
+                    connector.add_listener(event_pair[0], event_pair[1])
 
     def unregister_events(self):
         """
         Unregisters the events from the connectors.
         """
         for connector in self.connectors.values():
-            for event_pair in self._event_pairs:
-                connector.remove_listener(event_pair[0], event_pair[1])
+            if self.ROUTE_EVENTS_BY_ORDER_ID:
+                OrderEventDispatcher.for_connector(connector).unregister_executor(self)
+            else:
+                for event_pair in self._event_pairs:
+                    connector.remove_listener(event_pair[0], event_pair[1])
 
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
@@ -272,6 +283,23 @@ class ExecutorBase(SmartComponentBase):
         :param price: The price for the order.
         :return: The result of the order placement.
         """
+        connector = self.connectors.get(connector_name)
+        if not self.ROUTE_EVENTS_BY_ORDER_ID or connector is None:
+            return self._place_order(connector_name, trading_pair, order_type, side, amount, position_action, price)
+        dispatcher = OrderEventDispatcher.for_connector(connector)
+        with dispatcher.placing_order(self):
+            order_id = self._place_order(connector_name, trading_pair, order_type, side, amount, position_action, price)
+        dispatcher.register_order(self, order_id)
+        return order_id
+
+    def _place_order(self,
+                     connector_name: str,
+                     trading_pair: str,
+                     order_type: OrderType,
+                     side: TradeType,
+                     amount: Decimal,
+                     position_action: PositionAction,
+                     price: Decimal) -> str:
         if side == TradeType.BUY:
             return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Union
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.logger import HummingbotLogger
@@ -8,6 +8,7 @@ from hummingbot.smart_components.executors.arbitrage_executor.arbitrage_executor
 from hummingbot.smart_components.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.smart_components.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.smart_components.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.smart_components.executors.executor_base import ExecutorBase
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.smart_components.executors.twap_executor.data_types import TWAPExecutorConfig
@@ -22,9 +23,39 @@ from hummingbot.smart_components.models.executors_info import ExecutorInfo, Perf
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
+class ClosedExecutorsPerformance:
+    """
+    Running totals of the executors of a controller that are already closed, or that were loaded from the database.
+    Each executor is added once, identified by its id.
+    """
+
+    def __init__(self):
+        self.realized_pnl_quote = Decimal(0)
+        self.unrealized_pnl_quote = Decimal(0)
+        self.volume_traded = Decimal(0)
+        self.close_type_counts: Dict = {}
+        self.executor_ids: Set[str] = set()
+        self.history_loaded = False
+        # Executors removed from the orchestrator before being added to the totals
+        self.pending_executors: List[ExecutorBase] = []
+
+    def add(self, executor_id: str, executor: Union[ExecutorBase, ExecutorInfo]):
+        self.executor_ids.add(executor_id)
+        if executor.is_active:
+            # Executors stored while they were still active keep the PnL they had when they were stored
+            self.unrealized_pnl_quote += executor.net_pnl_quote
+        else:
+            self.realized_pnl_quote += executor.net_pnl_quote
+            self.close_type_counts[executor.close_type] = self.close_type_counts.get(executor.close_type, 0) + 1
+        self.volume_traded += executor.filled_amount_quote
+
+
 class ExecutorOrchestrator:
     """
     Orchestrator for various executors.
+    Executors are indexed by id, and the performance of the closed executors is accumulated as they close, so the
+    performance reports only need to compute the PnL of the active executors. The executors stored in the database
+    are loaded once per controller, with the first performance report.
     """
     _logger = None
 
@@ -37,7 +68,9 @@ class ExecutorOrchestrator:
     def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
-        self.executors = {}
+        self.executors: Dict[str, List[ExecutorBase]] = {}
+        self._executors_by_id: Dict[str, Dict[str, ExecutorBase]] = {}
+        self._closed_executors_performance: Dict[str, ClosedExecutorsPerformance] = {}
 
     def stop(self):
         """
@@ -99,6 +132,7 @@ class ExecutorOrchestrator:
 
         executor.start()
         self.executors[controller_id].append(executor)
+        self._executors_by_id.setdefault(controller_id, {})[executor_config.id] = executor
         self.logger().debug(f"Created {type(executor).__name__} for controller {controller_id}")
 
     def stop_executor(self, action: StopExecutorAction):
@@ -108,8 +142,7 @@ class ExecutorOrchestrator:
         controller_id = action.controller_id
         executor_id = action.executor_id
 
-        executor = next((executor for executor in self.executors[controller_id] if executor.config.id == executor_id),
-                        None)
+        executor = self._get_executor(controller_id, executor_id)
         if not executor:
             self.logger().error(f"Executor ID {executor_id} not found for controller {controller_id}.")
             return
@@ -122,8 +155,7 @@ class ExecutorOrchestrator:
         controller_id = action.controller_id
         executor_id = action.executor_id
 
-        executor = next((executor for executor in self.executors[controller_id] if executor.config.id == executor_id),
-                        None)
+        executor = self._get_executor(controller_id, executor_id)
         if not executor:
             self.logger().error(f"Executor ID {executor_id} not found for controller {controller_id}.")
             return
@@ -131,7 +163,28 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor ID {executor_id} is still active.")
             return
         MarketsRecorder.get_instance().store_or_update_executor(executor)
+        # The performance of the stored executor is kept, it's added to the totals with the next performance report
+        self._closed_performance(controller_id).pending_executors.append(executor)
         self.executors[controller_id].remove(executor)
+        self._executors_by_id[controller_id].pop(executor_id, None)
+
+    def _get_executor(self, controller_id: str, executor_id: str) -> Optional[ExecutorBase]:
+        executors_by_id = self._executors_by_id.setdefault(controller_id, {})
+        executor = executors_by_id.get(executor_id)
+        if executor is None:
+            # Executors added to the executors lists directly are indexed the first time they are requested
+            executor = next((executor for executor in self.executors.get(controller_id, [])
+                             if executor.config.id == executor_id), None)
+            if executor is not None:
+                executors_by_id[executor_id] = executor
+        return executor
+
+    def _closed_performance(self, controller_id: str) -> ClosedExecutorsPerformance:
+        performance = self._closed_executors_performance.get(controller_id)
+        if performance is None:
+            performance = ClosedExecutorsPerformance()
+            self._closed_executors_performance[controller_id] = performance
+        return performance
 
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
@@ -143,29 +196,41 @@ class ExecutorOrchestrator:
         return report
 
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
-        # Fetch executors from database and active in-memory executors
-        db_executors = MarketsRecorder.get_instance().get_executors_by_controller(controller_id)
-        active_executor_ids = [executor.executor_info.id for executor in self.executors.get(controller_id, [])]
-        filtered_db_executors = [executor for executor in db_executors if executor.id not in active_executor_ids]
-        combined_executors = self.executors.get(controller_id, []) + filtered_db_executors
-
-        # Initialize performance metrics
-        realized_pnl_quote = Decimal(0)
-        unrealized_pnl_quote = Decimal(0)
-        volume_traded = Decimal(0)
-        close_type_counts = {}
-
-        for executor in combined_executors:
-            if executor.is_active:  # For active executors
+        in_memory_executors = self.executors.get(controller_id, [])
+        performance = self._closed_performance(controller_id)
+        if not performance.history_loaded:
+            # The executors stored by previous runs are loaded from the database once
+            in_memory_executor_ids = {executor.config.id for executor in in_memory_executors if not executor.is_active}
+            for executor_info in MarketsRecorder.get_instance().get_executors_by_controller(controller_id):
+                if executor_info.id not in in_memory_executor_ids and executor_info.id not in performance.executor_ids:
+                    performance.add(executor_info.id, executor_info)
+            performance.history_loaded = True
+        for executor in performance.pending_executors:
+            if executor.config.id not in performance.executor_ids:
+                performance.add(executor.config.id, executor)
+        performance.pending_executors.clear()
+
+        realized_pnl_quote = performance.realized_pnl_quote
+        unrealized_pnl_quote = performance.unrealized_pnl_quote
+        volume_traded = performance.volume_traded
+        close_type_counts = dict(performance.close_type_counts)
+
+        for executor in in_memory_executors:
+            if executor.is_active:
                 unrealized_pnl_quote += executor.net_pnl_quote
-            else:  # For closed executors
+                volume_traded += executor.filled_amount_quote
+            elif executor.is_closed:
+                # Closed executors are added once, their PnL and volume don't change anymore
+                if executor.config.id not in performance.executor_ids:
+                    performance.add(executor.config.id, executor)
+                    realized_pnl_quote += executor.net_pnl_quote
+                    volume_traded += executor.filled_amount_quote
+                    close_type_counts[executor.close_type] = close_type_counts.get(executor.close_type, 0) + 1
+            else:
+                # Executors shutting down can still be filled
                 realized_pnl_quote += executor.net_pnl_quote
-                close_type = executor.close_type
-                if close_type in close_type_counts:
-                    close_type_counts[close_type] += 1
-                else:
-                    close_type_counts[close_type] = 1
-            volume_traded += executor.filled_amount_quote
+                volume_traded += executor.filled_amount_quote
+                close_type_counts[executor.close_type] = close_type_counts.get(executor.close_type, 0) + 1
 
         # Calculate global PNL values
         global_pnl_quote = unrealized_pnl_quote + realized_pnl_quote
@@ -0,0 +1,124 @@
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Set
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent
+
+if TYPE_CHECKING:
+    from hummingbot.smart_components.executors.executor_base import ExecutorBase
+
+
+class OrderEventDispatcher:
+    """
+    Routes the order events of a connector to the executor that placed each order.
+    There is one dispatcher per connector, listening to the order events only while executors are registered. Each
+    event is delivered to the executor owning its client order id with a single dictionary lookup, instead of being
+    forwarded to every executor using the connector.
+    Executors register the id of every order they place. Events triggered by the connector while an executor is
+    placing an order (before the order id is known) are delivered to that executor.
+    """
+    # Executor method processing each event
+    EVENT_HANDLERS: Dict[int, str] = {
+        MarketEvent.OrderCancelled.value: "process_order_canceled_event",
+        MarketEvent.BuyOrderCreated.value: "process_order_created_event",
+        MarketEvent.SellOrderCreated.value: "process_order_created_event",
+        MarketEvent.OrderFilled.value: "process_order_filled_event",
+        MarketEvent.BuyOrderCompleted.value: "process_order_completed_event",
+        MarketEvent.SellOrderCompleted.value: "process_order_completed_event",
+        MarketEvent.OrderFailure.value: "process_order_failed_event",
+    }
+
+    _dispatchers: "weakref.WeakKeyDictionary[ConnectorBase, OrderEventDispatcher]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_connector(cls, connector: ConnectorBase) -> "OrderEventDispatcher":
+        """
+        Returns the dispatcher of the connector, creating it if required
+        """
+        dispatcher = cls._dispatchers.get(connector)
+        if dispatcher is None:
+            dispatcher = cls(connector)
+            cls._dispatchers[connector] = dispatcher
+        return dispatcher
+
+    def __init__(self, connector: ConnectorBase):
+        # The dispatcher is stored in a dictionary weakly keyed by the connector, so it must not keep it alive
+        self._connector_ref = weakref.ref(connector)
+        self._event_forwarder = SourceInfoEventForwarder(self._dispatch_event)
+        self._executor_orders: Dict["ExecutorBase", Set[str]] = {}
+        self._order_owners: Dict[str, "ExecutorBase"] = {}
+        self._placing_executor: Optional["ExecutorBase"] = None
+
+    @property
+    def executors_count(self) -> int:
+        return len(self._executor_orders)
+
+    def owner_of(self, order_id: str) -> Optional["ExecutorBase"]:
+        return self._order_owners.get(order_id)
+
+    def register_executor(self, executor: "ExecutorBase"):
+        """
+        Starts routing the order events to the executor. The first executor registered adds the connector listeners.
+        """
+        if executor in self._executor_orders:
+            return
+        if len(self._executor_orders) == 0:
+            self._update_listeners(add=True)
+        self._executor_orders[executor] = set()
+
+    def unregister_executor(self, executor: "ExecutorBase"):
+        """
+        Stops routing the order events to the executor and forgets its orders. The connector listeners are removed
+        when no executor is left.
+        """
+        order_ids = self._executor_orders.pop(executor, None)
+        if order_ids is None:
+            return
+        for order_id in order_ids:
+            self._order_owners.pop(order_id, None)
+        if len(self._executor_orders) == 0:
+            self._update_listeners(add=False)
+
+    def register_order(self, executor: "ExecutorBase", order_id: str):
+        """
+        Routes the events of the order to the executor, if the executor is registered
+        """
+        order_ids = self._executor_orders.get(executor)
+        if order_ids is not None and order_id is not None:
+            order_ids.add(order_id)
+            self._order_owners[order_id] = executor
+
+    @contextmanager
+    def placing_order(self, executor: "ExecutorBase") -> Iterator[None]:
+        """
+        Context in which the executor places an order. Events of unknown orders triggered during the context belong to
+        the order being placed.
+        """
+        previous_executor = self._placing_executor
+        self._placing_executor = executor
+        try:
+            yield
+        finally:
+            self._placing_executor = previous_executor
+
+    def _update_listeners(self, add: bool):
+        connector = self._connector_ref()
+        if connector is None:
+            return
+        for event_tag in self.EVENT_HANDLERS:
+            if add:
+                connector.add_listener(MarketEvent(event_tag), self._event_forwarder)
+            else:
+                connector.remove_listener(MarketEvent(event_tag), self._event_forwarder)
+
+    def _dispatch_event(self, event_tag: int, market: ConnectorBase, event: any):
+        order_id = getattr(event, "order_id", None)
+        executor = self._order_owners.get(order_id)
+        if executor is None:
+            executor = self._placing_executor
+            if executor is None:
+                return
+            self.register_order(executor, order_id)
+        getattr(executor, self.EVENT_HANDLERS[event_tag])(event_tag, market, event)
@@ -5,14 +5,18 @@ from abc import ABC
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.smart_components.models.base import SmartComponentStatus
+from hummingbot.smart_components.smart_component_scheduler import SmartComponentScheduler
 
 
 class SmartComponentBase(ABC):
     """
     Base class for smart components in the Hummingbot application.
     This class provides a basic structure for components that need to perform tasks at regular intervals.
+    The control loops are run by the shared SmartComponentScheduler, that ticks all the components with the same update
+    interval together. Components can set USE_SHARED_SCHEDULER to False to run their control loop in their own task.
     """
     _logger = None
+    USE_SHARED_SCHEDULER: bool = True
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -47,6 +51,15 @@ class SmartComponentBase(ABC):
         if self._status == SmartComponentStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = SmartComponentStatus.RUNNING
+            self.start_control_loop()
+
+    def start_control_loop(self):
+        """
+        Starts executing the control task at the specified interval, with the shared scheduler or in a dedicated task.
+        """
+        if self.USE_SHARED_SCHEDULER:
+            SmartComponentScheduler.get_instance().schedule(self)
+        else:
             safe_ensure_future(self.control_loop())
 
     def stop(self):
@@ -60,7 +73,7 @@ class SmartComponentBase(ABC):
 
     async def control_loop(self):
         """
-        The main control loop of the smart component.
+        The main control loop of the smart component, used when the component is not run by the shared scheduler.
         This method is responsible for executing the control task at the specified interval.
         """
         self.on_start()
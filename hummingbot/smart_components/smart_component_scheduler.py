@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import time
+import weakref
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.smart_components.smart_component_base import SmartComponentBase
+
+
+class ScheduledGroupStats(NamedTuple):
+    update_interval: float
+    components: int
+    running_control_tasks: int
+    # Time from the start of the last completed batch until all its control tasks finished
+    last_batch_duration: float
+    # Duration of the slowest control task of the last completed batch
+    last_batch_max_control_task_duration: float
+
+
+class _ComponentState:
+    __slots__ = ("started", "task", "last_duration")
+
+    def __init__(self):
+        self.started: bool = False
+        self.task: Optional[asyncio.Task] = None
+        self.last_duration: float = 0.0
+
+
+class _Batch:
+    __slots__ = ("group", "start_timestamp", "pending_tasks", "max_duration")
+
+    def __init__(self, group: "_ScheduledGroup", start_timestamp: float):
+        self.group = group
+        self.start_timestamp = start_timestamp
+        self.pending_tasks = 0
+        self.max_duration = 0.0
+
+    def control_task_finished(self, duration: float, timestamp: float):
+        self.pending_tasks -= 1
+        self.max_duration = max(self.max_duration, duration)
+        if self.pending_tasks == 0:
+            self.group.last_batch_duration = timestamp - self.start_timestamp
+            self.group.last_batch_max_duration = self.max_duration
+
+
+class _ScheduledGroup:
+    def __init__(self, update_interval: float):
+        self.update_interval = update_interval
+        # Components in the order they were scheduled, which is the order their control tasks are started
+        self.components: Dict["SmartComponentBase", _ComponentState] = {}
+        self.wakeup_event = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.last_batch_duration: float = 0.0
+        self.last_batch_max_duration: float = 0.0
+
+
+class SmartComponentScheduler:
+    """
+    Runs the control loops of the smart components. Components with the same update interval are grouped, and each
+    group has a single timer: on every tick the control tasks of all the components of the group are started in one
+    pass, in the order the components were scheduled.
+    - A component whose previous control task is still running is skipped until it finishes, as in the control loop
+      of SmartComponentBase, where the next control task starts after the previous one.
+    - Errors raised by a control task are logged without affecting the rest of the components.
+    - Newly scheduled components run their first control task immediately, without waiting for the next tick.
+    - `on_start` is called before the first control task of a component, and `on_stop` once it is terminated and its
+      last control task has finished.
+    There is one scheduler per event loop.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SmartComponentScheduler]" = \
+        weakref.WeakKeyDictionary()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "SmartComponentScheduler":
+        loop = asyncio.get_event_loop()
+        instance = cls._instances.get(loop)
+        if instance is None:
+            instance = cls()
+            cls._instances[loop] = instance
+        return instance
+
+    def __init__(self):
+        self._groups: Dict[float, _ScheduledGroup] = {}
+        self._component_groups: Dict["SmartComponentBase", _ScheduledGroup] = {}
+
+    def schedule(self, component: "SmartComponentBase"):
+        """
+        Starts running the control loop of the component. Components already scheduled are ignored.
+        """
+        if component in self._component_groups:
+            return
+        group = self._groups.get(component.update_interval)
+        if group is None:
+            group = _ScheduledGroup(update_interval=component.update_interval)
+            self._groups[component.update_interval] = group
+            group.task = safe_ensure_future(self._run_group(group))
+        group.components[component] = _ComponentState()
+        self._component_groups[component] = group
+        group.wakeup_event.set()
+
+    def is_scheduled(self, component: "SmartComponentBase") -> bool:
+        return component in self._component_groups
+
+    def control_task_duration(self, component: "SmartComponentBase") -> Optional[float]:
+        """
+        Returns the duration in seconds of the last control task of the component, or None if it is not scheduled
+        """
+        group = self._component_groups.get(component)
+        return None if group is None else group.components[component].last_duration
+
+    def group_stats(self, update_interval: float) -> Optional[ScheduledGroupStats]:
+        group = self._groups.get(update_interval)
+        if group is None:
+            return None
+        return ScheduledGroupStats(
+            update_interval=update_interval,
+            components=len(group.components),
+            running_control_tasks=sum(1 for state in group.components.values() if state.task is not None),
+            last_batch_duration=group.last_batch_duration,
+            last_batch_max_control_task_duration=group.last_batch_max_duration,
+        )
+
+    async def _run_group(self, group: _ScheduledGroup):
+        next_tick = self._time()
+        while True:
+            self._run_batch(group, only_new_components=False)
+            if len(group.components) == 0:
+                break
+            # Ticks are aligned to the first one, ticks missed while the loop was busy are skipped
+            next_tick = max(next_tick + group.update_interval, self._time())
+            while True:
+                timeout = next_tick - self._time()
+                if timeout <= 0:
+                    break
+                group.wakeup_event.clear()
+                try:
+                    await asyncio.wait_for(group.wakeup_event.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                self._run_batch(group, only_new_components=True)
+        del self._groups[group.update_interval]
+
+    def _run_batch(self, group: _ScheduledGroup, only_new_components: bool):
+        batch = _Batch(group=group, start_timestamp=self._time())
+        for component, state in list(group.components.items()):
+            if state.task is not None or (only_new_components and state.started):
+                continue
+            if not state.started:
+                state.started = True
+                try:
+                    component.on_start()
+                except Exception:
+                    self.logger().error(f"Unexpected error starting {component}.", exc_info=True)
+                    self._remove(group, component)
+                    continue
+            if component.terminated.is_set():
+                self._stop(group, component)
+                continue
+            batch.pending_tasks += 1
+            state.task = safe_ensure_future(self._run_control_task(component, state, batch))
+
+    async def _run_control_task(self, component: "SmartComponentBase", state: _ComponentState, batch: _Batch):
+        start_timestamp = self._time()
+        try:
+            await component.control_task()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            component.logger().error(e, exc_info=True)
+        finally:
+            end_timestamp = self._time()
+            state.task = None
+            state.last_duration = end_timestamp - start_timestamp
+            batch.control_task_finished(duration=state.last_duration, timestamp=end_timestamp)
+
+    def _stop(self, group: _ScheduledGroup, component: "SmartComponentBase"):
+        self._remove(group, component)
+        try:
+            component.on_stop()
+        except Exception:
+            self.logger().error(f"Unexpected error stopping {component}.", exc_info=True)
+
+    def _remove(self, group: _ScheduledGroup, component: "SmartComponentBase"):
+        del group.components[component]
+        del self._component_groups[component]
+
+    @staticmethod
+    def _time() -> float:
+        return time.perf_counter()
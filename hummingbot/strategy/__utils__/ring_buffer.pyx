@@ -1,6 +1,8 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport sqrt
+from libc.stdint cimport int64_t
 
 
 pmm_logger = None
@@ -13,24 +15,67 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int64_t length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double removed_value
+            double previous_mean
+            int64_t size
+
+        if self._is_full:
+            # Sliding window update: the oldest value is replaced by the new one
+            removed_value = self._buffer[self._delimiter]
+            previous_mean = self._mean
+            self._sum += value - removed_value
+            self._mean += (value - removed_value) / self._length
+            self._m2 += (value - removed_value) * (value - self._mean + removed_value - previous_mean)
+        else:
+            size = self._delimiter + 1
+            self._sum += value
+            previous_mean = self._mean
+            self._mean += (value - previous_mean) / size
+            self._m2 += (value - previous_mean) * (value - self._mean)
+        self._buffer[self._delimiter] = value
         self.c_increment_delimiter()
 
+        self._updates_since_resync += 1
+        if self._is_full and (self._delimiter == 0 or self._updates_since_resync >= self._length):
+            # Recalculating the statistics once per buffer length removes the rounding errors accumulated by the
+            # incremental updates, keeping the amortized cost per value constant
+            self.c_resync_statistics()
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_reset_statistics(self):
+        self._sum = 0
+        self._mean = 0
+        self._m2 = 0
+        self._updates_since_resync = 0
+
+    cdef void c_resync_statistics(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+
+        self._updates_since_resync = 0
+        if values.size == 0:
+            self.c_reset_statistics()
+            return
+        self._sum = np.sum(values)
+        self._mean = np.mean(values)
+        self._m2 = np.var(values) * values.size
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
@@ -42,39 +87,58 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        return self._sum
+
+    cdef double c_running_mean(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._mean
+
+    cdef double c_running_variance(self):
+        if self.c_is_empty():
+            return np.nan
+        return max(self._m2, 0) / self.c_size()
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self._mean
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_running_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_running_variance())
         return result
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef tuple c_get_segments(self):
+        buffer = np.asarray(self._buffer)
+        if not self._is_full:
+            return buffer[:self._delimiter], buffer[self._delimiter:self._delimiter]
+        return buffer[self._delimiter:], buffer[:self._delimiter]
 
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        buffer = np.asarray(self._buffer)
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[:self._delimiter].copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +146,14 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_segments(self):
+        """
+        Returns the stored values as two views of the internal buffer, without copying them. The values of the first
+        segment are older than the values of the second one, and both are in insertion order.
+        The views are only valid until the next value is added.
+        """
+        return self.c_get_segments()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +161,28 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
+    @property
+    def sum_value(self):
+        return self.c_sum()
+
+    @property
+    def running_mean(self):
+        """
+        Mean of the values currently stored, also available before the buffer is full
+        """
+        return self.c_running_mean()
+
+    @property
+    def running_variance(self):
+        """
+        Variance of the values currently stored, also available before the buffer is full
+        """
+        return self.c_running_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -113,6 +207,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self.c_reset_statistics()
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,5 +1,6 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+import numpy as np
+
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +8,39 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._reset_weighted_sums()
+
+    def _reset_weighted_sums(self):
+        # Same weights as pandas ewm(span=sampling_length, adjust=True) over the samples in the buffer:
+        # the average is weighted_sum / weights_sum, the sample added i ticks ago has weight decay ** i
+        self._decay = 1.0 - 2.0 / (self.sampling_length + 1)
+        self._oldest_weight = self._decay ** self.sampling_length
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+        for sample in self._sampling_buffer.get_as_numpy_array():
+            self._weighted_sum = self._decay * self._weighted_sum + sample
+            self._weights_sum = self._decay * self._weights_sum + 1.0
+
+    def add_sample(self, value: float):
+        older_segment, _ = self._sampling_buffer.get_segments()
+        removed_sample = older_segment[0] if self._sampling_buffer.is_full else None
+        self._sampling_buffer.add_value(value)
+        self._weighted_sum = self._decay * self._weighted_sum + self._sampling_buffer.get_last_value()
+        self._weights_sum = self._decay * self._weights_sum + 1.0
+        if removed_sample is not None:
+            self._weighted_sum -= self._oldest_weight * removed_sample
+            self._weights_sum -= self._oldest_weight
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        if self._weights_sum <= 0:
+            return np.nan
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    @BaseTrailingIndicator.sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._reset_weighted_sums()
@@ -1,18 +1,42 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+from typing import Optional
+
 import numpy as np
 
+from ..ring_buffer import RingBuffer
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._log_returns: Optional[RingBuffer] = self._new_log_returns_buffer(sampling_length)
+
+    @staticmethod
+    def _new_log_returns_buffer(sampling_length: int) -> Optional[RingBuffer]:
+        # A window of n prices has n - 1 log returns
+        return RingBuffer(sampling_length - 1) if sampling_length > 1 else None
+
+    def add_sample(self, value: float):
+        previous_price = self._sampling_buffer.get_last_value()
+        self._sampling_buffer.add_value(value)
+        if self._log_returns is not None and not np.isnan(previous_price):
+            self._log_returns.add_value(np.log(self._sampling_buffer.get_last_value() / previous_price))
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._log_returns is None or self._log_returns.size == 0:
+            # Variance is not defined without returns, it is processed as zero
+            return 0.0
+        return self._log_returns.running_variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_buffer.size > 0:
+            return np.sqrt(max(self._processing_buffer.running_mean, 0))
+
+    @BaseTrailingIndicator.sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_returns = self._new_log_returns_buffer(value)
+        if self._log_returns is not None:
+            for log_return in np.diff(np.log(self._sampling_buffer.get_as_numpy_array())):
+                self._log_returns.add_value(log_return)
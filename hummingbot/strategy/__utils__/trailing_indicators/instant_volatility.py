@@ -1,19 +1,45 @@
-from .base_trailing_indicator import BaseTrailingIndicator
+from typing import Optional
+
 import numpy as np
 
+from ..ring_buffer import RingBuffer
+from .base_trailing_indicator import BaseTrailingIndicator
+
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._squared_diffs: Optional[RingBuffer] = self._new_squared_diffs_buffer(sampling_length)
+
+    @staticmethod
+    def _new_squared_diffs_buffer(sampling_length: int) -> Optional[RingBuffer]:
+        # A window of n samples has n - 1 differences between consecutive ticks
+        return RingBuffer(sampling_length - 1) if sampling_length > 1 else None
+
+    def add_sample(self, value: float):
+        previous_value = self._sampling_buffer.get_last_value()
+        self._sampling_buffer.add_value(value)
+        if self._squared_diffs is not None and not np.isnan(previous_value):
+            # Both buffers slide together, so the squared diffs buffer always covers the ticks of the sampling buffer
+            self._squared_diffs.add_value((self._sampling_buffer.get_last_value() - previous_value) ** 2)
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        squared_diffs_sum = self._squared_diffs.sum_value if self._squared_diffs is not None else 0
+        vol = np.sqrt(max(squared_diffs_sum, 0) / self._sampling_buffer.size)
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    @BaseTrailingIndicator.sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._squared_diffs = self._new_squared_diffs_buffer(value)
+        if self._squared_diffs is not None:
+            for squared_diff in np.square(np.diff(self._sampling_buffer.get_as_numpy_array())):
+                self._squared_diffs.add_value(squared_diff)
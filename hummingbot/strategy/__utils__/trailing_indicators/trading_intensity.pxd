@@ -13,16 +13,26 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _sample_timestamps
+        dict _volumes_by_price_level
+        dict _trades_by_price_level
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quote_timestamps
+        list _quote_prices
         int _sampling_length
         int _samples_length
+        bint _samples_changed
+        int _refit_interval
+        int _ticks_since_fit
+        int _estimations_count
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount)
+    cdef c_remove_oldest_sample(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
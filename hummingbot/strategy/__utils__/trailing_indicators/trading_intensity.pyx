@@ -1,9 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import bisect
 import warnings
 from decimal import Decimal
-from typing import Tuple
+from typing import Dict, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -26,11 +27,26 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the alpha and kappa parameters of the trading intensity (the traded volume at each distance from the mid
+    price) by fitting an exponential curve to the trades of the last `sampling_length` sampled quotes.
+
+    The mid price quotes are kept in timestamp order, so the quote before a trade is found with a binary search, and
+    the volume traded at each price level is kept up to date as trades enter and leave the sampling window. The curve
+    is fitted again only when the samples changed, and at most once every `refit_interval` calls to `calculate`.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 refit_interval: int = 1):
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
+        self._sample_timestamps = []
+        self._volumes_by_price_level = {}
+        self._trades_by_price_level = {}
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +54,12 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._quote_timestamps = []
+        self._quote_prices = []
+        self._samples_changed = False
+        self._refit_interval = refit_interval
+        self._ticks_since_fit = 0
+        self._estimations_count = 0
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +69,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -64,57 +85,79 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def refit_interval(self) -> int:
+        return self._refit_interval
+
+    @refit_interval.setter
+    def refit_interval(self, value: int):
+        self._refit_interval = value
+
+    @property
+    def trade_volumes_by_price_level(self) -> Dict[float, float]:
+        """
+        Returns the volume traded at each distance from the mid price in the current samples
+        """
+        return dict(self._volumes_by_price_level)
+
+    @property
+    def estimations_count(self) -> int:
+        """
+        Returns the number of times the intensity curve has been fitted
+        """
+        return self._estimations_count
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quote_timestamps = [quote["timestamp"] for quote in reversed(value)]
+        self._quote_prices = [float(quote["price"]) for quote in reversed(value)]
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_index
+            int latest_processed_quote_index = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(float(price))
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
-
-        # THere are no trades left to process
+            # The last quote before the trade. Quotes with the same timestamp are kept in arrival order, so the most
+            # recent one is used
+            quote_index = bisect.bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_index >= 0:
+                latest_processed_quote_index = max(latest_processed_quote_index, quote_index)
+                self.c_add_trade_to_sample(self._quote_timestamps[quote_index] + 1,
+                                           abs(trade.price - self._quote_prices[quote_index]),
+                                           trade.amount)
+
+        # There are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+        if latest_processed_quote_index > 0:
+            del self._quote_timestamps[:latest_processed_quote_index]
+            del self._quote_prices[:latest_processed_quote_index]
 
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        while len(self._sample_timestamps) > self._sampling_length:
+            self.c_remove_oldest_sample()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
-
-        if self.is_sampling_buffer_full:
+        self._ticks_since_fit += 1
+        if self.is_sampling_buffer_full and self._samples_changed and self._ticks_since_fit >= self._refit_interval:
             self.c_estimate_intensity()
+            self._estimations_count += 1
+            self._samples_changed = False
+            self._ticks_since_fit = 0
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,30 +166,37 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_to_sample(self, object sample_timestamp, double price_level, double amount):
+        sample = self._trade_samples.get(sample_timestamp)
+        if sample is None:
+            sample = []
+            self._trade_samples[sample_timestamp] = sample
+            bisect.insort(self._sample_timestamps, sample_timestamp)
+        sample.append((price_level, amount))
+        self._volumes_by_price_level[price_level] = self._volumes_by_price_level.get(price_level, 0) + amount
+        self._trades_by_price_level[price_level] = self._trades_by_price_level.get(price_level, 0) + 1
+        self._samples_changed = True
+
+    cdef c_remove_oldest_sample(self):
+        sample_timestamp = self._sample_timestamps.pop(0)
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            trades_count = self._trades_by_price_level[price_level] - 1
+            if trades_count == 0:
+                del self._trades_by_price_level[price_level]
+                del self._volumes_by_price_level[price_level]
+            else:
+                self._trades_by_price_level[price_level] = trades_count
+                self._volumes_by_price_level[price_level] -= amount
+        self._samples_changed = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
             list lambdas
             list price_levels
 
         # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        price_levels = sorted(self._volumes_by_price_level, reverse=True)
+        lambdas = [self._volumes_by_price_level[price_level] for price_level in price_levels]
 
         # Adjust to be able to calculate log
         lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
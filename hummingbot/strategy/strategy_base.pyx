@@ -189,8 +189,8 @@ cdef class StrategyBase(TimeIterator):
     @property
     def trades(self) -> List[Trade]:
         """
-        Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        Returns a list of the completed trades from the market.
+        The trades are taken from the market event logs, which keep the most recent order fill events.
         """
         def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
             return Trade(order_filled_event.trading_pair,
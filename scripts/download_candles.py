@@ -1,7 +1,6 @@
 import os
 from typing import Dict
 
-from hummingbot import data_path
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesConfig, CandlesFactory
@@ -12,7 +11,9 @@ class DownloadCandles(ScriptStrategyBase):
     """
     This script provides an example of how to use the Candles Feed to download and store historical data.
     It downloads 3-minute candles for 3 Binance trading pairs ["APE-USDT", "BTC-USDT", "BNB-USDT"] and stores them in
-    CSV files in the /data directory. The script stops after it has downloaded 50,000 max_records records for each pair.
+    the candles cache in the /data/candles directory, shared with the candles feeds and the backtesting engine, so only
+    the candles that are not cached yet are downloaded. The script stops after it has downloaded 50,000 max_records
+    records for each pair.
     Is important to notice that the component will fail if all the candles are not available since the idea of it is to
     use it in production based on candles needed to compute technical indicators.
     """
@@ -40,10 +41,8 @@ class DownloadCandles(ScriptStrategyBase):
 
             candle = CandlesFactory.get_candle(CandlesConfig(connector=self.exchange, trading_pair=combination[0], interval=combination[1], max_records=self.get_max_records(self.days_to_download, combination[1])))
             candle.start()
-            # we are storing the candles object and the csv path to save the candles
+            # we are storing the candles object, that persists the candles in the cache
             self.candles[f"{combination[0]}_{combination[1]}"]["candles"] = candle
-            self.candles[f"{combination[0]}_{combination[1]}"][
-                "csv_path"] = data_path() + f"/candles_{self.exchange}_{combination[0]}_{combination[1]}.csv"
 
     def on_tick(self):
         for trading_pair, candles_info in self.candles.items():
@@ -51,8 +50,7 @@ class DownloadCandles(ScriptStrategyBase):
                 self.logger().info(f"Candles not ready yet for {trading_pair}! Missing {candles_info['candles']._candles.maxlen - len(candles_info['candles']._candles)}")
                 pass
             else:
-                df = candles_info["candles"].candles_df
-                df.to_csv(candles_info["csv_path"], index=False)
+                candles_info["candles"].persist_candles()
         if all(candles_info["candles"].ready for candles_info in self.candles.values()):
             HummingbotApplication.main_application().stop()
 
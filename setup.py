@@ -81,6 +81,7 @@ def main():
         "nose",
         "nose-exclude",
         "numpy",
+        "orjson==3.8.3",
         "pandas",
         "pip",
         "pre-commit",
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""
+Compares the acquire overhead of AsyncThrottler and SlidingWindowAsyncThrottler with the request pattern of a
+connector tracking many trading pairs: one shared pool limit linked to many per-endpoint limits.
+
+Usage: python test/debug/benchmark_async_throttler.py [number_of_pairs] [requests_per_pair]
+"""
+
+import asyncio
+import sys
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.async_sliding_window_throttler import SlidingWindowAsyncThrottler
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+POOL_LIMIT_ID = "REQUEST_WEIGHT"
+
+
+def build_rate_limits(number_of_pairs: int, requests_per_pair: int) -> List[RateLimit]:
+    # Limits are big enough to never block, so the benchmark measures only the bookkeeping cost
+    total_requests = number_of_pairs * requests_per_pair
+    rate_limits = [RateLimit(limit_id=POOL_LIMIT_ID, limit=total_requests * 10, time_interval=60)]
+    for i in range(number_of_pairs):
+        rate_limits.append(RateLimit(limit_id=f"/depth/PAIR{i}",
+                                     limit=total_requests,
+                                     time_interval=60,
+                                     linked_limits=[LinkedLimitWeightPair(POOL_LIMIT_ID, 2)]))
+    return rate_limits
+
+
+async def run_requests(throttler: AsyncThrottlerBase, number_of_pairs: int, requests_per_pair: int) -> float:
+    async def pair_requests(pair_index: int):
+        for _ in range(requests_per_pair):
+            async with throttler.execute_task(limit_id=f"/depth/PAIR{pair_index}"):
+                pass
+
+    start = time.perf_counter()
+    await asyncio.gather(*[pair_requests(i) for i in range(number_of_pairs)])
+    return time.perf_counter() - start
+
+
+def main():
+    number_of_pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    requests_per_pair = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rate_limits = build_rate_limits(number_of_pairs, requests_per_pair)
+    total_requests = number_of_pairs * requests_per_pair
+
+    for throttler_class in (AsyncThrottler, SlidingWindowAsyncThrottler):
+        throttler = throttler_class(rate_limits=rate_limits)
+        elapsed = asyncio.get_event_loop().run_until_complete(
+            run_requests(throttler, number_of_pairs, requests_per_pair))
+        print(f"{throttler_class.__name__}: {total_requests} requests in {elapsed:.3f}s "
+              f"({elapsed / total_requests * 1e6:.1f} us/request)")
+
+
+if __name__ == "__main__":
+    main()
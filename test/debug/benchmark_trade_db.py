@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+"""
+Seeds a trades database and measures the queries of the `history` command and of the markets recorder startup, with
+and without the SQLite performance profile.
+
+The orders and trade fills are spread over several configs and markets, with the config under test having one trade
+out of `configs_count`. The databases are created in a temporary directory and deleted at the end.
+
+Usage: python test/debug/benchmark_trade_db.py [trade_fills_count] [configs_count]
+"""
+
+import sys
+import tempfile
+import time
+from os.path import join
+from typing import Callable
+
+from hummingbot.client.command.export_command import ExportCommand
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+MARKETS = ("binance", "kucoin", "gate_io", "okx")
+CONFIG_FILE_PATH = "conf_benchmark_0.yml"
+SEED_BATCH_SIZE = 50000
+
+
+def seed(manager: SQLConnectionManager, trade_fills_count: int, configs_count: int):
+    start_timestamp = 1640000000000
+    with manager.engine.begin() as connection:
+        for batch_start in range(0, trade_fills_count, SEED_BATCH_SIZE):
+            orders = []
+            trade_fills = []
+            for i in range(batch_start, min(batch_start + SEED_BATCH_SIZE, trade_fills_count)):
+                config_file_path = f"conf_benchmark_{i % configs_count}.yml"
+                market = MARKETS[(i // configs_count) % len(MARKETS)]
+                timestamp = start_timestamp + i * 1000
+                order_id = f"OID-{i}"
+                orders.append({
+                    "id": order_id, "config_file_path": config_file_path, "strategy": "pure_market_making",
+                    "market": market, "symbol": "BTC-USDT", "base_asset": "BTC", "quote_asset": "USDT",
+                    "creation_timestamp": timestamp, "order_type": "LIMIT", "amount": 1000000, "leverage": 1,
+                    "price": 40000000000, "last_status": "BuyOrderCompleted", "last_update_timestamp": timestamp,
+                    "exchange_order_id": f"EOID-{i}", "position": "NIL",
+                })
+                trade_fills.append({
+                    "config_file_path": config_file_path, "strategy": "pure_market_making", "market": market,
+                    "symbol": "BTC-USDT", "base_asset": "BTC", "quote_asset": "USDT", "timestamp": timestamp,
+                    "order_id": order_id, "trade_type": "BUY", "order_type": "LIMIT", "price": 40000000000,
+                    "amount": 1000000, "leverage": 1,
+                    "trade_fee": {"fee_type": "AddedToCost", "percent": "0.001", "percent_token": None,
+                                  "flat_fees": []},
+                    "trade_fee_in_quote": 40000000, "exchange_trade_id": f"TID-{i}", "position": "NIL",
+                })
+            connection.execute(Order.__table__.insert(), orders)
+            connection.execute(TradeFill.__table__.insert(), trade_fills)
+
+
+def measure(name: str, function: Callable, repetitions: int = 3):
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+    print(f"  {name}: {min(durations) * 1e3:.1f} ms (best of {repetitions}, {len(result)} rows)")
+
+
+def benchmark(db_dir: str, performance_profile: bool, trade_fills_count: int, configs_count: int):
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+    client_config_map.db_mode = DBSqliteMode(performance_profile=performance_profile)
+    db_path = join(db_dir, f"benchmark_{'profile' if performance_profile else 'default'}.sqlite")
+    manager = SQLConnectionManager(client_config_map, SQLConnectionType.TRADE_FILLS, db_path=db_path)
+
+    start = time.perf_counter()
+    seed(manager, trade_fills_count, configs_count)
+    print(f"Performance profile {'enabled' if performance_profile else 'disabled'}, "
+          f"seeded {trade_fills_count} trade fills in {time.perf_counter() - start:.1f}s")
+
+    # Queries of the markets recorder when it's created
+    recorder = MarketsRecorder.__new__(MarketsRecorder)
+    recorder._sql_manager = manager
+    market = type("Market", (), {"display_name": MARKETS[0]})()
+    measure("startup trades", lambda: recorder.get_trades_for_config(CONFIG_FILE_PATH, 2000))
+    measure("startup orders",
+            lambda: recorder.get_orders_for_config_and_market(CONFIG_FILE_PATH, market, True, 2000))
+
+    # Query of the `history` command, for the trades of the last day and all the trades of the config
+    export_command = ExportCommand()
+    last_day_timestamp = 1640000000000 + (trade_fills_count - 86400) * 1000
+
+    def history(start_timestamp: int):
+        with manager.get_new_session() as session:
+            trades = export_command._get_trades_from_session(
+                start_timestamp, session=session, config_file_path=CONFIG_FILE_PATH
+            )
+            # The history report reads the order of each trade
+            for trade in trades:
+                trade.order
+            return trades
+
+    measure("history (last day)", lambda: history(last_day_timestamp))
+    measure("history (all)", lambda: history(0))
+    manager.engine.dispose()
+
+
+def main():
+    trade_fills_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    configs_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with tempfile.TemporaryDirectory() as db_dir:
+        for performance_profile in (False, True):
+            benchmark(db_dir, performance_profile, trade_fills_count, configs_count)
+
+
+if __name__ == "__main__":
+    main()
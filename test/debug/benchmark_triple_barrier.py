@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+"""
+Compares the vectorized triple barrier labeling of BacktestingEngineBase.apply_tp_sl_on_tl with the previous
+implementation, that evaluated the path of each signal in a Python loop, over synthetic 1m candles.
+Both implementations are checked to produce the same close_time and close_type columns.
+
+Usage: python test/debug/benchmark_triple_barrier.py [candles] [signal_probability] [time_limit_seconds]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.smart_components.backtesting.backtesting_engine_base import BacktestingEngineBase
+
+
+def generate_candles(candles: int, signal_probability: float, time_limit: int) -> pd.DataFrame:
+    random_generator = np.random.default_rng(42)
+    df = pd.DataFrame({
+        "timestamp": 1672531200000 + np.arange(candles) * 60000,
+        "close": 20000 * np.exp(np.cumsum(random_generator.normal(0, 0.001, candles))),
+        "signal": random_generator.choice([-1, 0, 1], candles,
+                                          p=[signal_probability / 2, 1 - signal_probability, signal_probability / 2]),
+        "target": random_generator.uniform(0.002, 0.01, candles),
+    })
+    df.index = pd.to_datetime(df.timestamp, unit="ms")
+    df["tl"] = df.index + pd.Timedelta(seconds=time_limit)
+    return df
+
+
+def apply_tp_sl_on_tl_with_loop(df: pd.DataFrame, tp: float, sl: float) -> pd.DataFrame:
+    events = df[df["signal"] != 0].copy()
+    take_profit = tp * events["target"] if tp > 0 else pd.Series(index=df.index, dtype=float)
+    stop_loss = - sl * events["target"] if sl > 0 else pd.Series(index=df.index, dtype=float)
+    for loc, tl in events["tl"].fillna(df.index[-1]).items():
+        df0 = df.close[loc:tl]
+        df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]
+        df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()
+        df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()
+    df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
+    df["close_type"] = df[["take_profit_time", "stop_loss_time", "tl"]].dropna(how="all").idxmin(axis=1)
+    df["close_type"].replace({"take_profit_time": "tp", "stop_loss_time": "sl"}, inplace=True)
+    return df
+
+
+def main():
+    candles = int(sys.argv[1]) if len(sys.argv) > 1 else 60 * 24 * 30
+    signal_probability = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    time_limit = int(sys.argv[3]) if len(sys.argv) > 3 else 60 * 60 * 6
+    df = generate_candles(candles, signal_probability, time_limit)
+    print(f"{candles} candles, {(df['signal'] != 0).sum()} signals, time limit {time_limit}s")
+
+    start = time.perf_counter()
+    vectorized_df = BacktestingEngineBase.apply_tp_sl_on_tl(df.copy(), tp=1.0, sl=1.0)
+    vectorized_time = time.perf_counter() - start
+    print(f"Vectorized: {vectorized_time:.3f}s")
+
+    start = time.perf_counter()
+    loop_df = apply_tp_sl_on_tl_with_loop(df.copy(), tp=1.0, sl=1.0)
+    loop_time = time.perf_counter() - start
+    print(f"Loop: {loop_time:.3f}s ({loop_time / vectorized_time:.1f}x)")
+
+    pd.testing.assert_series_equal(loop_df["close_time"], vectorized_df["close_time"])
+    pd.testing.assert_series_equal(loop_df["close_type"], vectorized_df["close_type"])
+    print("close_time and close_type are identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+"""
+Replays websocket frames through the decoding path of WSConnection, comparing the available JSON decoders with and
+without a channel frame filter.
+
+The frames are read from a file with one raw frame per line (for example recorded from a depth stream). If no file
+is given, Binance-like depth and trade frames are generated.
+
+Usage: python test/debug/benchmark_ws_decoding.py [frames_file] [repetitions]
+"""
+
+import json
+import random
+import sys
+import time
+from typing import List, Optional
+
+import aiohttp
+
+from hummingbot.core.web_assistant.connections.json_decoders import (
+    JSONDecoderBase,
+    OrjsonJSONDecoder,
+    StdlibJSONDecoder,
+    orjson,
+)
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.connections.ws_frame_filters import ChannelFrameFilter, WSFrameFilterBase
+
+
+def generate_frames(count: int = 5000, levels: int = 50) -> List[str]:
+    frames = []
+    for i in range(count):
+        if i % 4 == 0:
+            frames.append(json.dumps({"e": "trade", "E": 1640000000000 + i, "s": "BTCUSDT", "t": i,
+                                      "p": f"{40000 + random.random():.2f}", "q": f"{random.random():.5f}",
+                                      "m": bool(i % 2)}, separators=(",", ":")))
+        else:
+            frames.append(json.dumps({
+                "e": "depthUpdate", "E": 1640000000000 + i, "s": "BTCUSDT", "U": i * 10, "u": i * 10 + 9,
+                "b": [[f"{40000 - j * 0.01:.2f}", f"{random.random():.5f}"] for j in range(levels)],
+                "a": [[f"{40000 + j * 0.01:.2f}", f"{random.random():.5f}"] for j in range(levels)],
+            }, separators=(",", ":")))
+    return frames
+
+
+def load_frames(path: str) -> List[str]:
+    with open(path) as frames_file:
+        return [line.rstrip("\n") for line in frames_file if line.strip()]
+
+
+def replay(frames: List[aiohttp.WSMessage],
+           decoder: JSONDecoderBase,
+           frame_filter: Optional[WSFrameFilterBase],
+           repetitions: int) -> float:
+    connection = WSConnection(aiohttp_client_session=None, json_decoder=decoder)
+    connection._frame_filter = frame_filter
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        for msg in frames:
+            if not connection._is_filtered(msg):
+                connection._build_resp(msg)
+    return time.perf_counter() - start
+
+
+def main():
+    frames_file = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] != "-" else None
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    raw_frames = load_frames(frames_file) if frames_file is not None else generate_frames()
+    frames = [aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, frame, None) for frame in raw_frames]
+    total_frames = len(frames) * repetitions
+    depth_filter = ChannelFrameFilter(markers=['"depthUpdate"'])
+
+    decoders = [StdlibJSONDecoder()] + ([OrjsonJSONDecoder()] if orjson is not None else [])
+    for decoder in decoders:
+        for frame_filter in (None, depth_filter):
+            elapsed = replay(frames, decoder, frame_filter, repetitions)
+            filter_name = "depth filter" if frame_filter is not None else "no filter"
+            print(f"{type(decoder).__name__} ({filter_name}): {total_frames} frames in {elapsed:.3f}s "
+                  f"({elapsed / total_frames * 1e6:.1f} us/frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -106,6 +106,23 @@ class HistoryCommandTest(unittest.TestCase):
             )
         )
 
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_history_writes_the_queued_trades_before_querying_them(self, notify_mock):
+        self.app.markets_recorder = MagicMock()
+        self.app.markets_recorder.flush = AsyncMock()
+        queried_after_flush = []
+
+        def get_session_trades_aggregates():
+            queried_after_flush.append(self.app.markets_recorder.flush.await_count == 1)
+            return {}
+
+        self.app.get_session_trades_aggregates = get_session_trades_aggregates
+
+        self.async_run_with_timeout(self.app.history_report_from_db())
+
+        self.assertEqual([True], queried_after_flush)
+        notify_mock.assert_called_once_with("\n  No past trades to report.")
+
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
     def test_list_trades(self, notify_mock):
         self.client_config_map.db_mode = DBSqliteMode()
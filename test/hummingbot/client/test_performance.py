@@ -1,11 +1,12 @@
 import asyncio
+import json
 import time
 import unittest
 from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PositionsAggregate, TradesAggregate
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -341,3 +342,62 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+    @patch("hummingbot.client.performance.PerformanceMetrics._is_trade_fill")
+    def test_metrics_from_aggregate_updated_in_parts_are_equal_to_metrics_from_all_trades(self, is_trade_fill_mock):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        RateOracle._shared_instance = rate_oracle
+
+        is_trade_fill_mock.return_value = True
+        fee = AddedToCostTradeFee(Decimal("0.1"), flat_fees=[TokenAmount("USD", Decimal("1"))])
+        trades = [
+            self.mock_trade(id="order1", amount=Decimal("60"), price=Decimal("10"), position="OPEN", fee=fee),
+            self.mock_trade(id="order1", amount=Decimal("40"), price=Decimal("11"), position="OPEN", fee=fee),
+            self.mock_trade(id="order2", amount=Decimal("100"), price=Decimal("15"), position="CLOSE", type="SELL",
+                            fee=fee),
+            self.mock_trade(id="order3", amount=Decimal("100"), price=Decimal("20"), position="OPEN", type="SELL",
+                            fee=fee),
+            self.mock_trade(id="order4", amount=Decimal("100"), price=Decimal("15"), position="CLOSE", fee=fee),
+        ]
+        cur_bals = {base: 100, quote: 10000}
+
+        aggregate = PerformanceMetrics.add_trades(TradesAggregate(trading_pair), trades[:3])
+        # The aggregate is stored and loaded before adding the rest of the trades
+        aggregate = TradesAggregate.from_json(json.loads(json.dumps(aggregate.to_json())))
+        PerformanceMetrics.add_trades(aggregate, trades[3:])
+
+        metrics_from_aggregate = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_aggregate(aggregate, cur_bals))
+        metrics_from_trades = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+
+        self.assertEqual(5, metrics_from_aggregate.num_trades)
+        # The fills of order1 are paired with order2 by amount: 60 * (15 - 10) + 40 * (15 - 11) + 100 * (20 - 15)
+        self.assertEqual(Decimal("960"), metrics_from_aggregate.trade_pnl)
+        self.assertEqual(vars(metrics_from_trades), vars(metrics_from_aggregate))
+        # Computing the metrics doesn't change the trades
+        self.assertEqual(Decimal("60"), trades[0].amount)
+
+    def test_positions_aggregate_pairs_the_fills_by_amount_and_keeps_the_fills_not_paired(self):
+        positions = PositionsAggregate()
+        positions.add_fill("BUY", "OPEN", Decimal("10"), Decimal("2"))
+        positions.add_fill("BUY", "OPEN", Decimal("12"), Decimal("1"))
+        positions.add_fill("SELL", "CLOSE", Decimal("15"), Decimal("2.5"))
+        positions.add_fill("SELL", "OPEN", Decimal("20"), Decimal("1"))
+        positions.add_fill("BUY", "CLOSE", Decimal("18"), Decimal("1"))
+        positions.add_fill("BUY", "NIL", Decimal("18"), Decimal("1"))
+
+        self.assertEqual(Decimal("13.5"), positions.realized_pnl)
+        self.assertEqual([("OPEN", Decimal("12"), Decimal("0.5"))],
+                         [(fill.position, fill.price, fill.amount) for fill in positions.long_fills])
+        self.assertEqual(0, len(positions.short_fills))
+
+        for _ in range(1000):
+            positions.add_fill("SELL", "OPEN", Decimal("20"), Decimal("1"))
+            positions.add_fill("BUY", "CLOSE", Decimal("19"), Decimal("1"))
+
+        self.assertEqual(Decimal("1013.5"), positions.realized_pnl)
+        self.assertEqual(1, len(positions.long_fills))
+        self.assertEqual(0, len(positions.short_fills))
+        stored_positions = PositionsAggregate.from_json(json.loads(json.dumps(positions.to_json())))
+        self.assertEqual(positions.to_json(), stored_positions.to_json())
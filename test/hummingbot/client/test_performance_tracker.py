@@ -0,0 +1,177 @@
+import unittest
+from decimal import Decimal
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import Dict, List, Tuple
+from unittest.mock import patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics, TradesAggregate
+from hummingbot.client.performance_tracker import PerformanceTracker
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+
+class PerformanceTrackerTests(unittest.TestCase, LoggerMixinForTest):
+    config_file_path = "conf_test.yml"
+    start_timestamp = 1640000000000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                            SQLConnectionType.TRADE_FILLS,
+                                            db_path=":memory:")
+        self.tracker = PerformanceTracker(self.manager)
+        self.set_loggers(loggers=[self.tracker.logger()])
+        self.trades_count = 0
+
+    def add_trade(self, timestamp: int, market: str = "binance", symbol: str = "BTC-USDT", trade_type: str = "BUY",
+                  config_file_path: str = config_file_path):
+        self.trades_count += 1
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(TradeFill(
+                    config_file_path=config_file_path,
+                    strategy="pure_market_making",
+                    market=market,
+                    symbol=symbol,
+                    base_asset=symbol.split("-")[0],
+                    quote_asset=symbol.split("-")[1],
+                    timestamp=timestamp,
+                    order_id=f"OID-{self.trades_count}",
+                    trade_type=trade_type,
+                    order_type="LIMIT",
+                    price=Decimal("100") + self.trades_count,
+                    amount=Decimal("1.5"),
+                    leverage=1,
+                    trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")).to_json(),
+                    exchange_trade_id=f"TID-{self.trades_count}",
+                ))
+
+    def expected_aggregates(self) -> Dict[Tuple[str, str], dict]:
+        with self.manager.get_new_session() as session:
+            trades: List[TradeFill] = (session.query(TradeFill)
+                                       .filter(TradeFill.timestamp >= self.start_timestamp,
+                                               TradeFill.config_file_path == self.config_file_path)
+                                       .order_by(TradeFill.timestamp)
+                                       .all())
+            aggregates = {}
+            for trade in trades:
+                aggregate = aggregates.setdefault((trade.market, trade.symbol), TradesAggregate(trade.symbol))
+                PerformanceMetrics.add_trades(aggregate, [trade])
+        return {key: aggregate.to_json() for key, aggregate in aggregates.items()}
+
+    def update(self, tracker: PerformanceTracker) -> Dict[Tuple[str, str], dict]:
+        aggregates = tracker.update(config_file_path=self.config_file_path, start_timestamp=self.start_timestamp)
+        return {key: aggregate.to_json() for key, aggregate in aggregates.items()}
+
+    def test_update_adds_the_new_trades_to_the_totals(self):
+        self.add_trade(self.start_timestamp - 1)
+        self.add_trade(self.start_timestamp)
+        self.add_trade(self.start_timestamp + 1, trade_type="SELL")
+        self.add_trade(self.start_timestamp + 1, market="kucoin", symbol="ETH-USDT")
+        self.add_trade(self.start_timestamp + 2, config_file_path="conf_other.yml")
+
+        self.assertEqual(self.expected_aggregates(), self.update(self.tracker))
+
+        self.add_trade(self.start_timestamp + 3, trade_type="SELL")
+        self.add_trade(self.start_timestamp + 4, market="kucoin", symbol="ETH-USDT")
+
+        with patch.object(PerformanceMetrics, "add_trades", wraps=PerformanceMetrics.add_trades) as add_trades_mock:
+            aggregates = self.update(self.tracker)
+
+        self.assertEqual(self.expected_aggregates(), aggregates)
+        self.assertEqual(2, sum(len(call.args[1]) for call in add_trades_mock.call_args_list))
+        self.assertEqual(3, aggregates[("binance", "BTC-USDT")]["buys"]["count"]
+                         + aggregates[("binance", "BTC-USDT")]["sells"]["count"])
+
+    def test_trades_stored_later_with_the_last_timestamp_are_added_once(self):
+        self.add_trade(self.start_timestamp)
+        self.update(self.tracker)
+        self.add_trade(self.start_timestamp)
+
+        self.assertEqual(self.expected_aggregates(), self.update(self.tracker))
+        self.assertEqual(self.expected_aggregates(), self.update(self.tracker))
+
+    def test_stored_checkpoint_is_used_by_a_new_tracker(self):
+        self.add_trade(self.start_timestamp)
+        self.add_trade(self.start_timestamp + 1)
+        self.update(self.tracker)
+
+        with self.manager.get_new_session() as session:
+            checkpoint: PerformanceCheckpoint = session.query(PerformanceCheckpoint).one()
+            self.assertEqual(self.start_timestamp + 1, checkpoint.last_trade_timestamp)
+            self.assertEqual(2, checkpoint.trades_count)
+
+        self.add_trade(self.start_timestamp + 2)
+        new_tracker = PerformanceTracker(self.manager)
+        with patch.object(PerformanceMetrics, "add_trades", wraps=PerformanceMetrics.add_trades) as add_trades_mock:
+            aggregates = self.update(new_tracker)
+
+        self.assertEqual(self.expected_aggregates(), aggregates)
+        self.assertEqual(1, sum(len(call.args[1]) for call in add_trades_mock.call_args_list))
+
+    def test_totals_are_computed_again_if_an_older_trade_is_stored_later(self):
+        self.add_trade(self.start_timestamp + 2)
+        self.update(self.tracker)
+        self.add_trade(self.start_timestamp + 1)
+        self.add_trade(self.start_timestamp + 3, trade_type="SELL")
+
+        self.assertEqual(self.expected_aggregates(), self.update(self.tracker))
+        self.assertTrue(self.is_logged("INFO", f"The performance checkpoint of {self.config_file_path} doesn't match "
+                                               f"the stored trades, computing it again."))
+
+    def test_checkpoints_of_previous_start_timestamps_are_replaced(self):
+        self.add_trade(self.start_timestamp)
+        self.tracker.update(config_file_path=self.config_file_path, start_timestamp=self.start_timestamp - 10)
+        self.tracker.update(config_file_path=self.config_file_path, start_timestamp=self.start_timestamp)
+
+        with self.manager.get_new_session() as session:
+            checkpoints: List[PerformanceCheckpoint] = session.query(PerformanceCheckpoint).all()
+            self.assertEqual([self.start_timestamp], [checkpoint.start_timestamp for checkpoint in checkpoints])
+
+    def test_for_db_returns_one_tracker_per_database(self):
+        tracker = PerformanceTracker.for_db(self.manager)
+
+        self.assertIs(tracker, PerformanceTracker.for_db(self.manager))
+        self.assertEqual({}, tracker.update(config_file_path=self.config_file_path,
+                                            start_timestamp=self.start_timestamp))
+
+    def test_checkpoint_is_saved_at_most_once_per_interval(self):
+        self.add_trade(self.start_timestamp)
+        with patch.object(PerformanceTracker, "_time", return_value=1000):
+            self.update(self.tracker)
+            self.add_trade(self.start_timestamp + 1)
+            self.assertEqual(self.expected_aggregates(), self.update(self.tracker))
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(1, session.query(PerformanceCheckpoint).one().trades_count)
+
+        # The trades added before the interval elapsed are saved with the next update, even without new trades
+        with patch.object(PerformanceTracker, "_time", return_value=1000 + self.tracker._checkpoint_interval):
+            self.update(self.tracker)
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, session.query(PerformanceCheckpoint).one().trades_count)
+
+    def test_checkpoint_stored_in_a_previous_format_is_not_used(self):
+        self.add_trade(self.start_timestamp)
+        self.update(self.tracker)
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                checkpoint: PerformanceCheckpoint = session.query(PerformanceCheckpoint).one()
+                market, aggregate = checkpoint.aggregates[0]
+                checkpoint.aggregates = [[market, {key: value for key, value in aggregate.items()
+                                                   if key != "positions"}]]
+        self.add_trade(self.start_timestamp + 1)
+
+        with patch.object(PerformanceMetrics, "add_trades", wraps=PerformanceMetrics.add_trades) as add_trades_mock:
+            aggregates = self.update(PerformanceTracker(self.manager))
+
+        self.assertEqual(self.expected_aggregates(), aggregates)
+        # The totals are computed again from all the trades
+        self.assertEqual(2, sum(len(call.args[1]) for call in add_trades_mock.call_args_list))
@@ -68,14 +68,14 @@ class InterfaceUtilsTest(unittest.TestCase):
             mock_monitor.log.call_args_list[0].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create_from_aggregate", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
     def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_perf, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
+        mock_app.get_session_trades_aggregates.return_value = {("ExchangeA", "HBOT-USDT"): MagicMock(num_trades=1)}
         mock_app.get_current_balances = AsyncMock()
         mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
                                  MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"))]
@@ -88,17 +88,17 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 2.00%', mock_result.log.call_args_list[2].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create_from_aggregate", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
     def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_perf, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="HBOT-BTC")
-        ]
+        mock_app.get_session_trades_aggregates.return_value = {
+            ("ExchangeA", "HBOT-USDT"): MagicMock(num_trades=1),
+            ("ExchangeA", "HBOT-BTC"): MagicMock(num_trades=1),
+        }
         mock_app.get_current_balances = AsyncMock()
         mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
                                  MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
@@ -110,17 +110,17 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 2, Total P&L: N/A, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create_from_aggregate", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
     def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_perf, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="BTC-USDT")
-        ]
+        mock_app.get_session_trades_aggregates.return_value = {
+            ("ExchangeA", "HBOT-USDT"): MagicMock(num_trades=1),
+            ("ExchangeA", "BTC-USDT"): MagicMock(num_trades=1),
+        }
         mock_app.get_current_balances = AsyncMock()
         mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
                                  MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
@@ -151,7 +151,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = []
+        mock_app.get_session_trades_aggregates.return_value = {}
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
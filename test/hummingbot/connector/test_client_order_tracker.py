@@ -1,7 +1,7 @@
 import asyncio
 import unittest
 from decimal import Decimal
-from typing import Awaitable, Dict
+from typing import Awaitable, Dict, Optional
 from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -1132,3 +1132,97 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_order(self, client_order_id: str, exchange_order_id: Optional[str] = None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+
+    def test_orders_are_found_by_exchange_order_id_assigned_after_tracking_them(self):
+        updated_order = self._create_order("OID1")
+        assigned_order = self._create_order("OID2")
+        self.tracker.start_tracking_order(updated_order)
+        self.tracker.start_tracking_order(assigned_order)
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+        self.async_run_with_timeout(self.tracker._process_order_update(OrderUpdate(
+            client_order_id="OID1",
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )))
+        # The connector sets the exchange order ID of the order without going through the tracker
+        assigned_order.update_exchange_order_id("EOID2")
+
+        self.assertIs(updated_order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertIs(assigned_order, self.tracker.fetch_order(exchange_order_id="EOID2"))
+        self.assertEqual({}, self.tracker._orders_without_exchange_order_id)
+
+    def test_orders_by_exchange_order_id_views_follow_the_tracked_orders(self):
+        tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        active_order = self._create_order("OID1", "EOID1")
+        cached_order = self._create_order("OID2", "EOID2")
+        lost_order = self._create_order("OID3", "EOID3")
+        for order in (active_order, cached_order, lost_order):
+            tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(cached_order.client_order_id)
+        self.async_run_with_timeout(tracker.process_order_not_found(lost_order.client_order_id))
+
+        fillable_orders = tracker.all_fillable_orders_by_exchange_order_id
+        updatable_orders = tracker.all_updatable_orders_by_exchange_order_id
+
+        self.assertEqual({"EOID1": active_order, "EOID2": cached_order, "EOID3": lost_order}, dict(fillable_orders))
+        self.assertEqual({"EOID1": active_order, "EOID3": lost_order}, dict(updatable_orders))
+        self.assertIsNone(updatable_orders.get("EOID2"))
+        self.assertIs(lost_order, tracker.fetch_lost_order(exchange_order_id="EOID3"))
+        self.assertIsNone(tracker.fetch_order(exchange_order_id="EOID3"))
+
+        # The views are not copies, they reflect the changes of the tracked orders
+        new_order = self._create_order("OID4", "EOID4")
+        tracker.start_tracking_order(new_order)
+        del tracker._cached_orders[cached_order.client_order_id]
+
+        self.assertIs(new_order, fillable_orders["EOID4"])
+        self.assertNotIn("EOID2", fillable_orders)
+        self.assertEqual(3, len(fillable_orders))
+        self.assertNotIn("EOID2", tracker._orders_by_exchange_order_id)
+
+    def test_lost_order_removed_from_exchange_order_id_index_when_canceled(self):
+        tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        order = self._create_order("OID1", "EOID1")
+        tracker.start_tracking_order(order)
+        self.async_run_with_timeout(tracker.process_order_not_found(order.client_order_id))
+
+        self.async_run_with_timeout(tracker._process_order_update(OrderUpdate(
+            exchange_order_id="EOID1",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.CANCELED,
+        )))
+
+        self.assertEqual({}, tracker.lost_orders)
+        self.assertNotIn("EOID1", tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertEqual({}, tracker._orders_by_exchange_order_id)
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.MAX_CACHE_SIZE", 2)
+    def test_untracked_orders_are_removed_from_the_exchange_order_id_index(self):
+        tracker = ClientOrderTracker(connector=self.connector)
+        for i in range(5):
+            order = self._create_order(f"OID{i}", f"EOID{i}")
+            tracker.start_tracking_order(order)
+            tracker.stop_tracking_order(order.client_order_id)
+            # The cached orders expire
+            tracker._cached_orders.clear()
+
+        self.assertLessEqual(len(tracker._orders_by_exchange_order_id), 2)
+        self.assertEqual(0, len(tracker.all_fillable_orders_by_exchange_order_id))
@@ -0,0 +1,254 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Any, Awaitable, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+
+class MockExchange(ExchangePyBase):
+
+    def __init__(self, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
+        self._mock_trading_pairs = trading_pairs
+        super().__init__(client_config_map)
+        self.status_requests_in_progress = 0
+        self.max_status_requests_in_progress = 0
+        self.requested_order_ids: List[str] = []
+        self.bulk_order_updates: Optional[List[OrderUpdate]] = None
+        self.bulk_trade_updates: Optional[List[TradeUpdate]] = None
+
+    @property
+    def name(self) -> str:
+        return "mock_exchange"
+
+    @property
+    def authenticator(self) -> AuthBase:
+        return MagicMock()
+
+    @property
+    def rate_limits_rules(self) -> List[RateLimit]:
+        return []
+
+    @property
+    def domain(self) -> str:
+        return ""
+
+    @property
+    def client_order_id_max_length(self) -> int:
+        return 32
+
+    @property
+    def client_order_id_prefix(self) -> str:
+        return ""
+
+    @property
+    def trading_rules_request_path(self) -> str:
+        return ""
+
+    @property
+    def trading_pairs_request_path(self) -> str:
+        return ""
+
+    @property
+    def check_network_request_path(self) -> str:
+        return ""
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._mock_trading_pairs
+
+    @property
+    def is_cancel_request_in_exchange_synchronous(self) -> bool:
+        return True
+
+    @property
+    def is_trading_required(self) -> bool:
+        return True
+
+    def supported_order_types(self) -> List[OrderType]:
+        return [OrderType.LIMIT]
+
+    def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
+        return False
+
+    def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
+        return False
+
+    async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
+        raise NotImplementedError
+
+    async def _place_order(self, order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                           order_type: OrderType, price: Decimal, **kwargs):
+        raise NotImplementedError
+
+    def _get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                 amount: Decimal, price: Decimal = Decimal("NaN"), is_maker: Optional[bool] = None):
+        return AddedToCostTradeFee()
+
+    async def _update_trading_fees(self):
+        pass
+
+    async def _user_stream_event_listener(self):
+        pass
+
+    async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
+        return []
+
+    async def _update_balances(self):
+        pass
+
+    async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
+        return []
+
+    async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
+        self.status_requests_in_progress += 1
+        self.max_status_requests_in_progress = max(self.max_status_requests_in_progress,
+                                                   self.status_requests_in_progress)
+        await asyncio.sleep(0.01)
+        self.status_requests_in_progress -= 1
+        self.requested_order_ids.append(tracked_order.client_order_id)
+        return OrderUpdate(
+            client_order_id=tracked_order.client_order_id,
+            trading_pair=tracked_order.trading_pair,
+            update_timestamp=self.current_timestamp,
+            new_state=OrderState.OPEN,
+        )
+
+    async def _request_order_updates_for_trading_pair(
+            self, trading_pair: str, orders: List[InFlightOrder]) -> Optional[List[OrderUpdate]]:
+        if self.bulk_order_updates is None:
+            return None
+        return [update for update in self.bulk_order_updates if update.trading_pair == trading_pair]
+
+    async def _all_trade_updates_for_trading_pair(
+            self, trading_pair: str, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        if self.bulk_trade_updates is None:
+            return None
+        return [update for update in self.bulk_trade_updates if update.trading_pair == trading_pair]
+
+    def _create_web_assistants_factory(self) -> WebAssistantsFactory:
+        return MagicMock()
+
+    def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
+        return MagicMock()
+
+    def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
+        return MagicMock()
+
+    def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
+        pass
+
+
+class ExchangePyBaseOrderReconciliationTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+        cls.other_trading_pair = "COINBETA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = MockExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trading_pairs=[self.trading_pair, self.other_trading_pair])
+        self.exchange._set_current_timestamp(1640000000.0)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def start_orders(self, count: int, trading_pair: str, prefix: str):
+        for i in range(count):
+            self.exchange.start_tracking_order(
+                order_id=f"{prefix}{i}",
+                exchange_order_id=f"EX{prefix}{i}",
+                trading_pair=trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10"),
+                amount=Decimal("1"),
+                order_type=OrderType.LIMIT,
+            )
+
+    def test_order_status_requests_are_executed_concurrently_and_bounded(self):
+        self.exchange.MAX_CONCURRENT_ORDER_UPDATE_REQUESTS = 4
+        self.start_orders(count=10, trading_pair=self.trading_pair, prefix="OID")
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(10, len(self.exchange.requested_order_ids))
+        self.assertEqual(4, self.exchange.max_status_requests_in_progress)
+        self.assertGreater(self.exchange.last_order_reconciliation_latency, 0)
+        for order in self.exchange.in_flight_orders.values():
+            self.assertEqual(OrderState.OPEN, order.current_state)
+
+    def test_orders_included_in_bulk_order_updates_are_not_requested_individually(self):
+        self.start_orders(count=2, trading_pair=self.trading_pair, prefix="OID")
+        self.start_orders(count=2, trading_pair=self.other_trading_pair, prefix="OTHER")
+        self.exchange.bulk_order_updates = [
+            OrderUpdate(
+                client_order_id="OID0",
+                trading_pair=self.trading_pair,
+                update_timestamp=self.exchange.current_timestamp,
+                new_state=OrderState.PARTIALLY_FILLED,
+            ),
+            OrderUpdate(
+                client_order_id="OTHER1",
+                trading_pair=self.other_trading_pair,
+                update_timestamp=self.exchange.current_timestamp,
+                new_state=OrderState.PARTIALLY_FILLED,
+            ),
+        ]
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertEqual(["OID1", "OTHER0"], sorted(self.exchange.requested_order_ids))
+        self.assertEqual(OrderState.PARTIALLY_FILLED, self.exchange.in_flight_orders["OID0"].current_state)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, self.exchange.in_flight_orders["OTHER1"].current_state)
+
+    def test_lost_orders_update_registers_reconciliation_latency(self):
+        self.assertEqual(0, self.exchange.last_order_reconciliation_latency)
+
+        self.async_run_with_timeout(self.exchange._update_lost_orders_status())
+
+        self.assertGreater(self.exchange.last_order_reconciliation_latency, 0)
+
+    def test_bulk_trade_updates_are_processed_for_all_orders_of_the_pair(self):
+        self.start_orders(count=2, trading_pair=self.trading_pair, prefix="OID")
+        self.exchange._all_trade_updates_for_order = AsyncMock()
+        self.exchange.bulk_trade_updates = [
+            TradeUpdate(
+                trade_id="T1",
+                client_order_id="OID1",
+                exchange_order_id="EXOID1",
+                trading_pair=self.trading_pair,
+                fill_timestamp=self.exchange.current_timestamp,
+                fill_price=Decimal("10"),
+                fill_base_amount=Decimal("0.5"),
+                fill_quote_amount=Decimal("5"),
+                fee=AddedToCostTradeFee(),
+            )
+        ]
+
+        self.async_run_with_timeout(
+            self.exchange._update_orders_fills(orders=list(self.exchange.in_flight_orders.values())))
+
+        self.exchange._all_trade_updates_for_order.assert_not_called()
+        self.assertEqual(Decimal("0.5"), self.exchange.in_flight_orders["OID1"].executed_amount_base)
+        self.assertEqual(Decimal("0"), self.exchange.in_flight_orders["OID0"].executed_amount_base)
@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from typing import Awaitable
@@ -6,6 +8,7 @@ from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import numpy as np
+import pandas as pd
 from sqlalchemy import create_engine
 
 from hummingbot.client.config.client_config_map import ClientConfigMap, MarketDataCollectionConfigMap
@@ -23,6 +26,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -85,6 +89,12 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -394,6 +404,118 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
 
+    def test_started_recorder_queues_the_records_and_writes_them_when_stopped(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.start()
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        self.tracking_states = {"OID1": "created"}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        complete_event = BuyOrderCompletedEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            base_asset=self.base,
+            quote_asset=self.quote,
+            base_asset_amount=create_event.amount,
+            quote_asset_amount=create_event.amount * create_event.price,
+            order_type=create_event.type,
+        )
+        self.tracking_states = {}
+        recorder._did_complete_order(MarketEvent.BuyOrderCompleted.value, self, complete_event)
+
+        # Two records plus a single market state save
+        self.assertEqual(3, recorder.write_queue_stats.queue_depth)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(Order).count())
+
+        recorder.stop()
+
+        self.assertEqual(0, recorder.write_queue_stats.queue_depth)
+        with self.manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            order_status = orders[0].status
+            market_states = session.query(MarketState).all()
+
+        self.assertEqual(1, len(orders))
+        self.assertEqual(MarketEvent.BuyOrderCompleted.name, orders[0].last_status)
+        self.assertEqual(2, len(order_status))
+        self.assertEqual(1, len(market_states))
+        self.assertEqual({}, market_states[0].saved_state)
+
+    def test_trade_fills_are_appended_to_the_csv_once_when_the_batch_is_retried(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.start()
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(2),
+            price=Decimal(1000),
+            order_id="OID1",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        for trade_id in ("TradeId1", "TradeId2"):
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id=create_event.order_id,
+                trading_pair=create_event.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=create_event.type,
+                price=Decimal(1010),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=trade_id
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        def failing_write(session):
+            raise Exception("Test error")
+
+        # The failing write makes the whole batch be committed again, one write at a time
+        recorder._write_queue.put(failing_write)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=temp_dir):
+                recorder.stop()
+            trades = pd.read_csv(os.path.join(temp_dir, f"trades_{self.config_file_path[:-4]}.csv"))
+
+        self.assertEqual(1, recorder.write_queue_stats.failed_writes)
+        self.assertEqual(["TradeId1", "TradeId2"], trades["exchange_trade_id"].tolist())
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, session.query(TradeFill).count())
+
     @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
     def test_market_data_collection_enabled(self, sleep_mock):
         sleep_mock.side_effect = [0.1, asyncio.CancelledError]
@@ -0,0 +1,70 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.order_fill_ledger import OrderFillLedger
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class OrderFillLedgerTests(unittest.TestCase):
+
+    @staticmethod
+    def fill_event(timestamp: float, trade_type: TradeType, price: str, amount: str,
+                   trading_pair: str = "COINALPHA-HBOT") -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+    def test_balances_since_timestamp(self):
+        ledger = OrderFillLedger()
+        ledger.add_fill(self.fill_event(1, TradeType.BUY, "10", "2"))
+        ledger.add_fill(self.fill_event(2, TradeType.SELL, "11", "1"))
+        ledger.add_fill(self.fill_event(2, TradeType.BUY, "1", "5", trading_pair="HBOT-USDT"))
+        ledger.add_fill(self.fill_event(4, TradeType.SELL, "12", "1"))
+
+        self.assertEqual({}, OrderFillLedger().balances_since(0))
+        self.assertEqual({"COINALPHA": Decimal("0"), "HBOT": Decimal("8"), "USDT": Decimal("-5")},
+                         ledger.balances_since(0))
+        self.assertEqual({"COINALPHA": Decimal("-2"), "HBOT": Decimal("28"), "USDT": Decimal("-5")},
+                         ledger.balances_since(1))
+        self.assertEqual({"COINALPHA": Decimal("-1"), "HBOT": Decimal("12"), "USDT": Decimal("0")},
+                         ledger.balances_since(3))
+        self.assertEqual({"COINALPHA": Decimal("0"), "HBOT": Decimal("0"), "USDT": Decimal("0")},
+                         ledger.balances_since(4))
+        self.assertEqual(4, ledger.fills_count)
+        self.assertEqual(3, ledger.checkpoints_count)
+
+    def test_fill_older_than_the_last_one_is_added_to_the_following_checkpoints(self):
+        ledger = OrderFillLedger()
+        ledger.add_fill(self.fill_event(1, TradeType.BUY, "10", "1"))
+        ledger.add_fill(self.fill_event(3, TradeType.BUY, "10", "2"))
+        ledger.add_fill(self.fill_event(2, TradeType.BUY, "10", "4"))
+        ledger.add_fill(self.fill_event(0.5, TradeType.BUY, "10", "8"))
+
+        self.assertEqual(Decimal("15"), ledger.balances_since(0)["COINALPHA"])
+        self.assertEqual(Decimal("7"), ledger.balances_since(0.5)["COINALPHA"])
+        self.assertEqual(Decimal("6"), ledger.balances_since(1)["COINALPHA"])
+        self.assertEqual(Decimal("2"), ledger.balances_since(2)["COINALPHA"])
+        self.assertEqual(Decimal("0"), ledger.balances_since(3)["COINALPHA"])
+
+    def test_old_checkpoints_are_discarded(self):
+        ledger = OrderFillLedger(max_checkpoints=2)
+        for timestamp in range(1, 6):
+            ledger.add_fill(self.fill_event(timestamp, TradeType.BUY, "10", "1"))
+        # Older than the discarded checkpoints, added to all of them
+        ledger.add_fill(self.fill_event(2, TradeType.BUY, "10", "10"))
+
+        self.assertEqual(2, ledger.checkpoints_count)
+        self.assertEqual(Decimal("15"), ledger.balances_since(0)["COINALPHA"])
+        self.assertEqual(Decimal("2"), ledger.balances_since(3)["COINALPHA"])
+        self.assertEqual(Decimal("1"), ledger.balances_since(4)["COINALPHA"])
+        # Timestamps older than the retained checkpoints include the fills after the newest discarded one
+        self.assertEqual(Decimal("2"), ledger.balances_since(2)["COINALPHA"])
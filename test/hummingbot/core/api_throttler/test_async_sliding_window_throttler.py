@@ -0,0 +1,187 @@
+import asyncio
+import time
+import unittest
+from typing import Awaitable, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_sliding_window_throttler import LimitWindow, SlidingWindowAsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+TEST_OTHER_ID = "/other"
+
+
+class LimitWindowTests(unittest.TestCase):
+
+    def test_record_and_evict_keep_running_total(self):
+        window = LimitWindow()
+        window.record(expiration_timestamp=10, weight=2)
+        window.record(expiration_timestamp=11, weight=3)
+
+        self.assertEqual(5, window.used_weight)
+
+        window.evict(now=9.5)
+        self.assertEqual(5, window.used_weight)
+
+        # Entries expire exactly at their expiration timestamp, when the wake up timer of the throttler fires
+        window.evict(now=10)
+        self.assertEqual(3, window.used_weight)
+        self.assertEqual(1, len(window))
+
+        window.evict(now=12)
+        self.assertEqual(0, window.used_weight)
+        self.assertEqual(0, len(window))
+
+    def test_next_capacity_timestamp(self):
+        window = LimitWindow()
+        window.record(expiration_timestamp=10, weight=2)
+        window.record(expiration_timestamp=11, weight=3)
+
+        self.assertEqual(0.0, window.next_capacity_timestamp(limit=10, weight=5))
+        self.assertEqual(10, window.next_capacity_timestamp(limit=6, weight=3))
+        self.assertEqual(11, window.next_capacity_timestamp(limit=6, weight=5))
+        self.assertIsNone(window.next_capacity_timestamp(limit=6, weight=7))
+
+
+class SlidingWindowAsyncThrottlerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+            RateLimit(limit_id=TEST_OTHER_ID, limit=10, time_interval=5.0),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowAsyncThrottler(rate_limits=self.rate_limits)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def execute_request(self, limit_id: str):
+        async with self.throttler.execute_task(limit_id=limit_id):
+            pass
+
+    def test_execute_task_registers_weight_in_rate_limit_and_linked_limits(self):
+        self.async_run_with_timeout(self.execute_request(TEST_WEIGHTED_TASK_1_ID))
+        self.async_run_with_timeout(self.execute_request(TEST_WEIGHTED_TASK_2_ID))
+
+        self.assertEqual(1, self.throttler.used_capacity(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(1, self.throttler.used_capacity(TEST_WEIGHTED_TASK_2_ID))
+        self.assertEqual(6, self.throttler.used_capacity(TEST_WEIGHTED_POOL_ID))
+
+    def test_execute_task_without_configured_limit_is_not_throttled(self):
+        for _ in range(10):
+            self.async_run_with_timeout(self.execute_request("unknown_limit_id"))
+
+        self.assertEqual(0, self.throttler.used_capacity("unknown_limit_id"))
+
+    def test_execute_task_awaits_when_limit_exceeded(self):
+        self.async_run_with_timeout(self.execute_request(TEST_PATH_URL))
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.execute_request(TEST_POOL_ID), timeout=0.5)
+
+        # The cancelled request should not remain in the queue
+        self.assertEqual(0, len(self.throttler._pending_requests))
+        self.assertIsNone(self.throttler._wakeup_handle)
+
+    def test_weighted_pool_capacity(self):
+        self.async_run_with_timeout(self.execute_request(TEST_WEIGHTED_TASK_1_ID))
+        self.async_run_with_timeout(self.execute_request(TEST_WEIGHTED_TASK_2_ID))
+
+        # Another Task 2 (weight=1) does not exceed the capacity (7/10)
+        self.async_run_with_timeout(self.execute_request(TEST_WEIGHTED_TASK_2_ID))
+
+        # Another Task 1 (weight=5) would exceed the capacity (12/10)
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.execute_request(TEST_WEIGHTED_TASK_1_ID), timeout=0.5)
+
+    def test_waiting_request_is_woken_up_when_capacity_is_freed(self):
+        throttler = SlidingWindowAsyncThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2)],
+            safety_margin_pct=0,
+        )
+
+        async def execute_requests(count: int):
+            for _ in range(count):
+                async with throttler.execute_task(limit_id=TEST_POOL_ID):
+                    pass
+
+        start = time.time()
+        self.async_run_with_timeout(execute_requests(3), timeout=2)
+        elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertLess(elapsed, 0.6)
+
+    def test_blocked_request_does_not_block_unrelated_limits(self):
+        self.async_run_with_timeout(self.execute_request(TEST_PATH_URL))
+        blocked_task = self.ev_loop.create_task(self.execute_request(TEST_POOL_ID))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.async_run_with_timeout(self.execute_request(TEST_OTHER_ID))
+
+        self.assertFalse(blocked_task.done())
+        self.assertEqual(1, len(self.throttler._pending_requests))
+        blocked_task.cancel()
+        self.ev_loop.run_until_complete(asyncio.gather(blocked_task, return_exceptions=True))
+
+    @patch("hummingbot.core.api_throttler.async_sliding_window_throttler.SlidingWindowAsyncThrottler._time")
+    def test_pending_requests_are_granted_in_fifo_order(self, time_mock):
+        time_mock.return_value = 1640000000.0
+        self.async_run_with_timeout(self.execute_request(TEST_POOL_ID))
+
+        granted: List[str] = []
+
+        async def execute_request(limit_id: str, name: str):
+            async with self.throttler.execute_task(limit_id=limit_id):
+                granted.append(name)
+
+        first = self.ev_loop.create_task(execute_request(TEST_POOL_ID, "first"))
+        self.async_run_with_timeout(asyncio.sleep(0))
+        second = self.ev_loop.create_task(execute_request(TEST_PATH_URL, "second"))
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(2, len(self.throttler._pending_requests))
+
+        time_mock.return_value = 1640000006.0
+        self.throttler._process_pending_requests()
+        self.async_run_with_timeout(first)
+
+        self.assertEqual(["first"], granted)
+        self.assertFalse(second.done())
+
+        time_mock.return_value = 1640000012.0
+        self.throttler._process_pending_requests()
+        self.async_run_with_timeout(second)
+
+        self.assertEqual(["first", "second"], granted)
+
+    def test_set_rate_limits_keeps_used_capacity(self):
+        self.async_run_with_timeout(self.execute_request(TEST_OTHER_ID))
+
+        self.throttler.set_rate_limits([RateLimit(limit_id=TEST_OTHER_ID, limit=1, time_interval=5.0)])
+
+        self.assertEqual(1, self.throttler.used_capacity(TEST_OTHER_ID))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.execute_request(TEST_OTHER_ID), timeout=0.5)
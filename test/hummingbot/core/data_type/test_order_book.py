@@ -2,7 +2,13 @@
 
 import logging
 import unittest
+from types import SimpleNamespace
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage, \
+    OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +56,183 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def _deep_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        bids_array = np.array([[100 - i * 0.5, 1 + i % 3, i] for i in range(50)], dtype=np.float64)
+        asks_array = np.array([[101 + i * 0.5, 1 + i % 4, i] for i in range(50)], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        return order_book
+
+    def test_snapshot_columns_and_order(self):
+        order_book = self._deep_order_book()
+        bids, asks = order_book.snapshot
+
+        self.assertEqual(["price", "amount", "update_id"], list(bids.columns))
+        self.assertEqual(50, len(bids))
+        self.assertEqual(50, len(asks))
+        self.assertEqual([100.0, 1.0, 0.0], bids.iloc[0].tolist())
+        self.assertEqual([101.0, 1.0, 0.0], asks.iloc[0].tolist())
+        self.assertEqual([row.price for row in order_book.bid_entries()], bids.price.tolist())
+        self.assertEqual([row.amount for row in order_book.ask_entries()], asks.amount.tolist())
+
+        bids, asks = OrderBook().snapshot
+        self.assertEqual(0, len(bids))
+        self.assertEqual(["price", "amount", "update_id"], list(asks.columns))
+
+    def test_side_arrays(self):
+        order_book = self._deep_order_book()
+
+        prices, amounts, cumulative_amounts = order_book.bid_arrays(depth=3)
+        self.assertEqual([100.0, 99.5, 99.0], prices.tolist())
+        self.assertEqual([1.0, 2.0, 3.0], amounts.tolist())
+        self.assertEqual([1.0, 3.0, 6.0], cumulative_amounts.tolist())
+
+        prices, amounts, cumulative_amounts = order_book.ask_arrays()
+        self.assertEqual(50, len(prices))
+        self.assertEqual([row.price for row in order_book.ask_entries()], prices.tolist())
+        self.assertEqual(np.cumsum(amounts).tolist(), cumulative_amounts.tolist())
+
+    def test_fill_arrays_in_preallocated_buffers(self):
+        order_book = self._deep_order_book()
+        prices = np.zeros(100)
+        amounts = np.zeros(100)
+        cumulative_amounts = np.zeros(100)
+        update_ids = np.zeros(100)
+
+        levels = order_book.fill_ask_arrays(prices, amounts, cumulative_amounts, update_ids)
+        self.assertEqual(50, levels)
+        self.assertEqual(101.0, prices[0])
+        self.assertEqual(49.0, update_ids[49])
+        self.assertEqual(0.0, prices[50])
+
+        levels = order_book.fill_bid_arrays(prices[:10], amounts[:10], cumulative_amounts[:10])
+        self.assertEqual(10, levels)
+        self.assertEqual(95.5, prices[9])
+
+    def test_depth_queries_match_row_traversal(self):
+        order_book = self._deep_order_book()
+
+        for is_buy in (True, False):
+            rows = list(order_book.ask_entries() if is_buy else order_book.bid_entries())
+            for volume in (0.5, 1, 7, 33.3, 1000):
+                cumulative = 0
+                expected_price = float("nan")
+                for row in rows:
+                    cumulative += row.amount
+                    if cumulative >= volume:
+                        expected_price = row.price
+                        break
+                result = order_book.get_price_for_volume(is_buy, volume)
+                if np.isnan(expected_price):
+                    self.assertTrue(np.isnan(result.result_price))
+                else:
+                    self.assertEqual(expected_price, result.result_price)
+                self.assertEqual(min(cumulative, volume), result.result_volume)
+
+            price = rows[10].price
+            result = order_book.get_volume_for_price(is_buy, price)
+            self.assertEqual(sum(row.amount for row in rows[:11]), result.result_volume)
+            self.assertEqual(price, result.result_price)
+
+            result = order_book.get_quote_volume_for_price(is_buy, price)
+            self.assertAlmostEqual(sum(row.amount * row.price for row in rows[:11]), result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 3)
+        self.assertAlmostEqual((101 * 1 + 101.5 * 2) / 3, result.result_price)
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_quote_volume_for_base_amount(False, 2)
+        self.assertAlmostEqual(100 * 1 + 99.5 * 1, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 200)
+        self.assertEqual(101.5, result.result_price)
+
+    def test_vectorized_queries_match_single_queries(self):
+        order_book = self._deep_order_book()
+        volumes = np.array([50, 0.5, 3, 1000, 7.5, 3])
+        prices = np.array([120, 99, 101.7, 90, 100, 102])
+
+        for is_buy in (True, False):
+            price_results = order_book.get_price_for_volumes(is_buy, volumes)
+            vwap_results = order_book.get_vwap_for_volumes(is_buy, volumes)
+            volume_results = order_book.get_volume_for_prices(is_buy, prices)
+            for i, volume in enumerate(volumes):
+                np.testing.assert_equal(order_book.get_price_for_volume(is_buy, volume).result_price,
+                                        price_results[i])
+                np.testing.assert_almost_equal(order_book.get_vwap_for_volume(is_buy, volume).result_price,
+                                               vwap_results[i])
+            for i, price in enumerate(prices):
+                self.assertEqual(order_book.get_volume_for_price(is_buy, price).result_volume, volume_results[i])
+
+    def test_vwap_for_zero_volume_is_handled_as_single_query(self):
+        order_book = self._deep_order_book()
+
+        with self.assertRaises(ZeroDivisionError):
+            order_book.get_vwap_for_volume(True, 0)
+        with self.assertRaises(ZeroDivisionError):
+            order_book.get_vwap_for_volumes(True, np.array([1, 0]))
+
+        empty_order_book = OrderBook()
+        self.assertTrue(np.isnan(empty_order_book.get_vwap_for_volume(True, 0).result_price))
+        self.assertTrue(np.isnan(empty_order_book.get_vwap_for_volumes(True, np.array([0]))[0]))
+
+    def test_composite_order_book_queries_use_composite_entries(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[100, 1, 1], [99, 2, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        order_book.record_filled_order(SimpleNamespace(price=101.0, amount=1, timestamp=1, trade_type=TradeType.BUY))
+
+        self.assertEqual([[102.0, 2.0]], [[row.price, row.amount] for row in order_book.ask_entries()])
+        self.assertEqual(102, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual(102, order_book.get_vwap_for_volume(True, 2).result_price)
+        self.assertEqual(0, order_book.get_volume_for_price(True, 101).result_volume)
+        np.testing.assert_equal(np.array([102, np.nan]), order_book.get_price_for_volumes(True, np.array([2, 3])))
+        prices, amounts, cumulative_amounts = order_book.ask_arrays()
+        self.assertEqual([102.0], prices.tolist())
+        self.assertEqual(1, len(order_book.snapshot[1]))
+
+    def test_numpy_diffs_with_explicit_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1]], dtype=np.float64),
+                                        np.empty((0, 3), dtype=np.float64),
+                                        update_id=10)
+        self.assertEqual(10, order_book.snapshot_uid)
+
+        order_book.apply_numpy_diffs(np.array([[2, 1, 3]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(3, order_book.last_diff_uid)
+
+        order_book.apply_numpy_diffs(np.empty((0, 3), dtype=np.float64),
+                                     np.empty((0, 3), dtype=np.float64),
+                                     update_id=11)
+        self.assertEqual(11, order_book.last_diff_uid)
+
+    def test_compact_messages_produce_same_order_book(self):
+        snapshot_content = {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["10", "1"], ["9", "2"]],
+            "asks": [["11", "1"], ["12", "2"]],
+        }
+        diffs_contents = [
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 2, "bids": [["10", "0"]], "asks": [["11.5", "3"]]},
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 3, "bids": [["9.5", "1"]], "asks": [["12", "0"]]},
+        ]
+        order_books = []
+        for message_class in (OrderBookMessage, CompactOrderBookMessage):
+            order_book = OrderBook()
+            snapshot = message_class(OrderBookMessageType.SNAPSHOT, snapshot_content, timestamp=1.0)
+            diffs = [message_class(OrderBookMessageType.DIFF, content, timestamp=2.0) for content in diffs_contents]
+            order_book.apply_snapshot_message(snapshot)
+            order_book.apply_diff_message(diffs[0])
+            order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+            order_books.append(order_book)
+
+        expected, compact = order_books
+        self.assertEqual(list(expected.bid_entries()), list(compact.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(compact.ask_entries()))
+        self.assertEqual(expected.snapshot_uid, compact.snapshot_uid)
+        self.assertEqual(3, compact.last_diff_uid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
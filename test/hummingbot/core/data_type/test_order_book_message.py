@@ -1,7 +1,7 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +248,83 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+
+class CompactOrderBookMessageTest(unittest.TestCase):
+    def test_scalar_fields_are_parsed_on_creation(self):
+        content = {"trading_pair": "COINALPHA-HBOT", "first_update_id": 8, "update_id": 10, "bids": [], "asks": []}
+        msg = CompactOrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=1640000000.0)
+
+        self.assertEqual("COINALPHA-HBOT", msg.trading_pair)
+        self.assertEqual(10, msg.update_id)
+        self.assertEqual(8, msg.first_update_id)
+        self.assertEqual(-1, msg.trade_id)
+        self.assertIs(content, msg.content)
+        self.assertFalse(hasattr(msg, "__dict__"))
+
+        msg = CompactOrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": "COINALPHA-HBOT", "trade_id": 5, "price": "1", "amount": "2"},
+            timestamp=1640000000.0)
+
+        self.assertEqual(-1, msg.update_id)
+        self.assertEqual(5, msg.trade_id)
+        self.assertTrue(msg.has_trade_id)
+        self.assertEqual((0, 3), msg.bids_array.shape)
+
+    def test_rows_are_parsed_into_arrays(self):
+        msg = CompactOrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 7,
+                "bids": [["10.5", "1", "extra"], ["10", "2.5", "extra"]],
+                "asks": [[11, 3]],
+            },
+            timestamp=1640000000.0)
+
+        self.assertEqual([[10.5, 1, 7], [10, 2.5, 7]], msg.bids_array.tolist())
+        self.assertEqual([[11, 3, 7]], msg.asks_array.tolist())
+        self.assertEqual([OrderBookRow(10.5, 1, 7), OrderBookRow(10, 2.5, 7)], msg.bids)
+        self.assertEqual([OrderBookRow(11, 3, 7)], msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+
+    def test_same_rows_and_ordering_as_order_book_message(self):
+        content = {"trading_pair": "COINALPHA-HBOT", "update_id": 3, "bids": [["1", "2"]], "asks": [["3", "4"]]}
+        msg = OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=1640000000.0)
+        compact_msg = CompactOrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=1640000000.0)
+        older_msg = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {"update_id": 2}, timestamp=1640000001.0)
+        newer_msg = CompactOrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": 4, "bids": [], "asks": []},
+            timestamp=1639999999.0)
+
+        self.assertEqual(msg.bids, compact_msg.bids)
+        self.assertEqual(msg.asks, compact_msg.asks)
+        self.assertEqual(msg, compact_msg)
+        self.assertTrue(older_msg < compact_msg)
+        self.assertTrue(compact_msg < newer_msg)
+        self.assertTrue(msg < newer_msg)
+
+    def test_merge_diffs_keeps_latest_amount_per_price(self):
+        older = CompactOrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "first_update_id": 2, "update_id": 3,
+             "bids": [["10", "1"], ["9", "2"]], "asks": [["11", "1"]]},
+            timestamp=1640000000.0)
+        newer = CompactOrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "first_update_id": 4, "update_id": 5,
+             "bids": [["10", "0"], ["8", "1"]], "asks": [["12", "3"]]},
+            timestamp=1640000001.0)
+
+        merged = CompactOrderBookMessage.merge_diffs(older=older, newer=newer)
+
+        self.assertEqual(OrderBookMessageType.DIFF, merged.type)
+        self.assertEqual(5, merged.update_id)
+        self.assertEqual(2, merged.first_update_id)
+        self.assertEqual(1640000001.0, merged.timestamp)
+        self.assertEqual([[8, 1, 5], [9, 2, 5], [10, 0, 5]], merged.bids_array.tolist())
+        self.assertEqual([[11, 1, 5], [12, 3, 5]], merged.asks_array.tolist())
+        self.assertEqual([OrderBookRow(8, 1, 5), OrderBookRow(9, 2, 5), OrderBookRow(10, 0, 5)], merged.bids)
+        self.assertEqual(older.bids_array.tolist(), [[10, 1, 3], [9, 2, 3]])
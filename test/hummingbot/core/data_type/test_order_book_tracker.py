@@ -0,0 +1,274 @@
+import asyncio
+import unittest
+from collections import defaultdict, deque
+from typing import Awaitable, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message_router import OrderBookMessageQueue
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerInitializationTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = [f"COIN{i}-HBOT" for i in range(6)]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.requests_in_progress = 0
+        self.max_requests_in_progress = 0
+        self.pending_snapshots: Dict[str, asyncio.Event] = {}
+        self.failures: Dict[str, int] = {}
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book.side_effect = self._get_new_order_book
+        self.tracker = None
+
+    def tearDown(self) -> None:
+        if self.tracker is not None:
+            self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def _get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requests_in_progress += 1
+        self.max_requests_in_progress = max(self.max_requests_in_progress, self.requests_in_progress)
+        try:
+            if trading_pair in self.pending_snapshots:
+                await self.pending_snapshots[trading_pair].wait()
+            else:
+                await asyncio.sleep(0.01)
+            if self.failures.get(trading_pair, 0) > 0:
+                self.failures[trading_pair] -= 1
+                raise IOError("Test snapshot error")
+        finally:
+            self.requests_in_progress -= 1
+        return OrderBook()
+
+    def create_tracker(self, trading_pairs: List[str], max_concurrent_initializations: int) -> OrderBookTracker:
+        tracker = OrderBookTracker(
+            data_source=self.data_source,
+            trading_pairs=trading_pairs,
+            max_concurrent_initializations=max_concurrent_initializations)
+        tracker._sleep = MagicMock(side_effect=lambda delay: asyncio.sleep(0))
+        return tracker
+
+    def test_concurrent_initialization_is_bounded(self):
+        self.tracker = self.create_tracker(trading_pairs=self.trading_pairs, max_concurrent_initializations=3)
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(3, self.max_requests_in_progress)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_book_init_durations.keys()))
+        self.tracker._sleep.assert_not_called()
+
+    def test_order_books_are_ready_per_trading_pair(self):
+        slow_trading_pair = self.trading_pairs[0]
+        self.pending_snapshots[slow_trading_pair] = asyncio.Event()
+        self.tracker = self.create_tracker(trading_pairs=self.trading_pairs, max_concurrent_initializations=10)
+
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertFalse(self.tracker.ready)
+        self.assertFalse(self.tracker.is_order_book_ready(slow_trading_pair))
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[1]))
+        self.assertEqual(self.trading_pairs[1:], self.tracker.ready_trading_pairs)
+
+        self.pending_snapshots[slow_trading_pair].set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertTrue(self.tracker.is_order_book_ready(slow_trading_pair))
+        self.assertGreaterEqual(self.tracker.order_book_init_durations[slow_trading_pair],
+                                self.tracker.order_book_init_durations[self.trading_pairs[1]])
+
+    def test_failed_initialization_is_retried(self):
+        self.failures[self.trading_pairs[0]] = 1
+        self.tracker = self.create_tracker(trading_pairs=self.trading_pairs, max_concurrent_initializations=2)
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(len(self.trading_pairs) + 1, self.data_source.get_new_order_book.call_count)
+        self.tracker._sleep.assert_called_once_with(delay=5.0)
+
+    def test_sequential_initialization_by_default(self):
+        self.tracker = self.create_tracker(trading_pairs=self.trading_pairs[:2], max_concurrent_initializations=None)
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(1, self.max_requests_in_progress)
+        self.assertEqual(2, self.tracker._sleep.call_count)
+
+
+class OrderBookTrackerRoutingTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+        cls.other_trading_pair = "COINBETA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = OrderBookTracker(data_source=MagicMock(),
+                                        trading_pairs=[self.trading_pair, self.other_trading_pair])
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def diff_message(self, update_id: int, bids: List[List[str]], asks: List[List[str]], trading_pair: str = None):
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": trading_pair or self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id))
+
+    def track_order_book(self, trading_pair: str, snapshot_uid: int = 0):
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], snapshot_uid)
+        self.tracker._order_books[trading_pair] = order_book
+        self.tracker._tracking_message_queues[trading_pair] = OrderBookMessageQueue(coalescing_threshold=3)
+
+    def test_router_dispatches_messages_to_trading_pair_queue(self):
+        self.track_order_book(self.trading_pair)
+        self.track_order_book(self.other_trading_pair)
+
+        self.tracker._diff_message_router.put_nowait(self.diff_message(1, [["10", "1"]], []))
+        self.async_run_with_timeout(self.tracker._diff_message_router.put(
+            self.diff_message(2, [], [["11", "1"]], trading_pair=self.other_trading_pair)))
+
+        self.assertEqual({self.trading_pair: 1, self.other_trading_pair: 1}, self.tracker.message_queue_depths)
+
+    def test_router_saves_messages_for_untracked_pairs_and_rejects_outdated_messages(self):
+        self.track_order_book(self.trading_pair, snapshot_uid=5)
+        router = self.tracker._diff_message_router
+
+        router.put_nowait(self.diff_message(4, [["10", "1"]], []))
+        router.put_nowait(self.diff_message(6, [["10", "1"]], []))
+        router.put_nowait(self.diff_message(1, [["10", "1"]], [], trading_pair=self.other_trading_pair))
+
+        self.assertEqual(1, self.tracker.message_queue_depths[self.trading_pair])
+        self.assertEqual(1, len(self.tracker._saved_message_queues[self.other_trading_pair]))
+
+    def test_router_uses_dictionaries_rebound_by_subclasses(self):
+        class RebindingOrderBookTracker(OrderBookTracker):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self._order_books = {}
+                self._saved_message_queues = defaultdict(lambda: deque(maxlen=1000))
+
+        self.tracker = RebindingOrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        self.track_order_book(self.trading_pair)
+        router = self.tracker._diff_message_router
+
+        router.put_nowait(self.diff_message(1, [["10", "1"]], []))
+        router.put_nowait(self.diff_message(2, [["10", "1"]], [], trading_pair=self.other_trading_pair))
+
+        self.assertEqual(1, self.tracker.message_queue_depths[self.trading_pair])
+        self.assertEqual(1, len(self.tracker._saved_message_queues[self.other_trading_pair]))
+
+    def test_diffs_are_not_coalesced_unless_enabled(self):
+        self.tracker._order_books[self.trading_pair] = OrderBook()
+        queue = self.tracker._tracking_message_queues[self.trading_pair] = OrderBookMessageQueue()
+        for update_id in range(1, 6):
+            self.tracker._diff_message_router.put_nowait(self.diff_message(update_id, [["10", "1"]], []))
+
+        self.assertEqual(5, queue.qsize())
+        self.assertEqual(0, queue.coalesced_messages)
+
+    def test_queue_coalesces_diffs_when_backlog_builds(self):
+        self.track_order_book(self.trading_pair)
+        router = self.tracker._diff_message_router
+
+        router.put_nowait(self.diff_message(1, [["10", "1"]], []))
+        router.put_nowait(self.diff_message(2, [["10", "2"]], []))
+        router.put_nowait(self.diff_message(3, [["9", "1"]], [["11", "1"]]))
+        router.put_nowait(self.diff_message(4, [["9", "0"]], [["12", "1"]]))
+        router.put_nowait(self.diff_message(5, [["8", "1"]], [["11", "3"]]))
+
+        queue = self.tracker._tracking_message_queues[self.trading_pair]
+        self.assertEqual(3, self.tracker.message_queue_depths[self.trading_pair])
+        self.assertEqual(2, queue.coalesced_messages)
+
+        messages = [queue.get_nowait() for _ in range(3)]
+        merged = messages[-1]
+        self.assertEqual(5, merged.update_id)
+        self.assertEqual(3, merged.first_update_id)
+        self.assertEqual(5.0, merged.timestamp)
+        self.assertEqual([["9", "0"], ["8", "1"]], merged.content["bids"])
+        self.assertEqual([["11", "3"], ["12", "1"]], merged.content["asks"])
+        self.assertIn(self.trading_pair, self.tracker.message_queue_lags)
+
+    def test_snapshots_are_not_coalesced(self):
+        queue = OrderBookMessageQueue(coalescing_threshold=1)
+        queue.put_nowait(self.diff_message(1, [["10", "1"]], []))
+        queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 2, "bids": [], "asks": []},
+            timestamp=2.0))
+        queue.put_nowait(self.diff_message(3, [["10", "1"]], []))
+
+        self.assertEqual(3, queue.qsize())
+        self.assertEqual(0, queue.coalesced_messages)
+
+    def test_coalesced_diffs_produce_same_order_book(self):
+        self.track_order_book(self.trading_pair)
+        messages = [
+            self.diff_message(1, [["10", "1"], ["9", "2"]], [["11", "1"]]),
+            self.diff_message(2, [["10", "0"]], [["12", "2"]]),
+            self.diff_message(3, [["9", "4"]], [["11", "0"], ["13", "1"]]),
+            self.diff_message(4, [["8", "1"]], [["12", "0"]]),
+        ]
+        for message in messages:
+            self.tracker._diff_message_router.put_nowait(message)
+        expected_book = OrderBook()
+        for message in messages:
+            expected_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+        track_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        track_task.cancel()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(0, self.tracker.message_queue_depths[self.trading_pair])
+        self.assertEqual([(row.price, row.amount) for row in expected_book.bid_entries()],
+                         [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(row.price, row.amount) for row in expected_book.ask_entries()],
+                         [(row.price, row.amount) for row in order_book.ask_entries()])
+
+    def test_flooded_queue_is_bounded_and_order_book_restored_from_new_snapshot(self):
+        self.track_order_book(self.trading_pair)
+        queue = self.tracker._tracking_message_queues[self.trading_pair] = OrderBookMessageQueue(max_size=3)
+        for update_id in range(1, 11):
+            self.tracker._diff_message_router.put_nowait(self.diff_message(update_id, [[str(update_id), "1"]], []))
+
+        self.assertEqual(1, self.tracker.message_queue_depths[self.trading_pair])
+        self.assertEqual({self.trading_pair: 9}, self.tracker.message_queue_drops)
+        self.assertTrue(queue.snapshot_required)
+
+        new_order_book = OrderBook()
+        new_order_book.apply_snapshot([OrderBookRow(8, 2, 8)], [OrderBookRow(20, 1, 8)], 8)
+        self.tracker._data_source.get_new_order_book = AsyncMock(return_value=new_order_book)
+        track_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        track_task.cancel()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertFalse(queue.snapshot_required)
+        self.assertEqual(8, order_book.snapshot_uid)
+        self.assertEqual([(10, 1), (8, 2)], [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(20, 1)], [(row.price, row.amount) for row in order_book.ask_entries()])
@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -82,6 +82,58 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_find_rate_through_several_intermediate_tokens(self):
+        prices = {"HBOT-USDT": Decimal("100"), "BTC-USDT": Decimal("20000"), "BTC-EUR": Decimal("18000"),
+                  "GBP-EUR": Decimal("1.2"), "ZBOT-ABOT": Decimal("3")}
+
+        self.assertEqual(Decimal("100") / Decimal("20000") * Decimal("18000") / Decimal("1.2"),
+                         find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(Decimal("1.2") / Decimal("18000") * Decimal("20000") / Decimal("100"),
+                         find_rate(prices, "GBP-HBOT"))
+        self.assertIsNone(find_rate(prices, "HBOT-ZBOT"))
+        self.assertEqual(Decimal("1"), find_rate(prices, "WETH-ETH"))
+
+    def test_rate_graph_prefers_shortest_path(self):
+        rate_graph = RateGraph({"HBOT-USDT": Decimal("100"), "USDT-EUR": Decimal("0.9"), "EUR-GBP": Decimal("0.8")})
+
+        self.assertEqual(Decimal("100") * Decimal("0.9") * Decimal("0.8"), rate_graph.find_rate("HBOT-GBP"))
+
+        rate_graph["HBOT-GBP"] = Decimal("70")
+        rate_graph["GBP-JPY"] = Decimal("150")
+
+        self.assertEqual(Decimal("70") * Decimal("150"), rate_graph.find_rate("HBOT-JPY"))
+
+    def test_rate_graph_invalidates_rates_computed_with_updated_pairs(self):
+        rate_graph = RateGraph({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "AAVE-USDT": Decimal("50")})
+
+        self.assertEqual(Decimal("75"), rate_graph.find_rate("HBOT-GBP"))
+        self.assertEqual(Decimal("2"), rate_graph.find_rate("HBOT-AAVE"))
+
+        rate_graph.update({"USDT-GBP": Decimal("0.8"), "AAVE-USDT": Decimal("50")})
+
+        self.assertNotIn(("HBOT", "GBP"), rate_graph._rates)
+        self.assertIn(("HBOT", "AAVE"), rate_graph._rates)
+        self.assertEqual(Decimal("80"), rate_graph.find_rate("HBOT-GBP"))
+
+        rate_graph["ZBOT-GBP"] = Decimal("2")
+
+        self.assertEqual(0, len(rate_graph._rates))
+        self.assertEqual(Decimal("40"), rate_graph.find_rate("HBOT-ZBOT"))
+
+        del rate_graph["ZBOT-GBP"]
+
+        self.assertIsNone(rate_graph.find_rate("HBOT-ZBOT"))
+
+    def test_rate_graph_ignores_zero_prices_for_inverse_conversions(self):
+        rate_graph = RateGraph({"HBOT-USDT": Decimal("0"), "HBOT-EUR": Decimal("2")})
+
+        self.assertEqual(Decimal("0"), rate_graph.find_rate("HBOT-USDT"))
+        self.assertIsNone(rate_graph.find_rate("USDT-EUR"))
+
+        rate_graph["HBOT-USDT"] = Decimal("4")
+
+        self.assertEqual(Decimal("2"), rate_graph.find_rate("EUR-USDT"))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
@@ -0,0 +1,151 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import patch
+
+from hummingbot.core.utils.async_cache import AsyncCacheStats, AsyncTTLCache, async_ttl_cache, make_cache_key
+
+
+class QuoteSource:
+    def __init__(self):
+        self.calls = 0
+        self.release_event = asyncio.Event()
+
+    @async_ttl_cache(ttl=5, maxsize=2)
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal, ignore_shim: bool = False):
+        self.calls += 1
+        await self.release_event.wait()
+        return Decimal("10") * amount
+
+
+class AsyncCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.now = 1000.0
+        time_patcher = patch.object(AsyncTTLCache, "_time", side_effect=lambda: self.now)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_make_cache_key_normalizes_arguments(self):
+        self.assertEqual(make_cache_key((Decimal("1.0"), [1, 2]), {"b": {"x": 1}, "a": 1}),
+                         make_cache_key((Decimal("1"), (1, 2)), {"a": 1, "b": {"x": 1}}))
+        self.assertNotEqual(make_cache_key((1,), {}), make_cache_key((2,), {}))
+
+    def test_make_cache_key_uses_repr_for_unhashable_arguments(self):
+        class Unhashable:
+            __hash__ = None
+
+            def __repr__(self):
+                return "unhashable"
+
+        key = make_cache_key((Unhashable(), {"x": [Unhashable()]}), {})
+
+        hash(key)
+        self.assertEqual(key, make_cache_key((Unhashable(), {"x": [Unhashable()]}), {}))
+
+    def test_clear_discards_loads_in_progress(self):
+        cache = AsyncTTLCache(ttl=5, maxsize=1)
+        release_event = asyncio.Event()
+        values = iter([1, 2])
+
+        async def loader():
+            await release_event.wait()
+            return next(values)
+
+        async def run():
+            pending_load = asyncio.ensure_future(cache.get("key", loader))
+            await asyncio.sleep(0)
+            cache.clear()
+            release_event.set()
+            return await pending_load
+
+        self.assertEqual(1, self.async_run_with_timeout(run()))
+        self.assertEqual(0, cache.stats.size)
+        self.assertEqual(2, self.async_run_with_timeout(cache.get("key", loader)))
+
+    def test_concurrent_calls_share_one_execution(self):
+        source = QuoteSource()
+
+        async def run():
+            calls = [source.get_quote_price("ETH-USDT", True, Decimal("1")) for _ in range(5)]
+            calls.append(source.get_quote_price("ETH-USDT", is_buy=True, amount=Decimal("1.0"), ignore_shim=False))
+            tasks = [asyncio.ensure_future(call) for call in calls]
+            await asyncio.sleep(0)
+            source.release_event.set()
+            return await asyncio.gather(*tasks)
+
+        results = self.async_run_with_timeout(run())
+
+        self.assertEqual([Decimal("10")] * 6, results)
+        self.assertEqual(1, source.calls)
+        self.assertEqual(AsyncCacheStats(misses=1, deduplicated=5, size=1), source.get_quote_price.cache_info(source))
+
+    def test_cache_is_scoped_per_instance(self):
+        first_source = QuoteSource()
+        second_source = QuoteSource()
+        first_source.release_event.set()
+        second_source.release_event.set()
+
+        for _ in range(2):
+            self.async_run_with_timeout(first_source.get_quote_price("ETH-USDT", True, Decimal("1")))
+            self.async_run_with_timeout(second_source.get_quote_price("ETH-USDT", True, Decimal("1")))
+
+        self.assertEqual(1, first_source.calls)
+        self.assertEqual(1, second_source.calls)
+        self.assertEqual(AsyncCacheStats(hits=1, misses=1, size=1), first_source.get_quote_price.cache_info(first_source))
+
+    def test_entries_expire_and_least_recently_used_is_evicted(self):
+        source = QuoteSource()
+        source.release_event.set()
+
+        for amount in ("1", "2", "3"):
+            self.async_run_with_timeout(source.get_quote_price("ETH-USDT", True, Decimal(amount)))
+        self.assertEqual(1, source.get_quote_price.cache_info(source).evictions)
+        self.async_run_with_timeout(source.get_quote_price("ETH-USDT", True, Decimal("1")))
+        self.assertEqual(4, source.calls)
+
+        self.now += 6
+        self.async_run_with_timeout(source.get_quote_price("ETH-USDT", True, Decimal("1")))
+        self.assertEqual(5, source.calls)
+
+        source.get_quote_price.cache_clear()
+        self.async_run_with_timeout(source.get_quote_price("ETH-USDT", True, Decimal("1")))
+        self.assertEqual(6, source.calls)
+
+    def test_exceptions_are_not_cached(self):
+        cache = AsyncTTLCache(ttl=5, maxsize=1)
+        results = iter([ValueError("failed"), 1])
+
+        async def loader():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(cache.get("key", loader))
+        self.assertEqual(1, self.async_run_with_timeout(cache.get("key", loader)))
+
+    def test_stale_value_returned_while_revalidating(self):
+        cache = AsyncTTLCache(ttl=5, maxsize=1, stale_ttl=10)
+        values = iter([1, 2, 3])
+
+        async def loader():
+            return next(values)
+
+        self.assertEqual(1, self.async_run_with_timeout(cache.get("key", loader)))
+        self.now += 6
+        self.assertEqual(1, self.async_run_with_timeout(cache.get("key", loader)))
+        self.async_run_with_timeout(asyncio.sleep(0))
+        self.assertEqual(2, self.async_run_with_timeout(cache.get("key", loader)))
+        self.assertEqual(AsyncCacheStats(hits=1, stale_hits=1, misses=1, size=1), cache.stats)
+
+        # Once the stale period is over the value is loaded again before returning it
+        self.now += 20
+        self.assertEqual(3, self.async_run_with_timeout(cache.get("key", loader)))
+        self.assertEqual(2, cache.stats.misses)
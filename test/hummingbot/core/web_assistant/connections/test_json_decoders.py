@@ -0,0 +1,62 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.web_assistant.connections.json_decoders import (
+    OrjsonJSONDecoder,
+    StdlibJSONDecoder,
+    default_json_decoder,
+    fastest_json_decoder,
+    orjson,
+)
+from hummingbot.core.web_assistant.connections.ws_frame_filters import ChannelFrameFilter
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class JSONDecodersTest(unittest.TestCase):
+
+    def test_decoders_return_same_documents(self):
+        payload = json.dumps({"e": "depthUpdate", "U": 157, "b": [["0.0024", "10"]], "a": [], "f": 1.5, "n": None})
+
+        for decoder in (StdlibJSONDecoder(), OrjsonJSONDecoder()):
+            self.assertEqual(json.loads(payload), decoder.decode(payload))
+            self.assertEqual(json.loads(payload), decoder.decode(payload.encode()))
+
+    def test_orjson_decoder_falls_back_to_stdlib_for_unsupported_documents(self):
+        payload = json.dumps({"big": 2 ** 70, "nan": float("nan")})
+
+        data = OrjsonJSONDecoder().decode(payload)
+
+        self.assertEqual(2 ** 70, data["big"])
+        self.assertNotEqual(data["nan"], data["nan"])
+
+    def test_decoders_raise_value_error_for_invalid_documents(self):
+        for decoder in (StdlibJSONDecoder(), OrjsonJSONDecoder()):
+            with self.assertRaises(ValueError):
+                decoder.decode("pong")
+
+    def test_orjson_decoder_does_not_parse_invalid_payloads_twice(self):
+        with patch("hummingbot.core.web_assistant.connections.json_decoders.json.loads") as stdlib_loads:
+            with self.assertRaises(ValueError):
+                OrjsonJSONDecoder().decode("pong")
+            with self.assertRaises(ValueError):
+                OrjsonJSONDecoder().decode(b"pong")
+
+        stdlib_loads.assert_not_called()
+
+    def test_default_decoder_is_stdlib_and_fastest_decoder_is_orjson(self):
+        self.assertIs(default_json_decoder(), default_json_decoder())
+        self.assertIsInstance(default_json_decoder(), StdlibJSONDecoder)
+        self.assertIs(fastest_json_decoder(), fastest_json_decoder())
+        self.assertIsInstance(fastest_json_decoder(), OrjsonJSONDecoder)
+
+
+class ChannelFrameFilterTest(unittest.TestCase):
+
+    def test_accept(self):
+        frame_filter = ChannelFrameFilter(markers=['"depthUpdate"', '"subscribed"'])
+
+        self.assertTrue(frame_filter.accept('{"e":"depthUpdate"}'))
+        self.assertTrue(frame_filter.accept(b'{"result":"subscribed"}'))
+        self.assertFalse(frame_filter.accept('{"e":"trade"}'))
+        self.assertFalse(frame_filter.accept(b'{"e":"trade"}'))
@@ -8,7 +8,9 @@ import aiohttp
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_decoders import StdlibJSONDecoder
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.connections.ws_frame_filters import ChannelFrameFilter
 
 
 class WSConnectionTest(unittest.TestCase):
@@ -248,3 +250,42 @@ class WSConnectionTest(unittest.TestCase):
         self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
 
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_returns_raw_data_for_invalid_json(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=b"\x1f\x8b", message_type=aiohttp.WSMsgType.BINARY)
+
+        self.assertEqual("pong", self.async_run_with_timeout(self.ws_connection.receive()).data)
+        self.assertEqual(b"\x1f\x8b", self.async_run_with_timeout(self.ws_connection.receive()).data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_with_custom_json_decoder(self, ws_connect_mock):
+        ws_connection = WSConnection(self.client_session, json_decoder=StdlibJSONDecoder())
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        data = {"one": 1, "big": 2 ** 70, "nan": float("nan")}
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=json.dumps(data))
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual(2 ** 70, response.data["big"])
+        self.assertNotEqual(response.data["nan"], response.data["nan"])
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_discards_frames_not_accepted_by_frame_filter(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(
+            self.ws_url, frame_filter=ChannelFrameFilter(markers=['"depthUpdate"'])))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps({"e": "trade", "p": "1"}))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps({"e": "depthUpdate", "b": []}))
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual({"e": "depthUpdate", "b": []}, response.data)
+        self.assertEqual(1, self.ws_connection.filtered_frames)
@@ -48,7 +48,8 @@ class WSAssistantTest(unittest.TestCase):
         connect_mock.assert_called_with(ws_url=ws_url,
                                         ws_headers={},
                                         ping_timeout=ping_timeout,
-                                        message_timeout=message_timeout)
+                                        message_timeout=message_timeout,
+                                        frame_filter=None)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.disconnect")
     def test_disconnect(self, disconnect_mock):
@@ -69,7 +70,7 @@ class WSAssistantTest(unittest.TestCase):
 
         sent_request = sent_requests[0]
 
-        self.assertNotEqual(id(request), id(sent_request))  # has been cloned
+        self.assertEqual(id(request), id(sent_request))  # not cloned, no pre-processors or auth to apply
         self.assertEqual(request, sent_request)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
@@ -93,6 +94,7 @@ class WSAssistantTest(unittest.TestCase):
         expected = {"one": 1, "two": 2}
 
         self.assertEqual(expected, sent_request.payload)
+        self.assertEqual({"one": 1}, request.payload)  # the request was cloned before pre-processing
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
     def test_subscribe(self, send_mock):
@@ -107,7 +109,7 @@ class WSAssistantTest(unittest.TestCase):
 
         sent_request = sent_requests[0]
 
-        self.assertNotEqual(id(request), id(sent_request))  # has been cloned
+        self.assertEqual(id(request), id(sent_request))  # not cloned, no pre-processors or auth to apply
         self.assertEqual(request, sent_request)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
@@ -1,14 +1,17 @@
 import asyncio
 import json
 import re
+import tempfile
 import unittest
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 
 
 class TestBinanceSpotCandles(unittest.TestCase):
@@ -314,6 +317,138 @@ class TestBinanceSpotCandles(unittest.TestCase):
         self.assertEqual(self.data_feed.candles_df.shape[0], 2)
         self.assertEqual(self.data_feed.candles_df.shape[1], 10)
 
+    def test_candles_df_is_built_again_only_when_the_candles_change(self):
+        candles = self.get_candles_rest_data_mock()
+        self.data_feed._candles.append([float(value) for value in candles[0][:6] + candles[0][7:11]])
+
+        with patch.object(self.data_feed, "_candles_to_df", wraps=self.data_feed._candles_to_df) as candles_to_df:
+            candles_df = self.data_feed.candles_df
+            candles_df["new_column"] = 1
+            self.assertNotIn("new_column", self.data_feed.candles_df)
+            self.assertEqual(1, candles_to_df.call_count)
+
+            self.data_feed._candles[-1] = self.data_feed._candles[-1]
+            self.assertEqual(1, self.data_feed.get_candles_df(max_records=1).shape[0])
+            self.assertEqual(1, candles_to_df.call_count)
+
+            self.data_feed._candles.append([float(value) for value in candles[1][:6] + candles[1][7:11]])
+            self.assertEqual(2, self.data_feed.candles_df.shape[0])
+            self.assertEqual(candles[1][0], self.data_feed.get_candles_df(max_records=1)["timestamp"].iloc[0])
+            self.assertEqual(2, candles_to_df.call_count)
+
+    def get_candles_rows(self) -> np.ndarray:
+        return np.array([candle[:6] + candle[7:11] for candle in self.get_candles_rest_data_mock()], dtype=float)
+
+    def test_candles_are_loaded_from_and_persisted_in_the_cache(self):
+        candles = self.get_candles_rows()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CandlesCache(name=self.data_feed.name, interval=self.interval, cache_dir=cache_dir)
+            cache.save(candles[:3])
+            self.data_feed.enable_cache(cache_dir=cache_dir)
+
+            self.data_feed.load_cached_candles()
+            self.assertEqual(candles[:3].tolist(), self.data_feed._candles.values.tolist())
+
+            self.data_feed._candles.append(candles[3])
+            self.data_feed.persist_candles()
+            # The last candle is not persisted until it is closed
+            self.assertEqual(candles[:3].tolist(), cache.load().tolist())
+            self.data_feed._candles.append(candles[3] + 3600000)
+            self.data_feed.persist_candles()
+            self.assertEqual(candles.tolist(), cache.load().tolist())
+
+    @patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+    @patch.object(BinanceSpotCandles, "fetch_candles", new_callable=AsyncMock)
+    def test_only_the_missing_candles_are_added_after_a_reconnection(self, fetch_candles_mock, fill_historical_mock):
+        candles = self.get_candles_rows()
+        self.data_feed._candles.extendleft(candles[:2][::-1])
+        self.async_run_with_timeout(self.data_feed._on_order_stream_interruption())
+        self.assertEqual(2, len(self.data_feed._candles))
+        fetch_candles_mock.return_value = candles[1:][::-1]
+
+        self.async_run_with_timeout(self.data_feed._fill_missing_candles())
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(candles.tolist(), self.data_feed._candles.values.tolist())
+        fetch_candles_mock.assert_called_once_with()
+        fill_historical_mock.assert_called_once()
+
+    @patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+    @patch.object(BinanceSpotCandles, "fetch_candles", new_callable=AsyncMock)
+    def test_candles_are_replaced_when_the_missing_candles_are_not_reached(self, fetch_candles_mock, _):
+        candles = self.get_candles_rows()
+        self.data_feed._candles.append(candles[0])
+        fetch_candles_mock.return_value = candles[2:]
+
+        self.async_run_with_timeout(self.data_feed._fill_missing_candles())
+
+        self.assertEqual(candles[2:].tolist(), self.data_feed._candles.values.tolist())
+
+    def hourly_candles(self, count: int) -> np.ndarray:
+        timestamps = 1672981200000 + np.arange(count) * 3600000
+        return np.column_stack([timestamps] + [np.full(count, 100.0)] * 9)
+
+    def fetch_candles_page(self, candles: np.ndarray, page_size: int):
+        async def fetch_candles(start_time=None, end_time=None, limit=500):
+            if start_time is None:
+                return candles[-page_size:]
+            return candles[candles[:, 0] >= start_time][:page_size]
+        return fetch_candles
+
+    @patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+    @patch.object(BinanceSpotCandles, "fetch_candles", new_callable=AsyncMock)
+    def test_gap_longer_than_one_page_is_fetched_page_by_page(self, fetch_candles_mock, fill_historical_mock):
+        candles = self.hourly_candles(40)
+        self.data_feed._candles.extendleft(candles[:10][::-1])
+        fetch_candles_mock.side_effect = self.fetch_candles_page(candles, page_size=10)
+
+        self.async_run_with_timeout(self.data_feed._fill_missing_candles())
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.assertEqual(candles.tolist(), self.data_feed._candles.values.tolist())
+        self.assertEqual([{}, {"start_time": int(candles[9, 0]) + 1}, {"start_time": int(candles[19, 0]) + 1}],
+                         [call.kwargs for call in fetch_candles_mock.call_args_list])
+        fill_historical_mock.assert_called_once()
+
+    @patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+    @patch.object(BinanceSpotCandles, "fetch_candles", new_callable=AsyncMock)
+    def test_candles_older_than_a_long_gap_are_loaded_from_the_cache(self, fetch_candles_mock, fill_historical_mock):
+        self.data_feed = BinanceSpotCandles(trading_pair=self.trading_pair, interval=self.interval, max_records=20)
+        candles = self.hourly_candles(50)
+        self.data_feed._candles.extendleft(candles[:5][::-1])
+        fetch_candles_mock.side_effect = self.fetch_candles_page(candles, page_size=10)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            CandlesCache(name=self.data_feed.name, interval=self.interval, cache_dir=cache_dir).save(candles[25:40])
+            self.data_feed.enable_cache(cache_dir=cache_dir)
+
+            self.async_run_with_timeout(self.data_feed._fill_missing_candles())
+
+        # The gap is longer than the store, so only the last candles are fetched
+        fetch_candles_mock.assert_called_once_with()
+        self.assertEqual(candles[30:].tolist(), self.data_feed._candles.values.tolist())
+        fill_historical_mock.assert_not_called()
+
+    @patch.object(BinanceSpotCandles, "fetch_candles", new_callable=AsyncMock)
+    def test_historical_candles_are_filled_by_one_task_at_a_time(self, fetch_candles_mock):
+        fill_event = asyncio.Event()
+        fill_historical_mock = AsyncMock(side_effect=fill_event.wait)
+        candles = self.hourly_candles(3)
+        self.data_feed._candles.append(candles[0])
+        fetch_candles_mock.return_value = candles[1:]
+
+        with patch.object(BinanceSpotCandles, "fill_historical_candles", fill_historical_mock):
+            self.async_run_with_timeout(self.data_feed._fill_missing_candles())
+            self.async_run_with_timeout(self.data_feed._fill_missing_candles())
+            self.async_run_with_timeout(asyncio.sleep(0))
+            self.assertEqual(1, fill_historical_mock.call_count)
+
+            fill_event.set()
+            self.async_run_with_timeout(asyncio.sleep(0))
+            self.async_run_with_timeout(self.data_feed._fill_missing_candles())
+            self.async_run_with_timeout(asyncio.sleep(0))
+            self.assertEqual(2, fill_historical_mock.call_count)
+        self.async_run_with_timeout(self.data_feed.stop_network())
+
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
+
+
+class CandlesCacheTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = CandlesCache.for_trading_pair("binance", "BTC-USDT", "1m", cache_dir=self.cache_dir.name)
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def candles(timestamps, close: float = 100) -> np.ndarray:
+        return np.array([[timestamp, close, close, close, close, 1] for timestamp in timestamps], dtype=float)
+
+    def test_empty_cache(self):
+        self.assertEqual(os.path.join(self.cache_dir.name, "binance_BTC-USDT_1m.npy"), self.cache.file_path)
+        self.assertEqual(0, len(self.cache.load()))
+        self.assertEqual(0, len(self.cache.load_last_candles(max_records=10)))
+        self.assertTrue(self.cache.get_candles_df(columns=["timestamp", "open", "high", "low", "close", "volume"]).empty)
+
+    def test_saved_candles_are_merged_by_timestamp(self):
+        self.cache.save(self.candles([3, 4, 5]))
+        self.cache.save(self.candles([1, 2]))
+        self.cache.save(self.candles([5, 6], close=101))
+
+        candles = self.cache.load()
+
+        self.assertEqual([1, 2, 3, 4, 5, 6], candles[:, 0].tolist())
+        self.assertEqual([100, 100, 100, 100, 101, 101], candles[:, 4].tolist())
+        self.assertFalse(os.path.exists(f"{self.cache.file_path}.tmp"))
+
+    def test_load_candles_of_a_time_range(self):
+        self.cache.save(self.candles(range(0, 600, 60)))
+
+        self.assertEqual([120, 180, 240], self.cache.load(start_time=120, end_time=240)[:, 0].tolist())
+        self.assertEqual([480, 540], self.cache.load(start_time=450)[:, 0].tolist())
+        self.assertEqual([0], self.cache.load(end_time=59)[:, 0].tolist())
+        candles_df = self.cache.get_candles_df(columns=["timestamp", "open", "high", "low", "close", "volume"],
+                                               start_time=540)
+        self.assertEqual([540], candles_df["timestamp"].tolist())
+
+    def test_last_candles_start_after_the_last_gap(self):
+        self.cache.save(self.candles([0, 60, 120, 600, 660, 720, 780]))
+
+        self.assertEqual([600, 660, 720, 780], self.cache.load_last_candles(max_records=10)[:, 0].tolist())
+        self.assertEqual([720, 780], self.cache.load_last_candles(max_records=2)[:, 0].tolist())
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub, CandlesResampler
+
+
+class CandlesResamplerTests(unittest.TestCase):
+    minute = 60000
+
+    def candle(self, timestamp: int, open: float, high: float, low: float, close: float, volume: float):
+        return np.array([timestamp, open, high, low, close, volume, volume * close, 1, volume / 2, volume * close / 2])
+
+    def test_stream_candles_are_aggregated_by_feed_candle(self):
+        resampler = CandlesResampler(candle_size=5 * self.minute)
+
+        resampler.update(self.candle(0, 100, 102, 99, 101, 1))
+        resampler.update(self.candle(self.minute, 101, 103, 100, 102, 2))
+        candle = resampler.update(self.candle(self.minute, 101, 105, 98, 104, 3))
+
+        self.assertEqual([0, 100, 105, 98, 104, 4, 101 + 3 * 104, 2, 2, (101 + 3 * 104) / 2], candle.tolist())
+        self.assertFalse(resampler.request_candle())
+
+        candle = resampler.update(self.candle(5 * self.minute, 104, 106, 103, 105, 1))
+        self.assertEqual([5 * self.minute, 104, 106, 103, 105, 1, 105, 1, 0.5, 52.5], candle.tolist())
+
+    def test_stored_candle_is_used_when_started_in_the_middle_of_a_feed_candle(self):
+        resampler = CandlesResampler(candle_size=5 * self.minute)
+        stored_candle = self.candle(0, 100, 104, 97, 103, 10)
+
+        candle = resampler.update(self.candle(2 * self.minute, 102, 103, 101, 103, 3), last_candle=stored_candle)
+        self.assertEqual(stored_candle.tolist(), candle.tolist())
+
+        # Only the volume added from then on is added to the stored candle
+        candle = resampler.update(self.candle(2 * self.minute, 102, 106, 101, 105, 5), last_candle=candle)
+        self.assertEqual([0, 100, 106, 97, 105, 12], candle[:6].tolist())
+        candle = resampler.update(self.candle(3 * self.minute, 105, 105, 96, 96, 1), last_candle=candle)
+        self.assertEqual([0, 100, 106, 96, 96, 13], candle[:6].tolist())
+        self.assertFalse(resampler.request_candle())
+
+    def test_feed_candle_is_requested_once_when_there_is_no_stored_candle(self):
+        resampler = CandlesResampler(candle_size=5 * self.minute)
+
+        candle = resampler.update(self.candle(2 * self.minute, 102, 103, 101, 103, 3))
+        self.assertEqual([0, 102, 103, 101, 103, 3], candle[:6].tolist())
+        self.assertTrue(resampler.request_candle())
+        self.assertFalse(resampler.request_candle())
+
+        # The fetched candle replaces the stream candles seen until then
+        fetched_candle = self.candle(0, 100, 104, 97, 103, 10)
+        candle = resampler.update(self.candle(2 * self.minute, 102, 103, 101, 104, 4), last_candle=fetched_candle)
+        self.assertEqual([0, 100, 104, 97, 104, 10], candle[:6].tolist())
+        candle = resampler.update(self.candle(2 * self.minute, 102, 103, 101, 102, 6), last_candle=candle)
+        self.assertEqual([0, 100, 104, 97, 102, 12], candle[:6].tolist())
+
+
+class CandlesHubTests(unittest.TestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+    minute = 60000
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        CandlesHub._hubs.clear()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.btc_1m = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m")
+        self.btc_5m = BinanceSpotCandles(trading_pair="BTC-USDT", interval="5m")
+        self.eth_1h = BinanceSpotCandles(trading_pair="ETH-USDT", interval="1h")
+        self.feeds = [self.btc_5m, self.btc_1m, self.eth_1h]
+        for feed in self.feeds:
+            feed.enable_candles_hub()
+
+    def tearDown(self) -> None:
+        for feed in self.feeds:
+            self.async_run_with_timeout(feed.stop_network())
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def kline_message(self, symbol: str, interval: str, timestamp: int, close: float, volume: float):
+        return {
+            "e": "kline",
+            "E": timestamp + 1000,
+            "s": symbol,
+            "k": {"t": timestamp, "T": timestamp + self.minute - 1, "s": symbol, "i": interval, "f": 100, "L": 200,
+                  "o": "100", "c": str(close), "h": str(max(100, close)), "l": str(min(100, close)),
+                  "v": str(volume), "n": 10, "x": False, "q": str(volume * close), "V": str(volume / 2),
+                  "Q": str(volume * close / 2), "B": "0"}
+        }
+
+    def add_messages(self, ws_connect_mock, messages):
+        for message in messages:
+            self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock=ws_connect_mock.return_value,
+                                                                 message=json.dumps(message))
+
+    @patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_of_an_exchange_share_one_connection(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+
+        for feed in self.feeds:
+            self.async_run_with_timeout(feed.start_network())
+        self.add_messages(ws_connect_mock, [
+            self.kline_message("BTCUSDT", "1m", 0, 101, 1),
+            self.kline_message("BTCUSDT", "1m", self.minute, 102, 2),
+            self.kline_message("ETHUSDT", "1h", 0, 99, 3),
+        ])
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        hub = CandlesHub.for_feed(self.btc_1m)
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertTrue(all(feed._api_factory is hub.api_factory for feed in self.feeds))
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        # The 5m candles are resampled from the 1m klines once the 1m feed is added
+        self.assertEqual([
+            {"method": "SUBSCRIBE", "params": ["btcusdt@kline_5m"], "id": 1},
+            {"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+            {"method": "UNSUBSCRIBE", "params": ["btcusdt@kline_5m"], "id": 1},
+            {"method": "SUBSCRIBE", "params": ["ethusdt@kline_1h"], "id": 1},
+        ], sent_messages)
+        self.assertEqual(["btcusdt@kline_1m", "ethusdt@kline_1h"], hub.streams)
+        self.assertEqual("btcusdt@kline_1m", hub.get_feed_stream(self.btc_5m))
+        self.assertEqual([[0, 101, 1], [self.minute, 102, 2]], self.btc_1m._candles.values[:, [0, 4, 5]].tolist())
+        self.assertEqual([[0, 102, 3]], self.btc_5m._candles.values[:, [0, 4, 5]].tolist())
+        self.assertEqual([[0, 99, 3]], self.eth_1h._candles.values[:, [0, 4, 5]].tolist())
+
+    @patch.object(BinanceSpotCandles, "fill_historical_candles", new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_are_subscribed_and_unsubscribed_on_the_open_connection(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.add_messages(ws_connect_mock, [self.kline_message("BTCUSDT", "1m", 0, 101, 1)])
+        self.async_run_with_timeout(self.btc_1m.start_network())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        for feed in (self.btc_5m, self.eth_1h):
+            self.async_run_with_timeout(feed.start_network())
+        self.add_messages(ws_connect_mock, [self.kline_message("BTCUSDT", "1m", 0, 102, 2)])
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+        self.async_run_with_timeout(self.eth_1h.stop_network())
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual([
+            {"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+            {"method": "SUBSCRIBE", "params": ["ethusdt@kline_1h"], "id": 1},
+            {"method": "UNSUBSCRIBE", "params": ["ethusdt@kline_1h"], "id": 1},
+        ], sent_messages)
+        self.assertEqual([[0, 102, 2]], self.btc_5m._candles.values[:, [0, 4, 5]].tolist())
+
+        hub = CandlesHub.for_feed(self.btc_1m)
+        for feed in (self.btc_1m, self.btc_5m):
+            self.async_run_with_timeout(feed.stop_network())
+        self.assertIsNone(hub._listen_task)
@@ -0,0 +1,93 @@
+import unittest
+from collections import deque
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTests(unittest.TestCase):
+
+    @staticmethod
+    def candle(timestamp: int, close: float = 100):
+        return [timestamp, close, close, close, close, 1]
+
+    def assert_same_candles(self, expected: deque, store: CandlesStore):
+        self.assertEqual(len(expected), len(store))
+        self.assertEqual([list(candle) for candle in expected], store.values.tolist())
+        self.assertEqual([list(candle) for candle in expected], [candle.tolist() for candle in store])
+
+    def test_append_discards_the_oldest_candles_as_a_deque(self):
+        store = CandlesStore(columns_count=6, maxlen=3)
+        expected = deque(maxlen=3)
+
+        for timestamp in range(10):
+            store.append(self.candle(timestamp))
+            expected.append(self.candle(timestamp))
+            self.assert_same_candles(expected, store)
+
+        self.assertEqual(3, store.maxlen)
+        self.assertEqual(9, store[-1][0])
+        self.assertEqual(7, store[0][0])
+
+    def test_extendleft_adds_older_candles_as_a_deque(self):
+        store = CandlesStore(columns_count=6, maxlen=5)
+        expected = deque(maxlen=5)
+        for timestamp in (10, 11):
+            store.append(self.candle(timestamp))
+            expected.append(self.candle(timestamp))
+
+        older_candles = np.array([self.candle(timestamp) for timestamp in (9, 8)])
+        store.extendleft(older_candles)
+        expected.extendleft(older_candles.tolist())
+        self.assert_same_candles(expected, store)
+
+        # The newest candles are discarded when the store is full
+        store.extendleft([self.candle(timestamp) for timestamp in (7, 6, 5)])
+        expected.extendleft([self.candle(timestamp) for timestamp in (7, 6, 5)])
+        self.assert_same_candles(expected, store)
+
+        store.extendleft([])
+        self.assert_same_candles(expected, store)
+
+    def test_version_changes_only_when_the_candles_change(self):
+        store = CandlesStore(columns_count=6, maxlen=3)
+        store.append(self.candle(1))
+        version = store.version
+
+        store[-1] = self.candle(1)
+        self.assertEqual(version, store.version)
+
+        store[-1] = np.array(["1", "101", "101", "101", "101", "1"])
+        self.assertNotEqual(version, store.version)
+        self.assertEqual(self.candle(1, 101), store[-1].tolist())
+
+        version = store.version
+        self.assertEqual(self.candle(1, 101), store.pop().tolist())
+        self.assertNotEqual(version, store.version)
+        self.assertEqual(0, len(store))
+
+        version = store.version
+        store.clear()
+        self.assertNotEqual(version, store.version)
+
+    def test_read_values_do_not_change_the_store(self):
+        store = CandlesStore(columns_count=6, maxlen=3)
+        store.append(self.candle(1))
+
+        store[0][1] = 0
+        with self.assertRaises(ValueError):
+            store.values[0, 1] = 0
+
+        self.assertEqual(self.candle(1), store[0].tolist())
+
+    def test_invalid_indexes_raise_errors(self):
+        store = CandlesStore(columns_count=6, maxlen=3)
+
+        with self.assertRaises(IndexError):
+            store.pop()
+        with self.assertRaises(IndexError):
+            store[-1]
+        store.append(self.candle(1))
+        with self.assertRaises(IndexError):
+            store[1] = self.candle(2)
@@ -0,0 +1,154 @@
+import unittest
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.indicators import (
+    EMA,
+    MACD,
+    NATR,
+    RSI,
+    SMA,
+    BBands,
+    CandlesIndicator,
+    CandlesIndicators,
+)
+
+
+class CandlesIndicatorsTests(unittest.TestCase):
+    candles_count = 300
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        random = np.random.default_rng(seed=42)
+        close = 40000 + np.cumsum(random.normal(0, 50, cls.candles_count))
+        close[100:110] = close[99]  # Flat prices
+        open = np.concatenate([[close[0]], close[:-1]])
+        high = np.maximum(open, close) + random.uniform(0, 30, cls.candles_count)
+        low = np.minimum(open, close) - random.uniform(0, 30, cls.candles_count)
+        timestamp = 1640000000000 + np.arange(cls.candles_count) * 60000
+        volume = random.uniform(1, 10, cls.candles_count)
+        cls.candles = np.column_stack([timestamp, open, high, low, close, volume] + [volume * 0] * 4)
+        cls.candles_df = pd.DataFrame(cls.candles, columns=CandlesBase.columns)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.store = CandlesStore(columns_count=len(CandlesBase.columns), maxlen=self.candles_count)
+        self.indicators = CandlesIndicators(candles=self.store, columns=CandlesBase.columns)
+
+    def expected_values(self, indicator: CandlesIndicator, candles_df: pd.DataFrame) -> np.ndarray:
+        close = candles_df["close"]
+        if isinstance(indicator, SMA):
+            expected = ta.sma(close, length=indicator._length)
+        elif isinstance(indicator, EMA):
+            expected = ta.ema(close, length=indicator._length)
+        elif isinstance(indicator, BBands):
+            expected = ta.bbands(close, length=indicator._length, std=indicator._std)
+        elif isinstance(indicator, MACD):
+            expected = ta.macd(close, fast=indicator._fast, slow=indicator._slow, signal=indicator._signal)
+        elif isinstance(indicator, RSI):
+            expected = ta.rsi(close, length=indicator._length)
+        else:
+            expected = ta.natr(candles_df["high"], candles_df["low"], close, length=indicator._length)
+        expected = expected.to_frame() if isinstance(expected, pd.Series) else expected
+        self.assertEqual(indicator.columns, list(expected.columns))
+        return expected.values
+
+    def all_indicators(self) -> List[CandlesIndicator]:
+        return [SMA(length=20), EMA(length=20), BBands(length=20, std=2.0), MACD(fast=12, slow=26, signal=9),
+                RSI(length=14), NATR(length=14)]
+
+    def assert_indicators_match(self, indicators: List[CandlesIndicator], candles_df: pd.DataFrame):
+        for indicator in indicators:
+            values = self.indicators.get_values(indicator)
+            # Only the values of the stored candles are kept
+            np.testing.assert_allclose(values,
+                                       self.expected_values(indicator, candles_df)[-len(values):],
+                                       rtol=1e-6, atol=1e-9, err_msg=indicator.name)
+
+    def test_indicators_updated_with_each_new_candle_match_pandas_ta(self):
+        indicators = [self.indicators.add(indicator) for indicator in self.all_indicators()]
+
+        for candles_count, candle in enumerate(self.candles, start=1):
+            self.store.append(candle)
+            if candles_count % 37 == 0:
+                self.assert_indicators_match(indicators, self.candles_df.iloc[:candles_count])
+
+        self.assert_indicators_match(indicators, self.candles_df)
+
+    def test_indicators_keep_their_state_when_the_oldest_candles_are_discarded(self):
+        self.store = CandlesStore(columns_count=len(CandlesBase.columns), maxlen=50)
+        self.indicators = CandlesIndicators(candles=self.store, columns=CandlesBase.columns)
+        indicators = [self.indicators.add(indicator) for indicator in self.all_indicators()]
+
+        for candle in self.candles:
+            self.store.append(candle)
+            self.indicators.get_values(indicators[0])
+
+        self.assertEqual(50, len(self.indicators.get_values(indicators[0])))
+        self.assert_indicators_match(indicators, self.candles_df)
+
+    def test_updates_of_the_live_candle_are_replaced_by_the_last_one(self):
+        indicators = [self.indicators.add(indicator) for indicator in self.all_indicators()]
+
+        for index, candle in enumerate(self.candles):
+            live_candle = candle.copy()
+            live_candle[2:5] = candle[1]
+            self.store.append(live_candle)
+            for indicator in indicators:
+                self.indicators.get_values(indicator)
+            self.store[-1] = candle
+            if index % 3 == 0:
+                # More candles can be added before the indicators are read
+                continue
+            for indicator in indicators:
+                self.indicators.get_values(indicator)
+
+        self.assert_indicators_match(indicators, self.candles_df)
+
+    def test_indicators_are_computed_again_when_older_candles_are_added(self):
+        indicators = [self.indicators.add(indicator) for indicator in self.all_indicators()]
+        self.store.append(self.candles[-1])
+        for indicator in indicators:
+            self.assertTrue(np.isnan(self.indicators.get_values(indicator)).all())
+
+        self.store.extendleft(self.candles[:-1][::-1])
+
+        self.assert_indicators_match(indicators, self.candles_df)
+
+    def test_indicator_added_later_is_computed_from_the_stored_candles(self):
+        store = CandlesStore(columns_count=len(CandlesBase.columns), maxlen=100)
+        self.indicators = CandlesIndicators(candles=store, columns=CandlesBase.columns)
+        for candle in self.candles:
+            store.append(candle)
+
+        self.assert_indicators_match(self.all_indicators(), self.candles_df.iloc[-100:])
+
+    def test_indicators_with_the_same_name_are_computed_once(self):
+        bbands = self.indicators.add(BBands(length=20, std=2.0))
+
+        self.assertIs(bbands, self.indicators.add(BBands(length=20, std=2.0)))
+        self.assertIsNot(bbands, self.indicators.add(BBands(length=20, std=3.0)))
+
+    def test_candles_feed_returns_the_indicators_with_the_candles(self):
+        feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=self.candles_count)
+        for candle in self.candles:
+            feed._candles.append(candle)
+        bbands = BBands(length=20, std=2.0)
+        macd = MACD(fast=12, slow=26, signal=9)
+
+        candles_df = feed.get_candles_df(max_records=50, indicators=[bbands, macd])
+
+        self.assertEqual(CandlesBase.columns + bbands.columns + macd.columns, list(candles_df.columns))
+        self.assertEqual(list(range(self.candles_count - 50, self.candles_count)), list(candles_df.index))
+        np.testing.assert_allclose(candles_df[macd.columns].values,
+                                   self.expected_values(macd, self.candles_df)[-50:], rtol=1e-6)
+        last_candle = feed.get_last_candle(indicators=[bbands])
+        self.assertEqual(self.candles[-1][4], last_candle["close"])
+        self.assertEqual(candles_df[bbands.columns[-1]].iloc[-1], last_candle[bbands.columns[-1]])
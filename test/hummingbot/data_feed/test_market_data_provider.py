@@ -22,6 +22,16 @@ class TestMarketDataProvider(unittest.TestCase):
             self.provider.initialize_candles_feed(config)
             self.assertTrue("mock_connector_BTC-USDT_1m" in self.provider.candles_feeds)
 
+    def test_feed_replaced_with_more_records_is_stopped(self):
+        existing_feed = MagicMock(max_records=100)
+        self.provider.candles_feeds = {"mock_connector_BTC-USDT_1m": existing_feed}
+        with patch('hummingbot.data_feed.candles_feed.candles_factory.CandlesFactory.get_candle', return_value=MagicMock()):
+            config = CandlesConfig(connector="mock_connector", trading_pair="BTC-USDT", interval="1m", max_records=200)
+            candles_feed = self.provider.get_candles_feed(config)
+        existing_feed.stop.assert_called_once()
+        self.assertIs(candles_feed, self.provider.candles_feeds["mock_connector_BTC-USDT_1m"])
+        candles_feed.start.assert_called_once()
+
     def test_stop(self):
         mock_candles_feed = MagicMock()
         self.provider.candles_feeds = {"mock_feed": mock_candles_feed}
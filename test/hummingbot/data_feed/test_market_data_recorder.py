@@ -0,0 +1,173 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.data_feed.market_data_recorder import MarketDataRecorder, MarketDataSegment
+
+
+class MarketDataRecorderTests(unittest.TestCase):
+    trading_pair = "BTC-USDT"
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.recorder = MarketDataRecorder(connector_name="binance", data_dir=self.temp_dir.name,
+                                           segment_duration=60, flush_interval=10, max_block_rows=1000)
+
+    def tearDown(self) -> None:
+        self.recorder.stop()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def diff_message(self, update_id: int, timestamp: float, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks}, timestamp)
+
+    def trade_message(self, trade_id, timestamp: float, price: str, amount: str, trade_type: TradeType):
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair, "trade_type": float(trade_type.value), "trade_id": trade_id,
+            "price": price, "amount": amount}, timestamp)
+
+    def messages(self):
+        random = np.random.default_rng(seed=7)
+        messages = []
+        for update_id in range(2, 300):
+            bid_prices = np.round(100 - random.integers(1, 40, 4) * 0.01, 2)
+            ask_prices = np.round(100 + random.integers(1, 40, 4) * 0.01, 2)
+            amounts = np.round(random.choice([0, 0.5, 1.25, 3], 8), 2)
+            bids = [[str(price), str(amount)] for price, amount in zip(bid_prices, amounts[:4])]
+            asks = [[str(price), str(amount)] for price, amount in zip(ask_prices, amounts[4:])]
+            messages.append(self.diff_message(update_id, 1000 + update_id * 0.1, bids, asks))
+            if update_id % 10 == 0:
+                messages.append(self.trade_message(str(update_id), 1000 + update_id * 0.1, "100.01", "0.2",
+                                                   TradeType.SELL if update_id % 20 == 0 else TradeType.BUY))
+        return messages
+
+    def test_recorded_messages_replay_the_order_book(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99.9, 2, 1)], [OrderBookRow(100.1, 2, 1)], 1)
+        self.recorder.start()
+        self.recorder.record_order_book(self.trading_pair, order_book, timestamp=1000)
+        messages = self.messages()
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+            self.recorder.record_message(message)
+        self.recorder.stop()
+
+        data = self.recorder.read(self.trading_pair)
+        self.assertEqual(2 + sum(1 if message.type is OrderBookMessageType.TRADE else 8 for message in messages),
+                         len(data))
+        replayed_messages = list(MarketDataRecorder.iter_messages(self.trading_pair, data))
+        self.assertEqual(len(messages) + 1, len(replayed_messages))
+        trades = [message for message in replayed_messages if message.type is OrderBookMessageType.TRADE]
+        self.assertEqual([(10, 1.0), (20, 2.0)], [(trade.trade_id, trade.content["trade_type"]) for trade in trades[:2]])
+
+        replayed_order_book = OrderBook()
+        for message in replayed_messages:
+            if message.type is OrderBookMessageType.SNAPSHOT:
+                replayed_order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+            elif message.type is OrderBookMessageType.DIFF:
+                replayed_order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        for expected, replayed in zip(order_book.snapshot, replayed_order_book.snapshot):
+            self.assertTrue(expected.equals(replayed))
+
+    def test_compact_messages_are_recorded(self):
+        self.recorder.start()
+        self.recorder.record_message(CompactOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": 5, "bids": [["99.5", "1"]],
+            "asks": [["100.5", "2"], ["101", "0"]]}, 1000))
+        self.recorder.stop()
+
+        data = self.recorder.read(self.trading_pair)
+        self.assertEqual([[1000, 5, 2, 1, 99.5, 1], [1000, 5, 2, 2, 100.5, 2], [1000, 5, 2, 2, 101, 0]],
+                         data.values.tolist())
+
+    def test_segments_are_rotated_and_read_by_time_range(self):
+        for message in self.messages():
+            # The messages are received every 0.2 seconds
+            now = message.timestamp * 2
+            self.recorder._add_message(message, now=now)
+            self.recorder._flush_buffers(now=now)
+        self.recorder._flush_buffers(now=0, flush_all=True)
+
+        segment_paths = self.recorder.segment_paths(self.trading_pair)
+        self.assertEqual(["19700101-003300.hbmd", "19700101-003400.hbmd"],
+                         [os.path.basename(file_path) for file_path in segment_paths])
+        blocks = MarketDataSegment.read_blocks(segment_paths[0])
+        # The blocks are written every 10 seconds, and when the segment is rotated
+        self.assertEqual(4, len(blocks))
+
+        data = self.recorder.read(self.trading_pair)
+        self.assertEqual(self.recorder.read(self.trading_pair, start_time=1015, end_time=1025).values.tolist(),
+                         data[(data["timestamp"] >= 1015) & (data["timestamp"] <= 1025)].values.tolist())
+
+    def test_incomplete_blocks_are_discarded_when_the_segment_is_opened(self):
+        file_path = os.path.join(self.temp_dir.name, "segment.hbmd")
+        columns = {"timestamp": np.array([1.0, 2.0]), "update_id": np.array([10, 11]), "type": np.array([2, 2]),
+                   "side": np.array([1, 2]), "price": np.array([99.0, 101.0]), "amount": np.array([1.0, 0.0])}
+        segment = MarketDataSegment(file_path)
+        segment.append(columns)
+        segment.append({name: values[:1] for name, values in columns.items()})
+        # The index is not updated with the last block, and the next block is half written
+        segment._blocks = segment._blocks[:1]
+        segment._write_index()
+        segment.close()
+        with open(file_path, "rb") as segment_file:
+            first_block = segment_file.read(segment._blocks[0][1])
+        with open(file_path, "ab") as segment_file:
+            segment_file.write(first_block[:-10])
+
+        self.assertEqual(3, len(MarketDataSegment.read(file_path)))
+        segment = MarketDataSegment(file_path)
+        segment.append({name: values[1:] for name, values in columns.items()})
+        segment.close()
+
+        data = MarketDataSegment.read(file_path)
+        self.assertEqual([1, 2, 1, 2], data["timestamp"].tolist())
+        self.assertEqual([10, 11, 10, 11], data["update_id"].tolist())
+        self.assertEqual(3, len(MarketDataSegment.read_blocks(file_path)))
+
+    def test_order_book_tracker_records_the_processed_messages(self):
+        data_source = MagicMock()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 1)
+        data_source.get_new_order_book = AsyncMock(return_value=order_book)
+        self.recorder = MagicMock()
+        tracker.start_recording(self.recorder)
+
+        self.async_run_with_timeout(tracker._init_order_book(self.trading_pair, start_time=0))
+        diff = self.diff_message(2, 1000, [["99", "1"]], [])
+        trade = self.trade_message(1, 1000, "100", "1", TradeType.BUY)
+        tracker._tracking_message_queues[self.trading_pair].put_nowait(diff)
+        tracker._order_book_trade_stream.put_nowait(trade)
+        tracker._order_books_initialized.set()
+        trade_task = self.ev_loop.create_task(tracker._emit_trade_event_loop())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        tracker.stop_recording()
+        tracker.stop()
+        trade_task.cancel()
+
+        self.recorder.record_order_book.assert_called_once()
+        self.assertEqual([((diff,),), ((trade,),)], self.recorder.record_message.call_args_list)
+        self.assertIsNone(tracker.market_data_recorder)
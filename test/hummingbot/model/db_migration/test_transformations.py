@@ -1,7 +1,14 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.model import get_declarative_base
+from hummingbot.model.db_migration.transformations import (
+    AddQueryIndexes,
+    AddTradeFeeInQuote,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +48,29 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class AddQueryIndexesTests(TestCase):
+    def test_name(self):
+        self.assertEqual("AddQueryIndexes", AddQueryIndexes(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20240501, AddQueryIndexes(self).to_version)
+
+    def test_apply_creates_the_missing_indexes(self):
+        engine = create_engine("sqlite:///:memory:")
+        get_declarative_base().metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX o_config_market_timestamp_index")
+            connection.exec_driver_sql("DROP INDEX tf_timestamp_config_index")
+        db_handle = MagicMock()
+        db_handle.engine = engine
+
+        AddQueryIndexes(migrator=self).apply(db_handle)
+        # Applying the transformation again doesn't fail
+        AddQueryIndexes(migrator=self).apply(db_handle)
+
+        inspector = inspect(engine)
+        self.assertIn("o_config_market_timestamp_index", [index["name"] for index in inspector.get_indexes("Order")])
+        self.assertIn("tf_timestamp_config_index", [index["name"] for index in inspector.get_indexes("TradeFill")])
+        self.assertIn("ex_controller_id", [index["name"] for index in inspector.get_indexes("Executors")])
@@ -0,0 +1,65 @@
+import tempfile
+from os.path import join
+from unittest import TestCase
+
+from sqlalchemy import inspect
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.db_path = join(self.db_dir.name, "test.sqlite")
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+    def tearDown(self) -> None:
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    def create_manager(self) -> SQLConnectionManager:
+        return SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+    @staticmethod
+    def pragma(manager: SQLConnectionManager, name: str):
+        with manager.engine.connect() as connection:
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_default_settings_are_used_without_performance_profile(self):
+        manager = self.create_manager()
+
+        self.assertFalse(manager.performance_profile)
+        self.assertEqual("delete", self.pragma(manager, "journal_mode"))
+        manager.engine.dispose()
+
+    def test_performance_profile_configures_the_connections(self):
+        self.client_config_map.db_mode = DBSqliteMode(performance_profile=True)
+        manager = self.create_manager()
+
+        self.assertTrue(manager.performance_profile)
+        self.assertEqual("wal", self.pragma(manager, "journal_mode"))
+        # NORMAL
+        self.assertEqual(1, self.pragma(manager, "synchronous"))
+        self.assertEqual(5000, self.pragma(manager, "busy_timeout"))
+        manager.checkpoint()
+        manager.engine.dispose()
+
+    def test_outdated_database_is_migrated_to_add_the_query_indexes(self):
+        manager = self.create_manager()
+        with manager.engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX tf_timestamp_config_index")
+            connection.exec_driver_sql(f"UPDATE Metadata SET value = '20230516' "
+                                       f"WHERE key = '{SQLConnectionManager.LOCAL_DB_VERSION_KEY}'")
+        manager.engine.dispose()
+
+        manager = self.create_manager()
+
+        index_names = [index["name"] for index in inspect(manager.engine).get_indexes("TradeFill")]
+        self.assertIn("tf_timestamp_config_index", index_names)
+        with manager.get_new_session() as session:
+            self.assertEqual(SQLConnectionManager.LOCAL_DB_VERSION_VALUE, manager.get_local_db_version(session).value)
+        manager.engine.dispose()
@@ -0,0 +1,154 @@
+import asyncio
+import tempfile
+from os.path import join
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import List, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.metadata import Metadata
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.write_behind_queue import WriteBehindQueue
+
+
+class WriteBehindQueueTests(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    def setUp(self) -> None:
+        super().setUp()
+        # The writes are committed in another thread, so the database can't be in memory
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()),
+                                            SQLConnectionType.TRADE_FILLS,
+                                            db_path=join(self.db_dir.name, "test.sqlite"))
+        self.queue = WriteBehindQueue(sql_manager=self.manager, flush_interval=10)
+        self.set_loggers(loggers=[self.queue.logger()])
+
+    def tearDown(self) -> None:
+        self.queue.stop()
+        self.manager.engine.dispose()
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def add_metadata(key: str, value: str):
+        def write(session: Session):
+            record = session.query(Metadata).filter(Metadata.key == key).one_or_none()
+            if record is None:
+                session.add(Metadata(key=key, value=value))
+            else:
+                record.value = value
+        return write
+
+    def stored_metadata(self) -> List[Tuple[str, str]]:
+        with self.manager.get_new_session() as session:
+            query = session.query(Metadata).filter(Metadata.key != SQLConnectionManager.LOCAL_DB_VERSION_KEY)
+            return [(record.key, record.value) for record in query]
+
+    async def test_writes_are_committed_in_batches_when_flushed(self):
+        self.queue.start()
+        self.queue.put(self.add_metadata("first", "1"))
+        self.queue.put(self.add_metadata("second", "2"))
+
+        self.assertEqual(2, self.queue.stats.queue_depth)
+        self.assertEqual([], self.stored_metadata())
+
+        await self.queue.flush()
+
+        self.assertEqual([("first", "1"), ("second", "2")], self.stored_metadata())
+        stats = self.queue.stats
+        self.assertEqual(0, stats.queue_depth)
+        self.assertEqual(1, stats.committed_batches)
+        self.assertEqual(2, stats.committed_writes)
+        self.assertGreater(stats.last_commit_latency, 0)
+
+    async def test_coalesced_writes_keep_the_last_write_and_are_prepared_when_flushed(self):
+        prepared_values = []
+
+        def prepare(value: str):
+            def prepare_write():
+                prepared_values.append(value)
+                return self.add_metadata("state", value)
+            return prepare_write
+
+        self.queue.start()
+        self.queue.put_coalesced(key="state", prepare_write=prepare("1"))
+        self.queue.put(self.add_metadata("other", "1"))
+        self.queue.put_coalesced(key="state", prepare_write=prepare("2"))
+
+        self.assertEqual(2, self.queue.stats.queue_depth)
+        self.assertEqual([], prepared_values)
+
+        await self.queue.flush()
+
+        self.assertEqual(["2"], prepared_values)
+        self.assertEqual([("other", "1"), ("state", "2")], self.stored_metadata())
+
+    async def test_full_batch_is_flushed_without_waiting_for_the_interval(self):
+        self.queue = WriteBehindQueue(sql_manager=self.manager, flush_interval=10, max_batch_size=2)
+        self.queue.start()
+        self.queue.put(self.add_metadata("first", "1"))
+        self.queue.put(self.add_metadata("second", "2"))
+
+        for _ in range(100):
+            if self.queue.stats.committed_batches > 0:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual([("first", "1"), ("second", "2")], self.stored_metadata())
+
+    async def test_stop_commits_the_pending_writes(self):
+        self.queue.start()
+        self.queue.put(self.add_metadata("first", "1"))
+        self.queue.put_coalesced(key="state", prepare_write=lambda: self.add_metadata("state", "1"))
+
+        self.queue.stop()
+
+        self.assertFalse(self.queue.started)
+        self.assertEqual([("first", "1"), ("state", "1")], self.stored_metadata())
+
+    async def test_failing_write_is_discarded_without_losing_the_rest_of_the_batch(self):
+        def failing_write(session: Session):
+            raise Exception("Test")
+
+        self.queue.start()
+        self.queue.put(self.add_metadata("first", "1"))
+        self.queue.put(failing_write)
+        self.queue.put(self.add_metadata("second", "2"))
+
+        await self.queue.flush()
+
+        self.assertEqual([("first", "1"), ("second", "2")], self.stored_metadata())
+        self.assertEqual(1, self.queue.stats.failed_writes)
+        self.assertEqual(2, self.queue.stats.committed_writes)
+        self.assertTrue(self.is_logged("ERROR", "Unexpected error committing a database write."))
+
+    async def test_post_commit_callbacks_are_called_once_when_the_batch_is_retried(self):
+        committed = []
+
+        def write_with_callback(key: str, value: str):
+            def write(session: Session):
+                self.add_metadata(key, value)(session)
+                return lambda: committed.append(key)
+            return write
+
+        def failing_write(session: Session):
+            raise Exception("Test")
+
+        self.queue.start()
+        self.queue.put(write_with_callback("first", "1"))
+        self.queue.put(failing_write)
+        self.queue.put(write_with_callback("second", "2"))
+
+        await self.queue.flush()
+
+        self.assertEqual([("first", "1"), ("second", "2")], self.stored_metadata())
+        self.assertEqual(["first", "second"], committed)
+
+    def test_writes_are_committed_immediately_if_not_started(self):
+        self.queue.put(self.add_metadata("first", "1"))
+
+        self.assertEqual([("first", "1")], self.stored_metadata())
+        self.assertEqual(0, self.queue.stats.queue_depth)
@@ -539,10 +539,12 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
+    @patch("hummingbot.client.command.history_command.HistoryCommand.flush_trade_records", new_callable=AsyncMock)
     @patch("hummingbot.client.command.history_command.HistoryCommand.get_history_trades_json")
     def test_mqtt_command_history(
         self,
-        get_history_trades_mock: MagicMock
+        get_history_trades_mock: MagicMock,
+        flush_trade_records_mock: AsyncMock
     ):
         fake_trades = self.build_fake_trades()
         get_history_trades_mock.return_value = fake_trades
@@ -558,6 +560,7 @@ class RemoteIfaceMQTTTests(TestCase):
         history_msg = {'status': 200, 'msg': '', 'trades': fake_trades}
         self.async_run_with_timeout(self.wait_for_rcv(history_topic, history_msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(history_topic, history_msg, msg_key='data'))
+        flush_trade_records_mock.assert_awaited_once()
 
         self.fake_mqtt_broker.publish_to_subscription(
             topic,
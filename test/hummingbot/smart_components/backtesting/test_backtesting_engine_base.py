@@ -1,10 +1,14 @@
+import tempfile
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 from pandas._testing import assert_frame_equal
 
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_cache import CandlesCache
 from hummingbot.smart_components.backtesting.backtesting_engine_base import BacktestingEngineBase
 
 
@@ -24,6 +28,21 @@ class TestBacktestingEngineBase(unittest.TestCase):
         self.assertEqual(filtered_df["timestamp"].min(), pd.Timestamp("2021-01-02"))
         self.assertEqual(filtered_df["timestamp"].max(), pd.Timestamp("2021-01-04"))
 
+    def test_load_candles_df_from_the_candles_cache(self):
+        day = 24 * 60 * 60 * 1000
+        start_timestamp = int(datetime(2021, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+        candles = np.zeros((5, len(CandlesBase.columns)))
+        candles[:, 0] = start_timestamp + np.arange(5) * day
+        candles[:, 4] = np.arange(5)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            CandlesCache.for_trading_pair("binance", "BTC-USDT", "1d", cache_dir=cache_dir).save(candles)
+
+            candles_df = self.backtesting_engine.load_candles_df("binance", "BTC-USDT", "1d", start="2021-01-02",
+                                                                 end="2021-01-04", cache_dir=cache_dir)
+
+        self.assertEqual(CandlesBase.columns, list(candles_df.columns))
+        self.assertEqual([1, 2, 3], candles_df["close"].tolist())
+
     def test_summarize_results(self):
         initial_date = datetime(2023, 3, 16, 0, 0, tzinfo=timezone.utc)
         initial_timestamp = int(initial_date.timestamp())
@@ -100,6 +119,60 @@ class TestBacktestingEngineBase(unittest.TestCase):
         self.assertTrue("stop_loss_time" in result_df.columns)
         self.assertTrue("take_profit_time" in result_df.columns)
 
+    @staticmethod
+    def get_candles_with_signals(candles: int, seed: int, time_limit: int):
+        random_generator = np.random.default_rng(seed)
+        df = pd.DataFrame({
+            "timestamp": 1609459200000 + np.arange(candles) * 60000,
+            "close": 100 * np.exp(np.cumsum(random_generator.normal(0, 0.002, candles))),
+            "signal": random_generator.choice([-1, 0, 1], candles, p=[0.2, 0.6, 0.2]),
+            "target": random_generator.uniform(0.001, 0.01, candles),
+        })
+        df.index = pd.to_datetime(df.timestamp, unit="ms")
+        df["tl"] = df.index + pd.Timedelta(seconds=time_limit)
+        return df
+
+    @staticmethod
+    def apply_tp_sl_on_tl_with_loop(df: pd.DataFrame, tp: float, sl: float):
+        # Reference implementation evaluating the path of each event one by one
+        events = df[df["signal"] != 0].copy()
+        take_profit = tp * events["target"] if tp > 0 else pd.Series(index=df.index, dtype=float)
+        stop_loss = - sl * events["target"] if sl > 0 else pd.Series(index=df.index, dtype=float)
+        for loc, tl in events["tl"].fillna(df.index[-1]).items():
+            df0 = df.close[loc:tl]
+            df0 = (df0 / df.close[loc] - 1) * events.at[loc, "signal"]
+            df.loc[loc, "stop_loss_time"] = df0[df0 < stop_loss[loc]].index.min()
+            df.loc[loc, "take_profit_time"] = df0[df0 > take_profit[loc]].index.min()
+        df["close_time"] = df[["tl", "take_profit_time", "stop_loss_time"]].dropna(how="all").min(axis=1)
+        df["close_type"] = df[["take_profit_time", "stop_loss_time", "tl"]].dropna(how="all").idxmin(axis=1)
+        df["close_type"].replace({"take_profit_time": "tp", "stop_loss_time": "sl"}, inplace=True)
+        return df
+
+    def test_apply_tp_sl_on_tl_matches_event_loop(self):
+        for tp, sl in [(1.0, 1.0), (0.3, 0.5), (0, 1.0), (1.0, 0), (0, 0)]:
+            for time_limit in [30, 600, 3600 * 4]:
+                df = self.get_candles_with_signals(candles=400, seed=time_limit, time_limit=time_limit)
+                expected_df = self.apply_tp_sl_on_tl_with_loop(df.copy(), tp=tp, sl=sl)
+
+                result_df = self.backtesting_engine.apply_tp_sl_on_tl(df, tp=tp, sl=sl)
+
+                assert_frame_equal(expected_df, result_df)
+
+    def test_get_barrier_hit_positions(self):
+        close = np.array([100, 101, 99, 103, 97, 100])
+        stop_loss_positions, take_profit_positions = self.backtesting_engine.get_barrier_hit_positions(
+            close=close,
+            signal=np.array([1, -1, 1, 1]),
+            take_profit=np.array([0.02, 0.01, np.nan, 0.5]),
+            stop_loss=np.array([-0.02, -0.01, -0.02, -0.5]),
+            start_positions=np.array([0, 1, 2, 5]),
+            end_positions=np.array([6, 4, 4, 6]),
+            max_chunk_size=6,
+        )
+
+        self.assertEqual([4, 3, -1, -1], stop_loss_positions.tolist())
+        self.assertEqual([3, 2, -1, -1], take_profit_positions.tolist())
+
     @patch("hummingbot.smart_components.backtesting.backtesting_engine_base.BacktestingEngineBase.simulate_execution")
     @patch("hummingbot.smart_components.backtesting.backtesting_engine_base.BacktestingEngineBase.get_data")
     def test_run_backtesting(self, mock_get_data, mock_simulate_execution):
@@ -159,3 +159,57 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertAlmostEqual(global_report.global_pnl_quote, expected_total_realized_pnl)
         self.assertAlmostEqual(global_report.global_pnl_pct,
                                (expected_total_realized_pnl / expected_total_volume_traded) * 100)
+
+    @staticmethod
+    def create_closed_executor_mock(executor_id: str, net_pnl_quote: Decimal, filled_amount_quote: Decimal):
+        executor_mock = MagicMock(spec=PositionExecutor)
+        executor_mock.is_active = False
+        executor_mock.is_closed = True
+        executor_mock.close_type = CloseType.TAKE_PROFIT
+        executor_mock.net_pnl_quote = net_pnl_quote
+        executor_mock.filled_amount_quote = filled_amount_quote
+        config_mock = MagicMock(PositionExecutorConfig)
+        config_mock.id = executor_id
+        config_mock.controller_id = "test"
+        executor_mock.config = config_mock
+        return executor_mock
+
+    @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
+    def test_performance_report_loads_stored_executors_once(self, mock_get_instance):
+        stored_executor = MagicMock()
+        stored_executor.id = "stored"
+        stored_executor.is_active = False
+        stored_executor.close_type = CloseType.STOP_LOSS
+        stored_executor.net_pnl_quote = Decimal(-5)
+        stored_executor.filled_amount_quote = Decimal(50)
+        mock_markets_recorder = MagicMock(spec=MarketsRecorder)
+        mock_markets_recorder.get_executors_by_controller.return_value = [stored_executor]
+        mock_get_instance.return_value = mock_markets_recorder
+        self.orchestrator.executors["test"] = [self.create_closed_executor_mock("closed", Decimal(10), Decimal(100))]
+
+        for _ in range(3):
+            report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        mock_markets_recorder.get_executors_by_controller.assert_called_once_with("test")
+        self.assertEqual(Decimal(5), report.realized_pnl_quote)
+        self.assertEqual(Decimal(150), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+
+    @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
+    def test_stored_executors_are_counted_once(self, mock_get_instance):
+        mock_markets_recorder = MagicMock(spec=MarketsRecorder)
+        mock_markets_recorder.get_executors_by_controller.return_value = []
+        mock_get_instance.return_value = mock_markets_recorder
+        executors = [self.create_closed_executor_mock(f"executor_{i}", Decimal(i), Decimal(10)) for i in range(3)]
+        self.orchestrator.executors["test"] = list(executors)
+
+        self.orchestrator.generate_performance_report(controller_id="test")
+        self.orchestrator.execute_action(StoreExecutorAction(executor_id="executor_1", controller_id="test"))
+        self.orchestrator.execute_action(StoreExecutorAction(executor_id="executor_2", controller_id="test"))
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        self.assertEqual([executors[0]], self.orchestrator.executors["test"])
+        self.assertEqual(Decimal(3), report.realized_pnl_quote)
+        self.assertEqual(Decimal(30), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 3}, report.close_type_counts)
+        mock_markets_recorder.store_or_update_executor.assert_called_with(executors[2])
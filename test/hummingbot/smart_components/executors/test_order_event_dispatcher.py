@@ -0,0 +1,106 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import MarketEvent, OrderCancelledEvent, OrderFilledEvent
+from hummingbot.smart_components.executors.data_types import ExecutorConfigBase
+from hummingbot.smart_components.executors.executor_base import ExecutorBase
+from hummingbot.smart_components.executors.order_event_dispatcher import OrderEventDispatcher
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class OrderEventDispatcherTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector = ConnectorBase(ClientConfigAdapter(ClientConfigMap()))
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        self.strategy.connectors = {"connector1": self.connector}
+        self.strategy.buy.side_effect = ["OID-1", "OID-2", "OID-3"]
+
+    def create_executor(self) -> ExecutorBase:
+        executor = ExecutorBase(strategy=self.strategy,
+                                connectors=["connector1"],
+                                config=ExecutorConfigBase(id="test", type="test", timestamp=1234567890))
+        executor.process_order_filled_event = MagicMock()
+        executor.process_order_canceled_event = MagicMock()
+        return executor
+
+    def place_buy_order(self, executor: ExecutorBase) -> str:
+        return executor.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                                    side=TradeType.BUY, amount=Decimal("1"), price=Decimal("1000"))
+
+    @staticmethod
+    def filled_event(order_id: str) -> OrderFilledEvent:
+        return OrderFilledEvent(timestamp=1234567890, order_id=order_id, trading_pair="ETH-USDT",
+                                trade_type=TradeType.BUY, order_type=OrderType.LIMIT, price=Decimal("1000"),
+                                amount=Decimal("1"), trade_fee=MagicMock())
+
+    def test_events_are_delivered_only_to_the_order_owner(self):
+        first_executor = self.create_executor()
+        second_executor = self.create_executor()
+        first_executor.register_events()
+        second_executor.register_events()
+
+        first_order_id = self.place_buy_order(first_executor)
+        second_order_id = self.place_buy_order(second_executor)
+        self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event(first_order_id))
+        self.connector.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(1234567890, second_order_id))
+        self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event("OID-UNKNOWN"))
+
+        first_executor.process_order_filled_event.assert_called_once()
+        self.assertEqual(first_order_id, first_executor.process_order_filled_event.call_args[0][2].order_id)
+        self.assertIs(self.connector, first_executor.process_order_filled_event.call_args[0][1])
+        first_executor.process_order_canceled_event.assert_not_called()
+        second_executor.process_order_filled_event.assert_not_called()
+        second_executor.process_order_canceled_event.assert_called_once()
+
+    def test_connector_listeners_are_shared_and_removed_with_the_last_executor(self):
+        connector_listeners = len(self.connector.get_listeners(MarketEvent.OrderFilled))
+        executors = [self.create_executor() for _ in range(3)]
+        for executor in executors:
+            executor.register_events()
+
+        self.assertEqual(connector_listeners + 1, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+        self.assertEqual(3, OrderEventDispatcher.for_connector(self.connector).executors_count)
+
+        order_id = self.place_buy_order(executors[0])
+        for executor in executors:
+            executor.unregister_events()
+
+        dispatcher = OrderEventDispatcher.for_connector(self.connector)
+        self.assertEqual(connector_listeners, len(self.connector.get_listeners(MarketEvent.OrderFilled)))
+        self.assertEqual(0, dispatcher.executors_count)
+        self.assertIsNone(dispatcher.owner_of(order_id))
+
+    def test_events_triggered_while_placing_an_order_belong_to_the_placing_executor(self):
+        executor = self.create_executor()
+        executor.register_events()
+
+        def buy(*args, **kwargs):
+            self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event("OID-SYNC"))
+            return "OID-SYNC"
+
+        self.strategy.buy.side_effect = buy
+        self.place_buy_order(executor)
+
+        executor.process_order_filled_event.assert_called_once()
+        self.assertIs(executor, OrderEventDispatcher.for_connector(self.connector).owner_of("OID-SYNC"))
+
+    @patch.object(ExecutorBase, "process_order_filled_event")
+    def test_listener_fallback_delivers_all_events(self, process_order_filled_event_mock: MagicMock):
+        executor = ExecutorBase(strategy=self.strategy,
+                                connectors=["connector1"],
+                                config=ExecutorConfigBase(id="test", type="test", timestamp=1234567890))
+        executor.ROUTE_EVENTS_BY_ORDER_ID = False
+        executor.register_events()
+
+        self.place_buy_order(executor)
+        self.connector.trigger_event(MarketEvent.OrderFilled, self.filled_event("OID-UNKNOWN"))
+
+        process_order_filled_event_mock.assert_called_once()
+        self.assertEqual(0, OrderEventDispatcher.for_connector(self.connector).executors_count)
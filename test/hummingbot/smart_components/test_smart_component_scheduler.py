@@ -0,0 +1,131 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import List
+
+from hummingbot.smart_components.smart_component_base import SmartComponentBase
+from hummingbot.smart_components.smart_component_scheduler import SmartComponentScheduler
+
+
+class RecordingComponent(SmartComponentBase):
+    def __init__(self, name: str, calls: List[str], update_interval: float = 0.05, task_delay: float = 0.0):
+        super().__init__(update_interval=update_interval)
+        self.name = name
+        self.calls = calls
+        self.task_delay = task_delay
+
+    def on_start(self):
+        self.calls.append(f"{self.name}-start")
+
+    def on_stop(self):
+        self.calls.append(f"{self.name}-stop")
+
+    async def control_task(self):
+        self.calls.append(self.name)
+        if self.task_delay > 0:
+            await asyncio.sleep(self.task_delay)
+
+
+class TestSmartComponentScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    def setUp(self):
+        super().setUp()
+        self.calls: List[str] = []
+        self.scheduler = SmartComponentScheduler.get_instance()
+        self.set_loggers(loggers=[SmartComponentBase.logger()])
+
+    async def test_components_with_same_interval_are_ticked_together_in_order(self):
+        components = [RecordingComponent(name, self.calls) for name in ("a", "b", "c")]
+        for component in components:
+            component.start()
+
+        await asyncio.sleep(0.12)
+
+        stats = self.scheduler.group_stats(0.05)
+        self.assertEqual(3, stats.components)
+        self.assertEqual(["a-start", "b-start", "c-start", "a", "b", "c"], self.calls[:6])
+        self.assertEqual(["a", "b", "c", "a", "b", "c"], self.calls[6:12])
+        self.assertEqual(1, self.calls.count("a-start"))
+        self.assertGreaterEqual(self.scheduler.control_task_duration(components[0]), 0)
+
+        for component in components:
+            component.stop()
+        await asyncio.sleep(0.06)
+
+        self.assertEqual(["a-stop", "b-stop", "c-stop"], self.calls[-3:])
+        self.assertIsNone(self.scheduler.group_stats(0.05))
+        self.assertFalse(self.scheduler.is_scheduled(components[0]))
+
+    async def test_errors_are_isolated_per_component(self):
+        failing_component = RecordingComponent("failing", self.calls)
+        component = RecordingComponent("a", self.calls)
+
+        async def raise_exception():
+            raise Exception("Test")
+
+        failing_component.control_task = raise_exception
+        failing_component.start()
+        component.start()
+        await asyncio.sleep(0.07)
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertEqual(2, self.calls.count("a"))
+        self.assertTrue(self.scheduler.is_scheduled(failing_component))
+
+        failing_component.stop()
+        component.stop()
+        await asyncio.sleep(0.06)
+
+    async def test_slow_component_is_skipped_until_its_control_task_finishes(self):
+        slow_component = RecordingComponent("slow", self.calls, task_delay=0.15)
+        component = RecordingComponent("a", self.calls)
+        slow_component.start()
+        component.start()
+
+        await asyncio.sleep(0.02)
+        stats = self.scheduler.group_stats(0.05)
+        self.assertEqual(1, stats.running_control_tasks)
+
+        await asyncio.sleep(0.06)
+
+        self.assertEqual(1, self.calls.count("slow"))
+        self.assertEqual(2, self.calls.count("a"))
+
+        await asyncio.sleep(0.1)
+
+        self.assertGreaterEqual(self.scheduler.control_task_duration(slow_component), 0.15)
+
+        slow_component.stop()
+        component.stop()
+        await asyncio.sleep(0.25)
+
+        self.assertIn("slow-stop", self.calls)
+
+    async def test_components_with_different_intervals_use_different_groups(self):
+        fast_component = RecordingComponent("fast", self.calls, update_interval=0.02)
+        slow_component = RecordingComponent("slow", self.calls, update_interval=0.1)
+        fast_component.start()
+        slow_component.start()
+
+        await asyncio.sleep(0.07)
+
+        self.assertEqual(1, self.scheduler.group_stats(0.02).components)
+        self.assertEqual(1, self.scheduler.group_stats(0.1).components)
+        self.assertEqual(1, self.calls.count("slow"))
+        self.assertGreaterEqual(self.calls.count("fast"), 3)
+
+        fast_component.stop()
+        slow_component.stop()
+        await asyncio.sleep(0.12)
+
+    async def test_component_can_use_its_own_control_loop(self):
+        component = RecordingComponent("a", self.calls)
+        component.USE_SHARED_SCHEDULER = False
+        component.start()
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(["a-start", "a"], self.calls)
+        self.assertFalse(self.scheduler.is_scheduled(component))
+
+        component.stop()
+        await asyncio.sleep(0.06)
@@ -107,3 +107,64 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_length_larger_than_int16(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i)
+
+        values = buffer.get_as_numpy_array()
+        self.assertEqual(length, values.size)
+        self.assertEqual(10, values[0])
+        self.assertEqual(length + 9, values[-1])
+
+    def test_get_segments(self):
+        buffer = RingBuffer(4)
+        older, newer = buffer.get_segments()
+        self.assertEqual(0, older.size + newer.size)
+
+        for i in range(3):
+            buffer.add_value(i)
+        older, newer = buffer.get_segments()
+        self.assertTrue(np.array_equal(older, np.array([0, 1, 2])))
+        self.assertEqual(0, newer.size)
+
+        buffer.add_value(3)
+        buffer.add_value(4)
+        older, newer = buffer.get_segments()
+        self.assertTrue(np.array_equal(older, np.array([1, 2, 3])))
+        self.assertTrue(np.array_equal(newer, np.array([4])))
+        self.assertTrue(np.array_equal(np.concatenate((older, newer)), buffer.get_as_numpy_array()))
+
+    def test_running_statistics_match_numpy(self):
+        np.random.seed(123456789)
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 5).astype(np.float32)
+
+        for i, sample in enumerate(samples):
+            self.buffer.add_value(sample)
+            values = self.buffer.get_as_numpy_array()
+            self.assertEqual(values.size, self.buffer.size)
+            self.assertAlmostEqual(np.sum(values), self.buffer.sum_value, 8)
+            self.assertAlmostEqual(np.mean(values), self.buffer.running_mean, 8)
+            self.assertAlmostEqual(np.var(values), self.buffer.running_variance, 8)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(values), self.buffer.mean_value, 8)
+                self.assertAlmostEqual(np.var(values), self.buffer.variance, 8)
+                self.assertAlmostEqual(np.std(values), self.buffer.std_dev, 8)
+
+    def test_running_statistics_when_empty(self):
+        self.assertEqual(0, self.buffer.size)
+        self.assertEqual(0, self.buffer.sum_value)
+        self.assertTrue(np.isnan(self.buffer.running_mean))
+        self.assertTrue(np.isnan(self.buffer.running_variance))
+
+    def test_running_statistics_after_length_change(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 10
+
+        self.assertTrue(self.buffer.is_full)
+        self.assertEqual(sum(range(self.BUFFER_LENGTH - 10, self.BUFFER_LENGTH)), self.buffer.sum_value)
+        self.assertAlmostEqual(np.var(self.buffer.get_as_numpy_array()), self.buffer.variance)
@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 123456789
+    BUFFER_LENGTH = 20
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_processing_length_must_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
+
+    def test_calculate_ema_matches_pandas(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 3).astype(np.float32)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(0, i + 1 - self.BUFFER_LENGTH):i + 1].astype(np.float64)
+            expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 3)
+
+    def test_sampling_length_change(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 2).astype(np.float32)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = 5
+        indicator.add_sample(samples[0])
+
+        window = np.append(samples[-4:], samples[0]).astype(np.float64)
+        expected = pd.Series(window).ewm(span=5, adjust=True).mean().iloc[-1]
+        self.assertAlmostEqual(expected, indicator.current_value, 3)
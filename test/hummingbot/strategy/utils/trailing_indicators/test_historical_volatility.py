@@ -66,3 +66,15 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_incremental_volatility_matches_buffer_calculation(self):
+        samples = np.random.lognormal(np.log(100), 0.1, 100).astype(np.float32)
+        self.indicator = HistoricalVolatilityIndicator(20, 5)
+        variances = []
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            window = samples[max(0, i - 19):i + 1].astype(np.float64)
+            variances.append(np.var(np.diff(np.log(window))) if window.size > 1 else 0)
+            expected = np.sqrt(np.mean(variances[-5:]))
+            self.assertAlmostEqual(expected, self.indicator.current_value, 6)
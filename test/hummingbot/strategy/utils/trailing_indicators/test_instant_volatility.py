@@ -20,3 +20,26 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_incremental_volatility_matches_buffer_calculation(self):
+        samples = np.random.normal(100, 10, 200).astype(np.float32)
+        self.indicator = InstantVolatilityIndicator(50, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            window = samples[max(0, i - 49):i + 1].astype(np.float64)
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, self.indicator.current_value, 3)
+
+    def test_sampling_length_change(self):
+        samples = np.random.normal(100, 10, 100).astype(np.float32)
+        self.indicator = InstantVolatilityIndicator(50, 1)
+        for sample in samples:
+            self.indicator.add_sample(sample)
+
+        self.indicator.sampling_length = 10
+        self.indicator.add_sample(samples[0])
+
+        window = np.append(samples[-9:], samples[0]).astype(np.float64)
+        expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+        self.assertAlmostEqual(expected, self.indicator.current_value, 3)
@@ -259,3 +259,61 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trades_are_sampled_with_last_quote_before_them(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        indicator.last_quotes = [{"timestamp": self.start_timestamp + 1, "price": 10},
+                                 {"timestamp": self.start_timestamp, "price": 5}]
+        for timestamp, price, amount in ((self.start_timestamp + 0.5, 6, 1),
+                                         (self.start_timestamp + 1.5, 12, 2),
+                                         (self.start_timestamp + 1.7, 13, 3)):
+            indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                         timestamp=timestamp,
+                                                         price=price,
+                                                         amount=amount,
+                                                         type=TradeType.BUY))
+
+        indicator.calculate(self.start_timestamp + 2)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual({1.0: 1, 2.0: 2, 3.0: 3}, indicator.trade_volumes_by_price_level)
+        # Only the quote before the latest trade and the newer quotes are kept
+        self.assertEqual([self.start_timestamp + 2, self.start_timestamp + 1],
+                         [quote["timestamp"] for quote in indicator.last_quotes])
+
+    def test_old_samples_leave_the_consolidated_volumes(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        mid_price = float(self.price_delegate.get_mid_price())
+        timestamp = self.start_timestamp
+        indicator.calculate(timestamp)
+        for amount in (1, 2, 3):
+            timestamp += 1
+            indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                         timestamp=timestamp - 0.5,
+                                                         price=mid_price + 1,
+                                                         amount=amount,
+                                                         type=TradeType.BUY))
+            indicator.calculate(timestamp)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual({1.0: 5}, indicator.trade_volumes_by_price_level)
+
+    def test_intensity_is_refitted_only_on_sample_changes_and_refit_interval(self):
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, refit_interval=2)
+        mid_price = float(self.price_delegate.get_mid_price())
+        timestamp = self.start_timestamp
+        indicator.calculate(timestamp)
+
+        for tick in range(6):
+            timestamp += 1
+            if tick < 3:
+                indicator.register_trade(OrderBookTradeEvent(trading_pair="COINALPHAHBOT",
+                                                             timestamp=timestamp - 0.5,
+                                                             price=mid_price + tick + 1,
+                                                             amount=1,
+                                                             type=TradeType.BUY))
+            indicator.calculate(timestamp)
+
+        self.assertEqual(2, indicator.refit_interval)
+        # Fitted on the first full buffer and after the third trade, but not when the samples did not change
+        self.assertEqual(2, indicator.estimations_count)